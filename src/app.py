@@ -11,19 +11,17 @@ import base64
 import hashlib
 import secrets
 import urllib.parse
-import requests
 from PyQt6.QtWidgets import QApplication, QStyleFactory
 from PyQt6.QtCore import (Qt, QTimer, QUrl, pyqtSignal, pyqtProperty, QObject, 
     QAbstractListModel, QModelIndex, QVariant, pyqtSlot, qInstallMessageHandler, 
-    QRectF, QPoint, QDir, QThread)
-from PyQt6.QtGui import QFontDatabase, QCursor, QRegion, QPainter, QPen, QBrush, QColor, QFont, QLinearGradient
-from PyQt6.QtQml import QQmlApplicationEngine, QQmlContext, qmlRegisterType
+    QRectF, QPoint, QDir, QThread, QStandardPaths, QSocketNotifier)
+from PyQt6.QtGui import (QFontDatabase, QFontMetrics, QCursor, QRegion, QPainter, QPen, QBrush, QColor, QFont,
+    QLinearGradient)
+from PyQt6.QtQml import QQmlApplicationEngine, QQmlContext, QQmlPropertyMap, qmlRegisterType
 from PyQt6.QtQuick import QQuickWindow, QSGRendererInterface, QQuickPaintedItem
 from PyQt6.QtWebEngineQuick import QtWebEngineQuick
-from PyQt6.QtCharts import QChartView, QLineSeries, QDateTimeAxis, QValueAxis
 from datetime import datetime, timedelta
 import logging
-from dateutil.parser import parse
 import pytz
 from dateutil.tz import tzlocal
 import time
@@ -32,17 +30,26 @@ import signal
 import calendar
 import threading
 import socket
+import concurrent.futures
 from functions import (
     # status helpers
     profiler,
+    metrics,
+    stall_detector,
+    STALL_HEARTBEAT_MS,
     set_loader_status_callback,
     emit_loader_status,
     # cache io
     load_cache_from_file,
     save_cache_to_file,
+    cache_writer,
     # launch cache helpers
     load_launch_cache,
     save_launch_cache,
+    # boot snapshot helpers
+    build_boot_snapshot,
+    save_boot_snapshot,
+    load_boot_snapshot,
     # network/system helpers
     check_wifi_status,
     fetch_launches,
@@ -80,6 +87,7 @@ from functions import (
     perform_wifi_scan,
     manage_nm_autoconnect,
     test_network_connectivity,
+    connectivity_bus,
     get_git_version_info,
     check_github_for_updates,
     get_launch_trends_series,
@@ -101,6 +109,19 @@ from functions import (
     calculate_chart_interval,
     filter_and_sort_wifi_networks,
     get_nmcli_profiles,
+    start_wifi_monitor,
+    stop_wifi_monitor,
+    DisplayControl,
+    DDC_DISPLAY_VCP_CODES,
+    DDC_VCP_BRIGHTNESS,
+    DDC_VCP_CONTRAST,
+    DDC_VCP_COLOR_PRESET,
+    DDC_VCP_GAIN_RED,
+    DDC_VCP_GAIN_GREEN,
+    DDC_VCP_GAIN_BLUE,
+    DDC_VCP_SHARPNESS,
+    DDC_VCP_INPUT_SOURCE,
+    DDC_VCP_POWER_MODE,
     fetch_weather_for_all_locations,
     perform_full_dashboard_data_load,
     setup_dashboard_environment,
@@ -109,25 +130,40 @@ from functions import (
     get_launch_tray_visibility_state,
     get_countdown_string,
     get_countdown_breakdown,
-    get_update_progress_summary,
+    LogTailFollower,
     perform_bootstrap_diagnostics,
     disconnect_from_wifi,
     bring_up_nm_connection,
     sync_remembered_networks,
     fetch_narratives,
+    build_ticker_text,
     remove_nm_connection,
-    degrees_to_cardinal,
+    WeatherViewModel,
     get_closest_x_video_url,
+    LiveStreamIndex,
     load_theme_settings,
     save_theme_settings,
     load_branch_setting,
     save_branch_setting,
     load_launch_tray_mode_setting,
     save_launch_tray_mode_setting,
+    load_display_settings,
+    save_display_settings,
+    DISPLAY_SETTINGS_SLIDERS,
     get_rpi_config_resolution,
     is_launch_near,
+    lazy_import,
+    SpotifyPollScheduler,
+    SPOTIFY_POLL_MIN_MS,
+    TTLCache,
+    SpotifyTokenState,
+    album_art_url,
 )
 
+# Only the Spotify worker talks HTTP from this module; defer the import until it does
+requests = lazy_import("requests")
+profiler.mark("Module Imports Complete")
+
 SPOTIFY_OAUTH_SCOPES = [
     "user-read-playback-state",
     "user-modify-playback-state",
@@ -141,6 +177,20 @@ SPOTIFY_MIN_QUERY_LENGTH = 2
 SPOTIFY_RELAY_KEY_DEFAULT = "spxrelay_Tp4r8Qm2Vz6Ld1Jx9Nc7Hk5Bw3Ys0FaE"
 SPOTIFY_RELAY_MIN_POLL_INTERVAL_SECONDS = 1.05
 SPOTIFY_RELAY_RATE_LIMIT_BACKOFF_SECONDS = 2.0
+# Library/search/item-track operations run on their own worker lane so player
+# polls and playback commands never queue behind them.
+SPOTIFY_LIBRARY_OPERATIONS = ("search", "library", "item_tracks")
+SPOTIFY_LIBRARY_ENDPOINTS = (
+    ("playlists", "/me/playlists", {"limit": 20}),
+    ("albums", "/me/albums", {"limit": 20}),
+    ("tracks", "/me/tracks", {"limit": 30}),
+    ("podcasts", "/me/shows", {"limit": 20}),
+)
+SPOTIFY_LIBRARY_CACHE_TTL_SECONDS = 300
+SPOTIFY_ITEM_TRACKS_CACHE_TTL_SECONDS = 600
+SPOTIFY_SEARCH_CACHE_TTL_SECONDS = 120
+SPOTIFY_RESPONSE_CACHE_MAX_ENTRIES = 128
+SPOTIFY_HTTP_POOL_SIZE = 8
 
 # DBus imports are now conditional and imported only on Linux
 # import dbus
@@ -185,9 +235,13 @@ logger.info(f"BOOT: Environment initialized. DASHBOARD_WIDTH={os.environ.get('DA
 # Qt message handler to surface QML / Qt internal messages (errors, warnings, info)
 # Install as early as possible after logger initialization
 
+# Own logger so QML noise can be tuned separately (DASHBOARD_LOG_LEVELS=qt=CRITICAL)
+qt_logger = logging.getLogger('qt')
+
+
 def _qt_message_handler(mode, context, message):
     msg = format_qt_message(mode, context, message)
-    if msg: logger.error(msg)
+    if msg: qt_logger.error(msg)
 
 # Install the handler only once
 try:
@@ -224,14 +278,19 @@ class EventModel(QAbstractListModel):
     LandingLocationRole = Qt.ItemDataRole.UserRole + 21
     XVideoUrlRole = Qt.ItemDataRole.UserRole + 22
 
-    def __init__(self, data, mode, event_type, tz, parent=None):
+    def __init__(self, data, mode, event_type, tz, parent=None, grouped_data=None):
         super().__init__(parent)
         self._data = data
         self._mode = mode
         self._event_type = event_type
         self._tz = tz
         self._grouped_data = []
-        self.update_data()
+        if grouped_data is not None:
+            # Rows restored from the boot snapshot are already grouped for this view
+            self._grouped_data = grouped_data
+            profiler.mark(f"EventModel: seeded from boot snapshot (count: {len(grouped_data)})")
+        else:
+            self.update_data()
 
     def rowCount(self, parent=QModelIndex()):
         return len(self._grouped_data)
@@ -314,18 +373,16 @@ class EventModel(QAbstractListModel):
         roles[self.XVideoUrlRole] = b"xVideoUrl"
         return roles
 
+    @metrics.timed("EventModel.update_data")
     def update_data(self):
-        profiler.mark(f"EventModel: update_data Start ({self._mode}, {self._event_type})")
         self.beginResetModel()
         try:
             # Delegate logic to UI-agnostic helper in functions.py
-            profiler.mark(f"EventModel: Calling group_event_data ({self._mode})")
             self._grouped_data = group_event_data(self._data, self._mode, self._event_type, self._tz)
         except Exception as e:
             logger.error(f"EventModel: Failed to update data: {e}")
             self._grouped_data = []
         self.endResetModel()
-        profiler.mark(f"EventModel: update_data End (count: {len(self._grouped_data)})")
 
 class WeatherForecastModel(QAbstractListModel):
     DayRole = Qt.ItemDataRole.UserRole + 1
@@ -416,16 +473,15 @@ class LaunchUpdater(QObject):
         super().__init__()
         self.tz_obj = tz_obj
 
+    @metrics.timed("LaunchUpdater.run")
     def run(self):
-        profiler.mark("LaunchUpdater: Starting update")
         launch_data = fetch_launches()
         narratives = fetch_narratives(launch_data)
         
         # Pre-compute calendar mapping
         from functions import get_calendar_mapping
         calendar_mapping = get_calendar_mapping(launch_data, tz_obj=self.tz_obj)
-        
-        profiler.mark("LaunchUpdater: Update complete")
+
         self.finished.emit(launch_data, narratives, calendar_mapping)
 
 class WeatherUpdater(QObject):
@@ -434,10 +490,9 @@ class WeatherUpdater(QObject):
         super().__init__()
         self.active_location = active_location
 
+    @metrics.timed("WeatherUpdater.run")
     def run(self):
-        profiler.mark(f"WeatherUpdater: Starting update (active: {self.active_location})")
         weather_data = fetch_weather_for_all_locations(location_settings, self.active_location)
-        profiler.mark("WeatherUpdater: Update complete")
         self.finished.emit(weather_data)
 
 class NextLaunchUpdater(QObject):
@@ -445,17 +500,53 @@ class NextLaunchUpdater(QObject):
     def __init__(self, launch_id):
         super().__init__()
         self.launch_id = launch_id
+    @metrics.timed("NextLaunchUpdater.run")
     def run(self):
-        profiler.mark(f"NextLaunchUpdater: Starting update ({self.launch_id})")
         # Use v2.3.0 detailed mode
         detailed_data = funcs.fetch_launch_details(self.launch_id)
-        profiler.mark(f"NextLaunchUpdater: Update complete ({self.launch_id})")
         if detailed_data:
             self.finished.emit(detailed_data)
 
 class SpotifyWorker(QObject):
     completed = pyqtSignal(str, object)
 
+    def __init__(self, response_cache=None, token_state=None, parent=None):
+        super().__init__(parent)
+        # Shared between the player and library lanes; see Backend._setup_spotify_worker
+        self._response_cache = response_cache if response_cache is not None else TTLCache(SPOTIFY_RESPONSE_CACHE_MAX_ENTRIES)
+        self._token_state = token_state if token_state is not None else SpotifyTokenState()
+        self._session = None
+        self._session_lock = threading.Lock()
+        self._fanout_pool = None
+
+    def _http(self):
+        """Pooled HTTP session so repeated Spotify calls reuse TLS connections."""
+        with self._session_lock:
+            if self._session is None:
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=SPOTIFY_HTTP_POOL_SIZE)
+                session.mount("https://", adapter)
+                self._session = session
+            return self._session
+
+    def _fanout(self):
+        if self._fanout_pool is None:
+            self._fanout_pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=len(SPOTIFY_LIBRARY_ENDPOINTS), thread_name_prefix="spotify-fanout")
+        return self._fanout_pool
+
+    def close(self):
+        if self._fanout_pool is not None:
+            self._fanout_pool.shutdown(wait=False)
+            self._fanout_pool = None
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def _cache_key(self, endpoint, params):
+        return (endpoint, tuple(sorted((params or {}).items())))
+
     def _snapshot(self, payload):
         snapshot = dict((payload or {}).get("snapshot") or {})
         snapshot["player"] = dict(snapshot.get("player") or {})
@@ -494,6 +585,18 @@ class SpotifyWorker(QObject):
         )
 
     def _refresh_access_token(self, snapshot):
+        # One refresh at a time across both lanes; another lane may already have refreshed
+        with self._token_state.lock:
+            stale_token = snapshot.get("access_token")
+            self._token_state.adopt_newer(snapshot)
+            if snapshot.get("access_token") != stale_token and self._token_is_valid(snapshot):
+                return True, snapshot
+            refreshed, snapshot = self._request_token_refresh(snapshot)
+            if refreshed:
+                self._token_state.publish(snapshot)
+            return refreshed, snapshot
+
+    def _request_token_refresh(self, snapshot):
         if not snapshot.get("client_id") or not snapshot.get("refresh_token"):
             return False, snapshot
         try:
@@ -520,7 +623,13 @@ class SpotifyWorker(QObject):
             return True, snapshot
         return self._refresh_access_token(snapshot)
 
-    def _api_request(self, snapshot, method, endpoint, params=None, json_data=None):
+    def _api_request(self, snapshot, method, endpoint, params=None, json_data=None, cache_ttl=None):
+        cache_key = None
+        if cache_ttl and method == "GET":
+            cache_key = self._cache_key(endpoint, params)
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                return True, cached, 200, snapshot
         ok, snapshot = self._ensure_access_token(snapshot)
         if not ok:
             return False, {}, 401, snapshot
@@ -529,25 +638,38 @@ class SpotifyWorker(QObject):
             headers["Content-Type"] = "application/json"
         url = f"https://api.spotify.com/v1{endpoint}"
         try:
-            response = requests.request(method, url, headers=headers, params=params, json=json_data, timeout=8)
+            session = self._http()
+            response = session.request(method, url, headers=headers, params=params, json=json_data, timeout=8)
             if response.status_code == 401:
                 refreshed, snapshot = self._refresh_access_token(snapshot)
                 if refreshed:
                     headers["Authorization"] = f"Bearer {snapshot.get('access_token', '')}"
-                    response = requests.request(method, url, headers=headers, params=params, json=json_data, timeout=8)
+                    response = session.request(method, url, headers=headers, params=params, json=json_data, timeout=8)
             if response.status_code == 204:
                 return True, {}, 204, snapshot
             body = response.json() if response.content else {}
-            return (200 <= response.status_code < 300), body, response.status_code, snapshot
+            ok = 200 <= response.status_code < 300
+            if ok and cache_key is not None:
+                self._response_cache.set(cache_key, body, cache_ttl)
+            return ok, body, response.status_code, snapshot
         except Exception as e:
             logger.warning(f"Spotify API request failed ({endpoint}): {e}")
             return False, {}, 0, snapshot
 
-    def _pick_image_url(self, images):
+    def _pick_image_url(self, images, size=funcs.ART_SIZE_LIST, prefetch=False):
+        """Local /art/ URL for the smallest Spotify image that still covers size px."""
         if not images:
             return ""
         try:
-            return images[-1].get("url", "") or images[0].get("url", "") or ""
+            candidates = [img for img in images if img and img.get("url")]
+            if not candidates:
+                return ""
+            covering = [img for img in candidates if int(img.get("width") or 0) >= size]
+            if covering:
+                best = min(covering, key=lambda img: int(img.get("width") or 0))
+            else:
+                best = max(candidates, key=lambda img: int(img.get("width") or 0))
+            return album_art_url(best.get("url", ""), size, prefetch=prefetch)
         except Exception:
             return ""
 
@@ -645,7 +767,7 @@ class SpotifyWorker(QObject):
             title = (item.get("name") or "").strip()
             show = (item.get("show") or {})
             subtitle = (show.get("name") or "").strip()
-            image_url = self._pick_image_url(show.get("images") or [])
+            image_url = self._pick_image_url(show.get("images") or [], funcs.ART_SIZE_QUEUE, prefetch=True)
             return {
                 "title": title,
                 "subtitle": subtitle,
@@ -657,7 +779,7 @@ class SpotifyWorker(QObject):
         artists = self._join_artists(item)
         album = item.get("album") or {}
         subtitle = artists or (album.get("name") or "").strip()
-        image_url = self._pick_image_url(album.get("images") or [])
+        image_url = self._pick_image_url(album.get("images") or [], funcs.ART_SIZE_QUEUE, prefetch=True)
         return {
             "title": title,
             "subtitle": subtitle,
@@ -726,7 +848,7 @@ class SpotifyWorker(QObject):
                 "title": item.get("name", "") or "Unknown Album",
                 "subtitle": artists or "Album",
                 "context": "Album",
-                "image_url": self._pick_image_url(item.get("images") or []),
+                "image_url": self._pick_image_url(item.get("images") or [], funcs.ART_SIZE_GRID),
                 "play_uri": item.get("uri", ""),
             }
         if entity_type == "playlist":
@@ -738,7 +860,7 @@ class SpotifyWorker(QObject):
                 "title": item.get("name", "") or "Unknown Playlist",
                 "subtitle": owner or "Playlist",
                 "context": "Playlist",
-                "image_url": self._pick_image_url(item.get("images") or []),
+                "image_url": self._pick_image_url(item.get("images") or [], funcs.ART_SIZE_GRID),
                 "play_uri": item.get("uri", ""),
             }
         if entity_type == "artist":
@@ -749,7 +871,7 @@ class SpotifyWorker(QObject):
                 "title": item.get("name", "") or "Unknown Artist",
                 "subtitle": "Artist",
                 "context": "",
-                "image_url": self._pick_image_url(item.get("images") or []),
+                "image_url": self._pick_image_url(item.get("images") or [], funcs.ART_SIZE_GRID),
                 "play_uri": item.get("uri", ""),
             }
         if entity_type == "podcast":
@@ -761,7 +883,7 @@ class SpotifyWorker(QObject):
                 "title": item.get("name", "") or "Unknown Podcast",
                 "subtitle": publisher or "Podcast",
                 "context": "Podcast",
-                "image_url": self._pick_image_url(item.get("images") or []),
+                "image_url": self._pick_image_url(item.get("images") or [], funcs.ART_SIZE_GRID),
                 "play_uri": item.get("uri", ""),
             }
         return {
@@ -783,8 +905,16 @@ class SpotifyWorker(QObject):
         if not (snapshot.get("access_token") or snapshot.get("refresh_token")):
             return self._result(snapshot, player_updates={"configured": True, "authenticated": False, "status": "Login to Spotify.", "queue_preview": "", "up_next_items": []})
 
+        # The poll scheduler decides whether devices/queue are worth fetching on this poll
+        include_devices = bool(payload.get("include_devices", True))
+        include_queue = bool(payload.get("include_queue", True))
+        api_calls = {"player": 1, "devices": 0, "queue": 0}
         ok, body, status_code, snapshot = self._api_request(snapshot, "GET", "/me/player")
-        devices, _, device_updates, snapshot = self._fetch_devices(snapshot)
+        if include_devices:
+            devices, _, device_updates, snapshot = self._fetch_devices(snapshot)
+            api_calls["devices"] = 1
+        else:
+            devices, device_updates = list(player.get("devices") or []), {}
         selected_device_id = (player.get("selected_device_id") or "").strip()
         current_device_id = (player.get("current_device_id") or "").strip()
         selected_device = next((d for d in devices if d.get("id") == selected_device_id), None)
@@ -802,7 +932,7 @@ class SpotifyWorker(QObject):
                 "status": "Spotify authorization required.",
                 "queue_preview": "",
                 "up_next_items": [],
-            }, save_tokens=save_tokens)
+            }, save_tokens=save_tokens, api_calls=api_calls)
 
         if not ok and status_code != 204:
             updates = {
@@ -818,7 +948,7 @@ class SpotifyWorker(QObject):
                 updates["status"] = self._error_message(body, f"Spotify player update failed (HTTP {status_code}).")
             elif "status" not in updates:
                 updates["status"] = "Spotify player update failed."
-            return self._result(snapshot, player_updates=updates, save_tokens=save_tokens)
+            return self._result(snapshot, player_updates=updates, save_tokens=save_tokens, api_calls=api_calls)
 
         if status_code == 204:
             return self._result(snapshot, player_updates={
@@ -832,15 +962,16 @@ class SpotifyWorker(QObject):
                 "selected_device_name": (selected_device or {}).get("name", ""),
                 "current_device_id": (current_device or {}).get("id", current_device_id),
                 "current_device_name": (current_device or {}).get("name", player.get("current_device_name", "")),
+                "track_uri": "",
                 "queue_preview": "",
                 "up_next_items": [],
-            }, save_tokens=save_tokens)
+            }, save_tokens=save_tokens, api_calls=api_calls)
 
         item = body.get("item") or {}
         artists = self._join_artists(item)
         images = ((item.get("album") or {}).get("images") or [])
-        album_art_small = images[-1].get("url") if images else ""
-        album_art_large = images[0].get("url") if images else ""
+        album_art_small = self._pick_image_url(images, funcs.ART_SIZE_PILL, prefetch=True)
+        album_art_large = self._pick_image_url(images, funcs.ART_SIZE_LARGE, prefetch=True)
         device = body.get("device") or {}
         active_device_id = (device.get("id") or "").strip()
         active_device_name = (device.get("name") or "").strip()
@@ -854,13 +985,18 @@ class SpotifyWorker(QObject):
             display_selected_name = active_device_name
         current_device_id = active_device_id or current_device_id
         current_device_name = active_device_name or (current_device or {}).get("name", player.get("current_device_name", ""))
-        queue_preview = ""
-        up_next_items = []
-        queue_ok, queue_body, _, snapshot = self._api_request(snapshot, "GET", "/me/player/queue")
-        if queue_ok:
-            queue_preview = self._queue_preview_text(queue_body, item)
-            up_next_items = self._get_formatted_queue_items(queue_body, item)
-        return self._result(snapshot, player_updates={
+        queue_updates = {}
+        queue_fetched = False
+        if include_queue:
+            api_calls["queue"] = 1
+            queue_fetched, queue_body, _, snapshot = self._api_request(snapshot, "GET", "/me/player/queue")
+            # A failed fetch keeps the current Up next list and is retried on the next poll
+            if queue_fetched:
+                queue_updates = {
+                    "queue_preview": self._queue_preview_text(queue_body, item),
+                    "up_next_items": self._get_formatted_queue_items(queue_body, item),
+                }
+        player_updates = {
             "configured": True,
             "authenticated": True,
             "is_playing": bool(body.get("is_playing")),
@@ -880,9 +1016,11 @@ class SpotifyWorker(QObject):
             "selected_device_name": display_selected_name,
             "current_device_id": current_device_id,
             "current_device_name": current_device_name,
-            "queue_preview": queue_preview,
-            "up_next_items": up_next_items,
-        }, save_tokens=save_tokens or selected_changed)
+            "track_uri": (item.get("uri") or "").strip(),
+        }
+        player_updates.update(queue_updates)
+        return self._result(snapshot, player_updates=player_updates, save_tokens=save_tokens or selected_changed,
+                            api_calls=api_calls, queue_fetched=queue_fetched)
 
     def _poll_relay_auth_result(self, snapshot):
         poll_url = snapshot.get("relay_poll_url", "") or ""
@@ -1113,6 +1251,8 @@ class SpotifyWorker(QObject):
         mode = payload.get("mode", "")
         if not uri:
             return self._result(snapshot)
+        # Starting playback reorders the user's recents, so cached /me/* library pages go stale
+        self._response_cache.invalidate(lambda key: key[0].startswith("/me/"))
         if mode == "track":
             logger.info("Spotify: track tap play requested")
             return self._start_playback(snapshot, {"uris": [uri]}, "track-tap")
@@ -1168,6 +1308,7 @@ class SpotifyWorker(QObject):
                 "type": "track,album,artist,playlist",
                 "limit": SPOTIFY_SEARCH_LIMIT,
             },
+            cache_ttl=SPOTIFY_SEARCH_CACHE_TTL_SECONDS,
         )
         if not ok:
             updates = {"authenticated": False, "status": "Spotify authorization required."} if status_code in (401, 403) else {}
@@ -1189,26 +1330,34 @@ class SpotifyWorker(QObject):
         if not (snapshot.get("access_token") or snapshot.get("refresh_token")):
             return self._result(snapshot, request_id=request_id, library={"playlists": [], "albums": [], "tracks": [], "podcasts": []})
         library = {"playlists": [], "albums": [], "tracks": [], "podcasts": []}
-        ok, body, _, snapshot = self._api_request(snapshot, "GET", "/me/playlists", params={"limit": 20})
-        if ok:
-            for playlist in body.get("items", []):
-                library["playlists"].append(self._format_entity(playlist, "playlist"))
-        ok, body, _, snapshot = self._api_request(snapshot, "GET", "/me/albums", params={"limit": 20})
-        if ok:
-            for item in body.get("items", []):
-                library["albums"].append(self._format_entity((item or {}).get("album") or {}, "album"))
-        ok, body, _, snapshot = self._api_request(snapshot, "GET", "/me/tracks", params={"limit": 30})
-        if ok:
-            for item in body.get("items", []):
-                library["tracks"].append(self._format_entity((item or {}).get("track") or {}, "track"))
-        ok, body, _, snapshot = self._api_request(snapshot, "GET", "/me/shows", params={"limit": 20})
-        if ok:
-            for item in body.get("items", []):
-                show = (item or {}).get("show") or {}
-                if show:
-                    library["podcasts"].append(self._format_entity(show, "podcast"))
+        # Refresh the token once up front so the parallel requests don't each refresh it
+        ok, snapshot = self._ensure_access_token(snapshot)
+        if not ok:
+            return self._result(snapshot, request_id=request_id, library=library)
+        futures = [
+            (key, self._fanout().submit(self._api_request, dict(snapshot), "GET", endpoint,
+                                        params, None, SPOTIFY_LIBRARY_CACHE_TTL_SECONDS))
+            for key, endpoint, params in SPOTIFY_LIBRARY_ENDPOINTS
+        ]
+        for key, future in futures:
+            ok, body, _, call_snapshot = future.result()
+            # Keep whichever token a 401 retry may have refreshed
+            if float(call_snapshot.get("expires_at", 0) or 0) > float(snapshot.get("expires_at", 0) or 0):
+                snapshot = call_snapshot
+            if ok:
+                library[key] = self._format_library_items(key, body)
         return self._result(snapshot, request_id=request_id, library=library)
 
+    def _format_library_items(self, key, body):
+        items = [item or {} for item in (body or {}).get("items", [])]
+        if key == "playlists":
+            return [self._format_entity(playlist, "playlist") for playlist in items]
+        if key == "albums":
+            return [self._format_entity(item.get("album") or {}, "album") for item in items]
+        if key == "tracks":
+            return [self._format_entity(item.get("track") or {}, "track") for item in items]
+        return [self._format_entity(item.get("show"), "podcast") for item in items if item.get("show")]
+
     def _op_item_tracks(self, payload):
         snapshot = self._snapshot(payload)
         request_id = int(payload.get("request_id", 0) or 0)
@@ -1218,11 +1367,13 @@ class SpotifyWorker(QObject):
         if not item_id:
             return self._result(snapshot, request_id=request_id, item_type=item_type, item_tracks=[])
         if item_type == "album":
-            ok, body, _, snapshot = self._api_request(snapshot, "GET", f"/albums/{item_id}/tracks", params={"limit": 50})
+            ok, body, _, snapshot = self._api_request(snapshot, "GET", f"/albums/{item_id}/tracks", params={"limit": 50},
+                                                     cache_ttl=SPOTIFY_ITEM_TRACKS_CACHE_TTL_SECONDS)
             tracks = [self._format_entity(t, "track") for t in body.get("items", []) if t] if ok else []
             return self._result(snapshot, request_id=request_id, item_type=item_type, item_tracks=tracks)
         if item_type == "playlist":
-            ok, body, _, snapshot = self._api_request(snapshot, "GET", f"/playlists/{item_id}/tracks", params={"limit": 50})
+            ok, body, _, snapshot = self._api_request(snapshot, "GET", f"/playlists/{item_id}/tracks", params={"limit": 50},
+                                                     cache_ttl=SPOTIFY_ITEM_TRACKS_CACHE_TTL_SECONDS)
             tracks = []
             if ok:
                 for item in body.get("items", []):
@@ -1231,7 +1382,8 @@ class SpotifyWorker(QObject):
                         tracks.append(self._format_entity(track, "track"))
             return self._result(snapshot, request_id=request_id, item_type=item_type, item_tracks=tracks)
         if item_type == "podcast":
-            ok, body, _, snapshot = self._api_request(snapshot, "GET", f"/shows/{item_id}/episodes", params={"limit": 50})
+            ok, body, _, snapshot = self._api_request(snapshot, "GET", f"/shows/{item_id}/episodes", params={"limit": 50},
+                                                     cache_ttl=SPOTIFY_ITEM_TRACKS_CACHE_TTL_SECONDS)
             episodes = []
             if ok:
                 for ep in body.get("items", []):
@@ -1243,7 +1395,7 @@ class SpotifyWorker(QObject):
                         "type": "episode",
                         "title": ep.get("name", "") or "Unknown Episode",
                         "subtitle": ep.get("description", "")[:80] if ep.get("description") else "",
-                        "image_url": self._pick_image_url(ep.get("images") or []),
+                        "image_url": self._pick_image_url(ep.get("images") or [], funcs.ART_SIZE_LIST),
                         "play_uri": ep.get("uri", ""),
                     })
             return self._result(snapshot, request_id=request_id, item_type=item_type, item_tracks=episodes)
@@ -1285,6 +1437,8 @@ class Backend(QObject):
     weatherChanged = pyqtSignal()
     weatherUpdated = pyqtSignal()
     launchesChanged = pyqtSignal()
+    launchDescriptionsChanged = pyqtSignal()
+    tickerTextChanged = pyqtSignal()
     chartViewModeChanged = pyqtSignal()
     chartTypeChanged = pyqtSignal()
     f1Changed = pyqtSignal() # Kept for potential future use or to avoid breaking QML bindings if they exist but weren't found
@@ -1297,6 +1451,7 @@ class Backend(QObject):
     wifiConnectingChanged = pyqtSignal()
     rememberedNetworksChanged = pyqtSignal()
     networkConnectedChanged = pyqtSignal()
+    connectivityPublished = pyqtSignal(bool)
     loadingFinished = pyqtSignal()
     # New signals for signal-based startup flow
     launchCacheReady = pyqtSignal()
@@ -1340,6 +1495,7 @@ class Backend(QObject):
     updatingStatusChanged = pyqtSignal()
     # Signal for thread-safe WiFi status updates
     wifiCheckReady = pyqtSignal(bool, str)
+    wifiMonitorEvent = pyqtSignal(str)
     touchCalibrationExistsChanged = pyqtSignal()
     calibrationStarted = pyqtSignal()
     calibrationFinished = pyqtSignal()
@@ -1351,6 +1507,7 @@ class Backend(QObject):
     spotifySearchResultsChanged = pyqtSignal()
     spotifyLibraryItemTracksChanged = pyqtSignal()
     spotifyWorkerRequested = pyqtSignal(str, object)
+    spotifyLibraryWorkerRequested = pyqtSignal(str, object)
 
     def __init__(self, initial_wifi_connected=False, initial_wifi_ssid=""):
         super().__init__()
@@ -1378,37 +1535,54 @@ class Backend(QObject):
         profiler.mark("Backend: isLoading=True set")
         self._online_load_in_progress = False
         self._is_high_resolution = False # Added to ensure property availability
-        # Try to load initial data from cache to avoid empty UI on first load
+        # Derived-state memos; seeded from the boot snapshot and cleared by _clear_launch_caches
+        self._timeline_cache = None
+        self._default_trajectory = None
+        self._selected_launch_mission = ""  # Track which launch is currently selected
+        self._boot_snapshot_timer = None
+        # Warm boot: the snapshot carries everything the first frame needs, so it is
+        # applied before any other cache I/O and the per-cache loads below are skipped.
+        self._boot_snapshot = None
         try:
-            profiler.mark("Backend: Loading Launch Cache Start")
-            prev = load_launch_cache('previous')
-            up = load_launch_cache('upcoming')
-            self._launch_data = {
-                'previous': prev['data'] if prev else [],
-                'upcoming': up['data'] if up else []
-            }
-            profiler.mark("Backend: Loading Launch Cache End")
+            self._boot_snapshot = load_boot_snapshot(self._tz, self._location, self._mode, self._event_type)
         except Exception as e:
-            logger.warning(f"Failed to load initial launch cache: {e}")
-            self._launch_data = {'previous': [], 'upcoming': []}
-        
-        profiler.mark("Backend: get_closest_x_video_url Start")
-        self._live_launch_url = get_closest_x_video_url(self._launch_data)
-        profiler.mark("Backend: get_closest_x_video_url End")
+            logger.warning(f"Failed to load boot snapshot: {e}")
+        if self._boot_snapshot:
+            self._apply_boot_snapshot_state(self._boot_snapshot)
+        else:
+            # Try to load initial data from cache to avoid empty UI on first load
+            try:
+                profiler.mark("Backend: Loading Launch Cache Start")
+                prev = load_launch_cache('previous')
+                up = load_launch_cache('upcoming')
+                self._launch_data = {
+                    'previous': prev['data'] if prev else [],
+                    'upcoming': up['data'] if up else []
+                }
+                profiler.mark("Backend: Loading Launch Cache End")
+            except Exception as e:
+                logger.warning(f"Failed to load initial launch cache: {e}")
+                self._launch_data = {'previous': [], 'upcoming': []}
+
+            profiler.mark("Backend: get_closest_x_video_url Start")
+            self._live_launch_url = get_closest_x_video_url(self._launch_data)
+            profiler.mark("Backend: get_closest_x_video_url End")
+            self._weather_data = {}
+            try:
+                profiler.mark("Backend: Loading Weather Cache Start")
+                weather_cache = load_cache_from_file(CACHE_FILE_WEATHER)
+                if weather_cache and 'data' in weather_cache:
+                    self._weather_data = weather_cache['data']
+                    logger.info(f"Backend: Loaded cached weather for {len(self._weather_data)} locations")
+                    # Force timestamp update to ensure UI sees recent data if cache is fresh
+                    if 'timestamp' in weather_cache:
+                        logger.info(f"Backend: Weather cache timestamp: {weather_cache['timestamp']}")
+                profiler.mark("Backend: Loading Weather Cache End")
+            except Exception as e:
+                logger.debug(f"Failed to load initial weather cache: {e}")
         self._launch_descriptions = LAUNCH_DESCRIPTIONS
-        self._weather_data = {}
-        try:
-            profiler.mark("Backend: Loading Weather Cache Start")
-            weather_cache = load_cache_from_file(CACHE_FILE_WEATHER)
-            if weather_cache and 'data' in weather_cache:
-                self._weather_data = weather_cache['data']
-                logger.info(f"Backend: Loaded cached weather for {len(self._weather_data)} locations")
-                # Force timestamp update to ensure UI sees recent data if cache is fresh
-                if 'timestamp' in weather_cache:
-                    logger.info(f"Backend: Weather cache timestamp: {weather_cache['timestamp']}")
-            profiler.mark("Backend: Loading Weather Cache End")
-        except Exception as e:
-            logger.debug(f"Failed to load initial weather cache: {e}")
+        self._ticker_text = build_ticker_text(self._launch_descriptions)
+        self._ticker_text_width = None  # measured on first read, once fonts are loaded
 
         self._spotify_client_id = (os.environ.get("SPOTIFY_CLIENT_ID") or "237156c29da8493e88f4de326f4768f1").strip()
         self._spotify_client_secret = (os.environ.get("SPOTIFY_CLIENT_SECRET") or "").strip()
@@ -1456,7 +1630,9 @@ class Backend(QObject):
             "current_device_name": "",
             "queue_preview": "",
             "up_next_items": [],
+            "track_uri": "",
         }
+        self._spotify_poll_scheduler = SpotifyPollScheduler()
         self._spotify_library = {"playlists": [], "albums": [], "tracks": [], "podcasts": []}
         self._spotify_search_results = []
         self._spotify_library_item_tracks = []
@@ -1475,6 +1651,11 @@ class Backend(QObject):
         self._spotify_item_tracks_expected_request_id = 0
 
         self._weather_forecast_model = WeatherForecastModel()
+        # Per-field weather values for QML; each key notifies on its own
+        self._weather_view = WeatherViewModel()
+        self._weather_view_map = QQmlPropertyMap(self)
+        for key, value in self._weather_view.fields.items():
+            self._weather_view_map.insert(key, value)
         # Seed the forecast model from cache immediately if available
         if self._weather_data:
             self._on_weather_updated(self._weather_data)
@@ -1482,17 +1663,22 @@ class Backend(QObject):
         self._radar_base_url = radar_locations.get(self._location, radar_locations.get('Starbase', ''))
         self._f1_data = {'schedule': [], 'standings': [], 'drivers': [], 'constructors': []}
         profiler.mark("Backend: Initializing EventModel Start")
-        self._event_model = EventModel(self._launch_data, self._mode, self._event_type, self._tz)
+        snapshot_rows = self._boot_snapshot.get('event_rows') if self._boot_snapshot else None
+        self._event_model = EventModel(self._launch_data, self._mode, self._event_type, self._tz,
+                                       grouped_data=snapshot_rows)
         profiler.mark("Backend: Initializing EventModel End")
-        self._launch_trends_cache = {}  # Cache for launch trends series
         self._first_weather_fetched = False
-        try:
-            trends_cache = load_cache_from_file(RUNTIME_CACHE_FILE_CHART_TRENDS)
-            if trends_cache:
-                self._launch_trends_cache = trends_cache['data']
-                logger.info("Backend: Loaded launch trends cache from disk")
-        except Exception as e:
-            logger.debug(f"Failed to load launch trends cache: {e}")
+        # Cached live wind is stale; show METAR until the first real fetch
+        self._refresh_weather_view()
+        if not self._boot_snapshot:
+            self._launch_trends_cache = {}  # Cache for launch trends series
+            try:
+                trends_cache = load_cache_from_file(RUNTIME_CACHE_FILE_CHART_TRENDS)
+                if trends_cache:
+                    self._launch_trends_cache = trends_cache['data']
+                    logger.info("Backend: Loaded launch trends cache from disk")
+            except Exception as e:
+                logger.debug(f"Failed to load launch trends cache: {e}")
         # Platform-aware defaults for resolution and scaling
         detected_w, detected_h = get_rpi_config_resolution()
         is_small_display = (os.environ.get("DASHBOARD_WIDTH") == "1480" or detected_w == 1480 or detected_h == 320)
@@ -1551,7 +1737,19 @@ class Backend(QObject):
         self._display_settings_timer.setSingleShot(True)
         self._display_settings_timer.timeout.connect(self._apply_display_settings)
 
+        # DDC/CI worker for the large display; the Waveshare backlight goes through sysfs
+        self._display_control = None
+        self._persisted_display_settings = {}
+        # Discrete codes the monitor has actually reported or accepted this session
+        self._confirmed_display_choices = {}
         if self._is_large_display and not IS_WINDOWS:
+            self._display_control = DisplayControl()
+            # Show the last applied values straight away; the monitor is reconciled in the background
+            self._persisted_display_settings = load_display_settings()
+            for key, value in self._persisted_display_settings.items():
+                setattr(self, f"_{key}", value)
+                if key in DISPLAY_SETTINGS_SLIDERS:
+                    setattr(self, f"_target_{key}", value)
             QTimer.singleShot(5000, self._initial_display_settings_fetch)
         
         # Support logical scaling for High DPI displays
@@ -1569,13 +1767,14 @@ class Backend(QObject):
             logger.warning(f"Backend: Invalid DASHBOARD_SCALE value: {scale_str}")
             scale = 1.0
 
-        try:
-            cal_cache = load_cache_from_file(RUNTIME_CACHE_FILE_CALENDAR)
-            if cal_cache:
-                self._launches_by_date_cache = cal_cache['data']
-                logger.info("Backend: Loaded calendar cache from disk")
-        except Exception as e:
-            logger.debug(f"Failed to load calendar cache: {e}")
+        if not self._boot_snapshot:
+            try:
+                cal_cache = load_cache_from_file(RUNTIME_CACHE_FILE_CALENDAR)
+                if cal_cache:
+                    self._launches_by_date_cache = cal_cache['data']
+                    logger.info("Backend: Loaded calendar cache from disk")
+            except Exception as e:
+                logger.debug(f"Failed to load calendar cache: {e}")
         self._precomputing_calendar = False
         self._precomputing_trends = False
         self._update_available = False
@@ -1587,7 +1786,11 @@ class Backend(QObject):
         # Throttle web content reload signals to avoid flapping-induced UI hiccups
         self._last_web_reload_emit = 0.0
         self._min_reload_emit_interval_sec = 8.0
-        self._last_live_url_update = 0.0
+        # Nearest X stream lookup: the index is rebuilt when launch data changes and
+        # rechecked only once the clock passes the point where the nearest launch can flip
+        self._live_stream_index = None
+        self._live_url_checked_at = 0.0
+        self._live_url_recheck_at = 0.0
         self._last_tray_visible = False
         
         # WiFi properties - initialize with provided values
@@ -1615,17 +1818,23 @@ class Backend(QObject):
         self._network_connected = bool(initial_wifi_connected)
         self._last_network_check = None
         self._network_check_in_progress = False
+        # Probe results arrive on whichever thread ran the check; the queued
+        # signal hops them onto the main thread.
+        self.connectivityPublished.connect(self._on_connectivity_published)
+        self._unsubscribe_connectivity = connectivity_bus.subscribe(
+            lambda state: self.connectivityPublished.emit(bool(state['online'])))
 
         # Update progress UI state
         self._updating_in_progress = False
         self._updating_status = ""
         self._update_log_timer = None
+        self._update_log_tail = None  # LogTailFollower for the current update run
+        self._update_log_notifier = None  # QSocketNotifier on the follower's inotify fd
         self._update_log_path = '/tmp/spacex-dashboard-update.log' if platform.system() == 'Linux' else None
         self._updater_pid = None  # PID of detached update script for cancellation on Linux
 
         # Initialize videoUrl to a safe default while HTTP server starts
         self._video_url = ""
-        self._selected_launch_mission = ""  # Track which launch is currently selected
         self._http_ready_timer = QTimer(self)
         self._http_ready_timer.setInterval(100)
         self._http_ready_timer.timeout.connect(self._check_http_server_ready)
@@ -1654,6 +1863,17 @@ class Backend(QObject):
         except Exception:
             pass
 
+        # Main-thread heartbeat for the stall watchdog; a late beat means this thread was blocked
+        # (DASHBOARD_STALL_THRESHOLD_MS=0 disables both)
+        self._stall_heartbeat_timer = None
+        if stall_detector.threshold_ms > 0:
+            self._stall_heartbeat_timer = QTimer(self)
+            self._stall_heartbeat_timer.setTimerType(Qt.TimerType.PreciseTimer)
+            self._stall_heartbeat_timer.setInterval(STALL_HEARTBEAT_MS)
+            self._stall_heartbeat_timer.timeout.connect(stall_detector.beat)
+            self._stall_heartbeat_timer.start()
+            stall_detector.start()
+
         self._time_timer = QTimer(self)
         self._time_timer.setInterval(5000)  # Increased from 1000ms for performance - time display updates every 5 seconds
         self._time_timer.timeout.connect(self.update_time)
@@ -1689,6 +1909,16 @@ class Backend(QObject):
             self.wifiScanResultsReady.connect(self._apply_wifi_scan_results)
         except Exception as _e:
             logger.debug(f"Could not connect wifiScanResultsReady signal: {_e}")
+        # Event-driven Wi‑Fi state from NetworkManager over D-Bus; the nmcli
+        # polling path (wifi_timer) only runs when the monitor can't start.
+        self._wifi_monitor = None
+        self._wifi_networks_timer = QTimer(self)
+        self._wifi_networks_timer.setSingleShot(True)
+        self._wifi_networks_timer.setInterval(300)  # coalesce bursts of AccessPointAdded after a scan
+        self._wifi_networks_timer.timeout.connect(self._apply_wifi_monitor_networks)
+        self.wifiMonitorEvent.connect(self._on_wifi_monitor_event)
+        if not IS_WINDOWS:
+            threading.Thread(target=self._start_wifi_monitor, name="wifi-monitor-start", daemon=True).start()
         # Boot guard timer placeholder
         self._initial_checks_guard_timer = None
         
@@ -2000,7 +2230,8 @@ class Backend(QObject):
         # WiFi timer for status updates - check every 60 seconds
         self.wifi_timer = QTimer(self)
         self.wifi_timer.timeout.connect(self.update_wifi_status)
-        self.wifi_timer.start(60000)
+        if self._wifi_monitor is None:
+            self.wifi_timer.start(60000)
 
         # Update check timer - check every 6 hours (21600000 ms)
         self.update_check_timer = QTimer(self)
@@ -2017,9 +2248,11 @@ class Backend(QObject):
         self.countdown_timer.timeout.connect(self.update_countdown)
         self.countdown_timer.start(1000)
 
+        # Single-shot: each finished poll reschedules itself from SpotifyPollScheduler
         self.spotify_timer = QTimer(self)
+        self.spotify_timer.setSingleShot(True)
         self.spotify_timer.timeout.connect(self.update_spotify_player)
-        self.spotify_timer.start(5000)
+        self.spotify_timer.start(SPOTIFY_POLL_MIN_MS)
 
         self.spotify_progress_timer = QTimer(self)
         self.spotify_progress_timer.timeout.connect(self._tick_spotify_progress)
@@ -2128,17 +2361,32 @@ class Backend(QObject):
         self._spotify_access_token = ""
         self._spotify_refresh_token = ""
         self._spotify_token_expires_at = 0.0
+        if getattr(self, "_spotify_token_state", None) is not None:
+            self._spotify_token_state.reset()
         self._save_spotify_tokens()
 
     def _setup_spotify_worker(self):
+        # Two lanes sharing one response cache: player polls/commands on one thread,
+        # library/search/item-track loads on the other.
+        # Both lanes also share the token state so only one of them refreshes at a time
+        self._spotify_response_cache = TTLCache(SPOTIFY_RESPONSE_CACHE_MAX_ENTRIES)
+        self._spotify_token_state = SpotifyTokenState()
         self._spotify_worker_thread = QThread(self)
-        self._spotify_worker = SpotifyWorker()
+        self._spotify_worker = SpotifyWorker(self._spotify_response_cache, self._spotify_token_state)
         self._spotify_worker.moveToThread(self._spotify_worker_thread)
         self.spotifyWorkerRequested.connect(self._spotify_worker.execute)
         self._spotify_worker.completed.connect(self._on_spotify_worker_completed)
         self._spotify_worker_thread.finished.connect(self._spotify_worker.deleteLater)
         self._spotify_worker_thread.start()
 
+        self._spotify_library_worker_thread = QThread(self)
+        self._spotify_library_worker = SpotifyWorker(self._spotify_response_cache, self._spotify_token_state)
+        self._spotify_library_worker.moveToThread(self._spotify_library_worker_thread)
+        self.spotifyLibraryWorkerRequested.connect(self._spotify_library_worker.execute)
+        self._spotify_library_worker.completed.connect(self._on_spotify_worker_completed)
+        self._spotify_library_worker_thread.finished.connect(self._spotify_library_worker.deleteLater)
+        self._spotify_library_worker_thread.start()
+
     def _spotify_worker_snapshot(self):
         return {
             "client_id": self._spotify_client_id,
@@ -2157,9 +2405,14 @@ class Backend(QObject):
         }
 
     def _dispatch_spotify_worker(self, operation, **payload):
+        if operation in ("command", "playback", "select_device"):
+            self._spotify_poll_scheduler.note_command()
         worker_payload = dict(payload or {})
         worker_payload["snapshot"] = self._spotify_worker_snapshot()
-        self.spotifyWorkerRequested.emit(operation, worker_payload)
+        if operation in SPOTIFY_LIBRARY_OPERATIONS:
+            self.spotifyLibraryWorkerRequested.emit(operation, worker_payload)
+        else:
+            self.spotifyWorkerRequested.emit(operation, worker_payload)
 
     def _set_spotify_library(self, library):
         normalized = library or {"playlists": [], "albums": [], "tracks": [], "podcasts": []}
@@ -2182,12 +2435,18 @@ class Backend(QObject):
             self.spotifyLibraryItemTracksChanged.emit()
 
     def _clear_spotify_async_collections(self):
+        # Cached responses belong to the account that just went away
+        self._spotify_response_cache.invalidate()
         self._set_spotify_library({"playlists": [], "albums": [], "tracks": [], "podcasts": []})
         self._set_spotify_search_results([])
         self._set_spotify_library_item_tracks([])
 
     def _apply_spotify_tokens_from_result(self, payload):
         tokens = (payload or {}).get("tokens") or {}
+        # Results from the two lanes can land out of order; a slower one must not
+        # put back tokens that a later refresh has already replaced
+        if float(tokens.get("expires_at", 0) or 0) <= float(self._spotify_token_expires_at or 0):
+            return False
         changed = False
         access_token = tokens.get("access_token", self._spotify_access_token) or ""
         refresh_token = tokens.get("refresh_token", self._spotify_refresh_token) or ""
@@ -2252,9 +2511,13 @@ class Backend(QObject):
         if operation == "refresh_player":
             self._spotify_refresh_inflight = False
             self._apply_spotify_operation_result(payload)
+            self._spotify_poll_scheduler.record_result(self._spotify_player, payload.get("api_calls"),
+                                                      queue_fetched=bool(payload.get("queue_fetched")))
             if self._spotify_refresh_pending:
                 self._spotify_refresh_pending = False
                 QTimer.singleShot(0, self.update_spotify_player)
+            else:
+                self._schedule_next_spotify_poll()
             return
         if operation == "poll_auth":
             self._spotify_auth_poll_inflight = False
@@ -2412,7 +2675,19 @@ class Backend(QObject):
             return
         self._spotify_refresh_inflight = True
         self._spotify_refresh_pending = False
-        self._dispatch_spotify_worker("refresh_player")
+        plan = self._spotify_poll_scheduler.plan_poll(self._spotify_player)
+        self._dispatch_spotify_worker("refresh_player", **plan)
+
+    def _schedule_next_spotify_poll(self):
+        timer = getattr(self, 'spotify_timer', None)
+        if timer is None:
+            return
+        timer.start(self._spotify_poll_scheduler.next_delay_ms(self._spotify_player))
+
+    @pyqtSlot(result=QVariant)
+    def spotifyPollStats(self):
+        """Spotify poll/API call counters (calls per endpoint and per hour)."""
+        return self._spotify_poll_scheduler.stats()
 
     @pyqtSlot(result=QVariant)
     def spotifyGetDevices(self):
@@ -2581,12 +2856,29 @@ class Backend(QObject):
 
     @pyqtSlot()
     def shutdown(self):
-        try:
-            if hasattr(self, '_spotify_worker_thread') and self._spotify_worker_thread and self._spotify_worker_thread.isRunning():
-                self._spotify_worker_thread.quit()
-                self._spotify_worker_thread.wait(2000)
-        except Exception as e:
-            logger.debug(f"Failed to stop Spotify worker thread cleanly: {e}")
+        stall_detector.stop()
+        if getattr(self, "_display_control", None) is not None:
+            self._display_control.stop()
+        unsubscribe = getattr(self, "_unsubscribe_connectivity", None)
+        if unsubscribe:
+            unsubscribe()
+        if getattr(self, "_wifi_monitor", None) is not None:
+            self._wifi_monitor = None
+            stop_wifi_monitor()
+        for worker_attr, thread_attr in (("_spotify_worker", "_spotify_worker_thread"),
+                                         ("_spotify_library_worker", "_spotify_library_worker_thread")):
+            try:
+                worker = getattr(self, worker_attr, None)
+                if worker is not None:
+                    worker.close()
+                thread = getattr(self, thread_attr, None)
+                if thread and thread.isRunning():
+                    thread.quit()
+                    thread.wait(2000)
+            except Exception as e:
+                logger.debug(f"Failed to stop Spotify worker thread cleanly: {e}")
+        # Write-behind cache saves must reach the disk before the process exits
+        cache_writer.flush()
 
     @pyqtProperty(int, notify=modeChanged)
     def httpPort(self):
@@ -2774,29 +3066,50 @@ class Backend(QObject):
                 pass
 
     def _start_update_progress_ui(self):
-        """Show an in-app updating overlay and begin polling the updater log for progress."""
+        """Show an in-app updating overlay and begin following the updater log for progress."""
         try:
             self._set_updating_status("Starting updater…")
             self._set_updating_in_progress(True)
+            # Follow the log from scratch for this run; with inotify the notifier
+            # drives polls and the timer only backs it up
+            self._stop_update_log_tail()
+            self._update_log_tail = LogTailFollower(self._update_log_path, use_inotify=True)
+            fd = self._update_log_tail.fileno()
+            if fd is not None:
+                self._update_log_notifier = QSocketNotifier(fd, QSocketNotifier.Type.Read, self)
+                self._update_log_notifier.activated.connect(self._poll_update_log)
             # Start (or restart) a timer to poll the log
             if self._update_log_timer is None:
                 self._update_log_timer = QTimer(self)
                 self._update_log_timer.timeout.connect(self._poll_update_log)
             # Poll quickly at first to catch early messages
-            self._update_log_timer.start(750)
+            self._update_log_timer.start(750 if fd is None else 5000)
+            self._poll_update_log()
         except Exception as e:
             logger.warning(f"Failed to start update progress UI: {e}")
 
-    def _poll_update_log(self):
-        """Read the last lines from the update log and reflect them into the UI."""
+    def _stop_update_log_tail(self):
+        if self._update_log_notifier is not None:
+            self._update_log_notifier.setEnabled(False)
+            self._update_log_notifier.deleteLater()
+            self._update_log_notifier = None
+        if self._update_log_tail is not None:
+            self._update_log_tail.close()
+            self._update_log_tail = None
+
+    def _poll_update_log(self, *_):
+        """Read new lines from the update log and reflect the tail into the UI when it changes."""
         try:
             if not self._updating_in_progress:
                 if self._update_log_timer and self._update_log_timer.isActive():
                     self._update_log_timer.stop()
+                self._stop_update_log_tail()
                 return
-            
-            tail = get_update_progress_summary(self._update_log_path)
-            self._set_updating_status(tail)
+
+            if self._update_log_tail is None:
+                self._update_log_tail = LogTailFollower(self._update_log_path)
+            if self._update_log_tail.poll():
+                self._set_updating_status(self._update_log_tail.summary)
 
             # If the script has reached the reboot step, keep showing status
             # The system will reboot shortly and the app will close.
@@ -2954,7 +3267,7 @@ class Backend(QObject):
         if self._color_preset != value:
             self._color_preset = value
             self.colorPresetChanged.emit()
-            self._set_setting_on_hardware("14", value)
+            self._set_setting_on_hardware(DDC_VCP_COLOR_PRESET, "color_preset", value)
 
     @pyqtSlot(float)
     def setVideoGainRed(self, value):
@@ -2997,14 +3310,14 @@ class Backend(QObject):
         if self._input_source != value:
             self._input_source = value
             self.inputSourceChanged.emit()
-            self._set_setting_on_hardware("60", value)
+            self._set_setting_on_hardware(DDC_VCP_INPUT_SOURCE, "input_source", value)
 
     @pyqtSlot(str)
     def setPowerMode(self, value):
         if self._power_mode != value:
             self._power_mode = value
             self.powerModeChanged.emit()
-            self._set_setting_on_hardware("D6", value)
+            self._set_setting_on_hardware(DDC_VCP_POWER_MODE, "power_mode", value)
 
     def _apply_brightness(self):
         """Triggered by debounce timer to ensure the latest target is set on hardware."""
@@ -3013,63 +3326,76 @@ class Backend(QObject):
 
     def _apply_display_settings(self):
         """Debounced applicator for multi-value slider settings (Contrast, RGB, Sharpness)."""
-        if IS_WINDOWS or not self._is_large_display:
+        if self._display_control is None:
             return
 
-        def _worker():
-            with self._brightness_lock:
-                targets = [
-                    ("12", self._target_contrast, "_last_applied_contrast"),
-                    ("16", self._target_video_gain_red, "_last_applied_video_gain_red"),
-                    ("18", self._target_video_gain_green, "_last_applied_video_gain_green"),
-                    ("1A", self._target_video_gain_blue, "_last_applied_video_gain_blue"),
-                    ("87", self._target_sharpness, "_last_applied_sharpness"),
-                ]
-                
-                for vcp, target_val, last_attr in targets:
-                    last_val = getattr(self, last_attr)
-                    if target_val != last_val:
-                        # Scale 0-100 to 0-31 for this monitor's quirks
-                        hw_val = int(round(target_val * 31 / 100))
-                        cmd = f"/usr/bin/ddcutil setvcp {vcp} {hw_val} --bus=13 --noverify --mccs 2.2"
-                        try:
-                            result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=10)
-                            if result.returncode == 0:
-                                setattr(self, last_attr, target_val)
-                                logger.info(f"Backend: Set VCP {vcp} to {hw_val} (UI: {target_val})")
-                            else:
-                                logger.error(f"Backend: ddcutil VCP {vcp} failed: {result.stderr.strip()}")
-                        except Exception as e:
-                            logger.error(f"Backend: Exception setting VCP {vcp}: {e}")
+        targets = [
+            (DDC_VCP_CONTRAST, self._target_contrast, "_last_applied_contrast"),
+            (DDC_VCP_GAIN_RED, self._target_video_gain_red, "_last_applied_video_gain_red"),
+            (DDC_VCP_GAIN_GREEN, self._target_video_gain_green, "_last_applied_video_gain_green"),
+            (DDC_VCP_GAIN_BLUE, self._target_video_gain_blue, "_last_applied_video_gain_blue"),
+            (DDC_VCP_SHARPNESS, self._target_sharpness, "_last_applied_sharpness"),
+        ]
+        for vcp, target_val, last_attr in targets:
+            if target_val != getattr(self, last_attr):
+                self._queue_vcp_write(vcp, target_val, last_attr)
+
+    def _queue_vcp_write(self, vcp, ui_value, last_attr):
+        """Queue a 0-100 slider value; the display worker keeps only the latest per code."""
+        # Scale 0-100 to 0-31 for this monitor's quirks
+        hw_val = int(round(ui_value * 31 / 100))
+
+        def _done(ok):
+            if ok:
+                setattr(self, last_attr, ui_value)
+                logger.info(f"Backend: Set VCP {vcp:02X} to {hw_val} (UI: {ui_value})")
+                self._persist_display_settings()
 
-        threading.Thread(target=_worker, daemon=True).start()
+        self._display_control.set(vcp, hw_val, _done)
+
+    def _set_setting_on_hardware(self, vcp, key, value):
+        """Direct applicator for discrete settings (non-debounced).
 
-    def _set_setting_on_hardware(self, vcp, value):
-        """Direct applicator for discrete settings (non-debounced)."""
-        if IS_WINDOWS or not self._is_large_display:
+        value is the two-digit hex string the QML option lists use, e.g. "11" for HDMI 1;
+        key is its DISPLAY_SETTINGS_CHOICES name, recorded once the monitor accepts it.
+        """
+        if self._display_control is None:
             return
-        
-        def _worker():
-            with self._brightness_lock:
-                cmd = f"/usr/bin/ddcutil setvcp {vcp} {value} --bus=13 --noverify --mccs 2.2"
-                try:
-                    result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=10)
-                    if result.returncode == 0:
-                        logger.info(f"Backend: Successfully set VCP {vcp} to {value}")
-                    else:
-                        logger.error(f"Backend: ddcutil setvcp {vcp} failed: {result.stderr.strip()}")
-                except Exception as e:
-                    logger.error(f"Backend: Exception setting VCP {vcp}: {e}")
-        
-        threading.Thread(target=_worker, daemon=True).start()
+        try:
+            hw_val = int(value, 16)
+        except ValueError:
+            logger.error(f"Backend: Invalid value {value!r} for VCP {vcp:02X}")
+            return
+
+        def _done(ok):
+            if ok:
+                logger.info(f"Backend: Successfully set VCP {vcp:02X} to {value}")
+                self._confirmed_display_choices[key] = value
+                self._persist_display_settings()
+
+        self._display_control.set(vcp, hw_val, _done)
 
     def set_brightness_on_hardware(self, value):
         if IS_WINDOWS:
             logger.info(f"Backend: Simulation: Setting brightness to {value}%")
             return
 
+        if self._is_large_display:
+            to_set = self._target_brightness
+            # Don't repeat the same value if we just set it successfully
+            if to_set == self._last_applied_brightness:
+                logger.debug(f"Backend: Skipping redundant hardware set for {to_set}%")
+                return
+            if self._display_control is not None:
+                # DFR1125 4K monitor on bus 13 (as verified)
+                # Root cause identified: Monitor VCP feature 10 actually uses a 0-31 scale
+                # but reports 0-100. Values above 31 wrap around (32=0, 33=1, etc.).
+                # _queue_vcp_write scales our 0-100% slider value to 0-31 for the hardware.
+                self._queue_vcp_write(DDC_VCP_BRIGHTNESS, to_set, "_last_applied_brightness")
+            return
+
         def _worker():
-            # Use a lock to ensure only one ddcutil process runs at a time
+            # Use a lock to ensure only one backlight write runs at a time
             with self._brightness_lock:
                 to_set = self._target_brightness
                 
@@ -3079,36 +3405,13 @@ class Backend(QObject):
                     return
 
                 try:
-                    if self._is_large_display:
-                        # DFR1125 4K monitor on bus 13 (as verified)
-                        # Root cause identified: Monitor VCP feature 10 actually uses a 0-31 scale
-                        # but reports 0-100. Values above 31 wrap around (32=0, 33=1, etc.).
-                        # We must scale our 0-100% slider value to 0-31 for the hardware.
-                        hw_value = int(round(to_set * 31 / 100))
-                        
-                        # Added --noverify to speed up command execution
-                        # Added --mccs 2.2 to avoid auto-detection overhead
-                        cmd = f"/usr/bin/ddcutil setvcp 10 {hw_value} --bus=13 --noverify --mccs 2.2"
-                        logger.debug(f"Backend: Executing hardware command: {cmd} (UI value: {to_set}%)")
-                        
-                        # Use a reasonable timeout
-                        result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=10)
-                        
-                        if result.returncode == 0:
-                            self._last_applied_brightness = to_set
-                            logger.info(f"Backend: Successfully set DFR1125 hardware brightness to {hw_value} (UI: {to_set}%)")
-                        else:
-                            logger.error(f"Backend: ddcutil failed with code {result.returncode}: {result.stderr.strip()}")
-                    else:
-                        # Waveshare display
-                        backlight_path = "/sys/class/backlight/rpi_backlight/brightness"
-                        if os.path.exists(backlight_path):
-                            hw_val = int(to_set * 2.55)
-                            subprocess.run(f"echo {hw_val} | sudo tee {backlight_path}", shell=True, check=True, capture_output=True)
-                            self._last_applied_brightness = to_set
-                            logger.info(f"Backend: Set Waveshare backlight to {hw_val}")
-                except subprocess.TimeoutExpired:
-                    logger.error("Backend: ddcutil command timed out")
+                    # Waveshare display
+                    backlight_path = "/sys/class/backlight/rpi_backlight/brightness"
+                    if os.path.exists(backlight_path):
+                        hw_val = int(to_set * 2.55)
+                        subprocess.run(f"echo {hw_val} | sudo tee {backlight_path}", shell=True, check=True, capture_output=True)
+                        self._last_applied_brightness = to_set
+                        logger.info(f"Backend: Set Waveshare backlight to {hw_val}")
                 except Exception as e:
                     logger.error(f"Backend: Failed to set brightness to {to_set}: {e}")
 
@@ -3116,114 +3419,83 @@ class Backend(QObject):
         threading.Thread(target=_worker, daemon=True).start()
 
     def _initial_display_settings_fetch(self):
-        if IS_WINDOWS or not self._is_large_display:
+        if self._display_control is None:
             return
+        # One batched DDC/CI session instead of a ddcutil process per code
+        self._display_control.read_all(DDC_DISPLAY_VCP_CODES, self._apply_display_readings)
 
-        def _worker():
-            try:
-                with self._brightness_lock:
-                    # Brightness (10)
-                    cmd = "/usr/bin/ddcutil getvcp 10 --bus=13 --brief"
-                    result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=10)
-                    if result.returncode == 0:
-                        parts = result.stdout.strip().split()
-                        if len(parts) >= 4 and parts[0] == "VCP" and parts[1] == "10":
-                            try:
-                                val = int(parts[3])
-                                ui_val = min(100, max(0, int(round(val * 100 / 31))))
-                                self._brightness = ui_val
-                                self._last_applied_brightness = ui_val
-                                self._target_brightness = ui_val
-                                self.brightnessChanged.emit()
-                                logger.info(f"Backend: Initial brightness fetched: {ui_val}%")
-                            except ValueError: pass
-
-                    # Contrast (12)
-                    cmd = "/usr/bin/ddcutil getvcp 12 --bus=13 --brief"
-                    result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=10)
-                    if result.returncode == 0:
-                        parts = result.stdout.strip().split()
-                        if len(parts) >= 4 and parts[0] == "VCP" and parts[1] == "12":
-                            try:
-                                val = int(parts[3])
-                                ui_val = min(100, max(0, int(round(val * 100 / 31))))
-                                self._contrast = ui_val
-                                self._last_applied_contrast = ui_val
-                                self._target_contrast = ui_val
-                                self.contrastChanged.emit()
-                                logger.info(f"Backend: Initial contrast fetched: {ui_val}%")
-                            except ValueError: pass
-
-                    # Color Preset (14)
-                    cmd = "/usr/bin/ddcutil getvcp 14 --bus=13 --brief"
-                    result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=10)
-                    if result.returncode == 0:
-                        parts = result.stdout.strip().split()
-                        if len(parts) >= 4 and parts[0] == "VCP" and parts[1] == "14":
-                            val = parts[3].lower().replace("0x", "")
-                            if len(val) == 1: val = "0" + val
-                            self._color_preset = val
-                            self.colorPresetChanged.emit()
-
-                    # RGB Gains (16, 18, 1A)
-                    for vcp, attr, sig in [("16", "video_gain_red", self.videoGainRedChanged), 
-                                           ("18", "video_gain_green", self.videoGainGreenChanged), 
-                                           ("1A", "video_gain_blue", self.videoGainBlueChanged)]:
-                        cmd = f"/usr/bin/ddcutil getvcp {vcp} --bus=13 --brief"
-                        result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=10)
-                        if result.returncode == 0:
-                            parts = result.stdout.strip().split()
-                            if len(parts) >= 4 and parts[0] == "VCP" and parts[1] == vcp:
-                                try:
-                                    val = int(parts[3])
-                                    ui_val = min(100, max(0, int(round(val * 100 / 31))))
-                                    setattr(self, f"_{attr}", ui_val)
-                                    setattr(self, f"_last_applied_{attr}", ui_val)
-                                    setattr(self, f"_target_{attr}", ui_val)
-                                    sig.emit()
-                                except ValueError: pass
-
-                    # Sharpness (87)
-                    cmd = "/usr/bin/ddcutil getvcp 87 --bus=13 --brief"
-                    result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=10)
-                    if result.returncode == 0:
-                        parts = result.stdout.strip().split()
-                        if len(parts) >= 4 and parts[0] == "VCP" and parts[1] == "87":
-                            try:
-                                val = int(parts[3])
-                                ui_val = min(100, max(0, int(round(val * 100 / 31))))
-                                self._sharpness = ui_val
-                                self._last_applied_sharpness = ui_val
-                                self._target_sharpness = ui_val
-                                self.sharpnessChanged.emit()
-                            except ValueError: pass
-
-                    # Input Source (60)
-                    cmd = "/usr/bin/ddcutil getvcp 60 --bus=13 --brief"
-                    result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=10)
-                    if result.returncode == 0:
-                        parts = result.stdout.strip().split()
-                        if len(parts) >= 4 and parts[0] == "VCP" and parts[1] == "60":
-                            val = parts[3].lower().replace("0x", "")
-                            if len(val) == 1: val = "0" + val
-                            self._input_source = val
-                            self.inputSourceChanged.emit()
-
-                    # Power Mode (D6)
-                    cmd = "/usr/bin/ddcutil getvcp D6 --bus=13 --brief"
-                    result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=10)
-                    if result.returncode == 0:
-                        parts = result.stdout.strip().split()
-                        if len(parts) >= 4 and (parts[0] == "VCP" and (parts[1] == "D6" or parts[1] == "d6")):
-                            val = parts[3].lower().replace("0x", "")
-                            if len(val) == 1: val = "0" + val
-                            self._power_mode = val
-                            self.powerModeChanged.emit()
+    def _apply_display_readings(self, readings):
+        """Reconcile the display's reported VCP values with the UI (runs on the display worker).
 
-            except Exception as e:
-                logger.error(f"Backend: Failed to fetch initial display settings: {e}")
+        Persisted settings are already showing and are only written when the monitor
+        disagrees; anything not persisted yet is adopted from the monitor.
+        """
+        persisted = self._persisted_display_settings
+        sliders = [
+            (DDC_VCP_BRIGHTNESS, "brightness", self.brightnessChanged),
+            (DDC_VCP_CONTRAST, "contrast", self.contrastChanged),
+            (DDC_VCP_GAIN_RED, "video_gain_red", self.videoGainRedChanged),
+            (DDC_VCP_GAIN_GREEN, "video_gain_green", self.videoGainGreenChanged),
+            (DDC_VCP_GAIN_BLUE, "video_gain_blue", self.videoGainBlueChanged),
+            (DDC_VCP_SHARPNESS, "sharpness", self.sharpnessChanged),
+        ]
+        for vcp, attr, sig in sliders:
+            if vcp not in readings:
+                continue
+            val = readings[vcp][0]
+            if attr in persisted:
+                # Compare on the 0-31 hardware scale so rounding never forces a write
+                desired = getattr(self, f"_target_{attr}")
+                if int(round(desired * 31 / 100)) == val:
+                    setattr(self, f"_last_applied_{attr}", desired)
+                else:
+                    logger.info(f"Backend: Display {attr.replace('_', ' ')} is {val}, restoring {desired}%")
+                    self._queue_vcp_write(vcp, desired, f"_last_applied_{attr}")
+                continue
+            ui_val = min(100, max(0, int(round(val * 100 / 31))))
+            setattr(self, f"_{attr}", ui_val)
+            setattr(self, f"_last_applied_{attr}", ui_val)
+            setattr(self, f"_target_{attr}", ui_val)
+            sig.emit()
+            logger.info(f"Backend: Initial {attr.replace('_', ' ')} fetched: {ui_val}%")
+
+        choices = [
+            (DDC_VCP_COLOR_PRESET, "color_preset", self.colorPresetChanged),
+            (DDC_VCP_INPUT_SOURCE, "input_source", self.inputSourceChanged),
+            (DDC_VCP_POWER_MODE, "power_mode", self.powerModeChanged),
+        ]
+        for vcp, attr, sig in choices:
+            if vcp not in readings:
+                continue
+            # Non-continuous values live in the low byte
+            val = f"{readings[vcp][0] & 0xFF:02x}"
+            if attr in persisted:
+                desired = getattr(self, f"_{attr}")
+                if desired != val:
+                    logger.info(f"Backend: Display {attr.replace('_', ' ')} is {val}, restoring {desired}")
+                    self._set_setting_on_hardware(vcp, attr, desired)
+                else:
+                    self._confirmed_display_choices[attr] = val
+                continue
+            self._confirmed_display_choices[attr] = val
+            setattr(self, f"_{attr}", val)
+            sig.emit()
 
-        threading.Thread(target=_worker, daemon=True).start()
+        self._persist_display_settings()
+
+    def _persist_display_settings(self):
+        """Save what the display was last set to, for the next boot.
+
+        Only values read from or written to the monitor are saved, merged over what
+        was persisted before, so defaults and failed reads never overwrite real state.
+        """
+        settings = load_display_settings()
+        for key in DISPLAY_SETTINGS_SLIDERS:
+            value = getattr(self, f"_last_applied_{key}")
+            if value >= 0:
+                settings[key] = value
+        settings.update(self._confirmed_display_choices)
+        save_display_settings(settings)
 
     @pyqtProperty(str, notify=locationChanged)
     def location(self):
@@ -3249,11 +3521,13 @@ class Backend(QObject):
             # Explicitly update radar URL property on location change
             self._radar_base_url = radar_locations.get(self._location, radar_locations.get('Starbase', ''))
             
-            # Reset calendar mapping cache so it recomputes with new timezone
+            # Reset the timezone-dependent caches so they recompute with the new timezone
             self._launches_by_date_cache = None
+            self._timeline_cache = None
             
             self.radarBaseUrlChanged.emit()
             self.locationChanged.emit()
+            self._refresh_weather_view()
             self.weatherChanged.emit()
             self.launchesChanged.emit() # Notify that calendar mapping may have changed
             self.update_countdown() # Triggers countdownChanged and launchTrayVisibilityChanged
@@ -3303,21 +3577,17 @@ class Backend(QObject):
 
     @pyqtProperty(QVariant, notify=weatherChanged)
     def weather(self):
-        active_weather = self._weather_data.get(self._location, {})
-        # Enrich with wind_direction_cardinal
-        # Prioritize live_wind if available
-        if self._first_weather_fetched and 'live_wind' in active_weather and active_weather['live_wind']:
-            live = active_weather['live_wind']
-            active_weather['wind_speed_kts'] = live.get('speed_kts', active_weather.get('wind_speed_kts', 0))
-            active_weather['wind_gusts_kts'] = live.get('gust_kts', active_weather.get('wind_gusts_kts', 0))
-            active_weather['wind_direction'] = live.get('direction', active_weather.get('wind_direction', 0))
-            active_weather['is_live_wind'] = True
-        else:
-            active_weather['is_live_wind'] = False
+        return self._weather_view.view(self._location)
 
-        if 'wind_direction' in active_weather:
-            active_weather['wind_direction_cardinal'] = degrees_to_cardinal(active_weather['wind_direction'])
-        return active_weather
+    @pyqtProperty(QObject, constant=True)
+    def weatherView(self):
+        return self._weather_view_map
+
+    def _refresh_weather_view(self):
+        """Rebuild the weather views and push only the changed fields to QML."""
+        self._weather_view.update(self._weather_data, use_live_wind=self._first_weather_fetched)
+        for key in self._weather_view.select(self._location):
+            self._weather_view_map.insert(key, self._weather_view.fields[key])
 
     @pyqtProperty(str, notify=countdownChanged)
     def countdown(self):
@@ -3373,12 +3643,8 @@ class Backend(QObject):
         """Return the converted X/Twitter livestream URL for the current launch."""
         return self.getConvertedVideoUrl(self._live_launch_url)
 
-    def _get_launch_trends_data(self):
-        """Helper to get launch trends data with internal caching to avoid redundant calls."""
-        # Fast path: return memoized data if available
-        if getattr(self, '_memoized_trends', None) is not None:
-            return self._memoized_trends
-
+    def _launch_trends_key(self):
+        """Return (cache_key, data_sig) identifying the current launch trends series."""
         current_year = datetime.now(pytz.UTC).year
         current_month = datetime.now(pytz.UTC).month
         
@@ -3391,6 +3657,15 @@ class Backend(QObject):
         if prev_launches:
             # Use first and last item IDs/nets as a heuristic for data identity
             data_sig += f"_{prev_launches[0].get('id','0')}_{prev_launches[-1].get('id','0')}"
+        return cache_key, data_sig
+
+    def _get_launch_trends_data(self):
+        """Helper to get launch trends data with internal caching to avoid redundant calls."""
+        # Fast path: return memoized data if available
+        if getattr(self, '_memoized_trends', None) is not None:
+            return self._memoized_trends
+
+        cache_key, data_sig = self._launch_trends_key()
         
         if (self._launch_trends_cache.get('key') == cache_key and 
             self._launch_trends_cache.get('data_sig') == data_sig):
@@ -3411,7 +3686,7 @@ class Backend(QObject):
             return
         self._precomputing_trends = True
         try:
-            profiler.mark("Backend: _precompute_launch_trends Recomputing")
+            metrics.count("launch_trends.recompute")
             prev_launches = self._launch_data.get('previous', [])
             current_year = datetime.now(pytz.UTC).year
             current_month = datetime.now(pytz.UTC).month
@@ -3444,8 +3719,7 @@ class Backend(QObject):
                 logger.info("Backend: Saved launch trends cache to disk (background)")
             except Exception as e:
                 logger.debug(f"Failed to save launch trends cache: {e}")
-                
-            profiler.mark("Backend: _precompute_launch_trends End (Recomputed)")
+
             self.launchesChanged.emit() # Signal UI to refresh charts
         except Exception as e:
             logger.error(f"Failed to precompute launch trends: {e}")
@@ -3523,18 +3797,56 @@ class Backend(QObject):
             except Exception:
                 pass
 
-    @pyqtProperty(QVariant, notify=launchesChanged)
+    @pyqtProperty(QVariant, notify=launchDescriptionsChanged)
     def launchDescriptions(self):
         # Ensure we're returning the latest enriched narratives
         return self._launch_descriptions
 
+    @pyqtProperty(str, notify=tickerTextChanged)
+    def tickerText(self):
+        return self._ticker_text
+
+    @pyqtProperty(int, notify=tickerTextChanged)
+    def tickerTextWidth(self):
+        """Pixel width of tickerText in the ticker's font (D-DIN 14px bold)."""
+        if self._ticker_text_width is None:
+            font = QFont("D-DIN")
+            font.setPixelSize(14)
+            font.setBold(True)
+            self._ticker_text_width = QFontMetrics(font).horizontalAdvance(self._ticker_text)
+        return self._ticker_text_width
+
+    def _set_launch_descriptions(self, narratives):
+        """Store new narratives; the ticker only changes when its text does."""
+        if narratives == self._launch_descriptions:
+            return
+        self._launch_descriptions = narratives
+        self.launchDescriptionsChanged.emit()
+        text = build_ticker_text(narratives)
+        if text != self._ticker_text:
+            self._ticker_text = text
+            self._ticker_text_width = None
+            self.tickerTextChanged.emit()
+
+    def _get_timeline(self):
+        """Next launch and upcoming list, memoised until the launch data or timezone changes."""
+        timeline = self._timeline_cache
+        if timeline is None:
+            upcoming = self._launch_data.get('upcoming', [])
+            timeline = {
+                'next_launch': get_next_launch_info(upcoming, self._tz),
+                'upcoming_launches': get_upcoming_launches_list(upcoming, self._tz),
+            }
+            self._timeline_cache = timeline
+        return timeline
+
     @pyqtSlot(result=QVariant)
     def get_next_launch(self):
-        return get_next_launch_info(self._launch_data['upcoming'], self._tz)
+        return self._get_timeline()['next_launch']
 
     @pyqtSlot(result=QVariant)
     def get_upcoming_launches(self):
-        return get_upcoming_launches_list(self._launch_data['upcoming'], self._tz)
+        return self._get_timeline()['upcoming_launches']
 
     @pyqtProperty(str, notify=radarBaseUrlChanged)
     def radarBaseUrl(self):
@@ -3549,8 +3861,10 @@ class Backend(QObject):
         """Get trajectory data for the next upcoming launch or currently selected launch"""
         # If we have a specific trajectory loaded, return that
         if hasattr(self, '_current_trajectory') and self._current_trajectory:
-            logger.info("get_launch_trajectory: Returning current selected launch trajectory")
+            logger.debug("get_launch_trajectory: Returning current selected launch trajectory")
             return self._current_trajectory
+        if self._default_trajectory is not None:
+            return self._default_trajectory
         
         # Otherwise, get the default next launch trajectory
         upcoming = self.get_upcoming_launches()
@@ -3570,11 +3884,12 @@ class Backend(QObject):
         upcoming_full = self._launch_data.get('upcoming', [])
         result = get_launch_trajectory_data(upcoming_full, previous)
         if result and 'booster_trajectory' in result:
-            logger.info(f"get_launch_trajectory: Returning {len(result['trajectory'])} main points and {len(result['booster_trajectory'])} booster points")
+            logger.debug(f"get_launch_trajectory: Returning {len(result['trajectory'])} main points and {len(result['booster_trajectory'])} booster points")
         elif result:
-            logger.info(f"get_launch_trajectory: Returning {len(result['trajectory'])} main points (no booster)")
+            logger.debug(f"get_launch_trajectory: Returning {len(result['trajectory'])} main points (no booster)")
         else:
-            logger.info("get_launch_trajectory: Returning None")
+            logger.debug("get_launch_trajectory: Returning None")
+        self._default_trajectory = result
         return result
 
     @pyqtSlot(str, str, str, str, result=bool)
@@ -3767,6 +4082,7 @@ class Backend(QObject):
         if upcoming[launch_index] != parsed_data:
             logger.info(f"Backend: Launch {parsed_data.get('id')} status/data changed! Status: {parsed_data.get('status')}")
             upcoming[launch_index] = parsed_data
+            self._clear_launch_caches()
             
             # Persist the update to disk cache so it's available after restart
             try:
@@ -3789,8 +4105,17 @@ class Backend(QObject):
         self.timeChanged.emit()
 
     def _update_live_launch_url(self):
-        self._last_live_url_update = time.time()
-        new_live_url = get_closest_x_video_url(self._launch_data)
+        """Rebuild the stream index after a launch data change and pick the nearest stream."""
+        self._live_stream_index = LiveStreamIndex(self._launch_data)
+        self._refresh_live_launch_url()
+
+    def _refresh_live_launch_url(self):
+        now = time.time()
+        if self._live_stream_index is None:
+            self._live_stream_index = LiveStreamIndex(self._launch_data)
+        new_live_url, change_ts = self._live_stream_index.nearest(now)
+        self._live_url_checked_at = now
+        self._live_url_recheck_at = change_ts if change_ts is not None else float('inf')
         if new_live_url != getattr(self, '_live_launch_url', ''):
             self._live_launch_url = new_live_url
             self.liveLaunchUrlChanged.emit()
@@ -3799,13 +4124,10 @@ class Backend(QObject):
     def update_countdown(self):
         # Update countdown every second and re-evaluate tray visibility
         now = time.time()
-        current_tray_visible = self.launchTrayVisible
-        
-        # Update URL if:
-        # 1. It's been more than 60 seconds since last update
-        # 2. The tray just became visible (opened)
-        if (now - self._last_live_url_update >= 60) or (current_tray_visible and not self._last_tray_visible):
-            self._update_live_launch_url()
+        # The nearest stream can only change at the scheduled midpoint; a clock stepped
+        # backwards (e.g. NTP correcting a Pi booted without RTC) invalidates it too
+        if now >= self._live_url_recheck_at or now < self._live_url_checked_at:
+            self._refresh_live_launch_url()
 
         self.timeChanged.emit()
         self.countdownChanged.emit()
@@ -3828,7 +4150,7 @@ class Backend(QObject):
         
         logger.info(f"Backend: Received {len(launch_data.get('upcoming', []))} upcoming launches")
         self._launch_data = launch_data
-        self._launch_descriptions = narratives
+        self._set_launch_descriptions(narratives)
         self._update_live_launch_url()
         self._clear_launch_caches()
         
@@ -3841,6 +4163,7 @@ class Backend(QObject):
             
         # self._f1_data is now initialized in __init__ and not updated here as it's currently missing from loader
         self._weather_data = weather_data
+        self._refresh_weather_view()
         # Update the EventModel's data reference
         profiler.mark("Backend: Updating EventModel")
         self._event_model._data = self._launch_data if self._mode == 'spacex' else self._f1_data['schedule']
@@ -3863,6 +4186,7 @@ class Backend(QObject):
         profiler.mark("Backend: Scheduling trajectory recompute")
         self._emit_update_globe_trajectory_debounced()
         self._schedule_trajectory_recompute()
+        self._schedule_boot_snapshot_write()
         profiler.mark("Backend: on_data_loaded End")
         profiler.log_summary()
         # REDUNDANT RELOAD REMOVED: Data loading should not force a full UI reload.
@@ -3891,6 +4215,7 @@ class Backend(QObject):
         threading.Thread(target=self._precompute_calendar_mapping, daemon=True).start()
         logger.info("BOOT: Loading cached weather data...")
         self._weather_data = self._load_cached_weather_data()
+        self._refresh_weather_view()
 
         # Update the EventModel's data reference
         logger.info(f"BOOT: Updating EventModel data (mode: {self._mode})")
@@ -3915,6 +4240,9 @@ class Backend(QObject):
         """Apply cached (runtime or git-seeded) data immediately and exit splash.
         This is signal-based and avoids any time-based waits."""
         profiler.mark("Backend: _seed_bootstrap Start")
+        if self._boot_snapshot:
+            self._apply_boot_snapshot_ui()
+            return
         
         def _bootstrap_worker():
             try:
@@ -3973,6 +4301,7 @@ class Backend(QObject):
                     
                     logger.info("BOOT: Seed/runtime cache applied; waiting for network or timeout to dismiss splash")
                     profiler.mark("Backend: _seed_bootstrap End")
+                    profiler.record_warm_boot('cache')
 
                 QTimer.singleShot(0, _apply_ui)
                 
@@ -3983,6 +4312,135 @@ class Backend(QObject):
         self.setLoadingStatus("Loading cached SpaceX data…")
         threading.Thread(target=_bootstrap_worker, daemon=True).start()
 
+    def _apply_boot_snapshot_state(self, snapshot):
+        """Restore derived state from a validated boot snapshot (called from __init__)."""
+        profiler.mark("Backend: Applying boot snapshot")
+        self._launch_data = snapshot.get('launch_data') or {'previous': [], 'upcoming': []}
+        self._live_launch_url = snapshot.get('live_launch_url') or ""
+        self._weather_data = {self._location: snapshot['weather']} if snapshot.get('weather') else {}
+        self._launches_by_date_cache = snapshot.get('calendar')
+        self._launch_trends_cache = snapshot.get('trends') or {}
+        self._timeline_cache = {
+            'next_launch': snapshot.get('next_launch'),
+            'upcoming_launches': snapshot.get('upcoming_launches') or [],
+        }
+        self._default_trajectory = snapshot.get('trajectory')
+        upcoming = self._timeline_cache['upcoming_launches']
+        if upcoming:
+            self._selected_launch_mission = upcoming[0].get('mission', '')
+        logger.info(f"BOOT: Boot snapshot applied ({len(self._launch_data.get('upcoming', []))} upcoming launches)")
+
+    def _apply_boot_snapshot_ui(self):
+        """Publish snapshot-restored state to QML; nothing is recomputed on this path."""
+        self.setLoadingStatus("Loading cached SpaceX data…")
+        if self._boot_snapshot.get('event_rows') is None:
+            # Local date rolled over since the snapshot was written; regroup only the rows
+            self._event_model.update_data()
+        try:
+            self.launchCacheReady.emit()
+        except Exception:
+            pass
+        self.launchesChanged.emit()
+        self._emit_tray_visibility_changed()
+        self.eventModelChanged.emit()
+        self._emit_update_globe_trajectory_debounced()
+        if self._default_trajectory is None:
+            self._schedule_trajectory_recompute()
+        logger.info("BOOT: Boot snapshot applied; waiting for network or timeout to dismiss splash")
+        profiler.mark("Backend: _seed_bootstrap End (snapshot)")
+        profiler.record_warm_boot('snapshot')
+        # Only the first boot uses it; later refreshes write a new one
+        self._boot_snapshot = None
+
+    def _schedule_boot_snapshot_write(self, delay_ms=5000):
+        """Debounce snapshot writes so background calendar/trend/trajectory work can land first."""
+        try:
+            if self._boot_snapshot_timer is None:
+                self._boot_snapshot_timer = QTimer(self)
+                self._boot_snapshot_timer.setSingleShot(True)
+                self._boot_snapshot_timer.timeout.connect(self._start_boot_snapshot_write)
+            self._boot_snapshot_timer.start(delay_ms)
+        except Exception as e:
+            logger.debug(f"Failed to schedule boot snapshot write: {e}")
+
+    def _start_boot_snapshot_write(self):
+        """Capture the snapshot inputs in one step on the Qt thread, then write them off-thread."""
+        try:
+            inputs = self._capture_boot_snapshot_inputs()
+        except Exception as e:
+            logger.warning(f"Failed to capture boot snapshot inputs: {e}")
+            return
+        if inputs is not None:
+            threading.Thread(target=self._write_boot_snapshot, args=(inputs,), daemon=True).start()
+
+    def _capture_boot_snapshot_inputs(self):
+        """Copy everything the snapshot needs from one consistent view of Backend state.
+
+        Derived values that aren't cached for this data are left as None and rebuilt
+        off-thread from the captured launch data, never from live Backend state.
+        """
+        launch_data = {key: list(value) if isinstance(value, list) else value
+                       for key, value in self._launch_data.items()}
+        if not launch_data.get('upcoming') and not launch_data.get('previous'):
+            return None
+        rows = None
+        if self._mode == 'spacex' and self._event_type == 'upcoming':
+            rows = list(self._event_model._grouped_data)
+        cache_key, data_sig = self._launch_trends_key()
+        trends = None
+        if (self._launch_trends_cache.get('key') == cache_key and
+                self._launch_trends_cache.get('data_sig') == data_sig):
+            trends = dict(self._launch_trends_cache)
+        return {
+            'launch_data': launch_data,
+            'tz': self._tz,
+            'location': self._location,
+            'rows': rows,
+            'calendar': self._launches_by_date_cache,
+            'trends': trends,
+            'trends_key': (cache_key, data_sig, self._chart_view_mode),
+            'trajectory': self._default_trajectory,
+            'weather': self._weather_data.get(self._location),
+            'live_launch_url': self._live_launch_url,
+        }
+
+    @staticmethod
+    def _write_boot_snapshot(inputs):
+        """Serialise the captured UI state for the default view (background thread)."""
+        try:
+            launch_data, tz = inputs['launch_data'], inputs['tz']
+            upcoming, previous = launch_data.get('upcoming', []), launch_data.get('previous', [])
+            rows = inputs['rows']
+            if rows is None:
+                rows = group_event_data(launch_data, 'spacex', 'upcoming', tz)
+
+            calendar_mapping = inputs['calendar']
+            if calendar_mapping is None:
+                from functions import get_calendar_mapping
+                calendar_mapping = get_calendar_mapping(launch_data, tz)
+
+            trends = inputs['trends']
+            if trends is None:
+                cache_key, data_sig, view_mode = inputs['trends_key']
+                now = datetime.now(pytz.UTC)
+                months, series = get_launch_trends_series(previous, view_mode, now.year, now.month)
+                trends = {'key': cache_key, 'data_sig': data_sig,
+                          'data': {'months': months, 'series': series,
+                                   'max_value': get_max_value_from_series(series)}}
+
+            trajectory = inputs['trajectory']
+            if trajectory is None:
+                trajectory = get_launch_trajectory_data(upcoming, previous)
+
+            snapshot = build_boot_snapshot(
+                launch_data, tz, inputs['location'], rows, calendar_mapping, trends,
+                get_next_launch_info(upcoming, tz), get_upcoming_launches_list(upcoming, tz),
+                trajectory, inputs['weather'], inputs['live_launch_url'])
+            if save_boot_snapshot(snapshot):
+                logger.info(f"Backend: Boot snapshot written ({len(rows)} rows)")
+        except Exception as e:
+            logger.warning(f"Failed to write boot snapshot: {e}")
+
     def _start_data_loading_online(self):
         """Start DataLoader immediately (no guard timers), used when firstOnline fires."""
         try:
@@ -4125,6 +4583,8 @@ class Backend(QObject):
         self._launch_trends_cache.clear()
         self._memoized_trends = None
         self._launches_by_date_cache = None
+        self._timeline_cache = None
+        self._default_trajectory = None
 
     def _precompute_calendar_mapping(self):
         """Pre-compute the calendar mapping in the background to avoid UI blocking."""
@@ -4156,7 +4616,7 @@ class Backend(QObject):
     def _on_launches_updated(self, launch_data, narratives, calendar_mapping=None):
         """Handle launch data update completion"""
         self._launch_data = launch_data
-        self._launch_descriptions = narratives
+        self._set_launch_descriptions(narratives)
         self._update_live_launch_url()
         self._clear_launch_caches()
         
@@ -4173,6 +4633,7 @@ class Backend(QObject):
         # Update globe trajectory in case current/next launch changed (e.g., after Success)
         self._emit_update_globe_trajectory_debounced()
         self._schedule_trajectory_recompute()
+        self._schedule_boot_snapshot_write()
         # Clean up thread
         if hasattr(self, '_launch_updater_thread'):
             self._launch_updater_thread.quit()
@@ -4243,11 +4704,14 @@ class Backend(QObject):
         
         logger.info(f"Backend: Updating weather forecast model with {len(forecast)} days")
         self._weather_forecast_model.update_data(forecast)
+        self._refresh_weather_view()
         self.weatherChanged.emit()
         self.weatherUpdated.emit()
         self.weatherForecastModelChanged.emit()
         # Clean up thread
         if hasattr(self, '_weather_updater_thread'):
+            # Only real refreshes reach here (not the cache seed in __init__)
+            self._schedule_boot_snapshot_write()
             self._weather_updater_thread.quit()
             self._weather_updater_thread.wait()
 
@@ -4521,6 +4985,38 @@ class Backend(QObject):
         # Timer runs continuously now, no need to start/stop it
         logger.debug("WiFi timer is running continuously")
 
+    def _start_wifi_monitor(self):
+        """Connect to NetworkManager's D-Bus API off the UI thread (initial model load)."""
+        monitor = start_wifi_monitor()
+        if monitor is None:
+            return
+        self._wifi_monitor = monitor
+        monitor.add_listener(self.wifiMonitorEvent.emit)
+        self.wifiMonitorEvent.emit('ready')
+
+    @pyqtSlot(str)
+    def _on_wifi_monitor_event(self, kind):
+        """Apply NetworkManager D-Bus updates on the main thread."""
+        try:
+            if kind == 'ready':
+                wifi_timer = getattr(self, 'wifi_timer', None)
+                if wifi_timer is not None:
+                    wifi_timer.stop()
+                logger.info("WiFi status is now event-driven via NetworkManager D-Bus; polling stopped")
+                self._wifi_networks_timer.start()
+            if kind in ('ready', 'status'):
+                self._apply_wifi_status(*self._wifi_monitor.status())
+            elif kind == 'networks':
+                self._wifi_networks_timer.start()
+        except Exception as e:
+            logger.error(f"Failed to apply NetworkManager update: {e}")
+
+    def _apply_wifi_monitor_networks(self):
+        if self._wifi_monitor is None:
+            return
+        self._wifi_networks = filter_and_sort_wifi_networks(self._wifi_monitor.networks())
+        self.wifiNetworksChanged.emit()
+
     def update_wifi_status(self):
         """Update WiFi connection status with enhanced fallback methods"""
         def _worker():
@@ -4726,6 +5222,7 @@ class Backend(QObject):
         try:
             if self._update_log_timer and self._update_log_timer.isActive():
                 self._update_log_timer.stop()
+            self._stop_update_log_tail()
         except Exception:
             pass
         self._set_updating_status("Update canceled.")
@@ -4826,13 +5323,40 @@ class Backend(QObject):
                     subprocess.run(['sudo', '-n', '/usr/sbin/reboot'], check=True)
             except Exception as e2:
                 logger.error(f"Fallback reboot failed: {e2}")
+    @pyqtSlot()
+    def logPerformanceMetrics(self):
+        """Write span latencies (p50/p95/max), counters and stall sites to the application log."""
+        metrics.log_report()
+        logger.info("\n" + stall_detector.format_report())
+
     def check_network_connectivity(self):
         """Check if we have active network connectivity (beyond just WiFi connection)"""
         return test_network_connectivity()
 
     # --- Non-blocking network connectivity check helpers ---
+    def _on_connectivity_published(self, online):
+        """Apply a connectivity_bus result on the Qt main thread."""
+        self._last_network_check = time.time()
+        if online == self._network_connected:
+            return
+        self._network_connected = online
+        logger.info(f"Network connectivity status changed: {online}")
+        # Emit signals; keep compatibility by reusing wifiConnectedChanged
+        try:
+            self.wifiConnectedChanged.emit()
+        except Exception as _e:
+            logger.debug(f"Emit wifiConnectedChanged failed: {_e}")
+        try:
+            self.networkConnectedChanged.emit()
+        except Exception as _e:
+            logger.debug(f"Emit networkConnectedChanged failed: {_e}")
+
     def _start_network_connectivity_check_async(self):
-        """Run the network connectivity check in a background thread to avoid blocking UI."""
+        """Run the network connectivity check in a background thread to avoid blocking UI.
+
+        The result reaches _on_connectivity_published through the connectivity bus,
+        together with results from checks started by the fetch helpers.
+        """
         try:
             if self._network_check_in_progress:
                 logger.debug("Network connectivity check already in progress; skipping new request")
@@ -4843,36 +5367,11 @@ class Backend(QObject):
             def _worker():
                 try:
                     # Perform the potentially blocking check off the UI thread
-                    result = self.check_network_connectivity()
+                    self.check_network_connectivity()
                 except Exception as e:
                     logger.debug(f"Background network check error: {e}")
-                    result = False
-
-                # Marshal result back to the main thread
-                def _apply():
-                    try:
-                        previous = self._network_connected
-                        if result != previous:
-                            self._network_connected = result
-                            logger.info(f"Network connectivity status changed: {result}")
-                            # Emit signals; keep compatibility by reusing wifiConnectedChanged
-                            try:
-                                self.wifiConnectedChanged.emit()
-                            except Exception as _e:
-                                logger.debug(f"Emit wifiConnectedChanged failed: {_e}")
-                            try:
-                                self.networkConnectedChanged.emit()
-                            except Exception as _e:
-                                logger.debug(f"Emit networkConnectedChanged failed: {_e}")
-                    finally:
-                        self._network_check_in_progress = False
-
-                # Use QTimer.singleShot(0, ...) to ensure execution on the Qt main thread
-                try:
-                    QTimer.singleShot(0, _apply)
-                except Exception as e:
-                    logger.debug(f"Failed to schedule result application on main thread: {e}; applying directly")
-                    _apply()
+                finally:
+                    self._network_check_in_progress = False
 
             threading.Thread(target=_worker, daemon=True).start()
         except Exception as e:
@@ -5261,6 +5760,37 @@ class ChartItem(QQuickPaintedItem):
         
 qmlRegisterType(ChartItem, 'Charts', 1, 0, 'ChartItem')
 
+
+def set_qml_context_properties(context, backend):
+    """Expose the backend and static asset paths Main.qml expects on its root context."""
+    assets_dir = os.path.join(os.path.dirname(__file__), '..', 'assets', 'images')
+    context.setContextProperty("backend", backend)
+    context.setContextProperty("radarLocations", radar_locations)
+    context.setContextProperty("circuitCoords", circuit_coords)
+    context.setContextProperty("spacexLogoPath", os.path.join(assets_dir, 'spacex_logo.png').replace('\\', '/'))
+    context.setContextProperty("chevronPath", os.path.join(assets_dir, 'double-chevron.png').replace('\\', '/'))
+    spotify_fallback_path = os.path.join(assets_dir, 'spotify.png')
+    context.setContextProperty("spotifyFallbackArtUrl", "file:///" + spotify_fallback_path.replace('\\', '/'))
+    globe_file_path = os.path.join(os.path.dirname(__file__), '..', 'src', 'globe.html')
+    context.setContextProperty("globeUrl", "file:///" + globe_file_path.replace('\\', '/'))
+
+
+def _qml_disk_cache_is_warm(main_qml_path):
+    """Best-effort check whether Qt's QML disk cache already holds compiled units
+    newer than Main.qml, so the boot profile can label cold vs warm QML loads."""
+    try:
+        if os.environ.get("QML_DISABLE_DISK_CACHE"):
+            return False
+        cache_dir = os.path.join(QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation), "qmlcache")
+        if not os.path.isdir(cache_dir):
+            return False
+        source_mtime = os.path.getmtime(main_qml_path)
+        with os.scandir(cache_dir) as entries:
+            return any(e.is_file() and e.stat().st_mtime >= source_mtime for e in entries)
+    except Exception as e:
+        logger.debug(f"QML cache check failed: {e}")
+        return False
+
 if __name__ == '__main__':
     auto_restart_enabled = read_bool_env("SPACEX_DASHBOARD_AUTORESTART", default=True)
     restart_delay_seconds = read_int_env("SPACEX_DASHBOARD_RESTART_DELAY_SECONDS", 4, minimum=1)
@@ -5355,32 +5885,21 @@ if __name__ == '__main__':
         except Exception as _e:
             logger.warning(f"Could not connect engine warnings signal: {_e}")
         profiler.mark("Setting Context Properties")
-        context = engine.rootContext()
-        context.setContextProperty("backend", backend)
-        context.setContextProperty("radarLocations", radar_locations)
-        context.setContextProperty("circuitCoords", circuit_coords)
-        context.setContextProperty("spacexLogoPath", os.path.join(os.path.dirname(__file__), '..', 'assets', 'images', 'spacex_logo.png').replace('\\', '/'))
-        context.setContextProperty("chevronPath", os.path.join(os.path.dirname(__file__), '..', 'assets', 'images', 'double-chevron.png').replace('\\', '/'))
-        spotify_fallback_path = os.path.join(os.path.dirname(__file__), '..', 'assets', 'images', 'spotify.png')
-        context.setContextProperty("spotifyFallbackArtUrl", "file:///" + spotify_fallback_path.replace('\\', '/'))
-
-        profiler.mark("Preparing URLs")
-        globe_file_path = os.path.join(os.path.dirname(__file__), '..', 'src', 'globe.html')
-        earth_texture_path = os.path.join(os.path.dirname(__file__), '..', 'assets', 'images', 'earth_texture.jpg')
-        youtube_html_path = os.path.join(os.path.dirname(__file__), 'youtube_embed.html')
-
-        context.setContextProperty("globeUrl", "file:///" + globe_file_path.replace('\\', '/'))
-
-        from ui_qml import qml_code  # Load QML from external module
-        profiler.mark("Engine LoadData Start")
+        set_qml_context_properties(engine.rootContext(), backend)
+
+        from ui_qml import MAIN_QML  # QML component files live in src/qml
+        # Loading from a file URL (rather than loadData on an in-memory string) lets Qt's
+        # QML disk cache reuse compiled bytecode on warm boots and auto-restarts.
+        qml_cache_state = "warm" if _qml_disk_cache_is_warm(MAIN_QML) else "cold"
+        profiler.mark(f"Engine LoadData Start (qml cache {qml_cache_state})")
         # Increase delay for QML loading status so it's not immediately overwritten 
         # if DataLoader finished very quickly.
         def _set_ui_loading():
             backend.setLoadingStatus("Preparing UI components...")
         QTimer.singleShot(1500, _set_ui_loading)
         
-        engine.loadData(qml_code.encode(), QUrl("inline.qml"))  # Provide a pseudo URL for better line numbers
-        profiler.mark("Engine LoadData End")
+        engine.load(QUrl.fromLocalFile(MAIN_QML))
+        profiler.mark(f"Engine LoadData End (qml cache {qml_cache_state})")
         if not engine.rootObjects():
             raise RuntimeError("QML root object creation failed. Check console output and application logs for QML loading errors.")
         profiler.mark("App Startup Complete")
@@ -7,83 +7,617 @@ imported from both production code and tests without pulling in Qt.
 
 from __future__ import annotations
 
+import atexit
+import bisect
+import functools
+import hashlib
 import json
 import logging
+import logging.handlers
 import math
+import mmap
 import platform
 IS_WINDOWS = platform.system() == 'Windows'
 import os
+import queue
 import re
 import socket
+import struct
 import subprocess
 import sys
+import tempfile
 import time
+import traceback
 import urllib.error
 import urllib.parse
 import urllib.request
+import zlib
 from datetime import datetime, timedelta
 
 import pytz
-import requests
+import collections
+import errno
 import concurrent.futures
-from dateutil.parser import parse
-from cryptography.fernet import Fernet
 import http.server
+import importlib
 import socketserver
 import threading
+import types
 
 logger = logging.getLogger(__name__)
 
+
+class LazyModule(types.ModuleType):
+    """Module proxy that performs the real import on first attribute access.
+
+    Keeps heavy dependencies (requests, cryptography, dateutil's parser) off the
+    cold-boot import path; the first use records a profiler mark so the deferred
+    cost shows up in the boot summary.
+    """
+    _import_lock = threading.Lock()
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.__dict__['_lazy_target'] = None
+
+    def _load(self):
+        module = self.__dict__['_lazy_target']
+        if module is None:
+            with LazyModule._import_lock:
+                module = self.__dict__['_lazy_target']
+                if module is None:
+                    started = time.perf_counter()
+                    module = importlib.import_module(self.__name__)
+                    self.__dict__['_lazy_target'] = module
+                    elapsed_ms = (time.perf_counter() - started) * 1000.0
+                    profiler.mark(f"Lazy import {self.__name__} ({elapsed_ms:.0f} ms)")
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+
+_LAZY_MODULES = {}
+
+
+def lazy_import(name):
+    """Return a module that is imported on first attribute access.
+
+    Modules that are already imported are returned as-is.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    module = _LAZY_MODULES.get(name)
+    if module is None:
+        module = _LAZY_MODULES.setdefault(name, LazyModule(name))
+    return module
+
+
+requests = lazy_import("requests")
+_fernet = lazy_import("cryptography.fernet")  # only needed for Wi-Fi password handling
+_dateutil_parser = lazy_import("dateutil.parser")
+
+# --- Instrumentation: spans, latency histograms, counters and a ring buffer ---
+# Set DASHBOARD_INSTRUMENTATION=0 to turn spans/counters into no-ops (boot marks are kept).
+INSTRUMENTATION_ENABLED = os.environ.get('DASHBOARD_INSTRUMENTATION', '1').strip().lower() not in ('0', 'false', 'no', 'off')
+INSTRUMENTATION_RING_SIZE = 1024
+# Boot marks are kept apart from the span ring; marks beyond this many are dropped
+INSTRUMENTATION_MARKS_LIMIT = 512
+# Log-spaced latency buckets in ms: four per doubling from 10 us to ~84 s (~19% resolution)
+LATENCY_BUCKETS_MS = tuple(0.01 * 2 ** (i / 4) for i in range(93))
+
+InstrumentEvent = collections.namedtuple('InstrumentEvent', 'kind name at duration_ms thread')
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram; O(log buckets) record, constant memory."""
+    __slots__ = ('counts', 'count', 'total_ms', 'max_ms')
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, ms):
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def percentile(self, q):
+        """Upper bound of the bucket holding the q-quantile (capped at the observed max)."""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        running = 0
+        for index, bucket_count in enumerate(self.counts):
+            running += bucket_count
+            if running >= target:
+                bound = LATENCY_BUCKETS_MS[index] if index < len(LATENCY_BUCKETS_MS) else self.max_ms
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+    def stats(self):
+        return {
+            'count': self.count,
+            'mean_ms': self.total_ms / self.count if self.count else 0.0,
+            'p50_ms': self.percentile(0.50),
+            'p95_ms': self.percentile(0.95),
+            'max_ms': self.max_ms,
+        }
+
+
+class _Span:
+    __slots__ = ('_owner', '_name', '_started')
+
+    def __init__(self, owner, name):
+        self._owner = owner
+        self._name = name
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._owner._finish_span(self._name, self._started, exc_type is not None)
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def _prometheus_label(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"')
+
+
+class Instrumentation:
+    """Process-wide spans, counters and recent-event ring buffer.
+
+    Usage::
+
+        with metrics.span("group_event_data"):
+            ...
+
+        @metrics.timed("fetch_weather")
+        def fetch_weather(...): ...
+
+        metrics.count("launch_cache.seed")
+
+    Nothing is logged while recording; format_report()/log_report() export on
+    demand and prometheus_text() backs the HTTP server's /metrics endpoint.
+    """
+
+    def __init__(self, enabled=INSTRUMENTATION_ENABLED, ring_size=INSTRUMENTATION_RING_SIZE,
+                 marks_limit=INSTRUMENTATION_MARKS_LIMIT):
+        self.enabled = enabled
+        self.start_time = time.time()
+        self._perf_origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._counters = {}
+        self._events = collections.deque(maxlen=ring_size)
+        # Marks live outside the span ring so steady-state spans never evict boot timings
+        self._marks = []
+        self._marks_limit = marks_limit
+
+    def span(self, name):
+        return _Span(self, name) if self.enabled else _NULL_SPAN
+
+    def timed(self, name=None):
+        """Decorator recording each call of the wrapped function as a span."""
+        def decorator(func):
+            span_name = name or func.__qualname__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                started = time.perf_counter()
+                failed = True
+                try:
+                    result = func(*args, **kwargs)
+                    failed = False
+                    return result
+                finally:
+                    self._finish_span(span_name, started, failed)
+            return wrapper
+        return decorator
+
+    def count(self, name, value=1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, name, ms):
+        """Record an externally measured duration (ms) into name's histogram."""
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = LatencyHistogram()
+            histogram.record(ms)
+
+    def event(self, name):
+        """Record a point-in-time mark (boot milestones); kept even when disabled.
+
+        Marks are never evicted: once marks_limit is reached later marks are dropped,
+        so the boot timeline stays intact however long the process runs.
+        """
+        with self._lock:
+            if len(self._marks) < self._marks_limit:
+                self._marks.append(InstrumentEvent('mark', name, time.time() - self.start_time, 0.0,
+                                                   threading.current_thread().name))
+
+    def _finish_span(self, name, started, failed):
+        ms = (time.perf_counter() - started) * 1000.0
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = LatencyHistogram()
+            histogram.record(ms)
+            if failed:
+                key = name + '.errors'
+                self._counters[key] = self._counters.get(key, 0) + 1
+        self._events.append(InstrumentEvent('span', name, started - self._perf_origin, ms,
+                                            threading.current_thread().name))
+
+    def events(self, kind=None):
+        """Marks plus the span ring buffer, ordered by start time."""
+        with self._lock:
+            marks = list(self._marks) if kind in (None, 'mark') else []
+        spans = list(self._events) if kind in (None, 'span') else []
+        return sorted(marks + spans, key=lambda e: e.at)
+
+    def snapshot(self):
+        with self._lock:
+            spans = {name: histogram.stats() for name, histogram in self._histograms.items()}
+            counters = dict(self._counters)
+        return {'uptime_s': time.time() - self.start_time, 'spans': spans, 'counters': counters}
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+            self._marks.clear()
+        self._events.clear()
+
+    def format_report(self):
+        snap = self.snapshot()
+        lines = [f"--- Instrumentation ({snap['uptime_s']:.0f}s uptime) ---"]
+        if snap['spans']:
+            lines.append(f"{'span':<44} {'count':>7} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9}")
+            for name, stats in sorted(snap['spans'].items(), key=lambda item: -item[1]['count'] * item[1]['mean_ms']):
+                lines.append(f"{name:.<44} {stats['count']:>7} {stats['p50_ms']:>9.2f} "
+                             f"{stats['p95_ms']:>9.2f} {stats['max_ms']:>9.2f}")
+        if snap['counters']:
+            lines.append("counters:")
+            for name, value in sorted(snap['counters'].items()):
+                lines.append(f"  {name:.<42} {value:>7}")
+        return "\n".join(lines)
+
+    def log_report(self):
+        logger.info("\n" + self.format_report())
+
+    def prometheus_text(self):
+        """Prometheus text exposition of span histograms and counters."""
+        _label = _prometheus_label
+        with self._lock:
+            histograms = {name: (list(h.counts), h.count, h.total_ms) for name, h in self._histograms.items()}
+            counters = dict(self._counters)
+        lines = ["# HELP dashboard_span_duration_ms Span latency in milliseconds.",
+                 "# TYPE dashboard_span_duration_ms histogram"]
+        for name, (counts, count, total_ms) in sorted(histograms.items()):
+            label = _label(name)
+            running = 0
+            for bound, bucket_count in zip(LATENCY_BUCKETS_MS, counts):
+                running += bucket_count
+                lines.append(f'dashboard_span_duration_ms_bucket{{span="{label}",le="{bound:.4g}"}} {running}')
+            lines.append(f'dashboard_span_duration_ms_bucket{{span="{label}",le="+Inf"}} {count}')
+            lines.append(f'dashboard_span_duration_ms_sum{{span="{label}"}} {total_ms:.3f}')
+            lines.append(f'dashboard_span_duration_ms_count{{span="{label}"}} {count}')
+        lines.append("# HELP dashboard_events_total Instrumentation counters.")
+        lines.append("# TYPE dashboard_events_total counter")
+        for name, value in sorted(counters.items()):
+            lines.append(f'dashboard_events_total{{name="{_label(name)}"}} {value}')
+        lines.append(f"dashboard_uptime_seconds {time.time() - self.start_time:.1f}")
+        return "\n".join(lines) + "\n"
+
+
+metrics = Instrumentation()
+
+
 class BootProfiler:
-    """Helper to track performance of boot operations."""
+    """Boot timeline view over the shared instrumentation ring buffer."""
     _instance = None
-    _MAX_EVENTS = 200  # Cap to prevent unbounded memory growth during long-running sessions
-    
+
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(BootProfiler, cls).__new__(cls)
-            cls._instance.events = []
-            cls._instance.start_time = time.time()
+            cls._instance.metrics = metrics
         return cls._instance
-    
+
+    @property
+    def start_time(self):
+        return self.metrics.start_time
+
+    @property
+    def events(self):
+        """(name, elapsed, thread) for each recorded mark."""
+        return [(e.name, e.at, e.thread) for e in self.metrics.events('mark')]
+
     def mark(self, event_name):
         """Mark a point in time with a name."""
-        elapsed = time.time() - self.start_time
-        thread_name = threading.current_thread().name
-        if len(self.events) >= self._MAX_EVENTS:
-            # Drop the oldest entry to keep the list bounded
-            self.events.pop(0)
-        self.events.append((event_name, elapsed, thread_name))
-        logger.info(f"PROFILER: [{thread_name}] {event_name} at {elapsed:.3f}s")
-        
+        self.metrics.event(event_name)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"PROFILER: [{threading.current_thread().name}] {event_name} "
+                         f"at {time.time() - self.start_time:.3f}s")
+
     def get_summary(self):
-        """Get a formatted summary of all tracked events."""
+        """Get a formatted summary of the marks and spans recorded so far."""
         summary = ["--- Boot Performance Summary ---"]
         prev_time = 0
-        for name, timestamp, thread_name in self.events:
-            duration = timestamp - prev_time
-            summary.append(f"[{thread_name:^12}] {name:.<40} {timestamp:>6.3f}s (step: {duration:>6.3f}s)")
-            prev_time = timestamp
+        for event in self.metrics.events():
+            if event.kind == 'span':
+                summary.append(f"[{event.thread:^12}] {event.name + ' (span)':.<40} "
+                               f"{event.at:>6.3f}s (took: {event.duration_ms / 1000:>6.3f}s)")
+                continue
+            duration = event.at - prev_time
+            summary.append(f"[{event.thread:^12}] {event.name:.<40} {event.at:>6.3f}s (step: {duration:>6.3f}s)")
+            prev_time = event.at
         summary.append(f"{'Total Boot Time':.<55} {prev_time:>6.3f}s")
+        summary.extend(self._warm_boot_comparison())
         return "\n".join(summary)
 
+    def record_warm_boot(self, path):
+        """Record time-to-first-data for this boot under path ('snapshot' or 'cache').
+
+        The latest time for each path is kept on disk so the summary can compare a
+        snapshot warm boot against the last cache-rebuild warm boot.
+        """
+        elapsed = time.time() - self.start_time
+        self.warm_boot = (path, elapsed)
+        try:
+            history = load_cache_from_file(RUNTIME_CACHE_FILE_BOOT_TIMES)
+            times = history['data'] if history and isinstance(history.get('data'), dict) else {}
+            times[path] = round(elapsed, 3)
+            save_cache_to_file(RUNTIME_CACHE_FILE_BOOT_TIMES, times, datetime.now(pytz.UTC))
+            self._warm_boot_history = times
+        except Exception as e:
+            logger.debug(f"Failed to record warm boot time: {e}")
+
+    def _warm_boot_comparison(self):
+        current = getattr(self, 'warm_boot', None)
+        if not current:
+            return []
+        path, elapsed = current
+        lines = ["--- Warm Boot (time to first data) ---",
+                 f"{path + ' (this boot)':.<55} {elapsed:>6.3f}s"]
+        for other, seconds in sorted(getattr(self, '_warm_boot_history', {}).items()):
+            if other != path:
+                lines.append(f"{other + ' (last recorded)':.<55} {seconds:>6.3f}s")
+        return lines
+
     def log_summary(self):
         """Log the summary to the application log."""
         logger.info("\n" + self.get_summary())
 
 profiler = BootProfiler()
 
+
+# --- Main-thread stall detection ---
+# The Qt thread beats a heartbeat from a QTimer; a watcher thread notices when the
+# beat is late and captures the Qt thread's stack while it is still stuck.
+STALL_HEARTBEAT_MS = 100
+# Set DASHBOARD_STALL_THRESHOLD_MS=0 to disable the watcher
+STALL_DEFAULT_THRESHOLD_MS = 500
+
+
+def _stall_threshold_from_env():
+    """DASHBOARD_STALL_THRESHOLD_MS in ms; a malformed value falls back to the default."""
+    value = os.environ.get('DASHBOARD_STALL_THRESHOLD_MS', str(STALL_DEFAULT_THRESHOLD_MS)).strip()
+    if not value:
+        return 0
+    try:
+        return max(0, int(value))
+    except ValueError:
+        logger.warning(f"Invalid DASHBOARD_STALL_THRESHOLD_MS={value!r}; using {STALL_DEFAULT_THRESHOLD_MS} ms")
+        return STALL_DEFAULT_THRESHOLD_MS
+
+
+STALL_THRESHOLD_MS = _stall_threshold_from_env()
+STALL_RING_SIZE = 64
+STALL_STACK_LIMIT = 30
+STALL_TOP_SITES = 10
+
+StallRecord = collections.namedtuple('StallRecord', 'at duration_ms site stack')
+
+
+class StallDetector:
+    """Heartbeat watchdog for one thread (the Qt main thread by default).
+
+    beat() is called from the watched thread's event loop every heartbeat_ms.
+    When a beat is more than threshold_ms late the watcher thread grabs that
+    thread's stack from sys._current_frames() and logs it with its site
+    (innermost dashboard frame) straight away, so a hang that never ends is
+    still reported. Once beats resume the stall's final duration goes to a
+    ring buffer, the log and the 'main_thread.stall' histogram in metrics.
+    """
+
+    def __init__(self, threshold_ms=STALL_THRESHOLD_MS, heartbeat_ms=STALL_HEARTBEAT_MS,
+                 ring_size=STALL_RING_SIZE, thread_id=None):
+        self.threshold_ms = threshold_ms
+        self.heartbeat_ms = heartbeat_ms
+        self.thread_id = thread_id or threading.main_thread().ident
+        self._last_beat = time.monotonic()
+        self._pending = None  # (last beat before the stall, captured stack) while stalled
+        self._stalls = collections.deque(maxlen=ring_size)
+        self._sites = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def beat(self):
+        self._last_beat = time.monotonic()
+
+    def start(self):
+        if self.threshold_ms <= 0 or (self._thread and self._thread.is_alive()):
+            return self
+        self._stop.clear()
+        self._last_beat = time.monotonic()
+        self._thread = threading.Thread(target=self._watch, name="stall-watchdog", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(1.0)
+            self._thread = None
+
+    def _watch(self):
+        poll_s = min(self.heartbeat_ms, self.threshold_ms / 2) / 1000.0
+        while not self._stop.wait(poll_s):
+            try:
+                self.check()
+            except Exception as e:
+                logger.debug(f"Stall watchdog check failed: {e}")
+
+    def check(self, now=None):
+        """Compare the last beat against the clock; capture or finish a stall."""
+        now = time.monotonic() if now is None else now
+        last_beat = self._last_beat
+        if self._pending is None:
+            late_ms = (now - last_beat) * 1000.0 - self.heartbeat_ms
+            if late_ms > self.threshold_ms:
+                stack = self._capture_stack()
+                self._pending = (last_beat, stack)
+                logger.warning(f"Main thread stalled >{late_ms:.0f} ms at {self._site(stack)}\n  "
+                               + "\n  ".join(self._format_stack(stack)[-12:]))
+            return
+        stalled_since, stack = self._pending
+        if last_beat != stalled_since:
+            self._pending = None
+            self._record(stalled_since, (last_beat - stalled_since) * 1000.0 - self.heartbeat_ms, stack)
+
+    def _capture_stack(self):
+        frame = sys._current_frames().get(self.thread_id)
+        if frame is None:
+            return []
+        return traceback.extract_stack(frame, limit=STALL_STACK_LIMIT)
+
+    @staticmethod
+    def _format_stack(stack):
+        return [f"{f.filename}:{f.lineno} in {f.name}" for f in stack]
+
+    @staticmethod
+    def _site(stack):
+        """Innermost frame in the dashboard's own sources, else the innermost frame."""
+        src_dir = os.path.dirname(os.path.abspath(__file__))
+        for frame in reversed(stack):
+            if os.path.abspath(frame.filename).startswith(src_dir):
+                return f"{os.path.basename(frame.filename)}:{frame.lineno} {frame.name}"
+        if stack:
+            return f"{os.path.basename(stack[-1].filename)}:{stack[-1].lineno} {stack[-1].name}"
+        return "unknown"
+
+    def _record(self, stalled_since, duration_ms, stack):
+        site = self._site(stack)
+        at = time.time() - (time.monotonic() - stalled_since)
+        record = StallRecord(at, duration_ms, site, self._format_stack(stack))
+        with self._lock:
+            self._stalls.append(record)
+            count, total_ms, max_ms = self._sites.get(site, (0, 0.0, 0.0))
+            self._sites[site] = (count + 1, total_ms + duration_ms, max(max_ms, duration_ms))
+        metrics.observe("main_thread.stall", duration_ms)
+        # The stack was logged when the stall was detected
+        logger.warning(f"Main thread stall at {site} ended after {duration_ms:.0f} ms")
+
+    def stalls(self):
+        with self._lock:
+            return list(self._stalls)
+
+    def summary(self, top=STALL_TOP_SITES):
+        """Totals since boot, the top stall sites by total time and the most recent stalls."""
+        with self._lock:
+            sites = sorted(self._sites.items(), key=lambda item: -item[1][1])
+            recent = list(self._stalls)[-top:]
+        return {
+            'threshold_ms': self.threshold_ms,
+            'count': sum(count for _, (count, _, _) in sites),
+            'total_ms': sum(total for _, (_, total, _) in sites),
+            'top_sites': [{'site': site, 'count': count, 'total_ms': total_ms, 'max_ms': max_ms}
+                          for site, (count, total_ms, max_ms) in sites[:top]],
+            'recent': [record._asdict() for record in reversed(recent)],
+        }
+
+    def format_report(self, top=STALL_TOP_SITES):
+        summary = self.summary(top)
+        lines = [f"--- Main-thread stalls (> {self.threshold_ms} ms): {summary['count']} "
+                 f"totalling {summary['total_ms'] / 1000:.1f}s ---"]
+        for site in summary['top_sites']:
+            lines.append(f"  {site['site']:.<52} {site['count']:>5} x  total {site['total_ms']:>8.0f} ms"
+                         f"  max {site['max_ms']:>7.0f} ms")
+        return "\n".join(lines)
+
+    def prometheus_text(self):
+        """Per-site stall totals, appended to the /metrics exposition."""
+        with self._lock:
+            sites = dict(self._sites)
+        lines = ["# HELP dashboard_main_thread_stall_ms_total Main-thread stall time by site.",
+                 "# TYPE dashboard_main_thread_stall_ms_total counter"]
+        for site, (_, total_ms, _) in sorted(sites.items()):
+            lines.append(f'dashboard_main_thread_stall_ms_total{{site="{_prometheus_label(site)}"}} {total_ms:.1f}')
+        lines.append("# HELP dashboard_main_thread_stalls_total Main-thread stalls by site.")
+        lines.append("# TYPE dashboard_main_thread_stalls_total counter")
+        for site, (count, _, _) in sorted(sites.items()):
+            lines.append(f'dashboard_main_thread_stalls_total{{site="{_prometheus_label(site)}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+
+stall_detector = StallDetector()
+
 __all__ = [
     # status helpers
     "BootProfiler",
+    "Instrumentation",
+    "metrics",
+    "StallDetector",
+    "stall_detector",
+    "lazy_import",
     "set_loader_status_callback",
     "emit_loader_status",
     # cache io
     "load_cache_from_file",
     "save_cache_to_file",
+    "atomic_write_bytes",
+    "json_codec",
+    "set_json_codec",
+    "CacheWriter",
+    "cache_writer",
     # launch cache helpers
     "load_launch_cache",
     "save_launch_cache",
+    # boot snapshot helpers
+    "build_boot_snapshot",
+    "save_boot_snapshot",
+    "load_boot_snapshot",
     # network/system helpers
     "check_wifi_status",
     "fetch_launches",
@@ -102,6 +636,7 @@ __all__ = [
     "CACHE_FILE_F1_CONSTRUCTORS",
     "RUNTIME_CACHE_FILE_LAUNCHES",
     "RUNTIME_CACHE_FILE_NARRATIVES",
+    "RUNTIME_CACHE_FILE_BOOT_SNAPSHOT",
     "WIFI_KEY_FILE",
     "REMEMBERED_NETWORKS_FILE",
     "LAST_CONNECTED_NETWORK_FILE",
@@ -118,12 +653,25 @@ __all__ = [
     "load_last_connected_network",
     "save_last_connected_network",
     "start_http_server",
+    "album_art_url",
     "reset_spotify_auth_result",
     "consume_spotify_auth_result",
+    "SpotifyPollScheduler",
+    "SpotifyTokenState",
+    "TTLCache",
+    "LiveStreamIndex",
+    "WeatherViewModel",
     "perform_wifi_scan",
     "manage_nm_autoconnect",
+    "DisplayControl",
+    "DDCCIClient",
+    "DDCUtilClient",
+    "DDC_DISPLAY_VCP_CODES",
     "test_network_connectivity",
+    "connectivity_bus",
+    "set_connectivity_probe_targets",
     "get_git_version_info",
+    "read_git_head",
     "check_github_for_updates",
     "connect_to_wifi_worker",
     "get_launch_trends_series",
@@ -144,22 +692,31 @@ __all__ = [
     "calculate_chart_interval",
     "filter_and_sort_wifi_networks",
     "get_nmcli_profiles",
+    "NetworkManagerWifiMonitor",
+    "start_wifi_monitor",
+    "stop_wifi_monitor",
     "fetch_weather_for_all_locations",
     "perform_full_dashboard_data_load",
     "setup_dashboard_environment",
     "setup_dashboard_logging",
+    "install_async_logging",
+    "parse_log_levels",
     "format_qt_message",
     "get_launch_tray_visibility_state",
     "get_countdown_string",
-    "get_update_progress_summary",
+    "LogTailFollower",
     "perform_bootstrap_diagnostics",
     "disconnect_from_wifi",
     "bring_up_nm_connection",
     "sync_remembered_networks",
     "remove_nm_connection",
     "fetch_narratives",
+    "enrich_narratives",
+    "build_ticker_text",
     "load_theme_settings",
     "save_theme_settings",
+    "load_display_settings",
+    "save_display_settings",
     "load_launch_tray_mode_setting",
     "save_launch_tray_mode_setting",
     "get_rpi_config_resolution",
@@ -228,6 +785,12 @@ RUNTIME_CACHE_FILE_CHART_TRENDS = os.path.join(CACHE_DIR_F1, 'chart_trends_cache
 RUNTIME_CACHE_FILE_PARSED_DATES = os.path.join(CACHE_DIR_F1, 'parsed_dates_cache.json')
 RUNTIME_CACHE_FILE_NARRATIVES = os.path.join(CACHE_DIR_F1, 'narratives_cache.json')
 CACHE_FILE_WEATHER = os.path.join(CACHE_DIR_F1, 'weather_cache.json')
+# Fully derived UI state for warm boots (see build_boot_snapshot)
+RUNTIME_CACHE_FILE_BOOT_SNAPSHOT = os.path.join(CACHE_DIR_F1, 'boot_snapshot.json')
+RUNTIME_CACHE_FILE_BOOT_TIMES = os.path.join(CACHE_DIR_F1, 'boot_times.json')
+# ETag and last answer of the GitHub update check, per branch URL
+RUNTIME_CACHE_FILE_UPDATE_CHECK = os.path.join(CACHE_DIR_F1, 'update_check_cache.json')
+BOOT_SNAPSHOT_VERSION = 2
 
 # Different refresh intervals for different F1 data types
 CACHE_REFRESH_INTERVAL_F1_SCHEDULE = 86400  # 24 hours for race schedule (rarely changes)
@@ -243,6 +806,7 @@ LAST_CONNECTED_NETWORK_FILE = os.path.join(CACHE_DIR_F1, 'last_connected_network
 THEME_SETTINGS_FILE = os.path.join(CACHE_DIR_F1, 'theme_settings.json')
 BRANCH_SETTINGS_FILE = os.path.join(CACHE_DIR_F1, 'branch_settings.json')
 LAUNCH_TRAY_SETTINGS_FILE = os.path.join(CACHE_DIR_F1, 'launch_tray_settings.json')
+DISPLAY_SETTINGS_FILE = os.path.join(CACHE_DIR_F1, 'display_settings.json')
 TOUCH_CALIBRATION_FILE = "/etc/X11/xorg.conf.d/99-calibration.conf"
 
 def check_touch_calibration_exists():
@@ -328,6 +892,42 @@ def save_launch_tray_mode_setting(mode):
     except Exception as e:
         logger.error(f"Failed to save launch tray mode setting: {e}")
 
+
+# Last values applied to the large display over DDC/CI: sliders are 0-100 UI
+# values, choices the two-digit hex strings used by the QML option lists.
+DISPLAY_SETTINGS_SLIDERS = ('brightness', 'contrast', 'video_gain_red', 'video_gain_green',
+                            'video_gain_blue', 'sharpness')
+DISPLAY_SETTINGS_CHOICES = ('color_preset', 'input_source', 'power_mode')
+
+
+def load_display_settings():
+    """Load persisted display settings; invalid or missing entries are left out."""
+    settings = {}
+    try:
+        data = load_cache_from_file(DISPLAY_SETTINGS_FILE)
+        stored = data.get('data', {}) if data else {}
+        for key in DISPLAY_SETTINGS_SLIDERS:
+            value = stored.get(key)
+            if isinstance(value, (int, float)) and not isinstance(value, bool) and 0 <= value <= 100:
+                settings[key] = int(round(value))
+        for key in DISPLAY_SETTINGS_CHOICES:
+            value = str(stored.get(key, '')).strip().lower()
+            if re.fullmatch(r'[0-9a-f]{2}', value):
+                settings[key] = value
+    except Exception as e:
+        logger.warning(f"Failed to load display settings: {e}")
+    return settings
+
+
+def save_display_settings(settings):
+    """Save display settings to file."""
+    try:
+        data = {key: settings[key] for key in DISPLAY_SETTINGS_SLIDERS + DISPLAY_SETTINGS_CHOICES
+                if key in settings}
+        save_cache_to_file(DISPLAY_SETTINGS_FILE, data, datetime.now(pytz.UTC))
+    except Exception as e:
+        logger.error(f"Failed to save display settings: {e}")
+
 # F1 Team colors for visualization
 F1_TEAM_COLORS = {
     'red_bull': '#3671C6',      # Red Bull blue
@@ -415,57 +1015,248 @@ circuit_coords = {
 f1_cache = None
 
 
+# --- JSON codec for the cache layer ---
+# orjson parses and serialises the multi-megabyte caches several times faster
+# than the stdlib and handles datetimes natively; it is optional, so the stdlib
+# json module remains the fallback. DASHBOARD_JSON_CODEC=json forces the fallback.
+JSON_CODEC_PREFERENCE = os.environ.get('DASHBOARD_JSON_CODEC', 'auto').strip().lower()
+
+
+def _json_default(obj):
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class StdlibJsonCodec:
+    name = 'json'
+
+    def dumps(self, obj):
+        return json.dumps(obj, default=_json_default, separators=(',', ':')).encode('utf-8')
+
+    def loads(self, data):
+        return json.loads(data)
+
+
+class OrjsonCodec:
+    name = 'orjson'
+
+    def __init__(self, module=None):
+        if module is None:
+            import orjson as module
+        self._orjson = module
+        # The stdlib writes int dict keys as strings; keep that behaviour
+        self._options = module.OPT_NON_STR_KEYS
+
+    def dumps(self, obj):
+        return self._orjson.dumps(obj, default=_json_default, option=self._options)
+
+    def loads(self, data):
+        return self._orjson.loads(data)
+
+
+_json_codec = None
+
+
+def json_codec():
+    """Return the codec used for cache files, picking orjson when it is installed."""
+    global _json_codec
+    if _json_codec is None:
+        codec = None
+        if JSON_CODEC_PREFERENCE in ('auto', 'orjson'):
+            try:
+                codec = OrjsonCodec()
+            except ImportError:
+                if JSON_CODEC_PREFERENCE == 'orjson':
+                    logger.warning("DASHBOARD_JSON_CODEC=orjson but orjson is not installed; using json")
+        _json_codec = codec or StdlibJsonCodec()
+        logger.info(f"Cache JSON codec: {_json_codec.name}")
+    return _json_codec
+
+
+def set_json_codec(codec):
+    """Override the cache codec (tests, benchmarks); None re-runs detection."""
+    global _json_codec
+    _json_codec = codec
+
+
+def decode_json_datetime(value):
+    """Datetime for a value the codec wrote: ISO-8601 text, or epoch seconds from older caches."""
+    try:
+        if isinstance(value, str):
+            dt = datetime.fromisoformat(value[:-1] + '+00:00' if value.endswith('Z') else value)
+            return dt.replace(tzinfo=pytz.UTC) if dt.tzinfo is None else dt.astimezone(pytz.UTC)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return datetime.fromtimestamp(value, pytz.UTC)
+    except (ValueError, OverflowError, OSError):
+        pass
+    return None
+
+
+# --- Cache persistence: atomic writes behind a coalescing write-behind queue ---
+# A power cut in the middle of open('w') + json.dump left a truncated cache
+# that the next boot threw away in favour of stale seed data. Cache files are
+# now replaced via temp file + fsync + rename, and saves of the same file
+# within CACHE_WRITE_BEHIND_S collapse into one write on a background thread.
+# cache.write_requests vs cache.disk_writes in the metrics shows the saving.
+CACHE_WRITE_BEHIND_S = float(os.environ.get('DASHBOARD_CACHE_WRITE_BEHIND_S', '2.0'))  # 0 writes inline
+
+
+def atomic_write_bytes(path, data):
+    """Replace path with data so that readers see either the old or the new file, never a torn one."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            mode = os.stat(path).st_mode & 0o777
+        except OSError:
+            mode = 0o644  # mkstemp creates 0600; keep caches readable like open('w') did
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    metrics.count("cache.disk_writes")
+    if hasattr(os, 'O_DIRECTORY'):
+        # Make the rename itself durable
+        try:
+            dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        except OSError:
+            pass
+
+
+class CacheWriter:
+    """Write-behind queue of whole-file replacements keyed by path.
+
+    submit() records the newest encoded bytes for a path and returns; the writer
+    thread waits delay seconds after a write is queued so later saves of the same
+    file replace it, then writes each file once with atomic_write_bytes. Queued
+    data stays visible through pending() until it is on disk.
+    """
+
+    def __init__(self, delay=CACHE_WRITE_BEHIND_S):
+        self.delay = delay
+        self._cond = threading.Condition()
+        self._io_lock = threading.Lock()
+        self._pending = {}
+        self._thread = None
+
+    def submit(self, path, data):
+        metrics.count("cache.write_requests")
+        if self.delay <= 0:
+            with self._io_lock:
+                atomic_write_bytes(path, data)
+            return
+        with self._cond:
+            if path in self._pending:
+                metrics.count("cache.writes_coalesced")
+            self._pending[path] = data
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="cache-writer", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def pending(self, path):
+        with self._cond:
+            return self._pending.get(path)
+
+    def discard(self, path):
+        """Drop a queued write, e.g. when the file is deliberately removed."""
+        with self._cond:
+            self._pending.pop(path, None)
+
+    def flush(self):
+        """Write everything queued so far on the calling thread."""
+        with self._io_lock:
+            with self._cond:
+                batch = list(self._pending.items())
+            for path, data in batch:
+                try:
+                    atomic_write_bytes(path, data)
+                except OSError as e:
+                    logger.warning(f"Failed to save cache to {path}: {e}")
+                with self._cond:
+                    # A newer save that arrived meanwhile stays queued
+                    if self._pending.get(path) is data:
+                        del self._pending[path]
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending)
+            time.sleep(self.delay)
+            self.flush()
+
+
+cache_writer = CacheWriter()
+atexit.register(cache_writer.flush)
+
+
 def load_cache_from_file(cache_file):
     """Load structured cache from a JSON file.
 
     Returns a dict with keys {"data", "timestamp"} where timestamp is
-    converted to timezone-aware UTC datetime, or None on failure.
+    converted to timezone-aware UTC datetime, or None on failure. A save
+    still queued in cache_writer is returned in place of the file on disk.
     """
     try:
-        if os.path.exists(cache_file):
-            with open(cache_file, 'r') as f:
-                cache_data = json.load(f)
-                
-                # Check for mandatory 'data' key
-                if 'data' not in cache_data:
-                    logger.warning(f"Cache file {cache_file} missing 'data' key")
-                    return None
-                
-                # Handle timestamp (standard dashboard cache format)
-                if 'timestamp' in cache_data:
-                    try:
-                        cache_data['timestamp'] = datetime.fromisoformat(cache_data['timestamp'])
-                        if cache_data['timestamp'].tzinfo is None:
-                            cache_data['timestamp'] = cache_data['timestamp'].replace(tzinfo=pytz.UTC)
-                    except (ValueError, TypeError):
-                        cache_data['timestamp'] = datetime.fromtimestamp(os.path.getmtime(cache_file), pytz.UTC)
-                else:
-                    # Fallback for seed files (use file modification time)
-                    cache_data['timestamp'] = datetime.fromtimestamp(os.path.getmtime(cache_file), pytz.UTC)
-                
-                return cache_data
+        queued = cache_writer.pending(cache_file)
+        if queued is None:
+            if not os.path.exists(cache_file):
+                return None
+            with open(cache_file, 'rb') as f:
+                queued = f.read()
+        cache_data = json_codec().loads(queued)
+
+        # Check for mandatory 'data' key
+        if 'data' not in cache_data:
+            logger.warning(f"Cache file {cache_file} missing 'data' key")
+            return None
+
+        # Handle timestamp (standard dashboard cache format)
+        if 'timestamp' in cache_data:
+            try:
+                cache_data['timestamp'] = datetime.fromisoformat(cache_data['timestamp'])
+                if cache_data['timestamp'].tzinfo is None:
+                    cache_data['timestamp'] = cache_data['timestamp'].replace(tzinfo=pytz.UTC)
+            except (ValueError, TypeError):
+                cache_data['timestamp'] = datetime.fromtimestamp(os.path.getmtime(cache_file), pytz.UTC)
+        else:
+            # Fallback for seed files (use file modification time)
+            cache_data['timestamp'] = datetime.fromtimestamp(os.path.getmtime(cache_file), pytz.UTC)
+
+        return cache_data
     except (OSError, PermissionError, json.JSONDecodeError) as e:
         logger.warning(f"Failed to load cache from {cache_file}: {e}")
     return None
 
 
 def save_cache_to_file(cache_file, data, timestamp):
-    """Persist structured cache to a JSON file with ISO timestamp."""
+    """Persist structured cache to a JSON file with ISO timestamp (atomic, write-behind)."""
     try:
-        cache_data = {'data': data, 'timestamp': timestamp.isoformat()}
-        with open(cache_file, 'w') as f:
-            json.dump(cache_data, f)
+        cache_writer.submit(cache_file, json_codec().dumps({'data': data, 'timestamp': timestamp}))
     except (OSError, PermissionError) as e:
         logger.warning(f"Failed to save cache to {cache_file}: {e}")
 
 
 # Helpers for launch caches that use a single combined runtime cache
+@metrics.timed("load_launch_cache")
 def load_launch_cache(kind: str):
     """Load a launch cache for kind in {'previous','upcoming'} from the combined cache.
     Falls back to kind-specific seed files in the project root if combined cache is missing.
     Returns a dict: {'data': list, 'timestamp': datetime} or None.
     """
-    profiler.mark(f"load_launch_cache Start ({kind})")
     try:
         if kind not in ('previous', 'upcoming'):
             raise ValueError("kind must be 'previous' or 'upcoming'")
@@ -475,7 +1266,7 @@ def load_launch_cache(kind: str):
         if data and isinstance(data.get('data'), dict):
             kind_data = data['data'].get(kind)
             if isinstance(kind_data, list) and len(kind_data) > 0:
-                profiler.mark(f"load_launch_cache End ({kind}: Success from runtime)")
+                metrics.count("load_launch_cache.runtime")
                 return {'data': kind_data, 'timestamp': data['timestamp']}
         
         # Fallback to seed files
@@ -483,20 +1274,20 @@ def load_launch_cache(kind: str):
         seed_path = SEED_CACHE_FILE_PREVIOUS if kind == 'previous' else SEED_CACHE_FILE_UPCOMING
         seed_data = load_cache_from_file(seed_path)
         if seed_data and isinstance(seed_data.get('data'), list):
-            profiler.mark(f"load_launch_cache End ({kind}: Success from seed)")
+            metrics.count("load_launch_cache.seed")
             return {'data': seed_data['data'], 'timestamp': seed_data['timestamp']}
         
-        profiler.mark(f"load_launch_cache End ({kind}: Empty/Fail)")
+        metrics.count("load_launch_cache.miss")
         return None
     except Exception as e:
         logger.warning(f"Failed to load {kind} launch cache: {e}")
-        profiler.mark(f"load_launch_cache End ({kind}: Exception)")
+        metrics.count("load_launch_cache.errors")
         return None
 
 
+@metrics.timed("save_launch_cache")
 def save_launch_cache(kind: str, data_list: list, timestamp=None):
     """Save kind-specific launches into the combined runtime cache."""
-    profiler.mark(f"save_launch_cache Start ({kind})")
     try:
         if kind not in ('previous', 'upcoming'):
             raise ValueError("kind must be 'previous' or 'upcoming'")
@@ -513,11 +1304,127 @@ def save_launch_cache(kind: str, data_list: list, timestamp=None):
         launch_data[kind] = data_list
         ts = timestamp or combined_ts
         save_cache_to_file(RUNTIME_CACHE_FILE_LAUNCHES, launch_data, ts)
-        profiler.mark(f"save_launch_cache End ({kind})")
     except Exception as e:
         logger.warning(f"Failed to save {kind} launch cache: {e}")
-        profiler.mark(f"save_launch_cache End ({kind}: Exception)")
+        metrics.count("save_launch_cache.errors")
+
+
+
+# --- Boot snapshot: derived UI state written after each refresh, applied first on warm boot ---
+# Freshness is judged by the runtime launch cache's mtime against the snapshot's
+# written_at (the cache file is the data version); launch_data_signature only
+# checks that the embedded launch data wasn't damaged or edited.
+def launch_data_signature(launch_data):
+    """Content checksum of launch data, stored in the boot snapshot as an integrity check."""
+    digest = hashlib.sha1()
+    for kind in ('previous', 'upcoming'):
+        for launch in (launch_data or {}).get(kind, []) or []:
+            digest.update(f"{kind}|{launch.get('id', launch.get('mission', ''))}|{launch.get('net', '')}|{launch.get('status', '')}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _snapshot_safe(value):
+    """Drop private keys (e.g. cached _parsed_dt) and make values JSON-serialisable."""
+    if isinstance(value, dict):
+        return {k: _snapshot_safe(v) for k, v in value.items() if not (isinstance(k, str) and k.startswith('_'))}
+    if isinstance(value, (list, tuple)):
+        return [_snapshot_safe(v) for v in value]
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def build_boot_snapshot(launch_data, tz_obj, location, event_rows, calendar_mapping, trends,
+                        next_launch, upcoming_launches, trajectory, weather, live_launch_url="",
+                        mode='spacex', event_type='upcoming'):
+    """Assemble the versioned boot snapshot from already-derived UI state."""
+    return {
+        'version': BOOT_SNAPSHOT_VERSION,
+        'data_checksum': launch_data_signature(launch_data),
+        'written_at': time.time(),
+        'timezone': str(tz_obj),
+        'local_date': datetime.now(tz_obj).date().isoformat(),
+        'location': location,
+        'mode': mode,
+        'event_type': event_type,
+        'launch_data': _snapshot_safe(launch_data),
+        'event_rows': _snapshot_safe(event_rows),
+        'calendar': _snapshot_safe(calendar_mapping),
+        'trends': _snapshot_safe(trends),
+        'next_launch': _snapshot_safe(next_launch),
+        'upcoming_launches': _snapshot_safe(upcoming_launches),
+        'trajectory': _snapshot_safe(trajectory),
+        'weather': _snapshot_safe(weather),
+        'live_launch_url': live_launch_url or "",
+    }
+
 
+def save_boot_snapshot(snapshot, path=None):
+    """Write the boot snapshot atomically so a crash never leaves a torn file.
+
+    Queued cache writes go out first: load_boot_snapshot treats a launch cache
+    newer than written_at as a sign the snapshot is stale.
+    """
+    path = path or RUNTIME_CACHE_FILE_BOOT_SNAPSHOT
+    try:
+        cache_writer.flush()
+        snapshot['written_at'] = time.time()
+        atomic_write_bytes(path, json_codec().dumps(snapshot))
+        return True
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning(f"Failed to save boot snapshot: {e}")
+        return False
+
+
+def load_boot_snapshot(tz_obj, location, mode='spacex', event_type='upcoming', path=None):
+    """Load and validate the boot snapshot with a single memory-mapped read.
+
+    Returns None when the file is missing, from another snapshot version, for a
+    different timezone/location/view, fails the launch-data integrity check, or
+    is older than the runtime launch cache (whose mtime is the data version).
+    The grouped event rows are dropped (set to None) when the local date has
+    changed since they were written, since the Today/This Week buckets move.
+    """
+    path = path or RUNTIME_CACHE_FILE_BOOT_SNAPSHOT
+    profiler.mark("load_boot_snapshot Start")
+    try:
+        with open(path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                snapshot = json_codec().loads(mm[:])
+    except FileNotFoundError:
+        profiler.mark("load_boot_snapshot End (missing)")
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Failed to read boot snapshot: {e}")
+        profiler.mark("load_boot_snapshot End (unreadable)")
+        return None
+
+    reason = None
+    if not isinstance(snapshot, dict) or snapshot.get('version') != BOOT_SNAPSHOT_VERSION:
+        reason = "version mismatch"
+    elif snapshot.get('timezone') != str(tz_obj):
+        reason = f"timezone {snapshot.get('timezone')} != {tz_obj}"
+    elif snapshot.get('location') != location or snapshot.get('mode') != mode or snapshot.get('event_type') != event_type:
+        reason = "view mismatch"
+    elif snapshot.get('data_checksum') != launch_data_signature(snapshot.get('launch_data')):
+        reason = "launch data failed its integrity check"
+    else:
+        try:
+            # Staleness: the launch cache is the data version, so any launch
+            # write that landed after the snapshot makes it out of date
+            if os.path.getmtime(RUNTIME_CACHE_FILE_LAUNCHES) > float(snapshot.get('written_at', 0)) + 1:
+                reason = "launch cache is newer"
+        except OSError:
+            pass
+    if reason:
+        logger.info(f"Boot snapshot ignored: {reason}")
+        profiler.mark("load_boot_snapshot End (invalid)")
+        return None
+
+    if snapshot.get('local_date') != datetime.now(tz_obj).date().isoformat():
+        snapshot['event_rows'] = None
+    profiler.mark("load_boot_snapshot End (valid)")
+    return snapshot
 
 
 def _ang_dist_deg(a, b):
@@ -563,17 +1470,21 @@ def compute_orbit_radius(orbit_label):
 _WIFI_STATUS_CACHE = {'connected': False, 'ssid': '', 'timestamp': 0}
 WIFI_STATUS_TTL = 30  # seconds
 
+@metrics.timed("check_wifi_status")
 def check_wifi_status():
     """Check WiFi connection status and return (connected, ssid) tuple"""
     global _WIFI_STATUS_CACHE
-    
+
+    # The D-Bus monitor's model is always current; no subprocesses needed
+    if _wifi_monitor is not None and _wifi_monitor.available:
+        return _wifi_monitor.status()
+
     # Return cached result if fresh
     now = time.time()
     if now - _WIFI_STATUS_CACHE['timestamp'] < WIFI_STATUS_TTL:
         logger.debug(f"Returning cached WiFi status: {_WIFI_STATUS_CACHE['connected']} ({_WIFI_STATUS_CACHE['ssid']})")
         return _WIFI_STATUS_CACHE['connected'], _WIFI_STATUS_CACHE['ssid']
 
-    profiler.mark("check_wifi_status Start")
     try:
         is_windows = platform.system() == 'Windows'
         
@@ -595,7 +1506,6 @@ def check_wifi_status():
                         current_ssid = ssid_match.group(1).strip()
             
             _WIFI_STATUS_CACHE = {'connected': connected, 'ssid': current_ssid, 'timestamp': now}
-            profiler.mark(f"check_wifi_status End (Windows: {connected})")
             return connected, current_ssid
         else:
             # Enhanced Linux WiFi status checking
@@ -651,11 +1561,10 @@ def check_wifi_status():
                 except Exception: pass
 
             _WIFI_STATUS_CACHE = {'connected': connected, 'ssid': current_ssid, 'timestamp': now}
-            profiler.mark(f"check_wifi_status End (Linux: {connected})")
             return connected, current_ssid
     except Exception as e:
         logger.error(f"Error in check_wifi_status: {e}")
-        profiler.mark("check_wifi_status End (Error)")
+        metrics.count("check_wifi_status.errors")
         return False, ""
 
 def fetch_launch_details(launch_id):
@@ -709,6 +1618,7 @@ def parse_launch_data(launch: dict, is_detailed: bool = False) -> dict:
     }
 
 # --- Data fetchers moved from app.py ---
+@metrics.timed("fetch_launches")
 def fetch_launches():
     """Fetch SpaceX launch data (upcoming and previous) from the new API."""
     logger.info("Fetching SpaceX launch data from new API")
@@ -760,45 +1670,44 @@ def fetch_launches():
                 merged_prev_map[launch_id] = l
         
         # Sort merged previous launches by date descending
-        profiler.mark("fetch_launches: Sorting and Deduplicating Start")
-        def _parse_net(l):
-            dt = _get_parsed_dt(l.get('net', ''))
-            return dt if dt else datetime.min.replace(tzinfo=pytz.UTC)
+        with metrics.span("fetch_launches.sort_dedupe"):
+            def _parse_net(l):
+                dt = _get_parsed_dt(l.get('net', ''))
+                return dt if dt else datetime.min.replace(tzinfo=pytz.UTC)
 
-        merged_previous = sorted(merged_prev_map.values(), key=_parse_net, reverse=True)
+            merged_previous = sorted(merged_prev_map.values(), key=_parse_net, reverse=True)
         
-        # For upcoming, we trust the API's current schedule
-        # but remove any that have moved into the previous list
-        # SPECIAL CASE: if a launch is in 'previous' but is NOT finished (e.g. 'In Flight'),
-        # we treat it as an active/upcoming launch so it stays in the banner and next launch slot.
-        prev_ids = {l.get('id') for l in merged_previous if l.get('id')}
+            # For upcoming, we trust the API's current schedule
+            # but remove any that have moved into the previous list
+            # SPECIAL CASE: if a launch is in 'previous' but is NOT finished (e.g. 'In Flight'),
+            # we treat it as an active/upcoming launch so it stays in the banner and next launch slot.
+            prev_ids = {l.get('id') for l in merged_previous if l.get('id')}
         
-        # Find unfinished launches in the previous list
-        active_launches = [l for l in merged_previous if not is_launch_finished(l.get('status'))]
-        active_ids = {l.get('id') for l in active_launches}
+            # Find unfinished launches in the previous list
+            active_launches = [l for l in merged_previous if not is_launch_finished(l.get('status'))]
+            active_ids = {l.get('id') for l in active_launches}
         
-        # Remove truly finished previous launches from the upcoming list
-        merged_upcoming = [l for l in api_upcoming if l.get('id') not in prev_ids or l.get('id') in active_ids]
+            # Remove truly finished previous launches from the upcoming list
+            merged_upcoming = [l for l in api_upcoming if l.get('id') not in prev_ids or l.get('id') in active_ids]
         
-        # Add any active launches from 'previous' back to 'upcoming' if they are missing
-        upcoming_ids = {l.get('id') for l in merged_upcoming if l.get('id')}
-        for al in active_launches:
-            if al.get('id') not in upcoming_ids:
-                merged_upcoming.append(al)
+            # Add any active launches from 'previous' back to 'upcoming' if they are missing
+            upcoming_ids = {l.get('id') for l in merged_upcoming if l.get('id')}
+            for al in active_launches:
+                if al.get('id') not in upcoming_ids:
+                    merged_upcoming.append(al)
                 
-        # To avoid showing them in "Past Launches" group while they are "In Flight",
-        # we remove active launches from the merged_previous list
-        merged_previous = [l for l in merged_previous if l.get('id') not in active_ids]
+            # To avoid showing them in "Past Launches" group while they are "In Flight",
+            # we remove active launches from the merged_previous list
+            merged_previous = [l for l in merged_previous if l.get('id') not in active_ids]
         
-        # Sort both lists by date (upcoming ascending, previous descending)
-        merged_upcoming = sorted(merged_upcoming, key=_parse_net)
-        merged_previous = sorted(merged_previous, key=_parse_net, reverse=True)
+            # Sort both lists by date (upcoming ascending, previous descending)
+            merged_upcoming = sorted(merged_upcoming, key=_parse_net)
+            merged_previous = sorted(merged_previous, key=_parse_net, reverse=True)
         
-        launch_data = {
-            'upcoming': merged_upcoming,
-            'previous': merged_previous
-        }
-        profiler.mark("fetch_launches: Sorting and Deduplicating End")
+            launch_data = {
+                'upcoming': merged_upcoming,
+                'previous': merged_previous
+            }
         
         save_cache_to_file(RUNTIME_CACHE_FILE_LAUNCHES, launch_data, datetime.now(pytz.UTC))
         logger.info(f"Fetched {len(api_upcoming)} upcoming and {len(api_previous)} previous launches from API")
@@ -811,9 +1720,127 @@ def fetch_launches():
         return {'previous': [], 'upcoming': []}
 
 
+# Narrative dates are "M/D HHMM" (e.g. "7/1 2104"); a launch matches when its
+# month/day agree and, if the narrative has a time, it is within a few minutes.
+NARRATIVE_MATCH_TOLERANCE_MIN = 5
+NARRATIVE_LAUNCH_FIELDS = ('status', 'landing_location', 'landing_type', 'orbit', 'rocket', 'pad', 'mission')
+_narrative_memo_lock = threading.Lock()
+_narrative_index_memo = {'version': None, 'index': None}
+_enriched_narratives_memo = {'key': None, 'data': None}
+_ticker_text_memo = {'key': None, 'text': ""}
+# The QML used join(" \ "); "\ " is an escaped space in JS, so " \ " is two spaces
+NARRATIVE_TICKER_SEPARATOR = "  "
+
+
+def build_narrative_launch_index(launch_data):
+    """Map (month, day) -> [(minute of day, net datetime, launch)], upcoming before previous."""
+    index = collections.defaultdict(list)
+    for launch in (launch_data.get('upcoming', []) or []) + (launch_data.get('previous', []) or []):
+        l_dt = _get_parsed_dt(launch.get('net'))
+        if l_dt:
+            index[(l_dt.month, l_dt.day)].append((l_dt.hour * 60 + l_dt.minute, l_dt, launch))
+    return index
+
+
+def _narrative_launch_index(launch_data, version):
+    with _narrative_memo_lock:
+        if _narrative_index_memo['version'] == version:
+            return _narrative_index_memo['index']
+    index = build_narrative_launch_index(launch_data)
+    with _narrative_memo_lock:
+        _narrative_index_memo.update(version=version, index=index)
+    return index
+
+
+def _match_narrative(date_str, index):
+    """Return (launch, net datetime) for a narrative date string, or None."""
+    parts = date_str.split(' ')
+    month, day = (int(v) for v in parts[0].split('/')[:2])
+    bucket = index.get((month, day))
+    if not bucket:
+        return None
+    if len(parts) > 1 and len(parts[1]) == 4:
+        wanted = int(parts[1][:2]) * 60 + int(parts[1][2:])
+        for minute_of_day, l_dt, launch in bucket:
+            if abs(minute_of_day - wanted) <= NARRATIVE_MATCH_TOLERANCE_MIN:
+                return launch, l_dt
+        return None
+    # Without a time the last launch of the day wins, as before
+    return bucket[-1][2], bucket[-1][1]
+
+
+def narrative_launch_signature(launch_data):
+    """Signature of everything enrichment reads from launch data: id, net and NARRATIVE_LAUNCH_FIELDS."""
+    digest = hashlib.sha1()
+    for kind in ('upcoming', 'previous'):
+        for launch in (launch_data or {}).get(kind, []) or []:
+            values = [launch.get('id'), launch.get('net')] + [launch.get(field) for field in NARRATIVE_LAUNCH_FIELDS]
+            digest.update(f"{kind}|{json.dumps(values, default=str)}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def narratives_signature(narratives_list):
+    """Content hash of a narratives list; equal lists give equal signatures."""
+    return hashlib.sha1(json.dumps(narratives_list, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+def build_ticker_text(narratives_list):
+    """The scrolling ticker line: each narrative's 'full' text (or the legacy string), joined.
+
+    Memoised on the narratives signature, so repeated launch updates carrying the
+    same narratives return the identical string.
+    """
+    key = narratives_signature(narratives_list or [])
+    with _narrative_memo_lock:
+        if _ticker_text_memo['key'] == key:
+            metrics.count("ticker_text.memo_hits")
+            return _ticker_text_memo['text']
+    parts = []
+    for item in narratives_list or []:
+        parts.append(str(item['full']) if isinstance(item, dict) and item.get('full') else str(item))
+    text = NARRATIVE_TICKER_SEPARATOR.join(parts)
+    with _narrative_memo_lock:
+        _ticker_text_memo.update(key=key, text=text)
+    return text
+
+
+def enrich_narratives(narratives_list, launch_data):
+    """Attach launch metadata to narratives; memoised per (narratives, launch data version)."""
+    if not launch_data or not narratives_list:
+        return narratives_list
+    version = narrative_launch_signature(launch_data)
+    key = (narratives_signature(narratives_list), version)
+    with _narrative_memo_lock:
+        if _enriched_narratives_memo['key'] == key:
+            metrics.count("enrich_narratives.memo_hits")
+            return _enriched_narratives_memo['data']
+
+    with metrics.span("enrich_narratives"):
+        index = _narrative_launch_index(launch_data, version)
+        enriched = []
+        for narr in narratives_list:
+            narr = dict(narr)
+            if narr.get('date'):
+                try:
+                    match = _match_narrative(narr['date'], index)
+                    if match:
+                        launch, l_dt = match
+                        for field in NARRATIVE_LAUNCH_FIELDS:
+                            narr[field] = launch.get(field)
+                        # Add day of week (abbreviated, e.g. "Wed")
+                        narr['day_of_week'] = l_dt.strftime('%a')
+                except Exception as e:
+                    logger.debug(f"Failed to match narrative to launch: {e}")
+            enriched.append(narr)
+
+    with _narrative_memo_lock:
+        _enriched_narratives_memo.update(key=key, data=enriched)
+    return enriched
+
+
+@metrics.timed("fetch_narratives")
 def fetch_narratives(launch_data=None):
     """Fetch witty launch narratives from the new API and optionally enrich with launch metadata."""
-    profiler.mark("fetch_narratives Start")
     logger.info("Fetching narratives from new API")
     
     def parse_narratives(raw_list):
@@ -833,78 +1860,6 @@ def fetch_narratives(launch_data=None):
                 parsed.append({'date': '', 'text': item, 'full': item})
         return parsed
 
-    def enrich_narratives(narratives_list, launches):
-        if not launches:
-            return narratives_list
-        
-        # Combine upcoming and previous
-        all_launches = launches.get('upcoming', []) + launches.get('previous', [])
-        
-        for narr in narratives_list:
-            # Try to match narrative to a launch
-            # Narrative dates are usually M/D HHMM, e.g. "7/1 2104"
-            # Launch 'net' is "2024-07-01T21:04:00Z"
-            
-            narr_date_str = narr.get('date', '')
-            if not narr_date_str:
-                continue
-                
-            try:
-                # Narratives usually have M/D HHMM. Net has YYYY-MM-DDTHH:MM:SSZ
-                # We'll try to match by month, day, and hour/minute if possible.
-                # Example: "7/1 2104" -> month 7, day 1, hour 21, minute 04
-                parts = narr_date_str.split(' ')
-                md = parts[0].split('/')
-                month = int(md[0])
-                day = int(md[1])
-                
-                hour = -1
-                minute = -1
-                if len(parts) > 1 and len(parts[1]) == 4:
-                    hour = int(parts[1][:2])
-                    minute = int(parts[1][2:])
-                
-                best_match = None
-                for l in all_launches:
-                    l_net = l.get('net')
-                    if not l_net: continue
-                    
-                    l_dt = _get_parsed_dt(l_net)
-                    if not l_dt: continue
-                    
-                    # Match month and day
-                    if l_dt.month == month and l_dt.day == day:
-                        # If we have time, check it too (allowing small delta due to TBD changes)
-                        if hour != -1:
-                            if l_dt.hour == hour and abs(l_dt.minute - minute) <= 5:
-                                best_match = l
-                                break
-                        else:
-                            best_match = l
-                            # Don't break, keep looking for better time match if possible? 
-                            # Usually one launch per day per pad, but let's be safe.
-                
-                if best_match:
-                    narr['status'] = best_match.get('status')
-                    narr['landing_location'] = best_match.get('landing_location')
-                    narr['landing_type'] = best_match.get('landing_type')
-                    narr['orbit'] = best_match.get('orbit')
-                    narr['rocket'] = best_match.get('rocket')
-                    narr['pad'] = best_match.get('pad')
-                    narr['mission'] = best_match.get('mission')
-                    
-                    # Add day of week (abbreviated, e.g. "Wed")
-                    try:
-                        l_dt = _get_parsed_dt(best_match.get('net'))
-                        if l_dt:
-                            narr['day_of_week'] = l_dt.strftime('%a')
-                    except Exception:
-                        pass
-            except Exception as e:
-                logger.debug(f"Failed to match narrative to launch: {e}")
-                
-        return narratives_list
-
     # Try loading from cache first
     cache = None
     try:
@@ -912,7 +1867,6 @@ def fetch_narratives(launch_data=None):
         current_time = datetime.now(pytz.UTC)
         if cache and (current_time - cache['timestamp']).total_seconds() < CACHE_REFRESH_INTERVAL_NARRATIVES:
             logger.info("Using cached narratives")
-            # If we don't have launch_data, we can't re-enrich, but we might have cached enriched data
             return enrich_narratives(cache['data'], launch_data)
     except Exception as e:
         logger.warning(f"Failed to load narratives cache: {e}")
@@ -925,22 +1879,20 @@ def fetch_narratives(launch_data=None):
 
     try:
         url = f"{LAUNCH_API_BASE_URL}/recent_launches_narratives"
-        profiler.mark("fetch_narratives: API Request Start")
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        profiler.mark("fetch_narratives: API Request End")
+        with metrics.span("fetch_narratives.request"):
+            response = requests.get(url, timeout=10)
+            response.raise_for_status()
+            data = response.json()
 
         raw_narratives = data.get('descriptions', [])
         if raw_narratives:
             narratives = parse_narratives(raw_narratives)
             save_cache_to_file(RUNTIME_CACHE_FILE_NARRATIVES, narratives, datetime.now(pytz.UTC))
-            profiler.mark("fetch_narratives End (Success)")
             return enrich_narratives(narratives, launch_data)
 
     except Exception as e:
         logger.warning(f"Failed to fetch narratives from API: {e}")
-        profiler.mark("fetch_narratives End (Error)")
+        metrics.count("fetch_narratives.errors")
 
     if cache and cache.get('data'):
         return enrich_narratives(cache['data'], launch_data)
@@ -992,6 +1944,80 @@ def degrees_to_cardinal(degrees):
     except (ValueError, TypeError):
         return "N/A"
 
+
+# Fields the weather pill binds to, with the values shown when a location has no data
+WEATHER_VIEW_DEFAULTS = {
+    'has_temperature': False,
+    'temperature_f': 0.0,
+    'wind_speed_kts': 0.0,
+    'wind_gusts_kts': 0.0,
+    'wind_direction': 0.0,
+    'has_wind_direction': False,
+    'wind_direction_cardinal': "",
+    'is_live_wind': False,
+}
+
+
+def build_weather_view(weather, use_live_wind=True):
+    """Copy of one location's weather with live wind applied and the cardinal added.
+
+    The source dict is left untouched; live_wind (when present and allowed)
+    overrides the METAR wind speed, gusts and direction.
+    """
+    view = dict(weather or {})
+    live = view.get('live_wind') if use_live_wind else None
+    if live:
+        view['wind_speed_kts'] = live.get('speed_kts', view.get('wind_speed_kts', 0))
+        view['wind_gusts_kts'] = live.get('gust_kts', view.get('wind_gusts_kts', 0))
+        view['wind_direction'] = live.get('direction', view.get('wind_direction', 0))
+    view['is_live_wind'] = bool(live)
+    if 'wind_direction' in view:
+        view['wind_direction_cardinal'] = degrees_to_cardinal(view['wind_direction'])
+    return view
+
+
+def weather_view_fields(view):
+    """Flatten a weather view into the fixed WEATHER_VIEW_DEFAULTS keys."""
+    fields = dict(WEATHER_VIEW_DEFAULTS)
+    if view.get('temperature_f') is not None:
+        fields['has_temperature'] = True
+        fields['temperature_f'] = view['temperature_f']
+    for key in ('wind_speed_kts', 'wind_gusts_kts', 'wind_direction'):
+        if view.get(key) is not None:
+            fields[key] = view[key]
+    if 'wind_direction_cardinal' in view:
+        fields['has_wind_direction'] = True
+        fields['wind_direction_cardinal'] = view['wind_direction_cardinal']
+    fields['is_live_wind'] = view.get('is_live_wind', False)
+    return fields
+
+
+class WeatherViewModel:
+    """Per-location weather views rebuilt once per weather update.
+
+    update() builds a fresh view for every location; select() flattens the
+    active location's view and returns the names of the fields whose values
+    differ from the previous selection, so only those need pushing to the UI.
+    Views are replaced, never mutated, once handed out.
+    """
+
+    def __init__(self):
+        self._views = {}
+        self.fields = dict(WEATHER_VIEW_DEFAULTS)
+
+    def update(self, weather_data, use_live_wind=True):
+        self._views = {location: build_weather_view(weather, use_live_wind)
+                       for location, weather in (weather_data or {}).items()}
+
+    def view(self, location):
+        return self._views.get(location) or {}
+
+    def select(self, location):
+        fields = weather_view_fields(self.view(location))
+        changed = [key for key, value in fields.items() if self.fields.get(key) != value]
+        self.fields = fields
+        return changed
+
 def c_to_f(c):
     """Convert Celsius to Fahrenheit."""
     try:
@@ -999,13 +2025,12 @@ def c_to_f(c):
     except (ValueError, TypeError):
         return c
 
+@metrics.timed("fetch_weather")
 def fetch_weather(lat, lon, location):
     """Fetch weather for a single location from the new API."""
-    profiler.mark(f"fetch_weather Start ({location})")
     logger.info(f"Fetching weather for {location} via new API")
     try:
         url = f"{LAUNCH_API_BASE_URL}/weather/{location}"
-        profiler.mark(f"fetch_weather: Request Start ({location})")
         response = requests.get(url, timeout=10)
         response.raise_for_status()
         res_json = response.json()
@@ -1082,11 +2107,10 @@ def fetch_weather(lat, lon, location):
             
             res_json['forecast_processed'] = forecast_list
             
-        profiler.mark(f"fetch_weather End ({location}: Success)")
         return res_json
     except Exception as e:
         logger.warning(f"Failed to fetch weather for {location}: {e}")
-        profiler.mark(f"fetch_weather End ({location}: Error)")
+        metrics.count("fetch_weather.errors")
         return {
             'temperature_c': (77 - 32) * 5/9, 'temperature_f': 77,
             'wind_speed_ms': 5, 'wind_speed_kts': 9.7,
@@ -1109,7 +2133,7 @@ def get_encryption_key():
             return f.read()
     else:
         # Generate a new key
-        key = Fernet.generate_key()
+        key = _fernet.Fernet.generate_key()
         with open(WIFI_KEY_FILE, 'wb') as f:
             f.write(key)
         # Set restrictive permissions on Linux
@@ -1127,7 +2151,7 @@ def encrypt_password(password, key=None):
         return None
     if key is None:
         key = get_encryption_key()
-    f = Fernet(key)
+    f = _fernet.Fernet(key)
     return f.encrypt(password.encode()).decode()
 
 
@@ -1138,7 +2162,7 @@ def decrypt_password(encrypted_password, key=None):
     try:
         if key is None:
             key = get_encryption_key()
-        f = Fernet(key)
+        f = _fernet.Fernet(key)
         return f.decrypt(encrypted_password.encode()).decode()
     except:
         return None
@@ -1297,6 +2321,362 @@ def consume_spotify_auth_result(expected_state: str | None = None):
         return {"error": "state_mismatch"}
     return payload
 
+
+class TTLCache:
+    """Thread-safe response cache with a per-entry TTL and LRU eviction.
+
+    get() returns None on a miss or an expired entry; hit/miss counts are kept
+    for diagnostics.
+    """
+
+    def __init__(self, max_entries=128, clock=time.monotonic):
+        self._max_entries = max(1, int(max_entries))
+        self._clock = clock
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, predicate=None):
+        """Drop entries whose key matches predicate (all entries when None)."""
+        with self._lock:
+            if predicate is None:
+                self._entries.clear()
+                return
+            for key in [k for k in self._entries if predicate(k)]:
+                del self._entries[key]
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+
+class SpotifyTokenState:
+    """Newest Spotify tokens seen by any worker lane.
+
+    Token refreshes are serialised on lock: a lane re-reads the shared tokens
+    after acquiring it and only refreshes if nobody has done so already. With
+    PKCE Spotify rotates the refresh token, so refreshing twice with the same
+    one (or reusing an old one) can end the session.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self._tokens = {'access_token': "", 'refresh_token': "", 'expires_at': 0.0}
+
+    @staticmethod
+    def _expires_at(tokens):
+        return float((tokens or {}).get('expires_at', 0) or 0)
+
+    def adopt_newer(self, snapshot):
+        """Copy the shared tokens into snapshot if they are newer; returns snapshot."""
+        if self._expires_at(self._tokens) > self._expires_at(snapshot):
+            snapshot.update(self._tokens)
+        return snapshot
+
+    def publish(self, snapshot):
+        """Record snapshot's tokens if they are newer than the shared ones."""
+        if self._expires_at(snapshot) > self._expires_at(self._tokens):
+            self._tokens = {'access_token': snapshot.get('access_token', "") or "",
+                            'refresh_token': snapshot.get('refresh_token', "") or "",
+                            'expires_at': self._expires_at(snapshot)}
+
+    def reset(self):
+        with self.lock:
+            self._tokens = {'access_token': "", 'refresh_token': "", 'expires_at': 0.0}
+
+
+# --- Spotify polling ---
+SPOTIFY_POLL_PLAYING_MS = 30000        # mid-track: progress is interpolated locally
+SPOTIFY_POLL_TRACK_END_MARGIN_MS = 750  # poll just after the predicted track boundary
+SPOTIFY_POLL_COMMAND_MS = 1500         # fast follow-ups right after a user command
+SPOTIFY_POLL_COMMAND_WINDOW_S = 6.0
+SPOTIFY_POLL_PAUSED_MS = 60000
+SPOTIFY_POLL_IDLE_MS = 120000          # no active device / not logged in
+SPOTIFY_POLL_MIN_MS = 1000
+SPOTIFY_DEVICE_REFRESH_S = 300.0       # devices otherwise only on demand
+SPOTIFY_QUEUE_REFRESH_S = 300.0        # queue (empty or not) otherwise only on track change/command
+
+
+class SpotifyPollScheduler:
+    """Decide when to poll Spotify's player state and whether devices/queue are needed.
+
+    Polls fast only around predicted track ends (from progress_ms/duration_ms)
+    and right after user commands, backs off while paused or idle, and keeps
+    per-endpoint API call counters so the savings can be measured.
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self._clock = clock
+        self._started_at = clock()
+        self._command_until = 0.0
+        self._devices_requested = True
+        self._last_devices_at = None
+        self._last_track_uri = None
+        self._last_queue_at = None  # None until a queue response has been received
+        self.counters = {'polls': 0, 'player': 0, 'devices': 0, 'queue': 0, 'commands': 0}
+
+    def note_command(self):
+        """A user command was sent; poll quickly for a few seconds to pick up its effect."""
+        self.counters['commands'] += 1
+        self._command_until = self._clock() + SPOTIFY_POLL_COMMAND_WINDOW_S
+        self._devices_requested = True
+
+    def plan_poll(self, player):
+        """Return {'include_devices', 'include_queue'} for the poll about to be sent."""
+        now = self._clock()
+        include_devices = (self._devices_requested or self._last_devices_at is None or
+                           (now - self._last_devices_at) >= SPOTIFY_DEVICE_REFRESH_S)
+        if include_devices:
+            self._devices_requested = False
+            self._last_devices_at = now
+        # The queue only changes with the track or after a command; an empty
+        # queue is a result like any other and is kept for the same refresh period
+        track_uri = (player or {}).get('track_uri') or ''
+        include_queue = (self._last_queue_at is None or track_uri != self._last_track_uri or
+                         now < self._command_until or (now - self._last_queue_at) >= SPOTIFY_QUEUE_REFRESH_S)
+        self.counters['polls'] += 1
+        return {'include_devices': include_devices, 'include_queue': include_queue}
+
+    def record_result(self, player, api_calls=None, queue_fetched=False):
+        """Account for a finished poll's API calls and remember the current track.
+
+        queue_fetched is True only when a queue response was received; a failed
+        queue request is counted as a call but retried on the next poll.
+        """
+        for endpoint, count in (api_calls or {}).items():
+            self.counters[endpoint] = self.counters.get(endpoint, 0) + int(count or 0)
+        if queue_fetched:
+            self._last_queue_at = self._clock()
+        self._last_track_uri = (player or {}).get('track_uri') or ''
+
+    def next_delay_ms(self, player):
+        """Milliseconds until the next poll for the given (locally interpolated) player state."""
+        player = player or {}
+        now = self._clock()
+        if now < self._command_until:
+            return SPOTIFY_POLL_COMMAND_MS
+        if not player.get('authenticated') or not player.get('has_active_device'):
+            return SPOTIFY_POLL_IDLE_MS
+        if not player.get('is_playing'):
+            return SPOTIFY_POLL_PAUSED_MS
+        duration = int(player.get('duration_ms') or 0)
+        progress = int(player.get('progress_ms') or 0)
+        delay = SPOTIFY_POLL_PLAYING_MS
+        if duration > 0:
+            delay = min(delay, max(0, duration - progress) + SPOTIFY_POLL_TRACK_END_MARGIN_MS)
+        return max(SPOTIFY_POLL_MIN_MS, delay)
+
+    def stats(self):
+        """Counters plus API calls/hour since the scheduler started."""
+        elapsed_h = max(1e-6, (self._clock() - self._started_at) / 3600.0)
+        api_calls = self.counters['player'] + self.counters['devices'] + self.counters['queue']
+        result = dict(self.counters)
+        result['api_calls'] = api_calls
+        result['api_calls_per_hour'] = round(api_calls / elapsed_h, 1)
+        return result
+
+# --- Album art cache (served by start_http_server under /art/) ---
+ART_CACHE_DIR = os.path.join(CACHE_DIR_F1, 'art')
+ART_CACHE_MAX_BYTES = 48 * 1024 * 1024
+# Registered key -> URL entries kept for art that hasn't been fetched or is still on disk
+ART_CACHE_MAX_SOURCES = 512
+# Pixel edges for the QML delegates at the 2x scale used on the large bar display
+ART_SIZE_QUEUE = 64       # up-next rows (32 px)
+ART_SIZE_LIST = 68        # search/track rows (34 px)
+ART_SIZE_PILL = 96        # header pill
+ART_SIZE_GRID = 240       # library grid tiles and the selected-item header
+ART_SIZE_LARGE = 640      # full-screen tray backdrop
+ART_SIZES = (ART_SIZE_QUEUE, ART_SIZE_LIST, ART_SIZE_PILL, ART_SIZE_GRID, ART_SIZE_LARGE)
+_ART_NAME_RE = re.compile(r'^([0-9a-f]{20})_(\d+)\.jpg$')
+
+
+class AlbumArtCache:
+    """Size-bounded on-disk cache of downscaled album art with LRU eviction.
+
+    Remote URLs are registered by album_art_url(); the HTTP server calls
+    ensure() to fetch, downscale and store on first request. File mtimes are
+    bumped on every hit so eviction can drop the least recently used files.
+    The key -> URL registry is bounded too: a key goes when its last file is
+    evicted, and the least recently used keys go past max_sources.
+    """
+
+    def __init__(self, cache_dir=ART_CACHE_DIR, max_bytes=ART_CACHE_MAX_BYTES, max_sources=ART_CACHE_MAX_SOURCES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.max_sources = max_sources
+        self._sources = collections.OrderedDict()
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self._prefetch_pool = None
+
+    @staticmethod
+    def key_for(url):
+        return hashlib.sha1(url.encode('utf-8')).hexdigest()[:20]
+
+    def register(self, url):
+        key = self.key_for(url)
+        with self._lock:
+            self._sources[key] = url
+            self._sources.move_to_end(key)
+            while len(self._sources) > self.max_sources:
+                self._sources.popitem(last=False)
+        return key
+
+    def path_for(self, key, size):
+        return os.path.join(self.cache_dir, f"{key}_{size}.jpg")
+
+    def resolve(self, name):
+        """Map an /art/<name> request to (key, size), or None when invalid."""
+        match = _ART_NAME_RE.match(name or '')
+        if not match or int(match.group(2)) not in ART_SIZES:
+            return None
+        return match.group(1), int(match.group(2))
+
+    def ensure(self, key, size):
+        """Return the local file for key at size, fetching it once if needed."""
+        path = self.path_for(key, size)
+        if os.path.exists(path):
+            try:
+                os.utime(path, None)
+            except OSError:
+                pass
+            return path
+        with self._lock:
+            url = self._sources.get(key)
+            event = self._inflight.get((key, size))
+            owner = event is None and url is not None
+            if owner:
+                event = self._inflight[(key, size)] = threading.Event()
+        if url is None:
+            return None
+        if not owner:
+            event.wait(10)
+            return path if os.path.exists(path) else None
+        try:
+            self._fetch(url, path, size)
+        finally:
+            with self._lock:
+                self._inflight.pop((key, size), None)
+            event.set()
+        if os.path.exists(path):
+            self.evict()
+            return path
+        return None
+
+    def _fetch(self, url, path, size):
+        try:
+            response = requests.get(url, timeout=8)
+            if response.status_code != 200 or not response.content:
+                logger.debug(f"Album art fetch failed ({response.status_code}): {url}")
+                return
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            data = _downscale_art(response.content, size)
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.debug(f"Album art cache error for {url}: {e}")
+
+    def prefetch(self, url, size):
+        """Fetch art in the background so the first paint is served from disk."""
+        key = self.register(url)
+        if os.path.exists(self.path_for(key, size)):
+            return
+        with self._lock:
+            if self._prefetch_pool is None:
+                self._prefetch_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="art-prefetch")
+            pool = self._prefetch_pool
+        pool.submit(self.ensure, key, size)
+
+    def evict(self):
+        """Delete least recently used files until the cache is under max_bytes."""
+        try:
+            entries = []
+            total = 0
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.is_file() and entry.name.endswith('.jpg'):
+                        st = entry.stat()
+                        entries.append((st.st_mtime, st.st_size, entry.path))
+                        total += st.st_size
+            if total <= self.max_bytes:
+                return
+            # Trim to 90% so we don't evict on every new file
+            target = int(self.max_bytes * 0.9)
+            removed = set()
+            for _, file_size, file_path in sorted(entries):
+                if total <= target:
+                    break
+                try:
+                    os.remove(file_path)
+                    total -= file_size
+                    removed.add(file_path)
+                except OSError:
+                    pass
+            # Forget keys with no size left on disk
+            kept = {os.path.basename(path).rsplit('_', 1)[0] for _, _, path in entries if path not in removed}
+            with self._lock:
+                for path in removed:
+                    key = os.path.basename(path).rsplit('_', 1)[0]
+                    if key not in kept:
+                        self._sources.pop(key, None)
+        except OSError as e:
+            logger.debug(f"Album art eviction skipped: {e}")
+
+
+def _downscale_art(data, size):
+    """Centre-crop and resize encoded image bytes to a size x size JPEG.
+
+    Pillow is optional; without it the original bytes are cached as-is.
+    """
+    try:
+        from PIL import Image, ImageOps
+    except ImportError:
+        return data
+    import io
+    with Image.open(io.BytesIO(data)) as img:
+        img = ImageOps.fit(img.convert('RGB'), (size, size), Image.Resampling.LANCZOS)
+        out = io.BytesIO()
+        img.save(out, 'JPEG', quality=85, optimize=True)
+        return out.getvalue()
+
+
+album_art_cache = AlbumArtCache()
+
+
+def album_art_url(url, size, prefetch=False):
+    """Return the local /art/ URL for a remote image, or the remote URL until the server is up."""
+    if not url or not HTTP_SERVER_READY.is_set():
+        return url or ""
+    if prefetch:
+        album_art_cache.prefetch(url, size)
+        key = album_art_cache.key_for(url)
+    else:
+        key = album_art_cache.register(url)
+    return f"http://127.0.0.1:{HTTP_SERVER_PORT}/art/{key}_{size}.jpg"
+
+
 def start_http_server():
     """Start a simple HTTP server for the globe and other web content"""
     global HTTP_SERVER_PORT
@@ -1331,6 +2711,12 @@ def start_http_server():
                 self.end_headers()
                 self.wfile.write(body)
                 return
+            if parsed.path.startswith("/art/"):
+                self._serve_album_art(parsed.path[len("/art/"):])
+                return
+            if parsed.path == "/metrics":
+                self._serve_metrics(urllib.parse.parse_qs(parsed.query).get("format", ["text"])[0])
+                return
             # Handle favicon requests to avoid noisy 404s
             if self.path in ("/favicon.ico", "/_favicon.ico"):
                 try:
@@ -1351,13 +2737,46 @@ def start_http_server():
                 return
             return super().do_GET()
 
+        def _serve_metrics(self, fmt):
+            if fmt == "json":
+                body = json.dumps(dict(metrics.snapshot(), stalls=stall_detector.summary())).encode("utf-8")
+                content_type = "application/json"
+            else:
+                body = (metrics.prometheus_text() + stall_detector.prometheus_text()).encode("utf-8")
+                content_type = "text/plain; version=0.0.4; charset=utf-8"
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Cache-Control", "no-store")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _serve_album_art(self, name):
+            resolved = album_art_cache.resolve(name)
+            path = album_art_cache.ensure(*resolved) if resolved else None
+            if not path:
+                self.send_response(404)
+                self.end_headers()
+                return
+            with open(path, 'rb') as f:
+                data = f.read()
+            self.send_response(200)
+            # Content for a given hash never changes; let QtQuick's network cache keep it
+            self.send_header("Content-Type", "image/jpeg")
+            self.send_header("Content-Length", str(len(data)))
+            self.send_header("Cache-Control", "public, max-age=604800, immutable")
+            self.end_headers()
+            self.wfile.write(data)
+
     handler = CustomHTTPRequestHandler
 
     # Try to start server on port 8080, then try alternative ports if busy
     for attempt_port in [8080, 8081, 8082, 8083, 8084]:
         try:
             # Note: We use "" to bind to all interfaces, but 127.0.0.1 is used for local access
-            with socketserver.TCPServer(("", attempt_port), handler) as httpd:
+            # Threaded so a first-time album art fetch doesn't stall globe/embed requests
+            with socketserver.ThreadingTCPServer(("", attempt_port), handler) as httpd:
+                httpd.daemon_threads = True
                 # Allow address reuse to prevent "address already in use" errors
                 httpd.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
                 HTTP_SERVER_PORT = attempt_port
@@ -1381,6 +2800,395 @@ def start_http_server():
         logger.error("Failed to start HTTP server on any available port (8080-8084)")
 
 
+# --- NetworkManager D-Bus Wi-Fi backend ---
+# Event-driven replacement for the nmcli polling above: one D-Bus connection
+# keeps an in-memory model of access points and connection state, updated from
+# NetworkManager's signals. The subprocess helpers remain the fallback when
+# NetworkManager or jeepney (pure-Python D-Bus client) is unavailable.
+NM_DBUS_SERVICE = 'org.freedesktop.NetworkManager'
+NM_DBUS_PATH = '/org/freedesktop/NetworkManager'
+NM_DBUS_SETTINGS_PATH = '/org/freedesktop/NetworkManager/Settings'
+NM_IFACE_DEVICE = NM_DBUS_SERVICE + '.Device'
+NM_IFACE_WIRELESS = NM_DBUS_SERVICE + '.Device.Wireless'
+NM_IFACE_ACCESS_POINT = NM_DBUS_SERVICE + '.AccessPoint'
+NM_IFACE_SETTINGS = NM_DBUS_SERVICE + '.Settings'
+NM_IFACE_SETTINGS_CONNECTION = NM_DBUS_SERVICE + '.Settings.Connection'
+DBUS_IFACE_PROPERTIES = 'org.freedesktop.DBus.Properties'
+NM_DEVICE_TYPE_WIFI = 2
+NM_DEVICE_STATE_DISCONNECTED = 30
+NM_DEVICE_STATE_ACTIVATED = 100
+NM_DEVICE_STATE_FAILED = 120
+NM_802_11_AP_FLAGS_PRIVACY = 0x1
+NM_DBUS_CALL_TIMEOUT = 5  # seconds
+NM_SCAN_WAIT_TIMEOUT = 8  # seconds to wait for LastScan after RequestScan
+NM_ACTIVATE_TIMEOUT = 25  # matches the `nmcli connection up` timeout
+
+
+def _nm_ssid_text(raw):
+    """NetworkManager exposes SSIDs as byte arrays."""
+    if isinstance(raw, (bytes, bytearray)):
+        return bytes(raw).decode('utf-8', errors='replace')
+    if isinstance(raw, (list, tuple)):
+        return bytes(raw).decode('utf-8', errors='replace')
+    return str(raw or '')
+
+
+class NetworkManagerDBus:
+    """Minimal jeepney transport used by NetworkManagerWifiMonitor.
+
+    Calls are made through a threaded router; subscribed signals are handed to
+    handler(path, *body) on a single dispatch thread, with PropertiesChanged
+    variants already unwrapped.
+    """
+
+    def __init__(self, bus='SYSTEM'):
+        from jeepney.io.threading import DBusRouter, open_dbus_connection
+        self._router = DBusRouter(open_dbus_connection(bus=bus))
+        self._signals = queue.Queue()
+        self._handlers = {}
+        self._filters = []
+        self._thread = threading.Thread(target=self._dispatch_signals, name="nm-dbus", daemon=True)
+        self._thread.start()
+
+    def call(self, path, interface, method, signature=None, body=()):
+        from jeepney import DBusAddress, MessageType, new_method_call
+        address = DBusAddress(path, bus_name=NM_DBUS_SERVICE, interface=interface)
+        reply = self._router.send_and_get_reply(new_method_call(address, method, signature, tuple(body)),
+                                                timeout=NM_DBUS_CALL_TIMEOUT)
+        if reply.header.message_type == MessageType.error:
+            raise RuntimeError(f"{interface}.{method} failed: {reply.body[0] if reply.body else 'D-Bus error'}")
+        return reply.body
+
+    def get_property(self, path, interface, name):
+        return self.call(path, DBUS_IFACE_PROPERTIES, 'Get', 'ss', (interface, name))[0][1]
+
+    def get_all(self, path, interface):
+        props = self.call(path, DBUS_IFACE_PROPERTIES, 'GetAll', 's', (interface,))[0]
+        return {key: value[1] for key, value in props.items()}
+
+    def subscribe(self, interface, member, handler):
+        from jeepney import MatchRule, MessageType, message_bus
+        # Signals carry NetworkManager's unique bus name, so match on the object tree instead
+        rule = MatchRule(type='signal', interface=interface, member=member, path_namespace=NM_DBUS_PATH)
+        reply = self._router.send_and_get_reply(message_bus.AddMatch(rule), timeout=NM_DBUS_CALL_TIMEOUT)
+        if reply.header.message_type == MessageType.error:
+            raise RuntimeError(f"AddMatch {interface}.{member} failed")
+        key = (interface, member)
+        if key not in self._handlers:
+            self._handlers[key] = []
+            self._filters.append(self._router.filter(rule, queue=self._signals))
+        self._handlers[key].append(handler)
+
+    def _dispatch_signals(self):
+        from jeepney import HeaderFields
+        while True:
+            msg = self._signals.get()
+            if msg is None:
+                return
+            fields = msg.header.fields
+            interface, member = fields.get(HeaderFields.interface), fields.get(HeaderFields.member)
+            body = msg.body
+            if member == 'PropertiesChanged' and len(body) >= 2:
+                body = (body[0], {key: value[1] for key, value in body[1].items()}) + tuple(body[2:])
+            for handler in self._handlers.get((interface, member), ()):
+                try:
+                    handler(fields.get(HeaderFields.path), *body)
+                except Exception as e:
+                    logger.debug(f"NetworkManager signal handler for {member} failed: {e}")
+
+    def close(self):
+        for handle in self._filters:
+            try:
+                handle.close()
+            except Exception:
+                pass
+        self._signals.put(None)
+        try:
+            self._router.close()
+        except Exception:
+            pass
+
+
+class NetworkManagerWifiMonitor:
+    """In-memory model of the Wi-Fi device, its access points and saved profiles.
+
+    bus provides call/get_property/get_all/subscribe (see NetworkManagerDBus).
+    Listeners are called with 'status' or 'networks' from the bus dispatch
+    thread whenever the corresponding part of the model changes.
+    """
+
+    def __init__(self, bus, interface=None):
+        self._bus = bus
+        self._interface = interface
+        self._cond = threading.Condition()
+        self._listeners = []
+        self._device = None
+        self._device_state = 0
+        self._state_changes = 0
+        self._active_ap = '/'
+        self._access_points = {}
+        self._last_scan = None
+        self._profiles = None
+        self.available = False
+
+    def add_listener(self, callback):
+        self._listeners.append(callback)
+
+    def _notify(self, kind):
+        for callback in list(self._listeners):
+            try:
+                callback(kind)
+            except Exception as e:
+                logger.debug(f"Wi-Fi monitor listener failed: {e}")
+
+    def start(self):
+        """Find the Wi-Fi device, subscribe to its signals and load the initial model."""
+        try:
+            bus = self._bus
+            for path in bus.call(NM_DBUS_PATH, NM_DBUS_SERVICE, 'GetDevices')[0]:
+                if bus.get_property(path, NM_IFACE_DEVICE, 'DeviceType') != NM_DEVICE_TYPE_WIFI:
+                    continue
+                if self._interface and bus.get_property(path, NM_IFACE_DEVICE, 'Interface') != self._interface:
+                    continue
+                self._device = path
+                break
+            if not self._device:
+                logger.info("NetworkManager reports no Wi-Fi device; using nmcli fallback")
+                return False
+
+            # Subscribe before reading state so nothing slips between the two
+            bus.subscribe(NM_DBUS_SERVICE, 'StateChanged', self._on_manager_state_changed)
+            bus.subscribe(NM_IFACE_DEVICE, 'StateChanged', self._on_device_state_changed)
+            bus.subscribe(NM_IFACE_WIRELESS, 'AccessPointAdded', self._on_access_point_added)
+            bus.subscribe(NM_IFACE_WIRELESS, 'AccessPointRemoved', self._on_access_point_removed)
+            bus.subscribe(DBUS_IFACE_PROPERTIES, 'PropertiesChanged', self._on_properties_changed)
+            bus.subscribe(NM_IFACE_SETTINGS, 'NewConnection', self._on_profiles_changed)
+            bus.subscribe(NM_IFACE_SETTINGS_CONNECTION, 'Removed', self._on_profiles_changed)
+            bus.subscribe(NM_IFACE_SETTINGS_CONNECTION, 'Updated', self._on_profiles_changed)
+
+            self._refresh_device()
+            for ap in bus.call(self._device, NM_IFACE_WIRELESS, 'GetAllAccessPoints')[0]:
+                self._load_access_point(ap)
+            self.available = True
+            logger.info(f"NetworkManager D-Bus Wi-Fi monitor active on {self._device} "
+                        f"({len(self._access_points)} access points)")
+            return True
+        except Exception as e:
+            logger.info(f"NetworkManager D-Bus unavailable ({e}); using nmcli fallback")
+            return False
+
+    def _refresh_device(self):
+        device = self._bus.get_all(self._device, NM_IFACE_DEVICE)
+        wireless = self._bus.get_all(self._device, NM_IFACE_WIRELESS)
+        active_ap = wireless.get('ActiveAccessPoint') or '/'
+        if active_ap != '/' and active_ap not in self._access_points:
+            self._load_access_point(active_ap)
+        with self._cond:
+            if device.get('State', 0) != self._device_state:
+                self._device_state = device.get('State', 0)
+                self._state_changes += 1
+            self._active_ap = active_ap
+            self._last_scan = wireless.get('LastScan', self._last_scan)
+            self._cond.notify_all()
+
+    def _load_access_point(self, path):
+        try:
+            props = self._bus.get_all(path, NM_IFACE_ACCESS_POINT)
+        except Exception as e:
+            # Access points vanish between AccessPointAdded and GetAll after a scan
+            logger.debug(f"Access point {path} disappeared before it was read: {e}")
+            return False
+        with self._cond:
+            self._access_points[path] = self._ap_entry(props)
+        return True
+
+    @staticmethod
+    def _ap_entry(props, entry=None):
+        entry = dict(entry or {})
+        if 'Ssid' in props:
+            entry['ssid'] = _nm_ssid_text(props['Ssid'])
+        if 'Strength' in props:
+            entry['signal'] = int(props['Strength'])
+        if any(key in props for key in ('Flags', 'WpaFlags', 'RsnFlags')):
+            entry['encrypted'] = bool((props.get('Flags', 0) & NM_802_11_AP_FLAGS_PRIVACY)
+                                      or props.get('WpaFlags', 0) or props.get('RsnFlags', 0))
+        return entry
+
+    # --- signal handlers (bus dispatch thread) ---
+    def _on_manager_state_changed(self, path, state):
+        if path != NM_DBUS_PATH:
+            return
+        self._refresh_device()
+        self._notify('status')
+
+    def _on_device_state_changed(self, path, new_state, old_state=0, reason=0):
+        if path != self._device:
+            return
+        with self._cond:
+            self._device_state = new_state
+            self._state_changes += 1
+            self._cond.notify_all()
+        self._notify('status')
+
+    def _on_access_point_added(self, path, ap_path):
+        if path == self._device and self._load_access_point(ap_path):
+            self._notify('networks')
+
+    def _on_access_point_removed(self, path, ap_path):
+        if path != self._device:
+            return
+        with self._cond:
+            removed = self._access_points.pop(ap_path, None)
+        if removed is not None:
+            self._notify('networks')
+
+    def _on_properties_changed(self, path, interface, changed, invalidated=()):
+        if interface == NM_IFACE_ACCESS_POINT:
+            with self._cond:
+                entry = self._access_points.get(path)
+                if entry is None:
+                    return
+                updated = self._ap_entry(changed, entry)
+                self._access_points[path] = updated
+            # Strength alone changes constantly; only renamed/re-secured APs are worth a UI refresh
+            if updated.get('ssid') != entry.get('ssid') or updated.get('encrypted') != entry.get('encrypted'):
+                self._notify('networks')
+        elif path == self._device and interface == NM_IFACE_WIRELESS:
+            if 'ActiveAccessPoint' in changed:
+                active_ap = changed['ActiveAccessPoint'] or '/'
+                if active_ap != '/' and active_ap not in self._access_points:
+                    self._load_access_point(active_ap)
+                with self._cond:
+                    self._active_ap = active_ap
+                self._notify('status')
+            if 'LastScan' in changed:
+                with self._cond:
+                    self._last_scan = changed['LastScan']
+                    self._cond.notify_all()
+                self._notify('networks')
+        elif path == self._device and interface == NM_IFACE_DEVICE and 'State' in changed:
+            self._on_device_state_changed(path, changed['State'])
+        elif path == NM_DBUS_PATH and interface == NM_DBUS_SERVICE and 'ActiveConnections' in changed:
+            self._on_manager_state_changed(path, None)
+
+    def _on_profiles_changed(self, path, *args):
+        with self._cond:
+            self._profiles = None
+
+    # --- queries ---
+    def status(self):
+        """Return (connected, ssid) like check_wifi_status()."""
+        with self._cond:
+            if self._device_state != NM_DEVICE_STATE_ACTIVATED:
+                return False, ""
+            entry = self._access_points.get(self._active_ap) or {}
+            return True, entry.get('ssid', '')
+
+    def networks(self):
+        """Visible networks in perform_wifi_scan()'s shape, strongest AP per SSID."""
+        seen = {}
+        with self._cond:
+            for entry in self._access_points.values():
+                ssid = entry.get('ssid')
+                if ssid and (ssid not in seen or entry.get('signal', 0) > seen[ssid]['signal']):
+                    seen[ssid] = {'ssid': ssid, 'signal': entry.get('signal', 0),
+                                  'encrypted': entry.get('encrypted', False)}
+        return list(seen.values())
+
+    def request_scan(self, wait=NM_SCAN_WAIT_TIMEOUT):
+        """Ask NetworkManager to rescan and wait for LastScan to move (no fixed sleep)."""
+        with self._cond:
+            before = self._last_scan
+        try:
+            self._bus.call(self._device, NM_IFACE_WIRELESS, 'RequestScan', 'a{sv}', ({},))
+        except Exception as e:
+            # NetworkManager rejects scans requested right after another one; its list is fresh anyway
+            logger.debug(f"RequestScan declined: {e}")
+            return self.networks()
+        if wait:
+            with self._cond:
+                self._cond.wait_for(lambda: self._last_scan != before, timeout=wait)
+        return self.networks()
+
+    def profiles(self):
+        """Saved Wi-Fi profiles like get_nmcli_profiles(), cached until NetworkManager reports a change."""
+        with self._cond:
+            if self._profiles is not None:
+                return [dict(p) for p in self._profiles]
+        profiles = []
+        for path in self._bus.call(NM_DBUS_SETTINGS_PATH, NM_IFACE_SETTINGS, 'ListConnections')[0]:
+            try:
+                settings = self._bus.call(path, NM_IFACE_SETTINGS_CONNECTION, 'GetSettings')[0]
+            except Exception as e:
+                logger.debug(f"GetSettings failed for {path}: {e}")
+                continue
+            connection = settings.get('connection', {})
+            if _dbus_value(connection.get('type')) != '802-11-wireless':
+                continue
+            wireless = settings.get('802-11-wireless', {})
+            profiles.append({'name': _dbus_value(connection.get('id')) or '',
+                             'ssid': _nm_ssid_text(_dbus_value(wireless.get('ssid'))),
+                             'path': path})
+        with self._cond:
+            self._profiles = profiles
+        return [dict(p) for p in profiles]
+
+    def activate_profile(self, profile_name, timeout=NM_ACTIVATE_TIMEOUT):
+        """Activate a saved profile and wait for the device to connect; returns (success, message)."""
+        match = next((p for p in self.profiles() if p['name'] == profile_name), None)
+        if match is None:
+            return False, f"No NetworkManager profile named {profile_name}"
+        with self._cond:
+            changes = self._state_changes
+        self._bus.call(NM_DBUS_PATH, NM_DBUS_SERVICE, 'ActivateConnection', 'ooo',
+                       (match['path'], self._device, '/'))
+        with self._cond:
+            self._cond.wait_for(lambda: self._state_changes != changes and self._device_state in
+                                (NM_DEVICE_STATE_ACTIVATED, NM_DEVICE_STATE_FAILED), timeout=timeout)
+            state = self._device_state
+        if state == NM_DEVICE_STATE_ACTIVATED:
+            return True, f"Connection '{profile_name}' activated"
+        return False, f"Connection '{profile_name}' did not activate (device state {state})"
+
+
+def _dbus_value(value):
+    """Unwrap a jeepney (signature, value) variant; plain values pass through."""
+    if isinstance(value, tuple) and len(value) == 2 and isinstance(value[0], str):
+        return value[1]
+    return value
+
+
+_wifi_monitor = None
+
+
+def start_wifi_monitor(bus=None, interface=None):
+    """Start the NetworkManager D-Bus monitor; returns it, or None to keep using nmcli."""
+    global _wifi_monitor
+    if bus is None:
+        if platform.system() != 'Linux':
+            return None
+        try:
+            bus = NetworkManagerDBus()
+        except Exception as e:
+            logger.info(f"NetworkManager D-Bus connection unavailable ({e}); using nmcli fallback")
+            return None
+    monitor = NetworkManagerWifiMonitor(bus, interface=interface)
+    if not monitor.start():
+        if hasattr(bus, 'close'):
+            bus.close()
+        return None
+    _wifi_monitor = monitor
+    return monitor
+
+
+def stop_wifi_monitor():
+    global _wifi_monitor
+    monitor, _wifi_monitor = _wifi_monitor, None
+    if monitor is not None and hasattr(monitor._bus, 'close'):
+        monitor._bus.close()
+
+
+@metrics.timed("perform_wifi_scan")
 def perform_wifi_scan(wifi_interface):
     """Perform a WiFi scan using platform-specific commands."""
     networks = []
@@ -1424,6 +3232,11 @@ def perform_wifi_scan(wifi_interface):
             return list(seen.values())
 
         else:
+            if _wifi_monitor is not None and _wifi_monitor.available:
+                networks = _wifi_monitor.request_scan()
+                logger.info(f"NetworkManager D-Bus scan found {len(networks)} networks")
+                return networks
+
             # Check if nmcli exists and use it if available
             nmcli_check = subprocess.run(['which', 'nmcli'], capture_output=True, timeout=3)
             if nmcli_check.returncode == 0:
@@ -1559,77 +3372,633 @@ def manage_nm_autoconnect(ssid):
         logger.error(f"Error managing NM autoconnect: {e}")
 
 
-# --- Network connectivity state cache to avoid repeated slow tests during boot ---
-_network_last_result = None
-_network_last_check_time = 0
-NETWORK_CHECK_TTL = 30  # seconds
-_network_check_lock = threading.Lock()
+# --- DDC/CI monitor control (large display over /dev/i2c-N) ---
+# Talks VESA DDC/CI directly on the I2C bus instead of spawning one ddcutil
+# process per setting: reads are batched into one session, writes are
+# coalesced to the latest value per VCP code and the spec's inter-command
+# delays are honoured. ddcutil remains the fallback when the i2c-dev node
+# cannot be opened (module not loaded, no permission).
+DDC_I2C_BUS = int(os.environ.get('DASHBOARD_DDC_BUS', '13'))
+DDC_I2C_ADDRESS = 0x37  # DDC/CI slave address (0x6E/0x6F on the wire)
+DDC_HOST_ADDRESS = 0x51
+DDC_REPLY_CHECKSUM_SEED = 0x50  # replies are checksummed against the virtual host address
+DDC_GET_VCP = 0x01
+DDC_GET_VCP_REPLY = 0x02
+DDC_SET_VCP = 0x03
+DDC_REPLY_DELAY_S = 0.04  # MCCS: wait 40 ms before reading a reply
+DDC_COMMAND_INTERVAL_S = 0.05  # MCCS: at least 50 ms between commands
+DDC_RETRIES = 3
+I2C_SLAVE = 0x0703  # linux/i2c-dev.h
+DDCUTIL_PATH = '/usr/bin/ddcutil'
+DDCUTIL_TIMEOUT = 10  # seconds
+DDC_VCP_BRIGHTNESS = 0x10
+DDC_VCP_CONTRAST = 0x12
+DDC_VCP_COLOR_PRESET = 0x14
+DDC_VCP_GAIN_RED = 0x16
+DDC_VCP_GAIN_GREEN = 0x18
+DDC_VCP_GAIN_BLUE = 0x1A
+DDC_VCP_INPUT_SOURCE = 0x60
+DDC_VCP_SHARPNESS = 0x87
+DDC_VCP_POWER_MODE = 0xD6
+DDC_DISPLAY_VCP_CODES = (DDC_VCP_BRIGHTNESS, DDC_VCP_CONTRAST, DDC_VCP_COLOR_PRESET, DDC_VCP_GAIN_RED,
+                         DDC_VCP_GAIN_GREEN, DDC_VCP_GAIN_BLUE, DDC_VCP_SHARPNESS, DDC_VCP_INPUT_SOURCE,
+                         DDC_VCP_POWER_MODE)
+
+
+# Errors opening the i2c-dev node that mean the native path can't work this session;
+# any other OSError (EIO/EREMOTEIO while the monitor NACKs) is transient and retried.
+DDC_DEVICE_UNAVAILABLE_ERRNOS = frozenset({errno.ENOENT, errno.ENODEV, errno.EACCES, errno.EPERM})
+
+
+class DDCError(Exception):
+    """A DDC/CI exchange failed (bad checksum, unsupported code, no reply)."""
+
+
+def ddc_device_unavailable(error):
+    """True if error means the i2c-dev node can't be used at all (vs. a transient bus error)."""
+    return isinstance(error, OSError) and error.errno in DDC_DEVICE_UNAVAILABLE_ERRNOS
+
+
+def _ddc_checksum(seed, data):
+    checksum = seed
+    for byte in data:
+        checksum ^= byte
+    return checksum
+
+
+def ddc_packet(payload):
+    """Host-to-display packet: source, length, payload, checksum."""
+    body = bytes([DDC_HOST_ADDRESS, 0x80 | len(payload)]) + bytes(payload)
+    return body + bytes([_ddc_checksum(DDC_I2C_ADDRESS << 1, body)])
+
+
+def parse_vcp_reply(data, code):
+    """Return (current, maximum) from a Get VCP Feature reply for code."""
+    if len(data) < 11:
+        raise DDCError(f"short reply for VCP {code:02X}: {bytes(data).hex()}")
+    length = data[1] & 0x7F
+    if data[1] & 0x80 == 0 or length != 8:
+        raise DDCError(f"unexpected reply length for VCP {code:02X}: {bytes(data).hex()}")
+    if _ddc_checksum(DDC_REPLY_CHECKSUM_SEED, data[:2 + length]) != data[2 + length]:
+        raise DDCError(f"bad checksum in reply for VCP {code:02X}")
+    opcode, result, reply_code = data[2], data[3], data[4]
+    if opcode != DDC_GET_VCP_REPLY or reply_code != code:
+        raise DDCError(f"reply for VCP {reply_code:02X} (opcode {opcode:02X}) while reading {code:02X}")
+    if result != 0:
+        raise DDCError(f"VCP {code:02X} unsupported by display")
+    return (data[8] << 8) | data[9], (data[6] << 8) | data[7]
+
+
+class I2CDevice:
+    """Raw i2c-dev node bound to one slave address."""
+
+    def __init__(self, path, address=DDC_I2C_ADDRESS):
+        import fcntl
+        self.path = path
+        self._fd = os.open(path, os.O_RDWR)
+        try:
+            fcntl.ioctl(self._fd, I2C_SLAVE, address)
+        except OSError:
+            os.close(self._fd)
+            raise
 
-def test_network_connectivity():
-    """Check for active network connectivity (beyond just WiFi connection)"""
-    global _network_last_result, _network_last_check_time
-    
-    with _network_check_lock:
-        now = time.time()
-        if _network_last_result is not None and (now - _network_last_check_time) < NETWORK_CHECK_TTL:
-            logger.debug(f"Returning cached network connectivity result: {_network_last_result}")
-            return _network_last_result
-
-        profiler.mark("test_network_connectivity Start")
-        test_urls = [
-            'http://www.google.com',
-            'http://www.cloudflare.com',
-            'http://1.1.1.1'
-        ]
+    def write(self, data):
+        os.write(self._fd, bytes(data))
+
+    def read(self, count):
+        return os.read(self._fd, count)
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+class DDCCIClient:
+    """In-process DDC/CI client for one display.
 
-        logger.debug("Testing network connectivity with multiple endpoints...")
+    device is anything with write/read/close (an I2CDevice by default, opened
+    lazily on first use). Each command waits out the previous command's
+    interval, so a batch of reads runs as one paced session on one open fd.
+    """
 
-        result = False
-        for url in test_urls:
+    name = 'i2c-dev'
+
+    def __init__(self, bus=DDC_I2C_BUS, device=None, reply_delay=DDC_REPLY_DELAY_S,
+                 command_interval=DDC_COMMAND_INTERVAL_S, retries=DDC_RETRIES):
+        self.path = f"/dev/i2c-{bus}"
+        self._device = device
+        self._reply_delay = reply_delay
+        self._command_interval = command_interval
+        self._retries = retries
+        self._last_command = None
+
+    def _open(self):
+        if self._device is None:
+            self._device = I2CDevice(self.path)
+        return self._device
+
+    def _pace(self):
+        if self._last_command is not None:
+            wait = self._command_interval - (time.monotonic() - self._last_command)
+            if wait > 0:
+                time.sleep(wait)
+
+    def _send(self, payload):
+        device = self._open()
+        self._pace()
+        try:
+            device.write(ddc_packet(payload))
+        finally:
+            self._last_command = time.monotonic()
+
+    def get_vcp(self, code):
+        """Return (current, maximum) for one VCP code.
+
+        Protocol errors and transient bus errors are retried; an unusable
+        device raises straight away.
+        """
+        error = None
+        for _ in range(self._retries):
             try:
-                logger.debug(f"Testing connectivity to {url}")
-                urllib.request.urlopen(url, timeout=3)  # Reduced timeout for faster boot
-                logger.info(f"Network connectivity confirmed via {url}")
-                result = True
-                break
-            except (urllib.error.URLError, socket.timeout, OSError) as e:
-                logger.debug(f"Failed to connect to {url}: {e}")
-                continue
+                self._send((DDC_GET_VCP, code))
+                time.sleep(self._reply_delay)
+                return parse_vcp_reply(self._device.read(11), code)
+            except (DDCError, OSError) as e:
+                if ddc_device_unavailable(e):
+                    raise
+                error = e
+            finally:
+                self._last_command = time.monotonic()
+        raise error
+
+    def set_vcp(self, code, value):
+        error = None
+        for _ in range(self._retries):
+            try:
+                return self._send((DDC_SET_VCP, code, (value >> 8) & 0xFF, value & 0xFF))
+            except OSError as e:
+                if ddc_device_unavailable(e):
+                    raise
+                error = e
+        raise error
+
+    def read_all(self, codes):
+        """Read codes in one session; codes the display rejects are left out."""
+        results = {}
+        for code in codes:
+            try:
+                results[code] = self.get_vcp(code)
+            except (DDCError, OSError) as e:
+                if ddc_device_unavailable(e):
+                    raise
+                logger.warning(f"DDC/CI read of VCP {code:02X} failed: {e}")
+        return results
+
+    def close(self):
+        device, self._device = self._device, None
+        if device is not None:
+            device.close()
+
 
-        if not result:
-            # Fallback DNS test
+def parse_ddcutil_brief(output):
+    """Return (current, maximum) from `ddcutil getvcp --brief` output.
+
+    Continuous features print "VCP 10 C 50 100"; non-continuous ones print
+    "VCP 60 SNC x11" and have no maximum.
+    """
+    parts = output.split()
+    if len(parts) < 4 or parts[0] != 'VCP':
+        raise DDCError(f"unexpected ddcutil output: {output.strip()!r}")
+    if parts[2] == 'C' and len(parts) >= 5:
+        return int(parts[3]), int(parts[4])
+    token = parts[3].lower()
+    return int(token[2:] if token.startswith('0x') else token.lstrip('x'), 16), None
+
+
+class DDCUtilClient:
+    """Fallback with the DDCCIClient interface that runs one ddcutil per command."""
+
+    name = 'ddcutil'
+
+    def __init__(self, bus=DDC_I2C_BUS, path=DDCUTIL_PATH, run=subprocess.run):
+        self._bus = bus
+        self._path = path
+        self._run = run
+
+    def _ddcutil(self, *args):
+        result = self._run([self._path, *args, f"--bus={self._bus}"], capture_output=True, text=True,
+                           timeout=DDCUTIL_TIMEOUT)
+        if result.returncode != 0:
+            raise DDCError(f"ddcutil {args[0]} failed: {(result.stderr or '').strip()}")
+        return result.stdout
+
+    def get_vcp(self, code):
+        return parse_ddcutil_brief(self._ddcutil('getvcp', f"{code:02X}", '--brief'))
+
+    def set_vcp(self, code, value):
+        self._ddcutil('setvcp', f"{code:02X}", str(value), '--noverify', '--mccs', '2.2')
+
+    def read_all(self, codes):
+        results = {}
+        for code in codes:
             try:
-                logger.debug("Testing DNS resolution...")
-                socket.gethostbyname('google.com')
-                logger.info("Network connectivity confirmed via DNS")
-                result = True
-            except socket.gaierror as e:
-                logger.debug(f"DNS resolution failed: {e}")
-            except Exception as e:
-                logger.warning(f"Unexpected error during DNS test: {e}")
+                results[code] = self.get_vcp(code)
+            except (DDCError, OSError, subprocess.SubprocessError) as e:
+                logger.warning(f"ddcutil read of VCP {code:02X} failed: {e}")
+        return results
 
-        _network_last_result = result
-        _network_last_check_time = now
-        profiler.mark(f"test_network_connectivity End (Result: {result})")
-        
-        if not result:
+    def close(self):
+        pass
+
+
+class DisplayControl:
+    """Asynchronous front end for a DDC/CI client.
+
+    One worker thread owns the bus. set() only records the latest value per VCP
+    code, so a slider drag that lands several values before the worker gets to
+    them costs a single write; read_all() queues a batched read. Callbacks run
+    on the worker thread. If the native client's device can't be opened the
+    worker switches to the fallback client for the rest of the session;
+    transient bus errors only fail the one command.
+    """
+
+    def __init__(self, client=None, fallback=None):
+        self._client = client if client is not None else DDCCIClient()
+        self._fallback = fallback if fallback is not None else DDCUtilClient()
+        self._cond = threading.Condition()
+        self._pending = {}
+        self._reads = []
+        self._busy = False
+        self._running = True
+        self.writes = 0
+        self._thread = threading.Thread(target=self._run, name="ddc-worker", daemon=True)
+        self._thread.start()
+
+    @property
+    def backend(self):
+        return self._client.name
+
+    def set(self, code, value, callback=None):
+        """Queue a write; callback(ok) runs once the value reached the display."""
+        with self._cond:
+            self._pending[code] = (value, callback)
+            self._cond.notify()
+
+    def read_all(self, codes, callback):
+        """Queue a batched read; callback receives {code: (current, maximum)}."""
+        with self._cond:
+            self._reads.append((tuple(codes), callback))
+            self._cond.notify()
+
+    def flush(self, timeout=None):
+        """Block until queued reads and writes are done; True if drained."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not (self._pending or self._reads or self._busy), timeout)
+
+    def stop(self, timeout=2):
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        for client in (self._client, self._fallback):
+            try:
+                client.close()
+            except Exception:
+                pass
+
+    def _call(self, method, *args):
+        try:
+            return getattr(self._client, method)(*args)
+        except OSError as e:
+            if self._fallback is None or self._client is self._fallback or not ddc_device_unavailable(e):
+                raise
+            logger.warning(f"DDC/CI via {self._client.path} unavailable ({e}); falling back to ddcutil")
+            try:
+                self._client.close()
+            except Exception:
+                pass
+            self._client = self._fallback
+            return getattr(self._client, method)(*args)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._busy = False
+                self._cond.notify_all()
+                self._cond.wait_for(lambda: self._pending or self._reads or not self._running)
+                if not self._running:
+                    return
+                reads, self._reads = self._reads, []
+                pending, self._pending = self._pending, {}
+                self._busy = True
+            for codes, callback in reads:
+                try:
+                    with metrics.span("ddc.read_all"):
+                        results = self._call('read_all', codes)
+                except Exception as e:
+                    logger.error(f"Display settings read failed: {e}")
+                    results = {}
+                self._notify(callback, results)
+            for code, (value, callback) in pending.items():
+                ok = True
+                try:
+                    with metrics.span("ddc.set_vcp"):
+                        self._call('set_vcp', code, value)
+                    self.writes += 1
+                except Exception as e:
+                    ok = False
+                    logger.error(f"Failed to set VCP {code:02X} to {value}: {e}")
+                self._notify(callback, ok)
+
+    @staticmethod
+    def _notify(callback, result):
+        if callback is None:
+            return
+        try:
+            callback(result)
+        except Exception as e:
+            logger.error(f"Display control callback failed: {e}")
+
+
+# --- Network connectivity: parallel race-to-first probe published on a shared bus ---
+NETWORK_CHECK_TTL = 30  # seconds
+CONNECTIVITY_PROBE_TIMEOUT = 1.0  # per probe and overall; offline is reported after ~1 s
+# Comma-separated URLs, or "dns:<host>" for a resolver-only probe. Tests can point this
+# at a local stand-in server via the environment or set_connectivity_probe_targets().
+DEFAULT_CONNECTIVITY_PROBE_TARGETS = (
+    'http://www.google.com',
+    'http://www.cloudflare.com',
+    'http://1.1.1.1',
+    'dns:google.com',
+)
+
+
+def _connectivity_targets_from_env():
+    raw = (os.environ.get('DASHBOARD_CONNECTIVITY_TARGETS') or '').strip()
+    if not raw:
+        return DEFAULT_CONNECTIVITY_PROBE_TARGETS
+    return tuple(t.strip() for t in raw.split(',') if t.strip())
+
+
+def _probe_target(target, timeout):
+    """Return True when target answers; raises on failure."""
+    if target.startswith('dns:'):
+        socket.gethostbyname(target[len('dns:'):])
+        return True
+    try:
+        urllib.request.urlopen(target, timeout=timeout).close()
+    except urllib.error.HTTPError:
+        pass  # Any HTTP status means the host was reached
+    return True
+
+
+class ConnectivityBus:
+    """Single source of truth for internet connectivity.
+
+    check() runs every probe target concurrently and returns as soon as one
+    succeeds (or all fail / the deadline passes). Concurrent callers share one
+    in-flight probe instead of serialising behind a lock, and every result is
+    published to subscribers.
+
+    Probes run on their own daemon threads because a blocking getaddrinfo or
+    connect can't be cancelled; a target whose previous probe is still running
+    is not probed again, the race just waits on that probe's result.
+    """
+
+    def __init__(self, targets=None, timeout=CONNECTIVITY_PROBE_TIMEOUT, ttl=NETWORK_CHECK_TTL):
+        self.targets = tuple(targets) if targets else _connectivity_targets_from_env()
+        self.timeout = timeout
+        self.ttl = ttl
+        self._state = {'online': None, 'checked_at': 0.0, 'via': None}
+        self._subscribers = []
+        self._lock = threading.Lock()
+        self._inflight = None
+        self._probing = {}  # target -> result queues waiting on its running probe
+
+    def state(self):
+        with self._lock:
+            return dict(self._state)
+
+    def subscribe(self, callback, replay=True):
+        """Call callback(state) on every published result; returns an unsubscribe function."""
+        with self._lock:
+            self._subscribers.append(callback)
+            current = dict(self._state)
+        if replay and current['online'] is not None:
+            callback(current)
+
+        def _unsubscribe():
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+        return _unsubscribe
+
+    def publish(self, online, via=None):
+        with self._lock:
+            self._state = {'online': bool(online), 'checked_at': time.time(), 'via': via}
+            state = dict(self._state)
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            try:
+                callback(state)
+            except Exception as e:
+                logger.debug(f"Connectivity subscriber failed: {e}")
+
+    def check(self, max_age=None):
+        """Return connectivity, probing only if the last result is older than max_age."""
+        max_age = self.ttl if max_age is None else max_age
+        with self._lock:
+            if self._state['online'] is not None and (time.time() - self._state['checked_at']) < max_age:
+                return self._state['online']
+            inflight = self._inflight
+            owner = inflight is None
+            if owner:
+                inflight = self._inflight = threading.Event()
+        if not owner:
+            inflight.wait(self.timeout + 1.0)
+            return bool(self.state()['online'])
+        try:
+            online, via = self._race()
+            self.publish(online, via)
+            return online
+        finally:
+            with self._lock:
+                self._inflight = None
+            inflight.set()
+
+    def _probe(self, target):
+        try:
+            result = (target, bool(_probe_target(target, self.timeout)), None)
+        except Exception as e:
+            result = (target, False, e)
+        with self._lock:
+            waiters = self._probing.pop(target, [])
+        for results in waiters:
+            results.put(result)
+
+    @metrics.timed("connectivity_probe")
+    def _race(self):
+        results = queue.Queue()
+        started = []
+        with self._lock:
+            targets = self.targets
+            for target in targets:
+                if target not in self._probing:
+                    self._probing[target] = []
+                    started.append(target)
+                self._probing[target].append(results)
+        for target in started:
+            threading.Thread(target=self._probe, args=(target,), name="netprobe", daemon=True).start()
+        deadline = time.monotonic() + self.timeout
+        outstanding = len(targets)
+        online, via = False, None
+        while outstanding and not online:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                target, ok, error = results.get(timeout=remaining)
+            except queue.Empty:
+                break
+            outstanding -= 1
+            if error is not None:
+                logger.debug(f"Connectivity probe {target} failed: {error}")
+            elif ok:
+                online, via = True, target
+        # Losers keep running until their own timeout; their results go nowhere
+        if online:
+            logger.info(f"Network connectivity confirmed via {via}")
+        else:
             logger.warning("All network connectivity tests failed")
-        
-        return result
+        metrics.count("connectivity.online" if online else "connectivity.offline")
+        return online, via
+
+
+connectivity_bus = ConnectivityBus()
+
+
+def set_connectivity_probe_targets(targets, timeout=None):
+    """Point the connectivity probe at other targets (e.g. a local stand-in in tests)."""
+    with connectivity_bus._lock:
+        connectivity_bus.targets = tuple(targets) if targets else _connectivity_targets_from_env()
+        if timeout is not None:
+            connectivity_bus.timeout = timeout
+        connectivity_bus._state = {'online': None, 'checked_at': 0.0, 'via': None}
+
+
+def test_network_connectivity():
+    """Check for active network connectivity (beyond just WiFi connection).
+
+    Served from connectivity_bus: cached for NETWORK_CHECK_TTL seconds and shared
+    between concurrent callers.
+    """
+    return connectivity_bus.check()
+
+
+# --- Version info and update check ---
+# The local version is read straight from .git (HEAD, loose refs, packed-refs and
+# loose commit objects) instead of forking git; only a commit that has been
+# packed falls back to `git log`, once per hash. The GitHub check sends the
+# last ETag as If-None-Match: an unchanged branch answers 304, which GitHub
+# does not count against the shared per-IP rate limit.
+GITHUB_API_BASE_URL = os.environ.get('DASHBOARD_GITHUB_API_URL', 'https://api.github.com').rstrip('/')
+_commit_message_cache = {}
+
+
+def _find_git_dir(start_dir):
+    """Return (git_dir, common_dir) for the checkout containing start_dir, or (None, None)."""
+    path = os.path.abspath(start_dir)
+    while True:
+        candidate = os.path.join(path, '.git')
+        if os.path.isdir(candidate):
+            git_dir = candidate
+            break
+        if os.path.isfile(candidate):
+            # Worktrees and submodules: ".git" is a file pointing at the real directory
+            with open(candidate, 'r') as f:
+                target = f.read().strip()
+            if not target.startswith('gitdir:'):
+                return None, None
+            git_dir = os.path.normpath(os.path.join(path, target[len('gitdir:'):].strip()))
+            break
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None, None
+        path = parent
+    common_dir = git_dir
+    commondir_file = os.path.join(git_dir, 'commondir')
+    if os.path.isfile(commondir_file):
+        with open(commondir_file, 'r') as f:
+            common_dir = os.path.normpath(os.path.join(git_dir, f.read().strip()))
+    return git_dir, common_dir
+
+
+def _resolve_git_ref(git_dir, common_dir, ref):
+    for base in (git_dir, common_dir):
+        ref_path = os.path.join(base, *ref.split('/'))
+        if os.path.isfile(ref_path):
+            with open(ref_path, 'r') as f:
+                value = f.read().strip()
+            if value.startswith('ref:'):
+                return _resolve_git_ref(git_dir, common_dir, value[4:].strip())
+            return value
+    packed = os.path.join(common_dir, 'packed-refs')
+    if os.path.isfile(packed):
+        with open(packed, 'r') as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) == 2 and parts[1] == ref and not line.startswith(('#', '^')):
+                    return parts[0]
+    return None
+
+
+def read_git_head(src_dir):
+    """Commit hash checked out in the repository containing src_dir, without running git."""
+    git_dir, common_dir = _find_git_dir(src_dir)
+    if git_dir is None:
+        return None
+    with open(os.path.join(git_dir, 'HEAD'), 'r') as f:
+        head = f.read().strip()
+    if head.startswith('ref:'):
+        return _resolve_git_ref(git_dir, common_dir, head[4:].strip())
+    return head or None
+
+
+def _read_commit_subject(common_dir, commit_hash):
+    """Subject line of a loose commit object, or None when the object is packed."""
+    object_path = os.path.join(common_dir, 'objects', commit_hash[:2], commit_hash[2:])
+    if not os.path.isfile(object_path):
+        return None
+    with open(object_path, 'rb') as f:
+        raw = zlib.decompress(f.read())
+    header, _, body = raw.partition(b'\0')
+    if not header.startswith(b'commit '):
+        return None
+    _, _, message = body.partition(b'\n\n')
+    # Like %s: the first paragraph, folded onto one line
+    paragraph = message.decode('utf-8', errors='replace').strip().split('\n\n', 1)[0]
+    return ' '.join(line.strip() for line in paragraph.splitlines())
 
 
 def get_git_version_info(src_dir):
     """Get summarized git version info (hash and message)"""
     profiler.mark("get_git_version_info Start")
     try:
-        res_hash = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, cwd=src_dir)
-        if res_hash.returncode != 0:
-            profiler.mark("get_git_version_info End (Fail: git rev-parse)")
+        commit_hash = read_git_head(src_dir)
+        if not commit_hash:
+            profiler.mark("get_git_version_info End (Fail: no HEAD)")
             return None
-        commit_hash = res_hash.stdout.strip()
 
-        res_msg = subprocess.run(['git', 'log', '-1', '--pretty=format:%s', commit_hash], capture_output=True, text=True, cwd=src_dir)
-        commit_message = res_msg.stdout.strip() if res_msg.returncode == 0 else "Unknown"
+        commit_message = _commit_message_cache.get(commit_hash)
+        if commit_message is None:
+            _, common_dir = _find_git_dir(src_dir)
+            commit_message = _read_commit_subject(common_dir, commit_hash)
+            if commit_message is None:
+                res_msg = subprocess.run(['git', 'log', '-1', '--pretty=format:%s', commit_hash],
+                                         capture_output=True, text=True, cwd=src_dir)
+                commit_message = res_msg.stdout.strip() if res_msg.returncode == 0 else "Unknown"
+            _commit_message_cache[commit_hash] = commit_message
 
         profiler.mark("get_git_version_info End (Success)")
         return {
@@ -1645,27 +4014,49 @@ def get_git_version_info(src_dir):
 def check_github_for_updates(current_hash, repo_owner="hwpaige", repo_name="spacex-dashboard", branch="master"):
     """Check if a newer version is available on GitHub using urllib for better boot performance."""
     profiler.mark("check_github_for_updates Start")
+    api_url = f"{GITHUB_API_BASE_URL}/repos/{repo_owner}/{repo_name}/commits/{branch}"
+    cache = load_cache_from_file(RUNTIME_CACHE_FILE_UPDATE_CHECK)
+    entries = cache['data'] if cache and isinstance(cache.get('data'), dict) else {}
+    cached = entries.get(api_url) or {}
     try:
-        api_url = f"https://api.github.com/repos/{repo_owner}/{repo_name}/commits/{branch}"
         # Use urllib.request with a short timeout to avoid GIL contention during boot
-        req = urllib.request.Request(api_url, headers={'User-Agent': 'SpaceX-Dashboard-App'})
+        headers = {'User-Agent': 'SpaceX-Dashboard-App', 'Accept': 'application/vnd.github+json'}
+        if cached.get('etag') and cached.get('latest'):
+            headers['If-None-Match'] = cached['etag']
+        req = urllib.request.Request(api_url, headers=headers)
         logger.info(f"Checking for updates at {api_url}...")
-        with urllib.request.urlopen(req, timeout=3) as response:
-            if response.status == 200:
-                latest = json.loads(response.read().decode())
-                latest_hash = latest['sha']
-                profiler.mark("check_github_for_updates End (Success)")
-                logger.info(f"Update check successful. Latest hash: {latest_hash[:8]}")
-                return latest_hash != current_hash, {
-                    'hash': latest_hash,
-                    'short_hash': latest_hash[:8],
-                    'message': latest['commit']['message'],
-                    'author': latest['commit']['author']['name'],
-                    'date': latest['commit']['author']['date'],
-                    'branch': branch
-                }
-            else:
-                logger.warning(f"GitHub update check returned status {response.status}")
+        try:
+            with urllib.request.urlopen(req, timeout=3) as response:
+                status, etag, body = response.status, response.headers.get('ETag'), response.read()
+        except urllib.error.HTTPError as e:
+            if e.code != 304:
+                raise
+            status = 304
+        if status == 304:
+            latest_info = cached['latest']
+            metrics.count("update_check.not_modified")
+            profiler.mark("check_github_for_updates End (Not Modified)")
+            logger.info(f"Update check: {branch} unchanged since last check ({latest_info['short_hash']})")
+            return latest_info['hash'] != current_hash, dict(latest_info, branch=branch)
+        if status == 200:
+            latest = json.loads(body.decode())
+            latest_hash = latest['sha']
+            latest_info = {
+                'hash': latest_hash,
+                'short_hash': latest_hash[:8],
+                'message': latest['commit']['message'],
+                'author': latest['commit']['author']['name'],
+                'date': latest['commit']['author']['date'],
+                'branch': branch
+            }
+            if etag:
+                entries[api_url] = {'etag': etag, 'latest': latest_info}
+                save_cache_to_file(RUNTIME_CACHE_FILE_UPDATE_CHECK, entries, datetime.now(pytz.UTC))
+            metrics.count("update_check.fetched")
+            profiler.mark("check_github_for_updates End (Success)")
+            logger.info(f"Update check successful. Latest hash: {latest_hash[:8]}")
+            return latest_hash != current_hash, latest_info
+        logger.warning(f"GitHub update check returned status {status}")
     except urllib.error.URLError as e:
         logger.info(f"GitHub update check network error (possibly offline): {e}")
     except socket.timeout:
@@ -1855,9 +4246,9 @@ def _get_linux_wifi_security_type(ssid, interface):
     return None
 
 
+@metrics.timed("get_launch_trends_series")
 def get_launch_trends_series(launches, chart_view_mode, current_year, current_month):
     """Process launch data into series for charting using plain Python (no pandas for better performance)"""
-    profiler.mark("get_launch_trends_series Start")
     rocket_types = ['Starship', 'Falcon 9', 'Falcon Heavy']
     
     if chart_view_mode == 'cumulative':
@@ -1925,12 +4316,12 @@ def get_launch_trends_series(launches, chart_view_mode, current_year, current_mo
             'values': values
         })
     
-    profiler.mark("get_launch_trends_series End")
     return all_months, series
 
 # Global trajectory data cache to avoid redundant disk I/O
 _TRAJECTORY_DATA_CACHE = None
 
+@metrics.timed("get_launch_trajectory_data")
 def get_launch_trajectory_data(upcoming_launches, previous_launches=None):
     """
     Get trajectory data for the next upcoming launch or a specific launch.
@@ -1938,8 +4329,7 @@ def get_launch_trajectory_data(upcoming_launches, previous_launches=None):
     If upcoming_launches is a list, use the first item (existing behavior).
     Standalone version of Backend.get_launch_trajectory.
     """
-    profiler.mark("get_launch_trajectory_data Start")
-    logger.info("get_launch_trajectory_data called")
+    logger.debug("get_launch_trajectory_data called")
     
     # Handle single launch object (dict) vs list of launches
     if isinstance(upcoming_launches, dict):
@@ -2083,7 +4473,7 @@ def get_launch_trajectory_data(upcoming_launches, previous_launches=None):
 
     if cache_key in _TRAJECTORY_DATA_CACHE:
         cached = _TRAJECTORY_DATA_CACHE[cache_key]
-        logger.info(f"Trajectory in-memory cache hit for {cache_key}")
+        logger.debug(f"Trajectory in-memory cache hit for {cache_key}")
         return {
             'launch_site': cached.get('launch_site', launch_site),
             'trajectory': cached.get('trajectory', []),
@@ -2347,18 +4737,17 @@ def get_launch_trajectory_data(upcoming_launches, previous_launches=None):
 # Global date parsing cache to avoid redundant expensive calls across different modules
 _DATE_PARSE_CACHE = {}
 _DATE_PARSE_CACHE_DIRTY = False
+_DATE_PARSE_CACHE_LOADED = False
+_UNPARSED = object()
 
 def _load_date_cache():
-    global _DATE_PARSE_CACHE
+    global _DATE_PARSE_CACHE, _DATE_PARSE_CACHE_LOADED
+    _DATE_PARSE_CACHE_LOADED = True
     try:
         cache_data = load_cache_from_file(RUNTIME_CACHE_FILE_PARSED_DATES)
-        if cache_data and 'data' in cache_data:
-            # Convert timestamps back to datetime objects
-            for net_str, ts in cache_data['data'].items():
-                if ts is None:
-                    _DATE_PARSE_CACHE[net_str] = None
-                else:
-                    _DATE_PARSE_CACHE[net_str] = datetime.fromtimestamp(ts, pytz.UTC)
+        if cache_data and isinstance(cache_data.get('data'), dict):
+            # Entries stay as stored until _get_parsed_dt first needs them
+            _DATE_PARSE_CACHE.update(cache_data['data'])
             logger.info(f"Loaded {len(_DATE_PARSE_CACHE)} parsed dates from cache")
     except Exception as e:
         logger.debug(f"Failed to load date parse cache: {e}")
@@ -2368,48 +4757,46 @@ def _save_date_cache():
     if not _DATE_PARSE_CACHE_DIRTY:
         return
     try:
-        # Convert datetime objects to timestamps for JSON
-        serializable_cache = {}
-        for net_str, dt in _DATE_PARSE_CACHE.items():
-            if dt is None:
-                serializable_cache[net_str] = None
-            else:
-                serializable_cache[net_str] = dt.timestamp()
-        
-        save_cache_to_file(RUNTIME_CACHE_FILE_PARSED_DATES, serializable_cache, datetime.now(pytz.UTC))
+        # The codec writes datetimes as ISO-8601; entries never decoded are written back as loaded
+        save_cache_to_file(RUNTIME_CACHE_FILE_PARSED_DATES, dict(_DATE_PARSE_CACHE), datetime.now(pytz.UTC))
         _DATE_PARSE_CACHE_DIRTY = False
         logger.info(f"Saved {len(_DATE_PARSE_CACHE)} parsed dates to cache")
     except Exception as e:
         logger.debug(f"Failed to save date parse cache: {e}")
 
-# Initial load
-_load_date_cache()
-
 def _get_parsed_dt(net_str):
     """Helper to get parsed datetime from cache or parse it if not cached."""
     global _DATE_PARSE_CACHE, _DATE_PARSE_CACHE_DIRTY
     if not net_str: return None
-    if net_str not in _DATE_PARSE_CACHE:
+    # Loaded on first use rather than at import so it stays off the cold-boot import path
+    if not _DATE_PARSE_CACHE_LOADED:
+        _load_date_cache()
+    dt = _DATE_PARSE_CACHE.get(net_str, _UNPARSED)
+    if dt is None or type(dt) is datetime:
+        return dt
+    if dt is _UNPARSED:
         try:
-            dt = parse(net_str)
+            dt = _dateutil_parser.parse(net_str)
             if dt.tzinfo is None:
                 dt = dt.replace(tzinfo=pytz.UTC)
             else:
                 dt = dt.astimezone(pytz.UTC)
-            _DATE_PARSE_CACHE[net_str] = dt
-            _DATE_PARSE_CACHE_DIRTY = True
         except Exception:
-            _DATE_PARSE_CACHE[net_str] = None
-            _DATE_PARSE_CACHE_DIRTY = True
-    return _DATE_PARSE_CACHE[net_str]
+            dt = None
+        _DATE_PARSE_CACHE_DIRTY = True
+    else:
+        # Loaded from the parsed-dates cache file
+        dt = decode_json_datetime(dt)
+    _DATE_PARSE_CACHE[net_str] = dt
+    return dt
 
+@metrics.timed("group_event_data")
 def group_event_data(data, mode, event_type, timezone_obj):
     """
     Group and filter launch or race event data by date range (Today, This Week, Later, etc.).
     UI-agnostic logic extracted from EventModel.update_data.
     """
     global _DATE_PARSE_CACHE, _DATE_PARSE_CACHE_DIRTY
-    profiler.mark(f"group_event_data Start (mode={mode}, type={event_type})")
     
     # ...
     # Determine local "today" for grouping
@@ -2515,7 +4902,6 @@ def group_event_data(data, mode, event_type, timezone_obj):
                 grouped.append({'group': 'Earlier'})
                 grouped.extend(earlier_launches)
     
-    profiler.mark(f"group_event_data End (grouped count: {len(grouped)})")
     return grouped
 
 LAUNCH_DESCRIPTIONS = [
@@ -2772,12 +5158,12 @@ def is_launch_near(next_launch, window_seconds=600):
     except Exception:
         return False
 
+@metrics.timed("get_calendar_mapping")
 def get_calendar_mapping(launch_data, tz_obj=None):
     """
     Generate a mapping of date strings (YYYY-MM-DD) to lists of launches.
     Extracted from Backend.launchesByDate to allow pre-computation during boot.
     """
-    profiler.mark("get_calendar_mapping Start")
     mapping = {}
     if not launch_data:
         return mapping
@@ -2827,7 +5213,6 @@ def get_calendar_mapping(launch_data, tz_obj=None):
             l_typed['localDate'] = d
             l_typed['localTime'] = d + " " + t
             mapping[d].append(l_typed)
-    profiler.mark(f"get_calendar_mapping End ({len(mapping)} dates)")
     _save_date_cache()
     return mapping
 
@@ -2885,49 +5270,73 @@ def get_upcoming_launches_list(upcoming_launches, tz_obj, limit=10):
             launches.append(launch)
     return launches
 
-def get_closest_x_video_url(launch_data):
-    """Find the X.com livestream URL of the launch closest to current time."""
-    if not launch_data:
-        logger.debug("get_closest_x_video_url: No launch data provided, returning empty URL")
-        return ""
+def _x_stream_url(launch):
+    """Prefer explicit x_video_url, but fall back to video_url if it's an X/Twitter link."""
+    x_url = launch.get('x_video_url')
+    if not x_url:
+        v_url = launch.get('video_url', '')
+        if v_url and ('x.com' in v_url.lower() or 'twitter.com' in v_url.lower()):
+            x_url = v_url
+    return x_url
 
-    current_time = datetime.now(pytz.UTC)
-    previous = launch_data.get('previous', [])
-    upcoming = launch_data.get('upcoming', [])
-
-    all_launches = previous + upcoming
-    closest_url = ""
-    min_diff = float('inf')
-
-    for launch in all_launches:
-        # Prefer explicit x_video_url, but fallback to video_url if it's an X/Twitter link
-        x_url = launch.get('x_video_url')
-        if not x_url:
-            v_url = launch.get('video_url', '')
-            if v_url and ('x.com' in v_url.lower() or 'twitter.com' in v_url.lower()):
-                x_url = v_url
-        
-        if not x_url:
-            continue
 
-        try:
-            launch_net = _get_parsed_dt(launch['net'])
-            if not launch_net:
+class LiveStreamIndex:
+    """Launches with an X/Twitter stream, sorted by NET epoch for nearest-in-time lookups.
+
+    Build one per launch data version. nearest(now) also returns when the answer
+    can next change (the midpoint to the following candidate), so callers can
+    schedule the recheck instead of polling.
+    """
+
+    def __init__(self, launch_data):
+        candidates = []
+        launches = (launch_data or {}).get('previous', []) + (launch_data or {}).get('upcoming', [])
+        for launch in launches:
+            x_url = _x_stream_url(launch)
+            if not x_url:
+                continue
+            try:
+                launch_net = _get_parsed_dt(launch['net'])
+            except Exception:
                 continue
+            if launch_net:
+                candidates.append((launch_net.timestamp(), x_url))
+        # Stable sort: among equal NETs the earlier list entry stays first, as the linear scan preferred
+        candidates.sort(key=lambda c: c[0])
+        self.epochs = [c[0] for c in candidates]
+        self.urls = [c[1] for c in candidates]
+
+    def __len__(self):
+        return len(self.epochs)
+
+    def nearest(self, now_ts):
+        """Return (url, change_ts): the closest stream and when that may stop being true.
+
+        change_ts is None when no later candidate exists.
+        """
+        epochs = self.epochs
+        if not epochs:
+            return "", None
+        i = bisect.bisect_left(epochs, now_ts)
+        if i == len(epochs):
+            best = bisect.bisect_left(epochs, epochs[-1])
+        elif i == 0:
+            best = 0
+        else:
+            before = bisect.bisect_left(epochs, epochs[i - 1])
+            # Ties go to the earlier NET, which also came first in previous + upcoming
+            best = before if now_ts - epochs[before] <= epochs[i] - now_ts else i
+        later = bisect.bisect_right(epochs, epochs[best])
+        change_ts = (epochs[best] + epochs[later]) / 2 if later < len(epochs) else None
+        return self.urls[best], change_ts
 
-            diff = abs((current_time - launch_net).total_seconds())
-            
-            # Prioritization:
-            # 1. If it's very close to now (within 12 hours), it's likely the "Live" one we want.
-            # 2. Upcoming launches with URLs are generally better candidates than old previous ones.
-            # But for now, we'll stick to closest in time, but allow the fallback.
-            
-            if diff < min_diff:
-                min_diff = diff
-                closest_url = x_url
-        except Exception:
-            continue
 
+def get_closest_x_video_url(launch_data):
+    """Find the X.com livestream URL of the launch closest to current time."""
+    if not launch_data:
+        logger.debug("get_closest_x_video_url: No launch data provided, returning empty URL")
+        return ""
+    closest_url, _ = LiveStreamIndex(launch_data).nearest(time.time())
     logger.debug(f"get_closest_x_video_url: Found URL: {closest_url}")
     return closest_url
 
@@ -3009,6 +5418,9 @@ def get_nmcli_profiles():
         return []
 
     try:
+        if _wifi_monitor is not None and _wifi_monitor.available:
+            return [{'name': p['name'], 'ssid': p['ssid']} for p in _wifi_monitor.profiles()]
+
         nmcli_check = subprocess.run(['which', 'nmcli'], capture_output=True, timeout=3)
         if nmcli_check.returncode != 0:
             return []
@@ -3029,16 +5441,16 @@ def get_nmcli_profiles():
         logger.debug(f"Failed to fetch nmcli profiles: {e}")
         return []
 
+@metrics.timed("fetch_weather_for_all_locations")
 def fetch_weather_for_all_locations(locations_config, active_location=None):
     """Fetch weather for all configured locations, prioritizing active location for performance."""
-    profiler.mark("fetch_weather_for_all_locations Start")
 
     # Try loading from cache first
     try:
         cache = load_cache_from_file(CACHE_FILE_WEATHER)
         current_time = datetime.now(pytz.UTC)
         if cache and (current_time - cache['timestamp']).total_seconds() < CACHE_REFRESH_INTERVAL_WEATHER:
-            logger.info("Using cached weather data for all locations")
+            logger.debug("Using cached weather data for all locations")
             
             # Ensure wind_gusts_kts is present in cached data
             data = cache['data']
@@ -3046,7 +5458,7 @@ def fetch_weather_for_all_locations(locations_config, active_location=None):
                 if 'wind_gusts_kts' not in data[loc]:
                     data[loc]['wind_gusts_kts'] = data[loc].get('wind_speed_kts', 0) * 1.2
             
-            profiler.mark("fetch_weather_for_all_locations End (Cache Hit)")
+            metrics.count("fetch_weather_for_all_locations.cache_hit")
             return data
     except Exception as e:
         logger.warning(f"Failed to load weather cache: {e}")
@@ -3178,7 +5590,6 @@ def fetch_weather_for_all_locations(locations_config, active_location=None):
         # Save to cache
         save_cache_to_file(CACHE_FILE_WEATHER, weather_data, datetime.now(pytz.UTC))
         logger.info(f"Fetched and cached weather for {len(weather_data)} locations")
-        profiler.mark("fetch_weather_for_all_locations End (API Success)")
         return weather_data
     except Exception as e:
         logger.error(f"Failed to fetch weather from new API: {e}")
@@ -3280,8 +5691,8 @@ def perform_full_dashboard_data_load(locations_config, status_callback=None, tz_
         narratives = f_narratives.result()
         profiler.mark("Narratives received")
         
-        # Enrich narratives with launch data now that both are available
-        narratives = fetch_narratives(launch_data)
+        # Enrich the narratives already fetched now that launch data is available
+        narratives = enrich_narratives(narratives, launch_data)
 
     profiler.mark("perform_full_dashboard_data_load End")
     _emit("Synchronizing dashboard...")
@@ -3515,8 +5926,168 @@ def setup_dashboard_environment():
         # More aggressive VSync for Mesa
         os.environ.setdefault("__GL_SYNC_TO_VBLANK", "1")
 
+# --- Logging pipeline ---
+# Callers only enqueue records (QueueHandler); AsyncLogWriter formats and writes
+# them on a background thread and flushes in batches, so SD-card writes never
+# block the Qt main thread. Levels per subsystem (logger name) come from
+# DASHBOARD_LOG_LEVELS, e.g. "functions=WARNING,qt=ERROR,app=DEBUG".
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+LOG_MAX_BYTES = 2 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
+LOG_FLUSH_INTERVAL = 1.0  # seconds between flushes; ERROR and above flush immediately
+LOG_BATCH_SIZE = 256
+LOG_SUBSYSTEM_ALIASES = {'app': '__main__'}
+
+
+def parse_log_levels(spec):
+    """Parse "name=LEVEL,..." into {logger_name: level}; unknown levels are skipped."""
+    levels = {}
+    for item in (spec or '').split(','):
+        name, sep, level = item.partition('=')
+        name, level = name.strip(), level.strip().upper()
+        if not sep or not name:
+            continue
+        value = logging.getLevelName(level) if not level.isdigit() else int(level)
+        if isinstance(value, int):
+            levels[LOG_SUBSYSTEM_ALIASES.get(name, name)] = value
+    return levels
+
+
+class _BatchFlushRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler whose flushes are driven by AsyncLogWriter."""
+
+    def flush(self):
+        pass
+
+    def flush_now(self):
+        super().flush()
+
+
+class _BatchFlushStreamHandler(logging.StreamHandler):
+    def flush(self):
+        pass
+
+    def flush_now(self):
+        super().flush()
+
+
+class AsyncLogWriter:
+    """Drains a QueueHandler queue on a background thread and writes in batches."""
+    _STOP = object()
+
+    def __init__(self, log_queue, handlers, flush_interval=LOG_FLUSH_INTERVAL, batch_size=LOG_BATCH_SIZE):
+        self.queue = log_queue
+        self.handlers = list(handlers)
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.flushes = 0
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=2.0):
+        """Write everything queued so far, flush and close the handlers."""
+        if self._thread is None:
+            return
+        self.queue.put(self._STOP)
+        self._thread.join(timeout)
+        self._thread = None
+        for handler in self.handlers:
+            handler.close()
+
+    def _flush(self):
+        for handler in self.handlers:
+            try:
+                getattr(handler, 'flush_now', handler.flush)()
+            except Exception:
+                pass
+        self.flushes += 1
+
+    def _run(self):
+        last_flush = time.monotonic()
+        dirty = False
+        while True:
+            try:
+                if dirty:
+                    record = self.queue.get(timeout=max(0.0, self.flush_interval - (time.monotonic() - last_flush)))
+                else:
+                    record = self.queue.get()
+            except queue.Empty:
+                self._flush()
+                last_flush, dirty = time.monotonic(), False
+                continue
+
+            batch = [record]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stopping = urgent = False
+            for record in batch:
+                if record is self._STOP:
+                    stopping = True
+                    continue
+                urgent = urgent or record.levelno >= logging.ERROR
+                for handler in self.handlers:
+                    if record.levelno >= handler.level:
+                        handler.handle(record)
+            dirty = True
+            if stopping or urgent or time.monotonic() - last_flush >= self.flush_interval:
+                self._flush()
+                last_flush, dirty = time.monotonic(), False
+            if stopping:
+                return
+
+
+_log_writer = None
+
+
+def _stop_log_writer():
+    global _log_writer
+    writer, _log_writer = _log_writer, None
+    if writer is not None:
+        writer.stop()
+
+
+def install_async_logging(log_file, level=logging.INFO, max_bytes=LOG_MAX_BYTES,
+                          backup_count=LOG_BACKUP_COUNT, subsystem_levels=None, stream=None):
+    """Route the root logger through a queue to a background rotating-file writer."""
+    global _log_writer
+    _stop_log_writer()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    file_handler = _BatchFlushRotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count,
+                                                  encoding='utf-8')
+    # Keep the previous run as app.log.1 instead of truncating it
+    if backup_count and os.path.getsize(log_file) > 0:
+        file_handler.doRollover()
+    handlers = [file_handler]
+    if stream is not False:
+        handlers.append(_BatchFlushStreamHandler(stream or sys.stdout))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(level)
+    for name, subsystem_level in (subsystem_levels or {}).items():
+        logging.getLogger(name).setLevel(subsystem_level)
+
+    _log_writer = AsyncLogWriter(log_queue, handlers)
+    _log_writer.start()
+    return _log_writer
+
+
 def setup_dashboard_logging(module_file):
-    """Initialize logging with file and console handlers."""
+    """Initialize logging with an asynchronous rotating file and console pipeline."""
     try:
         log_dir = os.path.join(os.path.dirname(module_file), '..', 'docs')
         if not os.path.exists(log_dir):
@@ -3530,15 +6101,15 @@ def setup_dashboard_logging(module_file):
         # Print intention first to verify path logic
         print(f"ATTEMPTING TO LOG TO: {os.path.abspath(log_file)}")
 
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file, mode='w', encoding='utf-8'),
-                logging.StreamHandler(sys.stdout)
-            ],
-            force=True
+        level = logging.getLevelName(os.environ.get('DASHBOARD_LOG_LEVEL', 'INFO').strip().upper())
+        install_async_logging(
+            log_file,
+            level=level if isinstance(level, int) else logging.INFO,
+            max_bytes=int(os.environ.get('DASHBOARD_LOG_MAX_BYTES', LOG_MAX_BYTES)),
+            backup_count=int(os.environ.get('DASHBOARD_LOG_BACKUPS', LOG_BACKUP_COUNT)),
+            subsystem_levels=parse_log_levels(os.environ.get('DASHBOARD_LOG_LEVELS', '')),
         )
+        atexit.register(_stop_log_writer)
         # Log the log path immediately to stdout and logger
         print(f"LOGGING SETUP COMPLETE. File: {os.path.abspath(log_file)}")
         logger.info(f"LOGGING INITIALIZED: {os.path.abspath(log_file)}")
@@ -3724,20 +6295,159 @@ def get_countdown_breakdown(launch_data, mode, next_launch, tz_obj):
         'label': 'LIFTOFF' if is_t_plus else 'LAUNCH'
     }
 
-def get_update_progress_summary(log_path):
-    """Read the last few lines of the update log to provide a status update."""
-    if not log_path or not os.path.exists(log_path):
-        return "Preparing update…"
-    try:
-        with open(log_path, 'r', encoding='utf-8', errors='ignore') as f:
-            lines = f.readlines()
-        if lines:
-            tail_lines = lines[-15:]
-            tail = "\n".join([ln.rstrip() for ln in tail_lines]).strip()
-            return tail if tail else "Updating…"
-    except Exception:
-        pass
-    return "Updating…"
+UPDATE_LOG_TAIL_LINES = 15
+UPDATE_LOG_INITIAL_BYTES = 64 * 1024  # how far back the first read of an existing log starts
+
+
+class _InotifyWatch:
+    """Non-blocking inotify watch on a log file's directory via libc.
+
+    Watching the directory rather than the file sees the log being created,
+    replaced or removed as well as appended to. Raises OSError where inotify
+    is unavailable.
+    """
+
+    IN_MODIFY = 0x002
+    IN_CLOSE_WRITE = 0x008
+    IN_MOVED_FROM = 0x040
+    IN_MOVED_TO = 0x080
+    IN_CREATE = 0x100
+    IN_DELETE = 0x200
+    IN_Q_OVERFLOW = 0x4000
+    IN_NONBLOCK = os.O_NONBLOCK
+    IN_CLOEXEC = 0o2000000
+    _EVENT = struct.Struct('iIII')
+
+    def __init__(self, path):
+        import ctypes
+        import ctypes.util
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self.name = os.fsencode(os.path.basename(path))
+        self.fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        mask = (self.IN_MODIFY | self.IN_CLOSE_WRITE | self.IN_MOVED_FROM | self.IN_MOVED_TO
+                | self.IN_CREATE | self.IN_DELETE)
+        directory = os.path.dirname(os.path.abspath(path))
+        if libc.inotify_add_watch(self.fd, os.fsencode(directory), mask) < 0:
+            err = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(err, f"inotify_add_watch failed for {directory}")
+
+    def changed(self):
+        """Drain queued events; True if any concerned the watched file."""
+        hit = False
+        while True:
+            try:
+                buf = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return hit
+            if not buf:
+                return hit
+            pos = 0
+            while pos + self._EVENT.size <= len(buf):
+                _wd, mask, _cookie, length = self._EVENT.unpack_from(buf, pos)
+                pos += self._EVENT.size
+                name = buf[pos:pos + length].rstrip(b'\0')
+                pos += length
+                if mask & self.IN_Q_OVERFLOW or name == self.name:
+                    hit = True
+
+    def close(self):
+        try:
+            os.close(self.fd)
+        except OSError:
+            pass
+
+
+class LogTailFollower:
+    """Incremental tail -F of a log file keeping the last max_lines lines.
+
+    poll() reads only the bytes appended since the previous call and returns
+    True when summary changed. A file that shrinks (truncated) or whose inode
+    changes (rotated or recreated) is read again from the start. With
+    use_inotify, polls between which the directory saw no event for the file
+    return without touching the filesystem, and fileno() exposes the inotify
+    descriptor so an event loop can call poll() only when it becomes readable.
+    """
+
+    def __init__(self, path, max_lines=UPDATE_LOG_TAIL_LINES, use_inotify=False):
+        self.path = path
+        self.max_lines = max_lines
+        self._lines = collections.deque(maxlen=max_lines)
+        self._partial = b''
+        self._offset = 0
+        self._identity = None
+        self._polled = False
+        self.summary = "Preparing update…"
+        self._watch = None
+        if use_inotify and path and sys.platform.startswith('linux'):
+            try:
+                self._watch = _InotifyWatch(path)
+            except (OSError, AttributeError) as e:
+                logger.debug(f"inotify unavailable for {path}, polling instead: {e}")
+
+    def fileno(self):
+        return self._watch.fd if self._watch is not None else None
+
+    def _reset(self, identity=None):
+        self._lines.clear()
+        self._partial = b''
+        self._offset = 0
+        self._identity = identity
+
+    def _summarise(self):
+        lines = list(self._lines)
+        if self._partial:
+            lines = (lines + [self._partial.decode('utf-8', errors='ignore').rstrip()])[-self.max_lines:]
+        tail = "\n".join(lines).strip()
+        return tail if tail else "Updating…"
+
+    def _publish(self, summary):
+        if summary == self.summary:
+            return False
+        self.summary = summary
+        return True
+
+    def poll(self):
+        if self._watch is not None and self._polled and not self._watch.changed():
+            return False
+        self._polled = True
+        if not self.path:
+            return self._publish("Preparing update…")
+        try:
+            f = open(self.path, 'rb')
+        except OSError:
+            self._reset()
+            return self._publish("Preparing update…")
+        with f:
+            st = os.fstat(f.fileno())
+            identity = (st.st_dev, st.st_ino)
+            if identity != self._identity:
+                self._reset(identity)
+                if st.st_size > UPDATE_LOG_INITIAL_BYTES:
+                    # Only the tail matters; skip to the last whole line before it
+                    f.seek(st.st_size - UPDATE_LOG_INITIAL_BYTES)
+                    f.readline()
+                    self._offset = f.tell()
+            elif st.st_size < self._offset:
+                self._reset(identity)
+            if st.st_size == self._offset:
+                return self._publish(self._summarise())
+            f.seek(self._offset)
+            data = f.read()
+        self._offset += len(data)
+        metrics.count("update_log.bytes_read", len(data))
+        chunks = (self._partial + data).split(b'\n')
+        self._partial = chunks.pop()
+        self._lines.extend(c.decode('utf-8', errors='ignore').rstrip() for c in chunks)
+        return self._publish(self._summarise())
+
+    def close(self):
+        if self._watch is not None:
+            self._watch.close()
+            self._watch = None
+
 
 def perform_bootstrap_diagnostics(src_dir, wifi_connected_state=True, skip_update_check=False):
     """Perform bootstrap network and update checks. Update check can be skipped to avoid boot delay."""
@@ -3792,6 +6502,8 @@ def bring_up_nm_connection(profile_name):
     if platform.system() != 'Linux':
         return False, "Not on Linux"
     try:
+        if _wifi_monitor is not None and _wifi_monitor.available:
+            return _wifi_monitor.activate_profile(profile_name)
         res = subprocess.run(['nmcli', 'connection', 'up', 'id', profile_name], capture_output=True, text=True, timeout=25)
         if res.returncode == 0:
             return True, res.stdout.strip()
@@ -0,0 +1,390 @@
+import QtQuick
+import QtQuick.Window
+import QtQuick.Controls
+import QtQuick.Layouts
+
+Item {
+    id: calendarViewItem
+    property var launchesMapping: backend.launchesByDate
+    property var todayDateString: Qt.formatDate(new Date(), "yyyy-MM-dd")
+    property var currentMonth: new Date()
+
+    property var popupLaunches: []
+    property string popupDateString: ""
+
+    property bool staggeredLoadActive: false
+    property Item hoveredCell: null
+    property int hoveredLaunchesCount: 0
+
+    Timer {
+        id: staggeredTimer
+        interval: 400
+        running: true
+        onTriggered: calendarViewItem.staggeredLoadActive = true
+    }
+
+    ToolTip {
+        id: sharedToolTip
+        visible: calendarViewItem.hoveredCell !== null
+        text: calendarViewItem.hoveredLaunchesCount > 0 ? (calendarViewItem.hoveredLaunchesCount + " Launch" + (calendarViewItem.hoveredLaunchesCount > 1 ? "es" : "")) : ""
+        parent: calendarViewItem.hoveredCell
+        delay: 500
+    }
+
+    Component {
+        id: monthGridComponent
+        GridLayout {
+            id: grid
+            property date pageDate
+            property int daysInMonth
+            property int startDayOfWeek
+
+            property var gridData: {
+                if (!pageDate || isNaN(pageDate.getTime())) return [];
+                var data = [];
+                var year = pageDate.getFullYear();
+                var month = pageDate.getMonth();
+                for (var i = 0; i < 42; i++) {
+                    var dayNum = i - startDayOfWeek + 1;
+                    var isCurrent = dayNum > 0 && dayNum <= daysInMonth;
+                    var d = new Date(year, month, dayNum);
+                    data.push({
+                        day: d.getDate(),
+                        dateString: isCurrent ? Qt.formatDate(d, "yyyy-MM-dd") : "",
+                        isCurrentMonth: isCurrent,
+                        fullDate: d
+                    });
+                }
+                return data;
+            }
+
+            anchors.fill: parent
+            columns: 7
+            rows: 6
+            rowSpacing: 2
+            columnSpacing: 2
+
+            Repeater {
+                model: grid.gridData
+
+                Rectangle {
+                    Layout.fillWidth: true
+                    Layout.fillHeight: true
+
+                    property bool isCurrentMonth: modelData.isCurrentMonth
+                    property string dateString: modelData.dateString
+
+                    color: "transparent"
+
+                    // Check for launches (optimized via backend mapping)
+                    property var dayLaunches: (isCurrentMonth && calendarViewItem.launchesMapping) ? 
+                                              (calendarViewItem.launchesMapping[dateString] || []) : []
+
+                    // Selection/Highlight
+                    Rectangle {
+                        anchors.centerIn: parent
+                        width: Math.min(parent.width, parent.height) - 4
+                        height: width
+                        radius: width/2
+                        color: {
+                            if (dayLaunches.length > 0) {
+                                return root.getStatusColor(dayLaunches[0].status)
+                            }
+                            // Today highlight
+                            if (isCurrentMonth && dateString === calendarViewItem.todayDateString) return backend.theme === "dark" ? "#444" : "#ddd"
+                            return "transparent"
+                        }
+                        opacity: dayLaunches.length > 0 ? 0.2 : 1.0
+
+                        border.color: dayLaunches.length > 0 ? root.getStatusColor(dayLaunches[0].status) : "transparent"
+                        border.width: dayLaunches.length > 0 ? 1 : 0
+                    }
+
+                    // Inner Dots for launches
+                    Row {
+                        anchors.centerIn: parent
+                        anchors.verticalCenterOffset: 6
+                        spacing: 2
+                        visible: dayLaunches.length > 0
+
+                        Repeater {
+                            model: Math.min(dayLaunches.length, 3) // Cap at 3
+                            Rectangle {
+                                width: 4; height: 4; radius: 2
+                                color: root.getStatusColor(dayLaunches[index].status)
+                            }
+                        }
+                    }
+
+                    Text {
+                        anchors.centerIn: parent
+                        anchors.verticalCenterOffset: -2
+                        text: modelData.day
+                        font.pixelSize: 12
+                        color: isCurrentMonth ? 
+                               (backend.theme === "dark" ? "white" : "black") : 
+                               (backend.theme === "dark" ? "#555555" : "#aaaaaa")
+                        font.bold: isCurrentMonth && dayLaunches.length > 0
+                    }
+
+                    MouseArea {
+                        id: ma
+                        anchors.fill: parent
+                        hoverEnabled: true
+                        cursorShape: dayLaunches.length > 0 ? Qt.PointingHandCursor : Qt.ArrowCursor
+                        onEntered: {
+                            if (dayLaunches.length > 0) {
+                                calendarViewItem.hoveredLaunchesCount = dayLaunches.length
+                                calendarViewItem.hoveredCell = ma
+                            }
+                        }
+                        onExited: calendarViewItem.hoveredCell = null
+                        onClicked: {
+                            if (dayLaunches.length > 0) {
+                                calendarViewItem.showPopup(dayLaunches, modelData.fullDate)
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+
+    function getMonthName(date) {
+        if (!date || isNaN(date.getTime())) return "";
+        return date.toLocaleDateString(Qt.locale(), "MMMM yyyy")
+    }
+
+    function showPopup(launches, dateVal) {
+        popupLaunches = launches;
+        popupDateString = Qt.formatDate(dateVal, "MMM d, yyyy");
+        dayPopup.open();
+    }
+
+    Popup {
+        id: dayPopup
+        anchors.centerIn: parent
+        width: Math.min(parent.width * 0.9, 300)
+        height: Math.min(parent.height * 0.8, 400)
+        modal: true
+        focus: true
+        closePolicy: Popup.CloseOnEscape | Popup.CloseOnPressOutside
+
+        background: Rectangle {
+            color: backend.theme === "dark" ? "#181818" : "#ffffff"
+            radius: 12
+            border.color: backend.theme === "dark" ? "#2a2a2a" : "#e0e0e0"
+            border.width: 1
+        }
+
+        ColumnLayout {
+            anchors.fill: parent
+            anchors.margins: 8
+            spacing: 2
+
+            Text {
+                text: calendarViewItem.popupDateString
+                font.bold: true
+                font.pixelSize: 14
+                color: backend.theme === "dark" ? "white" : "black"
+                Layout.alignment: Qt.AlignHCenter
+            }
+
+            ListView {
+                Layout.fillWidth: true
+                Layout.fillHeight: true
+                clip: true
+                model: calendarViewItem.popupLaunches
+                interactive: true
+                boundsBehavior: Flickable.StopAtBounds
+                flickableDirection: Flickable.VerticalFlick
+                delegate: Column {
+                    width: parent.width
+                    spacing: 1
+                    padding: 2
+
+                    Column {
+                        spacing: 0
+                        width: parent.width
+                        Text { 
+                            text: {
+                                var m = modelData.mission;
+                                var idx = m.indexOf("|");
+                                return idx !== -1 ? m.substring(idx + 1).trim() : m;
+                            }
+                            font.family: "D-DIN"; font.pixelSize: 14; font.bold: true; 
+                            color: backend.theme === "dark" ? "white" : "black"
+                            width: parent.width
+                            wrapMode: Text.Wrap
+                        }
+                        Text { 
+                            text: {
+                                var m = modelData.mission;
+                                var idx = m.indexOf("|");
+                                return idx !== -1 ? m.substring(0, idx).trim() : "";
+                            }
+                            visible: text !== ""
+                            font.family: "D-DIN"; font.pixelSize: 11; font.bold: false;
+                            color: (backend && backend.theme === "dark") ? "#cccccc" : "#666666"
+                            width: parent.width
+                            wrapMode: Text.Wrap
+                        }
+                    }
+                    Text { 
+                        text: (modelData.localTime && backend ? modelData.localTime + " " + backend.timezoneAbbrev : "TBD") + " / " + 
+                              (modelData.date ? modelData.date : "") + (modelData.time ? (" " + modelData.time) : "") + " UTC"
+                        font.family: "D-DIN"; font.pixelSize: 14; font.bold: true; color: "#999999" 
+                    }
+                    Row {
+                        spacing: 5
+                        Rectangle {
+                           width: 10; height: 10; radius: 5
+                           color: root.getStatusColor(modelData.status)
+                           anchors.verticalCenter: parent.verticalCenter
+                        }
+                        Text { text: modelData.status; font.bold: true; font.pixelSize: 12; color: root.getStatusColor(modelData.status) }
+                    }
+                    Rectangle { width: parent.width; height: 1; color: "#333333"; opacity: 0.2; visible: index < calendarViewItem.popupLaunches.length - 1 }
+                }
+            }
+
+            Button {
+                text: "Close"
+                Layout.alignment: Qt.AlignHCenter
+                onClicked: dayPopup.close()
+            }
+        }
+    }
+
+    ColumnLayout {
+        anchors.fill: parent
+        spacing: 0
+
+        // Month Header
+        Rectangle {
+            Layout.fillWidth: true
+            Layout.preferredHeight: 30
+            color: "transparent"
+
+            RowLayout {
+                anchors.fill: parent
+
+                // Previous Month
+                Text {
+                    text: "\uf053"
+                    font.family: "Font Awesome 5 Free"
+                    color: backend.theme === "dark" ? "#cccccc" : "#666666"
+                    font.pixelSize: 12
+                    Layout.preferredWidth: 30
+                    horizontalAlignment: Text.AlignHCenter
+                    MouseArea {
+                        anchors.fill: parent
+                        cursorShape: Qt.PointingHandCursor
+                        onClicked: calendarSwipe.decrementCurrentIndex()
+                    }
+                }
+
+                Text {
+                    text: calendarViewItem.getMonthName(calendarViewItem.currentMonth)
+                    font.bold: true
+                    font.pixelSize: 18
+                    color: backend.theme === "dark" ? "white" : "black"
+                    Layout.fillWidth: true
+                    horizontalAlignment: Text.AlignHCenter
+                }
+
+                // Next Month
+                Text {
+                    text: "\uf054"
+                    font.family: "Font Awesome 5 Free"
+                    color: backend.theme === "dark" ? "#cccccc" : "#666666"
+                    font.pixelSize: 12
+                    Layout.preferredWidth: 30
+                    horizontalAlignment: Text.AlignHCenter
+                    MouseArea {
+                        anchors.fill: parent
+                        cursorShape: Qt.PointingHandCursor
+                        onClicked: calendarSwipe.incrementCurrentIndex()
+                    }
+                }
+            }
+        }
+
+        // Days of Week Header
+        Row {
+            Layout.fillWidth: true
+            Layout.preferredHeight: 20
+            Layout.leftMargin: 5
+            Layout.rightMargin: 5
+            Repeater {
+                model: ["S", "M", "T", "W", "T", "F", "S"]
+                Text {
+                    width: parent.width / 7
+                    text: modelData
+                    font.pixelSize: 10
+                    color: backend.theme === "dark" ? "#999999" : "#666666"
+                    horizontalAlignment: Text.AlignHCenter
+                }
+            }
+        }
+
+        // Calendar Swipe View
+        SwipeView {
+            id: calendarSwipe
+            Layout.fillWidth: true
+            Layout.fillHeight: true
+            clip: true
+            interactive: true
+
+            // Start a few months back to allow history, but center on "today" logically
+            // Index 12 will be "current month" (relative offset 0)
+            currentIndex: 12
+
+            Component.onCompleted: {
+                // Jump to index 12 without animation on initial load
+                if (contentItem) {
+                    var oldDuration = contentItem.highlightMoveDuration
+                    contentItem.highlightMoveDuration = 0
+                    currentIndex = 12
+                    contentItem.highlightMoveDuration = oldDuration
+                }
+            }
+
+            onCurrentIndexChanged: {
+                var today = new Date()
+                var offset = currentIndex - 12
+                var newDate = new Date(today.getFullYear(), today.getMonth() + offset, 1)
+                calendarViewItem.currentMonth = newDate
+            }
+
+            Repeater {
+                model: 25 // Show range of +/- 12 months
+
+                Item {
+                    id: monthPage
+                    property int monthOffset: index - 12
+
+                    Loader {
+                        anchors.fill: parent
+                        anchors.margins: 5
+                        active: {
+                            if (index === calendarSwipe.currentIndex) return true;
+                            return calendarViewItem.staggeredLoadActive && Math.abs(index - calendarSwipe.currentIndex) <= 1;
+                        }
+                        asynchronous: true
+                        sourceComponent: monthGridComponent
+
+                        // Pass properties to the loaded item
+                        onLoaded: {
+                            var d = new Date()
+                            var pageDate = new Date(d.getFullYear(), d.getMonth() + monthOffset, 1)
+                            item.pageDate = pageDate
+                            item.daysInMonth = new Date(pageDate.getFullYear(), pageDate.getMonth() + 1, 0).getDate()
+                            item.startDayOfWeek = pageDate.getDay()
+                        }
+                    }
+                }
+            }
+        }
+    }
+}
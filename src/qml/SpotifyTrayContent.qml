@@ -0,0 +1,1079 @@
+import QtQuick
+import QtQuick.Window
+import QtQuick.Controls
+import QtQuick.Layouts
+
+ColumnLayout {
+    id: spotifyTrayContent
+
+    // Exposed so the tray shell in Main.qml can reach them once this is loaded
+    property alias devicesPopup: spotifyDevicesPopup
+    property alias searchField: spotifySearchField
+    property alias resultsList: spotifyResultsList
+
+    spacing: 0
+
+    RowLayout {
+        Layout.fillWidth: true
+        Layout.fillHeight: true
+        spacing: 0
+
+        // Left: full-height album art
+
+        Item {
+            id: spotifyAlbumArtPanel
+            Layout.fillHeight: true
+            Layout.preferredWidth: spotifyAlbumArtPanel.height
+            Layout.maximumWidth: Math.floor(spotifyFullScreenTray.width * 0.42)
+            visible: spotifyFullScreenTray.spotifyAuthenticated
+
+            Rectangle {
+                anchors.fill: parent
+                color: "transparent"
+            }
+
+            Image {
+                anchors.fill: parent
+                source: {
+                    var liveArt = (backend && backend.spotifyPlayer)
+                        ? (backend.spotifyPlayer.album_art_url_large || backend.spotifyPlayer.album_art_url || "")
+                        : ""
+                    return liveArt || spotifyFallbackArtUrl || ""
+                }
+                fillMode: Image.PreserveAspectCrop
+                asynchronous: true
+            }
+        }
+
+        // Right: now playing (left half) + library/search (right half)
+        ColumnLayout {
+            Layout.fillWidth: true
+            Layout.fillHeight: true
+            spacing: 0
+
+            Item {
+                visible: spotifyFullScreenTray.spotifyAuthenticated
+                Layout.fillWidth: true
+                Layout.preferredHeight: 8
+            }
+
+            MouseArea {
+                anchors.fill: root.contentItem
+                visible: spotifyDevicesPopup.visible
+                z: 2998
+                onClicked: spotifyDevicesPopup.close()
+            }
+
+            Item {
+                id: spotifyDevicesPopup
+                parent: root.contentItem
+                visible: false
+                z: 2999
+                width: Math.min(220, Math.max(150, spotifyFullScreenTray.width * 0.24))
+                x: spotifyFullScreenTray.devicePickerX
+                y: spotifyFullScreenTray.devicePickerY
+                height: spotifyDevicesContent.implicitHeight + 14
+
+                function open() { visible = true }
+                function close() {
+                    visible = false
+                    spotifyFullScreenTray.devicePickerAnchorKey = ""
+                }
+
+                Rectangle {
+                    anchors.fill: parent
+                    radius: 8
+                    color: (backend && backend.theme === "dark") ? "#121212" : "#fafafa"
+                    border.width: 1
+                    border.color: (backend && backend.theme === "dark") ? "#2a2a2a" : "#d7d7d7"
+                }
+
+                ColumnLayout {
+                    id: spotifyDevicesContent
+                    anchors.fill: parent
+                    anchors.margins: 7
+                    spacing: 5
+
+                    RowLayout {
+                        Layout.fillWidth: true
+                        Text {
+                            text: "Playback Device"
+                            color: (backend && backend.theme === "dark") ? "white" : "black"
+                            font.family: "D-DIN"
+                            font.pixelSize: 12
+                            font.bold: true
+                        }
+                        Item { Layout.fillWidth: true }
+                        Text {
+                            text: "\uf021"
+                            font.family: "Font Awesome 5 Free"
+                            font.pixelSize: 11
+                            color: (backend && backend.theme === "dark") ? "#b5b5b5" : "#666666"
+                            TapHandler {
+                                gesturePolicy: TapHandler.ReleaseWithinBounds
+                                onTapped: if (backend) backend.spotifyGetDevices()
+                            }
+                        }
+                    }
+
+                    ListView {
+                        Layout.fillWidth: true
+                        property int maxVisibleDevices: 3
+                        Layout.preferredHeight: Math.min(contentHeight, (30 * maxVisibleDevices) + (spacing * Math.max(0, maxVisibleDevices - 1)))
+                        clip: true
+                        spacing: 3
+                        model: {
+                            var base = [{"id": "", "name": "Auto (active device)", "type": "", "is_active": false, "is_restricted": false}]
+                            var currentId = (backend && backend.spotifyPlayer) ? (backend.spotifyPlayer.current_device_id || "") : ""
+                            var currentName = (backend && backend.spotifyPlayer) ? (backend.spotifyPlayer.current_device_name || "Current Device") : "Current Device"
+                            var items = (backend && backend.spotifyPlayer && backend.spotifyPlayer.devices) ? backend.spotifyPlayer.devices : []
+                            if (currentId) {
+                                var exists = false
+                                for (var i = 0; i < items.length; i++) {
+                                    if ((items[i].id || "") === currentId) {
+                                        exists = true
+                                        break
+                                    }
+                                }
+                                if (!exists) {
+                                    base.push({"id": currentId, "name": "Current: " + currentName, "type": "Current", "is_active": true, "is_restricted": false})
+                                }
+                            }
+                            return base.concat(items)
+                        }
+
+                        delegate: Rectangle {
+                            width: ListView.view.width
+                            height: 30
+                            radius: 6
+                            property string selectedId: (backend && backend.spotifyPlayer) ? (backend.spotifyPlayer.selected_device_id || "") : ""
+                            property bool isSelected: (modelData.id || "") === selectedId || (!selectedId && !(modelData.id || ""))
+                            color: isSelected
+                                ? ((backend && backend.theme === "dark") ? "#2a2a2a" : "#dcdcdc")
+                                : ((backend && backend.theme === "dark") ? "#181818" : "#f0f0f0")
+
+                            RowLayout {
+                                anchors.fill: parent
+                                anchors.leftMargin: 8
+                                anchors.rightMargin: 8
+                                spacing: 6
+
+                                Text {
+                                    text: modelData.name || "Unknown Device"
+                                    color: (backend && backend.theme === "dark") ? "white" : "black"
+                                    font.family: "D-DIN"
+                                    font.pixelSize: 11
+                                    elide: Text.ElideRight
+                                    Layout.fillWidth: true
+                                }
+
+                                Text {
+                                    text: (modelData.is_active ? "Active" : (modelData.type || ""))
+                                    color: (backend && backend.theme === "dark") ? "#9a9a9a" : "#666666"
+                                    font.family: "D-DIN"
+                                    font.pixelSize: 10
+                                }
+                            }
+
+                            TapHandler {
+                                gesturePolicy: TapHandler.ReleaseWithinBounds
+                                onTapped: {
+                                    if (!backend) return
+                                    backend.spotifySelectDevice(modelData.id || "")
+                                    backend.spotifyGetDevices()
+                                    spotifyDevicesPopup.close()
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+
+            // Horizontal split: now playing (left) + library/search (right)
+            RowLayout {
+                Layout.fillWidth: true
+                Layout.fillHeight: true
+                spacing: 0
+
+                // Drag-to-close overlay for the entire tray content
+                DragHandler {
+                    id: spotifyTrayDragToClose
+                    target: null
+                    xAxis.enabled: false
+
+                    property real dragStartY: 0
+                    property real dragDeltaY: 0
+                    property bool dragDownward: false
+
+                    onActiveChanged: {
+                        if (active) {
+                            dragStartY = centroid.scenePosition.y
+                            dragDeltaY = 0
+                            dragDownward = false
+                            spotifyFullScreenTray.isDragging = true
+                        } else {
+                            spotifyFullScreenTray.isDragging = false
+                            // If dragged down enough and we're at top of lists, close
+                            if (dragDownward && dragDeltaY > 60) {
+                                var canClose = true
+                                // Check if we're in a scrollable list view
+                                if (spotifyFullScreenTray.libraryCategory === -1) {
+                                    // Search results list
+                                    if (spotifyResultsList && spotifyResultsList.contentY > 0) {
+                                        canClose = false
+                                    }
+                                } else {
+                                    // Library grid/list
+                                    if (spotifyLibraryItemGrid && spotifyLibraryItemGrid.contentY > 0) {
+                                        canClose = false
+                                    }
+                                    if (spotifyTrackListView && spotifyTrackListView.contentY > 0) {
+                                        canClose = false
+                                    }
+                                }
+                                if (canClose) {
+                                    spotifyFullScreenTray.height = 0
+                                }
+                            }
+                        }
+                    }
+
+                    onCentroidChanged: {
+                        if (!active) return
+                        var delta = centroid.scenePosition.y - dragStartY
+                        dragDeltaY = delta
+                        if (delta > 5) {
+                            dragDownward = true
+                        }
+                    }
+                }
+
+                // Left: Now Playing
+                Rectangle {
+                    Layout.fillWidth: true
+                    Layout.fillHeight: true
+                    color: "transparent"
+                    clip: true
+
+                    StackLayout {
+                        anchors.fill: parent
+                        anchors.margins: 10
+                        visible: spotifyFullScreenTray.spotifyAuthenticated
+                        currentIndex: 0
+
+                        // Tab 0: Now Playing
+                        ColumnLayout {
+                            spacing: 8
+
+                            RowLayout {
+                                Layout.fillWidth: true
+                                Layout.bottomMargin: 4
+                                spacing: 14
+
+                                ColumnLayout {
+                                    Layout.fillWidth: true
+                                    spacing: 2
+
+                                    Text {
+                                        text: (backend && backend.spotifyPlayer) ? (backend.spotifyPlayer.track_name || "Nothing playing") : "Spotify"
+                                        color: (backend && backend.theme === "dark") ? "white" : "black"
+                                        font.family: "D-DIN"
+                                        font.pixelSize: 20
+                                        font.bold: true
+                                        elide: Text.ElideRight
+                                        Layout.fillWidth: true
+                                    }
+
+                                    Text {
+                                        text: (backend && backend.spotifyPlayer) ? (backend.spotifyPlayer.artist_name || backend.spotifyPlayer.status || "") : ""
+                                        color: (backend && backend.theme === "dark") ? "#c0c0c0" : "#666666"
+                                        font.family: "D-DIN"
+                                        font.pixelSize: 14
+                                        elide: Text.ElideRight
+                                        Layout.fillWidth: true
+                                    }
+                                }
+
+                                RowLayout {
+                                    Layout.preferredWidth: Math.min(220, Math.max(150, spotifyFullScreenTray.width * 0.22))
+                                    Layout.alignment: Qt.AlignVCenter
+                                    spacing: 8
+
+                                    Text {
+                                        text: "\uf026"
+                                        font.family: "Font Awesome 5 Free"
+                                        font.pixelSize: 11
+                                        color: (backend && backend.theme === "dark") ? "#888888" : "#999999"
+                                    }
+                                    Slider {
+                                        Layout.fillWidth: true
+                                        from: 0; to: 100
+                                        value: (backend && backend.spotifyPlayer) ? (backend.spotifyPlayer.volume_percent || 50) : 50
+                                        onMoved: backend.setSpotifyVolume(Math.round(value))
+                                    }
+                                    Text {
+                                        text: "\uf028"
+                                        font.family: "Font Awesome 5 Free"
+                                        font.pixelSize: 11
+                                        color: (backend && backend.theme === "dark") ? "#888888" : "#999999"
+                                    }
+                                }
+                            }
+
+                            ColumnLayout {
+                                Layout.fillWidth: true
+                                spacing: 6
+                                visible: (backend && backend.spotifyPlayer && backend.spotifyPlayer.up_next_items) ? (backend.spotifyPlayer.up_next_items.length > 0) : false
+
+                                Text {
+                                    Layout.fillWidth: true
+                                    text: "UP NEXT"
+                                    color: "white"
+                                    font.family: "D-DIN"
+                                    font.pixelSize: 18
+                                    font.bold: true
+                                }
+
+                                ListView {
+                                    Layout.fillWidth: true
+                                    Layout.preferredHeight: Math.min(spotifyFullScreenTray.upNextListMaxHeight, Math.max(0, contentHeight))
+                                    focus: true
+                                    keyNavigationEnabled: true
+                                    clip: true
+                                    spacing: 5
+                                    model: (backend && backend.spotifyPlayer) ? (backend.spotifyPlayer.up_next_items || []) : []
+
+                                    delegate: Rectangle {
+                                        width: ListView.view.width
+                                        height: 46
+                                        focus: ListView.isCurrentItem
+                                        radius: 8
+                                        color: (backend && backend.theme === "dark") ? "#171717" : "#f3f3f3"
+                                        border.width: 1
+                                        border.color: activeFocus ? "#1DB954" : ((backend && backend.theme === "dark") ? "#262626" : "#dddddd")
+
+                                        function playQueueItem() {
+                                            if (!backend) return
+                                            var uri = modelData.uri || ""
+                                            if (uri) backend.spotifyPlayTrackUri(uri)
+                                        }
+
+                                        Keys.onReturnPressed: playQueueItem()
+                                        Keys.onEnterPressed: playQueueItem()
+                                        Keys.onSpacePressed: playQueueItem()
+
+                                        RowLayout {
+                                            anchors.fill: parent
+                                            anchors.leftMargin: 8
+                                            anchors.rightMargin: 8
+                                            spacing: 8
+
+                                            Rectangle {
+                                                width: 32
+                                                height: 32
+                                                radius: 4
+                                                color: (backend && backend.theme === "dark") ? "#2a2a2a" : "#d8d8d8"
+                                                clip: true
+                                                Image {
+                                                    anchors.fill: parent
+                                                    source: modelData.image_url || ""
+                                                    fillMode: Image.PreserveAspectCrop
+                                                    asynchronous: true
+                                                }
+                                            }
+
+                                            ColumnLayout {
+                                                Layout.fillWidth: true
+                                                spacing: 1
+                                                Text {
+                                                    text: modelData.title || ""
+                                                    color: (backend && backend.theme === "dark") ? "white" : "black"
+                                                    font.family: "D-DIN"
+                                                    font.pixelSize: 11
+                                                    font.bold: true
+                                                    elide: Text.ElideRight
+                                                    Layout.fillWidth: true
+                                                }
+                                                Text {
+                                                    text: modelData.subtitle || ""
+                                                    color: (backend && backend.theme === "dark") ? "#9a9a9a" : "#666666"
+                                                    font.family: "D-DIN"
+                                                    font.pixelSize: 9
+                                                    elide: Text.ElideRight
+                                                    Layout.fillWidth: true
+                                                }
+                                            }
+
+                                            Button {
+                                                width: 28
+                                                height: 28
+                                                focusPolicy: Qt.StrongFocus
+                                                onClicked: playQueueItem()
+
+                                                background: Rectangle {
+                                                    radius: 14
+                                                    color: "#1DB954"
+                                                    border.width: parent.activeFocus ? 1 : 0
+                                                    border.color: "white"
+                                                }
+
+                                                contentItem: Text {
+                                                    horizontalAlignment: Text.AlignHCenter
+                                                    verticalAlignment: Text.AlignVCenter
+                                                    text: "\uf04b"
+                                                    font.family: "Font Awesome 5 Free"
+                                                    font.pixelSize: 10
+                                                    color: "white"
+                                                }
+                                            }
+                                        }
+                                    }
+                                }
+                            }
+
+                            Item { Layout.fillHeight: true }
+
+                            // Device picker trigger
+                            ColumnLayout {
+                                visible: spotifyFullScreenTray.spotifyAuthenticated
+                                Layout.fillWidth: true
+                                spacing: 6
+
+                                Rectangle {
+                                    id: fullscreenDevicePickerButton
+                                    Layout.fillWidth: true
+                                    Layout.preferredHeight: 32
+                                    radius: 8
+                                    color: (backend && backend.theme === "dark") ? "#101010" : "#f4f4f4"
+                                    border.width: 1
+                                    border.color: (backend && backend.theme === "dark") ? "#2a2a2a" : "#d7d7d7"
+
+                                    RowLayout {
+                                        anchors.fill: parent
+                                        anchors.leftMargin: 10
+                                        anchors.rightMargin: 10
+                                        spacing: 8
+
+                                        Text {
+                                            text: {
+                                                var selectedId = (backend && backend.spotifyPlayer) ? (backend.spotifyPlayer.selected_device_id || "") : ""
+                                                var currentName = (backend && backend.spotifyPlayer) ? (backend.spotifyPlayer.current_device_name || "Current Device") : "Current Device"
+                                                if (!selectedId) return currentName
+                                                var items = (backend && backend.spotifyPlayer && backend.spotifyPlayer.devices) ? backend.spotifyPlayer.devices : []
+                                                for (var i = 0; i < items.length; i++) {
+                                                    if ((items[i].id || "") === selectedId) return items[i].name || currentName
+                                                }
+                                                return currentName
+                                            }
+                                            color: (backend && backend.theme === "dark") ? "#9edfb6" : "#2f7d4c"
+                                            font.family: "D-DIN"
+                                            font.pixelSize: 12
+                                            font.bold: true
+                                            elide: Text.ElideRight
+                                            Layout.fillWidth: true
+                                        }
+
+                                        Text {
+                                            text: "\uf078"
+                                            font.family: "Font Awesome 5 Free"
+                                            font.pixelSize: 11
+                                            color: (backend && backend.theme === "dark") ? "#b5b5b5" : "#666666"
+                                        }
+                                    }
+
+                                    TapHandler {
+                                        gesturePolicy: TapHandler.ReleaseWithinBounds
+                                        onTapped: spotifyFullScreenTray.openDevicePicker(fullscreenDevicePickerButton, "fullscreen")
+                                    }
+                                }
+                            }
+
+                            // Playback controls: shuffle | prev | play/pause | next | repeat
+                            RowLayout {
+                                Layout.alignment: Qt.AlignHCenter
+                                spacing: 22
+
+                                Text {
+                                    text: "\uf074"
+                                    font.family: "Font Awesome 5 Free"
+                                    font.pixelSize: 16
+                                    color: (backend && backend.spotifyPlayer && backend.spotifyPlayer.shuffle_state) ? "#1DB954"
+                                           : (backend && backend.theme === "dark") ? "#666666" : "#aaaaaa"
+                                    MouseArea {
+                                        anchors.fill: parent
+                                        cursorShape: Qt.PointingHandCursor
+                                        onClicked: backend.spotifySetShuffle(!(backend.spotifyPlayer && backend.spotifyPlayer.shuffle_state))
+                                    }
+                                }
+
+                                Text {
+                                    text: "\uf048"
+                                    font.family: "Font Awesome 5 Free"
+                                    font.pixelSize: 22
+                                    color: (backend && backend.theme === "dark") ? "white" : "black"
+                                    MouseArea { anchors.fill: parent; cursorShape: Qt.PointingHandCursor; onClicked: backend.spotifyPreviousTrack() }
+                                }
+
+                                Rectangle {
+                                    width: 48; height: 48
+                                    radius: 24
+                                    color: "#1DB954"
+                                    Text {
+                                        anchors.centerIn: parent
+                                        text: (backend && backend.spotifyPlayer && backend.spotifyPlayer.is_playing) ? "\uf04c" : "\uf04b"
+                                        font.family: "Font Awesome 5 Free"
+                                        font.pixelSize: 20
+                                        color: "white"
+                                    }
+                                    MouseArea { anchors.fill: parent; cursorShape: Qt.PointingHandCursor; onClicked: backend.spotifyTogglePlayPause() }
+                                }
+
+                                Text {
+                                    text: "\uf051"
+                                    font.family: "Font Awesome 5 Free"
+                                    font.pixelSize: 22
+                                    color: (backend && backend.theme === "dark") ? "white" : "black"
+                                    MouseArea { anchors.fill: parent; cursorShape: Qt.PointingHandCursor; onClicked: backend.spotifyNextTrack() }
+                                }
+
+                                Text {
+                                    text: "\uf01e"
+                                    font.family: "Font Awesome 5 Free"
+                                    font.pixelSize: 16
+                                    color: (backend && backend.spotifyPlayer && backend.spotifyPlayer.repeat_state !== "off") ? "#1DB954"
+                                           : (backend && backend.theme === "dark") ? "#666666" : "#aaaaaa"
+                                    MouseArea {
+                                        anchors.fill: parent
+                                        cursorShape: Qt.PointingHandCursor
+                                        onClicked: {
+                                            var cur = (backend && backend.spotifyPlayer) ? (backend.spotifyPlayer.repeat_state || "off") : "off"
+                                            backend.spotifySetRepeat(cur === "off" ? "context" : cur === "context" ? "track" : "off")
+                                        }
+                                    }
+                                }
+                            }
+
+                            // Progress bar + timestamps
+                            ColumnLayout {
+                                Layout.fillWidth: true
+                                spacing: 2
+
+                                Slider {
+                                    id: spotifyProgressSlider
+                                    Layout.fillWidth: true
+                                    from: 0
+                                    to: Math.max(1, (backend && backend.spotifyPlayer) ? (backend.spotifyPlayer.duration_ms || 1) : 1)
+
+                                    Binding {
+                                        target: spotifyProgressSlider
+                                        property: "value"
+                                        value: (backend && backend.spotifyPlayer) ? (backend.spotifyPlayer.progress_ms || 0) : 0
+                                        when: !spotifyProgressSlider.pressed
+                                    }
+
+                                    onPressedChanged: {
+                                        if (!pressed) backend.spotifySeek(Math.round(value))
+                                    }
+
+                                    background: Rectangle {
+                                        x: spotifyProgressSlider.leftPadding
+                                        y: spotifyProgressSlider.topPadding + spotifyProgressSlider.availableHeight / 2 - height / 2
+                                        width: spotifyProgressSlider.availableWidth
+                                        height: 4
+                                        radius: 2
+                                        color: (backend && backend.theme === "dark") ? "#333333" : "#cccccc"
+                                        Rectangle {
+                                            width: spotifyProgressSlider.visualPosition * parent.width
+                                            height: parent.height
+                                            radius: 2
+                                            color: "#1DB954"
+                                        }
+                                    }
+
+                                    handle: Rectangle {
+                                        x: spotifyProgressSlider.leftPadding + spotifyProgressSlider.visualPosition * (spotifyProgressSlider.availableWidth - width)
+                                        y: spotifyProgressSlider.topPadding + spotifyProgressSlider.availableHeight / 2 - height / 2
+                                        width: 12; height: 12
+                                        radius: 6
+                                        color: spotifyProgressSlider.pressed ? "#1DB954" : "white"
+                                        border.color: "#1DB954"
+                                        border.width: 1
+                                    }
+                                }
+
+                                RowLayout {
+                                    Layout.fillWidth: true
+                                    Text {
+                                        text: {
+                                            var ms = spotifyProgressSlider.value
+                                            var s = Math.floor(ms / 1000)
+                                            var m = Math.floor(s / 60)
+                                            return m + ":" + (s % 60 < 10 ? "0" : "") + (s % 60)
+                                        }
+                                        color: (backend && backend.theme === "dark") ? "#888888" : "#999999"
+                                        font.family: "D-DIN"
+                                        font.pixelSize: 10
+                                    }
+                                    Item { Layout.fillWidth: true }
+                                    Text {
+                                        text: {
+                                            var ms = (backend && backend.spotifyPlayer) ? (backend.spotifyPlayer.duration_ms || 0) : 0
+                                            var s = Math.floor(ms / 1000)
+                                            var m = Math.floor(s / 60)
+                                            return m + ":" + (s % 60 < 10 ? "0" : "") + (s % 60)
+                                        }
+                                        color: (backend && backend.theme === "dark") ? "#888888" : "#999999"
+                                        font.family: "D-DIN"
+                                        font.pixelSize: 10
+                                    }
+                                }
+                            }
+                        }
+
+                    }
+
+                    // Login screen
+                    ColumnLayout {
+                        anchors.fill: parent
+                        anchors.margins: 12
+                        spacing: 10
+                        visible: !spotifyFullScreenTray.spotifyAuthenticated
+
+                        Rectangle {
+                            Layout.fillWidth: true
+                            Layout.fillHeight: true
+                            radius: 8
+                            color: (backend && backend.theme === "dark") ? "#0f0f0f" : "white"
+                            clip: true
+
+                            ColumnLayout {
+                                anchors.fill: parent
+                                anchors.margins: 10
+                                spacing: 8
+
+                                Item { Layout.fillHeight: true }
+
+                                Rectangle {
+                                    Layout.alignment: Qt.AlignHCenter
+                                    Layout.preferredWidth: Math.min(parent.width - 20, parent.height - 20, 180)
+                                    Layout.preferredHeight: Layout.preferredWidth
+                                    radius: 8
+                                    color: "white"
+                                    clip: true
+                                    Image {
+                                        anchors.fill: parent
+                                        anchors.margins: 8
+                                        source: backend ? backend.spotifyAuthQrUrl : ""
+                                        fillMode: Image.PreserveAspectFit
+                                        asynchronous: true
+                                    }
+                                }
+
+                                Item { Layout.fillHeight: true }
+                            }
+                        }
+                    }
+                }
+
+                // Divider
+                Rectangle {
+                    width: 1
+                    Layout.fillHeight: true
+                    color: (backend && backend.theme === "dark") ? "#2a2a2a" : "#d0d0d0"
+                }
+
+                // Right: Library (always visible)
+                Rectangle {
+                    Layout.fillWidth: true
+                    Layout.fillHeight: true
+                    color: "transparent"
+                    clip: true
+
+                    Item {
+                        anchors.fill: parent
+                        anchors.margins: 10
+
+                        RowLayout {
+                            id: spotifyLibraryNavRow
+                            anchors.top: parent.top
+                            anchors.left: parent.left
+                            anchors.right: parent.right
+                            visible: spotifyFullScreenTray.spotifyAuthenticated
+                            spacing: 6
+
+                            Repeater {
+                                model: [
+                                    {"label": "Search", "category": -1},
+                                    {"label": "Playlists", "category": 0},
+                                    {"label": "Albums", "category": 1},
+                                    {"label": "Podcasts", "category": 3}
+                                ]
+                                Rectangle {
+                                    Layout.preferredHeight: 26
+                                    Layout.preferredWidth: Math.max(74, spotifyLibraryTabLabel.implicitWidth + 20)
+                                    radius: 13
+                                    color: spotifyFullScreenTray.libraryCategory === modelData.category
+                                           ? ((backend && backend.theme === "dark") ? "#2f2f2f" : "#dcdcdc")
+                                           : ((backend && backend.theme === "dark") ? "#1a1a1a" : "#ebebeb")
+
+                                    Text {
+                                        id: spotifyLibraryTabLabel
+                                        anchors.centerIn: parent
+                                        text: modelData.label
+                                        color: (backend && backend.theme === "dark") ? "white" : "black"
+                                        font.family: "D-DIN"
+                                        font.pixelSize: 11
+                                        font.bold: spotifyFullScreenTray.libraryCategory === modelData.category
+                                    }
+
+                                    MouseArea {
+                                        anchors.fill: parent
+                                        cursorShape: Qt.PointingHandCursor
+                                        onClicked: {
+                                            spotifyFullScreenTray.librarySelectedItem = null
+                                            spotifyFullScreenTray.libraryCategory = modelData.category
+                                            if (modelData.category === -1) spotifyFullScreenTray.refreshSearch()
+                                        }
+                                    }
+                                }
+                            }
+
+                            Item { Layout.fillWidth: true }
+                        }
+
+                        ColumnLayout {
+                            anchors.top: spotifyLibraryNavRow.visible ? spotifyLibraryNavRow.bottom : parent.top
+                            anchors.topMargin: spotifyLibraryNavRow.visible ? 8 : 0
+                            anchors.left: parent.left
+                            anchors.right: parent.right
+                            anchors.bottom: parent.bottom
+                            spacing: 8
+
+                            // Search panel is now part of the right pane navigation.
+                            ColumnLayout {
+                                Layout.fillWidth: true
+                                Layout.fillHeight: true
+                                spacing: 8
+                                visible: spotifyFullScreenTray.libraryCategory === -1 && !spotifyFullScreenTray.librarySelectedItem
+
+                                TextField {
+                                    id: spotifySearchField
+                                    Layout.fillWidth: true
+                                    placeholderText: "Search songs, albums, artists, playlists"
+                                    color: (backend && backend.theme === "dark") ? "white" : "black"
+                                    placeholderTextColor: (backend && backend.theme === "dark") ? "#7c7c7c" : "#9a9a9a"
+                                    background: Rectangle {
+                                        radius: 8
+                                        color: (backend && backend.theme === "dark") ? "#1e1e1e" : "#f0f0f0"
+                                    }
+                                    onTextChanged: spotifySearchDebounce.restart()
+                                }
+
+                                Timer {
+                                    id: spotifySearchDebounce
+                                    interval: spotifyFullScreenTray.searchDebounceMs
+                                    repeat: false
+                                    onTriggered: spotifyFullScreenTray.refreshSearch()
+                                }
+
+                                ListView {
+                                    id: spotifyResultsList
+                                    Layout.fillWidth: true
+                                    Layout.fillHeight: true
+                                    clip: true
+                                    spacing: 4
+                                    model: backend ? backend.spotifySearchResults : []
+                                    delegate: Rectangle {
+                                        width: ListView.view.width
+                                        height: 48
+                                        radius: 8
+                                        color: (backend && backend.theme === "dark") ? "#1b1b1b" : "#f6f6f6"
+
+                                        RowLayout {
+                                            anchors.fill: parent
+                                            anchors.leftMargin: 8
+                                            anchors.rightMargin: 8
+                                            spacing: 8
+
+                                            Rectangle {
+                                                Layout.preferredWidth: 34
+                                                Layout.preferredHeight: 34
+                                                radius: 4
+                                                color: (backend && backend.theme === "dark") ? "#252525" : "#e5e5e5"
+                                                clip: true
+                                                Image {
+                                                    anchors.fill: parent
+                                                    source: modelData.image_url || ""
+                                                    fillMode: Image.PreserveAspectCrop
+                                                    asynchronous: true
+                                                }
+                                            }
+
+                                            ColumnLayout {
+                                                Layout.fillWidth: true
+                                                spacing: 0
+                                                Text {
+                                                    text: modelData.title || ""
+                                                    color: (backend && backend.theme === "dark") ? "white" : "black"
+                                                    font.family: "D-DIN"
+                                                    font.pixelSize: 12
+                                                    font.bold: true
+                                                    elide: Text.ElideRight
+                                                    Layout.fillWidth: true
+                                                }
+                                                Text {
+                                                    text: ((modelData.type || "").toUpperCase()) + " • " + (modelData.subtitle || "")
+                                                    color: (backend && backend.theme === "dark") ? "#b8b8b8" : "#666666"
+                                                    font.family: "D-DIN"
+                                                    font.pixelSize: 10
+                                                    elide: Text.ElideRight
+                                                    Layout.fillWidth: true
+                                                }
+                                            }
+                                        }
+
+                                        TapHandler {
+                                            gesturePolicy: TapHandler.ReleaseWithinBounds
+                                            onTapped: spotifyFullScreenTray._playItem(modelData)
+                                        }
+                                    }
+                                }
+                            }
+                        }
+
+                        // Category items grid (drill-down)
+                        ColumnLayout {
+                            anchors.fill: parent
+                            spacing: 6
+                            visible: spotifyFullScreenTray.libraryCategory !== -1 && !spotifyFullScreenTray.librarySelectedItem
+
+                            RowLayout {
+                                Layout.fillWidth: true
+                                spacing: 8
+
+                                Item { Layout.fillWidth: true }
+
+                                Text {
+                                    text: "\uf021"
+                                    font.family: "Font Awesome 5 Free"
+                                    font.pixelSize: 13
+                                    color: (backend && backend.theme === "dark") ? "#aaaaaa" : "#777777"
+                                    MouseArea {
+                                        anchors.fill: parent
+                                        cursorShape: Qt.PointingHandCursor
+                                        onClicked: spotifyFullScreenTray.refreshLibrary()
+                                    }
+                                }
+                            }
+
+                            GridView {
+                                id: spotifyLibraryItemGrid
+                                Layout.fillWidth: true
+                                Layout.fillHeight: true
+                                clip: true
+                                property int cols: Math.max(2, Math.floor(width / 130))
+                                cellWidth: Math.floor(width / cols)
+                                cellHeight: cellWidth + 44
+                                model: spotifyFullScreenTray.libraryCategory === 0 ? ((backend && backend.spotifyLibrary) ? (backend.spotifyLibrary.playlists || []) : [])
+                                       : spotifyFullScreenTray.libraryCategory === 1 ? ((backend && backend.spotifyLibrary) ? (backend.spotifyLibrary.albums || []) : [])
+                                       : ((backend && backend.spotifyLibrary) ? (backend.spotifyLibrary.podcasts || []) : [])
+
+                                delegate: Item {
+                                    width: spotifyLibraryItemGrid.cellWidth
+                                    height: spotifyLibraryItemGrid.cellHeight
+
+                                    Rectangle {
+                                        anchors.fill: parent
+                                        anchors.margins: 4
+                                        radius: 10
+                                        color: (backend && backend.theme === "dark") ? "#1a1a1a" : "#f0f0f0"
+                                        clip: true
+
+                                        ColumnLayout {
+                                            anchors.fill: parent
+                                            spacing: 0
+
+                                            Rectangle {
+                                                Layout.fillWidth: true
+                                                Layout.preferredHeight: spotifyLibraryItemGrid.cellWidth - 8
+                                                color: (backend && backend.theme === "dark") ? "#252525" : "#e0e0e0"
+                                                clip: true
+                                                radius: 10
+                                                Image {
+                                                    anchors.fill: parent
+                                                    source: modelData.image_url || ""
+                                                    fillMode: Image.PreserveAspectCrop
+                                                    asynchronous: true
+                                                }
+                                            }
+
+                                            Text {
+                                                text: modelData.title || ""
+                                                color: (backend && backend.theme === "dark") ? "white" : "black"
+                                                font.family: "D-DIN"
+                                                font.pixelSize: 11
+                                                font.bold: true
+                                                elide: Text.ElideRight
+                                                Layout.fillWidth: true
+                                                Layout.leftMargin: 6
+                                                Layout.rightMargin: 6
+                                                Layout.topMargin: 4
+                                            }
+
+                                            Text {
+                                                text: modelData.subtitle || ""
+                                                color: (backend && backend.theme === "dark") ? "#aaaaaa" : "#777777"
+                                                font.family: "D-DIN"
+                                                font.pixelSize: 9
+                                                elide: Text.ElideRight
+                                                Layout.fillWidth: true
+                                                Layout.leftMargin: 6
+                                                Layout.rightMargin: 6
+                                                Layout.bottomMargin: 4
+                                            }
+                                        }
+
+                                        TapHandler {
+                                            gesturePolicy: TapHandler.ReleaseWithinBounds
+                                            onTapped: spotifyFullScreenTray.openLibraryItem(modelData)
+                                        }
+                                    }
+                                }
+                            }
+                        }
+
+                        // Track list (album/playlist drill-down)
+                        ColumnLayout {
+                            anchors.fill: parent
+                            spacing: 0
+                            visible: !!spotifyFullScreenTray.librarySelectedItem
+
+                            RowLayout {
+                                Layout.fillWidth: true
+                                Layout.bottomMargin: 6
+                                spacing: 10
+
+                                Text {
+                                    text: "\uf060"
+                                    font.family: "Font Awesome 5 Free"
+                                    font.pixelSize: 14
+                                    color: (backend && backend.theme === "dark") ? "white" : "black"
+                                    MouseArea {
+                                        anchors.fill: parent
+                                        cursorShape: Qt.PointingHandCursor
+                                        onClicked: spotifyFullScreenTray.librarySelectedItem = null
+                                    }
+                                }
+
+                                Rectangle {
+                                    width: 44; height: 44
+                                    radius: 6
+                                    color: (backend && backend.theme === "dark") ? "#252525" : "#e0e0e0"
+                                    clip: true
+                                    Image {
+                                        anchors.fill: parent
+                                        source: spotifyFullScreenTray.librarySelectedItem ? (spotifyFullScreenTray.librarySelectedItem.image_url || "") : ""
+                                        fillMode: Image.PreserveAspectCrop
+                                        asynchronous: true
+                                    }
+                                }
+
+                                ColumnLayout {
+                                    Layout.fillWidth: true
+                                    spacing: 2
+                                    Text {
+                                        text: spotifyFullScreenTray.librarySelectedItem ? (spotifyFullScreenTray.librarySelectedItem.title || "") : ""
+                                        color: (backend && backend.theme === "dark") ? "white" : "black"
+                                        font.family: "D-DIN"
+                                        font.pixelSize: 13
+                                        font.bold: true
+                                        elide: Text.ElideRight
+                                        Layout.fillWidth: true
+                                    }
+                                    Text {
+                                        text: spotifyFullScreenTray.librarySelectedItem ? (spotifyFullScreenTray.librarySelectedItem.subtitle || "") : ""
+                                        color: (backend && backend.theme === "dark") ? "#aaaaaa" : "#777777"
+                                        font.family: "D-DIN"
+                                        font.pixelSize: 10
+                                        elide: Text.ElideRight
+                                        Layout.fillWidth: true
+                                    }
+                                }
+
+                                Text {
+                                    text: "\uf144"
+                                    font.family: "Font Awesome 5 Free"
+                                    font.pixelSize: 22
+                                    color: "#1DB954"
+                                    MouseArea {
+                                        anchors.fill: parent
+                                        cursorShape: Qt.PointingHandCursor
+                                        onClicked: spotifyFullScreenTray._playItem(spotifyFullScreenTray.librarySelectedItem)
+                                    }
+                                }
+                            }
+
+                            ListView {
+                                id: spotifyTrackListView
+                                Layout.fillWidth: true
+                                Layout.fillHeight: true
+                                clip: true
+                                spacing: 3
+                                model: backend ? backend.spotifyLibraryItemTracks : []
+
+                                delegate: Rectangle {
+                                    width: ListView.view.width
+                                    height: 46
+                                    radius: 8
+                                    color: (backend && backend.theme === "dark") ? "#181818" : "#f4f4f4"
+
+                                    RowLayout {
+                                        anchors.fill: parent
+                                        anchors.leftMargin: 10
+                                        anchors.rightMargin: 10
+                                        spacing: 10
+
+                                        Text {
+                                            text: (index + 1) + "."
+                                            color: (backend && backend.theme === "dark") ? "#666666" : "#aaaaaa"
+                                            font.family: "D-DIN"
+                                            font.pixelSize: 11
+                                            Layout.preferredWidth: 24
+                                        }
+
+                                        ColumnLayout {
+                                            Layout.fillWidth: true
+                                            spacing: 1
+                                            Text {
+                                                text: modelData.title || ""
+                                                color: (backend && backend.theme === "dark") ? "white" : "black"
+                                                font.family: "D-DIN"
+                                                font.pixelSize: 12
+                                                font.bold: true
+                                                elide: Text.ElideRight
+                                                Layout.fillWidth: true
+                                            }
+                                            Text {
+                                                text: modelData.subtitle || ""
+                                                color: (backend && backend.theme === "dark") ? "#888888" : "#777777"
+                                                font.family: "D-DIN"
+                                                font.pixelSize: 10
+                                                elide: Text.ElideRight
+                                                Layout.fillWidth: true
+                                            }
+                                        }
+                                    }
+
+                                    TapHandler {
+                                        gesturePolicy: TapHandler.ReleaseWithinBounds
+                                        onTapped: spotifyFullScreenTray._playItem(modelData)
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+}
@@ -0,0 +1,668 @@
+import QtQuick
+import QtQuick.Window
+import QtQuick.Controls
+import QtQuick.Layouts
+
+Item {
+    id: wifiSettings
+
+    property alias wifiPopup: wifiPopup
+
+    Popup {
+        id: wifiPopup
+        width: 450
+        height: 240
+        x: (parent.width - width) / 2
+        y: (parent.height - height) / 2
+        modal: true
+        focus: true
+        closePolicy: Popup.CloseOnEscape | Popup.CloseOnPressOutside
+
+        property string selectedNetwork: ""
+
+        onOpened: backend.startWifiTimer()
+        onClosed: backend.stopWifiTimer()
+
+        background: Rectangle {
+            color: backend.theme === "dark" ? "#cc181818" : "#ccf5f5f5"
+            topLeftRadius: 0
+            topRightRadius: 8
+            bottomLeftRadius: 0
+            bottomRightRadius: 0
+            // Inner shadow approximation
+            Rectangle {
+                anchors.fill: parent
+                color: "transparent"
+                radius: parent.radius
+                border.color: Qt.rgba(0, 0, 0, 0.1)
+                border.width: 1
+            }
+        }
+
+        ColumnLayout {
+            anchors.fill: parent
+            anchors.margins: 12
+            spacing: 8
+
+            Text {
+                text: "WiFi Networks"
+                font.pixelSize: 16
+                font.bold: true
+                color: backend.theme === "dark" ? "white" : "black"
+                Layout.alignment: Qt.AlignHCenter
+            }
+
+            // Current connection status - compact
+            Rectangle {
+                Layout.fillWidth: true
+                Layout.preferredHeight: 30
+                color: backend.theme === "dark" ? "#111111" : "#e0e0e0"
+                radius: 4
+
+                RowLayout {
+                    anchors.fill: parent
+                    anchors.margins: 5
+                    spacing: 5
+
+                    Text {
+                        text: backend.wifiConnected ? "\uf1eb" : "\uf6ab"
+                        font.family: "Font Awesome 5 Free"
+                        font.pixelSize: 12
+                        color: backend.wifiConnected ? "#4CAF50" : "#F44336"
+                    }
+
+                    Text {
+                        text: backend.wifiConnected ? ("Connected: " + backend.currentWifiSsid) : "Not connected"
+                        color: backend.theme === "dark" ? "white" : "black"
+                        font.pixelSize: 11
+                        Layout.fillWidth: true
+                        elide: Text.ElideRight
+                    }
+
+                    Button {
+                        text: "Disconnect"
+                        visible: !!(backend && backend.wifiConnected)
+                        Layout.preferredWidth: 60
+                        Layout.preferredHeight: 20
+                        onClicked: {
+                            backend.disconnectWifi()
+                            wifiPopup.close()
+                        }
+                        background: Rectangle {
+                            color: "#F44336"
+                            radius: 3
+                        }
+                        contentItem: Text {
+                            text: parent.text
+                            color: "white"
+                            font.pixelSize: 9
+                            horizontalAlignment: Text.AlignHCenter
+                            verticalAlignment: Text.AlignVCenter
+                        }
+                    }
+                }
+            }
+
+            // Scan button - compact
+            Button {
+                text: backend.wifiScanInProgress ? "Scanning..." : (backend.wifiConnecting ? "Connecting..." : "Scan Networks")
+                Layout.fillWidth: true
+                Layout.preferredHeight: 25
+                enabled: !(backend.wifiScanInProgress || backend.wifiConnecting)
+                onClicked: backend.scanWifiNetworks()
+
+                background: Rectangle {
+                    color: backend.theme === "dark" ? "#303030" : "#d0d0d0"
+                    radius: 3
+                }
+
+                contentItem: Text {
+                    text: parent.text
+                    color: backend.theme === "dark" ? "white" : "black"
+                    font.pixelSize: 11
+                    horizontalAlignment: Text.AlignHCenter
+                    verticalAlignment: Text.AlignVCenter
+                }
+            }
+
+            // Scanning spinner indicator
+            BusyIndicator {
+                running: !!(backend && backend.wifiScanInProgress)
+                visible: running
+                Layout.alignment: Qt.AlignHCenter
+                Layout.preferredHeight: 16
+                Layout.preferredWidth: 16
+            }
+
+            // Debug info button - compact
+            Button {
+                text: "Interface Info"
+                Layout.fillWidth: true
+                Layout.preferredHeight: 18
+                onClicked: debugDialog.open()
+
+                background: Rectangle {
+                    color: backend.theme === "dark" ? "#2a2a2a" : "#c0c0c0"
+                    radius: 3
+                }
+
+                contentItem: Text {
+                    text: parent.text
+                    color: backend.theme === "dark" ? "#cccccc" : "#666666"
+                    font.pixelSize: 8
+                    horizontalAlignment: Text.AlignHCenter
+                    verticalAlignment: Text.AlignVCenter
+                }
+            }
+
+            // Networks list - compact single line layout
+            ListView {
+                Layout.fillWidth: true
+                Layout.fillHeight: true
+                model: backend.wifiNetworks
+                clip: true
+                spacing: 2
+                interactive: true
+                boundsBehavior: Flickable.StopAtBounds
+                flickableDirection: Flickable.VerticalFlick
+
+                delegate: Rectangle {
+                    width: ListView.view.width
+                    height: 28
+                    color: backend.theme === "dark" ? "#111111" : "#e0e0e0"
+                    radius: 3
+
+                    RowLayout {
+                        anchors.fill: parent
+                        anchors.margins: 5
+                        spacing: 8
+
+                        // Network icon
+                        Text {
+                            text: modelData.encrypted ? "\uf023" : "\uf09c"
+                            font.family: "Font Awesome 5 Free"
+                            font.pixelSize: 12
+                            color: modelData.encrypted ? "#FF9800" : "#4CAF50"
+                            Layout.preferredWidth: 16
+                        }
+
+                        // Network info in one line
+                        Text {
+                            text: modelData.ssid + " (" + modelData.signal + " dBm)"
+                            color: backend.theme === "dark" ? "white" : "black"
+                            font.pixelSize: 12
+                            font.bold: true
+                            Layout.fillWidth: true
+                            elide: Text.ElideRight
+                        }
+
+                        // Remove button for remembered networks
+                        Button {
+                            text: "\uf2ed"
+                            font.family: "Font Awesome 5 Free"
+                            Layout.preferredWidth: 22
+                            Layout.preferredHeight: 22
+                            visible: {
+                                for (var i = 0; i < backend.rememberedNetworks.length; i++) {
+                                    if (backend.rememberedNetworks[i].ssid === modelData.ssid) {
+                                        return true
+                                    }
+                                }
+                                return false
+                            }
+                            onClicked: {
+                                backend.remove_remembered_network(modelData.ssid)
+                            }
+
+                            background: Rectangle {
+                                color: "#F44336"
+                                radius: 3
+                            }
+
+                            contentItem: Text {
+                                text: parent.text
+                                color: "white"
+                                font.pixelSize: 10
+                                horizontalAlignment: Text.AlignHCenter
+                                verticalAlignment: Text.AlignVCenter
+                            }
+
+                            ToolTip {
+                                text: "Remove from remembered networks"
+                                delay: 500
+                            }
+                        }
+
+                        // Connect button - compact
+                        Button {
+                            text: "Connect"
+                            Layout.preferredWidth: 55
+                            Layout.preferredHeight: 22
+                            onClicked: {
+                                wifiPopup.selectedNetwork = modelData.ssid
+                                // Check if this network is remembered
+                                var isRemembered = false
+                                for (var i = 0; i < backend.rememberedNetworks.length; i++) {
+                                    if (backend.rememberedNetworks[i].ssid === modelData.ssid) {
+                                        isRemembered = true
+                                        break
+                                    }
+                                }
+                                if (isRemembered) {
+                                    backend.connectToRememberedNetwork(modelData.ssid)
+                                } else {
+                                    passwordDialog.open()
+                                }
+                            }
+
+                            background: Rectangle {
+                                color: backend.theme === "dark" ? "#303030" : "#d0d0d0"
+                                radius: 3
+                            }
+
+                            contentItem: Text {
+                                text: parent.text
+                                color: backend.theme === "dark" ? "white" : "black"
+                                font.pixelSize: 9
+                                horizontalAlignment: Text.AlignHCenter
+                                verticalAlignment: Text.AlignVCenter
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+
+    // Password dialog
+    Popup {
+        id: passwordDialog
+        width: 320
+        height: 120
+        x: (parent.width - width) / 2
+        y: (parent.height - height - 200) / 2  // Leave room for keyboard
+        modal: true
+        focus: true
+        // Keep the password dialog open while interacting with the custom on-screen keyboard
+        // so that tapping outside (on the keyboard) does not close it.
+        closePolicy: Popup.CloseOnEscape
+
+        onOpened: {
+            passwordField.focus = true
+            passwordField.text = ""
+        }
+
+        background: Rectangle {
+            color: backend.theme === "dark" ? "#cc181818" : "#ccf5f5f5"
+            radius: 8
+            border.color: backend.theme === "dark" ? "#2a2a2a" : "#e0e0e0"
+            border.width: 1
+        }
+
+        ColumnLayout {
+            anchors.fill: parent
+            anchors.margins: 10
+            spacing: 8
+
+            Text {
+                text: "Password for " + wifiPopup.selectedNetwork
+                color: backend.theme === "dark" ? "white" : "black"
+                font.pixelSize: 13
+                font.bold: true
+                elide: Text.ElideRight
+                Layout.fillWidth: true
+            }
+
+            RowLayout {
+                spacing: 5
+
+                TextField {
+                    id: passwordField
+                    placeholderText: "Enter password"
+                    echoMode: TextField.Password
+                    Layout.fillWidth: true
+                    Layout.preferredHeight: 28
+
+                    background: Rectangle {
+                        color: (backend && backend.theme === "dark") ? "#111111" : "#ffffff"
+                        border.color: (backend && backend.theme === "dark") ? "#2a2a2a" : "#cccccc"
+                        border.width: 1
+                        radius: 3
+                    }
+
+                    color: (backend && backend.theme === "dark") ? "white" : "black"
+                }
+
+                Button {
+                    text: "👁"
+                    Layout.preferredWidth: 30
+                    Layout.preferredHeight: 28
+                    onClicked: {
+                        passwordField.echoMode = passwordField.echoMode === TextField.Password ? TextField.Normal : TextField.Password
+                        passwordField.focus = true
+                    }
+
+                    background: Rectangle {
+                        color: (backend && backend.theme === "dark") ? "#2a2a2a" : "#e0e0e0"
+                        radius: 3
+                    }
+
+                    contentItem: Text {
+                        text: parent.text
+                        color: (backend && backend.theme === "dark") ? "white" : "black"
+                        font.pixelSize: 12
+                        horizontalAlignment: Text.AlignHCenter
+                        verticalAlignment: Text.AlignVCenter
+                    }
+                }
+            }
+
+            RowLayout {
+                spacing: 8
+
+                Button {
+                    text: "Cancel"
+                    Layout.fillWidth: true
+                    Layout.preferredHeight: 24
+                    onClicked: {
+                        passwordField.text = ""
+                        passwordDialog.close()
+                    }
+
+                    background: Rectangle {
+                        color: (backend && backend.theme === "dark") ? "#303030" : "#d0d0d0"
+                        radius: 3
+                    }
+
+                    contentItem: Text {
+                        text: parent.text
+                        color: (backend && backend.theme === "dark") ? "white" : "black"
+                        font.pixelSize: 10
+                        horizontalAlignment: Text.AlignHCenter
+                        verticalAlignment: Text.AlignVCenter
+                    }
+                }
+
+                Button {
+                    text: "Connect"
+                    Layout.fillWidth: true
+                    Layout.preferredHeight: 24
+                    onClicked: {
+                        backend.connectToWifi(wifiPopup.selectedNetwork, passwordField.text)
+                        passwordDialog.close()
+                    }
+
+                    background: Rectangle {
+                        color: "#4CAF50"
+                        radius: 3
+                    }
+
+                    contentItem: Text {
+                        text: parent.text
+                        color: "white"
+                        font.pixelSize: 10
+                        horizontalAlignment: Text.AlignHCenter
+                        verticalAlignment: Text.AlignVCenter
+                    }
+                }
+            }
+        }
+    }
+
+    // Virtual Keyboard for password entry
+    Popup {
+        id: virtualKeyboard
+        width: 480
+        height: 180
+        x: passwordDialog.x + passwordDialog.width / 2 - width / 2
+        y: passwordDialog.y + passwordDialog.height + 5
+        modal: false
+        focus: false
+        visible: passwordDialog.visible
+        // Prevent the keyboard from auto-closing when tapping outside or interacting with other controls
+        closePolicy: Popup.NoAutoClose
+        // Ensure the keyboard stays above other content
+        z: 2000
+        property bool shiftPressed: false
+        property bool numberMode: false
+
+        onOpened: {
+            // Reset keyboard state when opened
+            shiftPressed = false
+            numberMode = false
+        }
+
+        background: Rectangle {
+            color: backend.theme === "dark" ? "#181818" : "#f0f0f0"
+            radius: 8
+            border.color: backend.theme === "dark" ? "#2a2a2a" : "#e0e0e0"
+            border.width: 1
+        }
+
+        ColumnLayout {
+            anchors.fill: parent
+            anchors.margins: 10
+            spacing: 5
+
+            // QWERTY keyboard rows
+            RowLayout {
+                spacing: 3
+                Layout.alignment: Qt.AlignHCenter
+                Layout.maximumWidth: 460
+
+                Repeater {
+                    model: virtualKeyboard.numberMode ? ["1", "2", "3", "4", "5", "6", "7", "8", "9", "0"] : (virtualKeyboard.shiftPressed ? ["Q", "W", "E", "R", "T", "Y", "U", "I", "O", "P"] : ["q", "w", "e", "r", "t", "y", "u", "i", "o", "p"])
+                    Button {
+                        text: modelData
+                        Layout.preferredWidth: 33
+                        Layout.preferredHeight: 30
+                        // Avoid stealing focus from the password field
+                        focusPolicy: Qt.NoFocus
+                        onClicked: passwordField.text += text
+
+                        background: Rectangle {
+                            color: parent.pressed ? "#FF6B35" : (backend.theme === "dark" ? "#303030" : "#d0d0d0")
+                            radius: 3
+                            Behavior on color { ColorAnimation { duration: 100 } }
+                        }
+
+                        contentItem: Text {
+                            text: parent.text
+                            color: backend.theme === "dark" ? "white" : "black"
+                            font.pixelSize: 12
+                            horizontalAlignment: Text.AlignHCenter
+                            verticalAlignment: Text.AlignVCenter
+                        }
+                    }
+                }
+            }
+
+            RowLayout {
+                spacing: 3
+                Layout.alignment: Qt.AlignHCenter
+                Layout.maximumWidth: 460
+
+                Repeater {
+                    model: virtualKeyboard.numberMode ? ["!", "@", "#", "$", "%", "^", "&", "*", "(", ")"] : (virtualKeyboard.shiftPressed ? ["A", "S", "D", "F", "G", "H", "J", "K", "L"] : ["a", "s", "d", "f", "g", "h", "j", "k", "l"])
+                    Button {
+                        text: modelData
+                        Layout.preferredWidth: 33
+                        Layout.preferredHeight: 30
+                        // Avoid stealing focus from the password field
+                        focusPolicy: Qt.NoFocus
+                        onClicked: passwordField.text += text
+
+                        background: Rectangle {
+                            color: parent.pressed ? "#FF6B35" : (backend.theme === "dark" ? "#303030" : "#d0d0d0")
+                            radius: 3
+                            Behavior on color { ColorAnimation { duration: 100 } }
+                        }
+
+                        contentItem: Text {
+                            text: parent.text
+                            color: backend.theme === "dark" ? "white" : "black"
+                            font.pixelSize: 12
+                            horizontalAlignment: Text.AlignHCenter
+                            verticalAlignment: Text.AlignVCenter
+                        }
+                    }
+                }
+            }
+
+            RowLayout {
+                spacing: 3
+                Layout.alignment: Qt.AlignHCenter
+                Layout.maximumWidth: 460
+
+                Button {
+                    text: "⇧"
+                    Layout.preferredWidth: 46
+                    Layout.preferredHeight: 30
+                    enabled: !virtualKeyboard.numberMode
+                    // Avoid stealing focus from the password field
+                    focusPolicy: Qt.NoFocus
+                    onClicked: {
+                        virtualKeyboard.shiftPressed = !virtualKeyboard.shiftPressed
+                    }
+
+                    background: Rectangle {
+                        color: parent.pressed ? "#FF6B35" : (virtualKeyboard.numberMode ? (backend.theme === "dark" ? "#181818" : "#e0e0e0") : (virtualKeyboard.shiftPressed ? "#FF9800" : (backend.theme === "dark" ? "#2a2a2a" : "#c0c0c0")))
+                        radius: 3
+                        Behavior on color { ColorAnimation { duration: 100 } }
+                    }
+
+                    contentItem: Text {
+                        text: parent.text
+                        color: backend.theme === "dark" ? "white" : "black"
+                        font.pixelSize: 10
+                        horizontalAlignment: Text.AlignHCenter
+                        verticalAlignment: Text.AlignVCenter
+                    }
+                }
+
+                Repeater {
+                    model: virtualKeyboard.numberMode ? ["-", "_", "+", "=", "{", "}", "[", "]", "|"] : (virtualKeyboard.shiftPressed ? ["Z", "X", "C", "V", "B", "N", "M"] : ["z", "x", "c", "v", "b", "n", "m"])
+                    Button {
+                        text: modelData
+                        Layout.preferredWidth: 33
+                        Layout.preferredHeight: 30
+                        // Avoid stealing focus from the password field
+                        focusPolicy: Qt.NoFocus
+                        onClicked: passwordField.text += text
+
+                        background: Rectangle {
+                            color: parent.pressed ? "#FF6B35" : (backend.theme === "dark" ? "#303030" : "#d0d0d0")
+                            radius: 3
+                            Behavior on color { ColorAnimation { duration: 100 } }
+                        }
+
+                        contentItem: Text {
+                            text: parent.text
+                            color: backend.theme === "dark" ? "white" : "black"
+                            font.pixelSize: 12
+                            horizontalAlignment: Text.AlignHCenter
+                            verticalAlignment: Text.AlignVCenter
+                        }
+                    }
+                }
+
+                Button {
+                    text: "⌫"
+                    Layout.preferredWidth: 46
+                    Layout.preferredHeight: 30
+                    // Avoid stealing focus from the password field
+                    focusPolicy: Qt.NoFocus
+                    onClicked: passwordField.text = passwordField.text.slice(0, -1)
+
+                    background: Rectangle {
+                        color: parent.pressed ? "#D84315" : "#FF5722"
+                        radius: 3
+                        Behavior on color { ColorAnimation { duration: 100 } }
+                    }
+
+                    contentItem: Text {
+                        text: parent.text
+                        color: "white"
+                        font.pixelSize: 10
+                        horizontalAlignment: Text.AlignHCenter
+                        verticalAlignment: Text.AlignVCenter
+                    }
+                }
+            }
+
+            RowLayout {
+                spacing: 3
+                Layout.alignment: Qt.AlignHCenter
+                Layout.maximumWidth: 460
+
+                Button {
+                    text: virtualKeyboard.numberMode ? "ABC" : "123"
+                    Layout.preferredWidth: 53
+                    Layout.preferredHeight: 30
+                    // Avoid stealing focus from the password field
+                    focusPolicy: Qt.NoFocus
+                    onClicked: {
+                        virtualKeyboard.numberMode = !virtualKeyboard.numberMode
+                        virtualKeyboard.shiftPressed = false  // Reset shift when switching modes
+                    }
+
+                    background: Rectangle {
+                        color: parent.pressed ? "#FF6B35" : (backend.theme === "dark" ? "#2a2a2a" : "#c0c0c0")
+                        radius: 3
+                        Behavior on color { ColorAnimation { duration: 100 } }
+                    }
+
+                    contentItem: Text {
+                        text: parent.text
+                        color: backend.theme === "dark" ? "white" : "black"
+                        font.pixelSize: 10
+                        horizontalAlignment: Text.AlignHCenter
+                        verticalAlignment: Text.AlignVCenter
+                    }
+                }
+
+                Button {
+                    text: "Space"
+                    Layout.preferredWidth: 267
+                    Layout.preferredHeight: 30
+                    // Avoid stealing focus from the password field
+                    focusPolicy: Qt.NoFocus
+                    onClicked: passwordField.text += " "
+
+                    background: Rectangle {
+                        color: backend.theme === "dark" ? "#303030" : "#d0d0d0"
+                        radius: 3
+                    }
+
+                    contentItem: Text {
+                        text: parent.text
+                        color: backend.theme === "dark" ? "white" : "black"
+                        font.pixelSize: 10
+                        horizontalAlignment: Text.AlignHCenter
+                        verticalAlignment: Text.AlignVCenter
+                    }
+                }
+
+                Button {
+                    text: "Done"
+                    Layout.preferredWidth: 67
+                    Layout.preferredHeight: 30
+                    onClicked: virtualKeyboard.visible = false
+
+                    background: Rectangle {
+                        color: "#4CAF50"
+                        radius: 3
+                    }
+
+                    contentItem: Text {
+                        text: parent.text
+                        color: "white"
+                        font.pixelSize: 10
+                        horizontalAlignment: Text.AlignHCenter
+                        verticalAlignment: Text.AlignVCenter
+                    }
+                }
+            }
+        }
+    }
+}
@@ -1,9 +1,12 @@
 import sys
 import os
 sys.path.append(os.path.join(os.getcwd(), 'src'))
-from ui_qml import qml_code
+from ui_qml import MAIN_QML
 import re
 
+with open(MAIN_QML, 'r', encoding='utf-8') as f:
+    qml_code = f.read()
+
 def check_balance():
     balance = 0
     lines = qml_code.split('\n')
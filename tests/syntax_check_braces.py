@@ -1,9 +1,12 @@
 import sys
 import os
 sys.path.append(os.path.join(os.getcwd(), 'src'))
-from ui_qml import qml_code
+from ui_qml import MAIN_QML
 import re
 
+with open(MAIN_QML, 'r', encoding='utf-8') as f:
+    qml_code = f.read()
+
 # Remove /* ... */ comments
 code_no_comments = re.sub(r'/\*.*?\*/', '', qml_code, flags=re.DOTALL)
 # Remove // ... comments
@@ -0,0 +1,58 @@
+import os
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), "..", "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+import functions as funcs
+
+
+def test_art_names_are_validated():
+    cache = funcs.AlbumArtCache(cache_dir="unused")
+    key = cache.register("https://i.scdn.co/image/abc")
+    assert cache.resolve(f"{key}_{funcs.ART_SIZE_GRID}.jpg") == (key, funcs.ART_SIZE_GRID)
+    # Unknown sizes and path tricks are rejected
+    assert cache.resolve(f"{key}_123.jpg") is None
+    assert cache.resolve(f"../{key}_{funcs.ART_SIZE_GRID}.jpg") is None
+
+
+def test_cached_file_is_served_without_a_source(tmp_path):
+    cache = funcs.AlbumArtCache(cache_dir=str(tmp_path))
+    path = tmp_path / f"{'a' * 20}_{funcs.ART_SIZE_LIST}.jpg"
+    path.write_bytes(b"jpeg")
+    assert cache.ensure("a" * 20, funcs.ART_SIZE_LIST) == str(path)
+    # Unknown key and nothing on disk
+    assert cache.ensure("b" * 20, funcs.ART_SIZE_LIST) is None
+
+
+def test_eviction_drops_least_recently_used(tmp_path):
+    cache = funcs.AlbumArtCache(cache_dir=str(tmp_path), max_bytes=250)
+    for index, name in enumerate(("old", "mid", "new")):
+        path = tmp_path / f"{name}.jpg"
+        path.write_bytes(b"x" * 100)
+        os.utime(path, (1000 + index, 1000 + index))
+    cache.evict()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["mid.jpg", "new.jpg"]
+
+
+def test_album_art_url_falls_back_to_remote_before_server_ready(monkeypatch):
+    monkeypatch.setattr(funcs, "HTTP_SERVER_READY", funcs.threading.Event())
+    assert funcs.album_art_url("https://i.scdn.co/image/abc", funcs.ART_SIZE_LIST) == "https://i.scdn.co/image/abc"
+    funcs.HTTP_SERVER_READY.set()
+    url = funcs.album_art_url("https://i.scdn.co/image/abc", funcs.ART_SIZE_LIST)
+    assert url.endswith(f"/art/{funcs.AlbumArtCache.key_for('https://i.scdn.co/image/abc')}_{funcs.ART_SIZE_LIST}.jpg")
+
+
+def test_sources_are_bounded_with_the_files(tmp_path):
+    cache = funcs.AlbumArtCache(cache_dir=str(tmp_path), max_bytes=250, max_sources=3)
+    keys = [cache.register(f"https://i.scdn.co/image/{index}") for index in range(5)]
+    # Past max_sources the least recently registered keys go
+    assert list(cache._sources) == keys[2:]
+    for index, key in enumerate(keys[2:]):
+        path = tmp_path / f"{key}_{funcs.ART_SIZE_LIST}.jpg"
+        path.write_bytes(b"x" * 100)
+        os.utime(path, (1000 + index, 1000 + index))
+    cache.evict()
+    # The evicted image takes its source entry with it
+    assert list(cache._sources) == keys[3:]
@@ -0,0 +1,119 @@
+import os
+import sys
+from datetime import datetime
+
+import pytest
+import pytz
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), "..", "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+import functions as funcs
+
+
+LAUNCH_DATA = {
+    "previous": [{"id": "p1", "mission": "Starlink 1", "net": "2024-01-01T00:00:00Z", "status": "Success"}],
+    "upcoming": [{"id": "u1", "mission": "Crew-9", "net": "2099-01-01T00:00:00Z", "status": "Go",
+                  "_parsed_dt": datetime(2099, 1, 1, tzinfo=pytz.UTC)}],
+}
+
+
+def _write_snapshot(tmp_path, monkeypatch, tz=pytz.UTC):
+    monkeypatch.setattr(funcs, "RUNTIME_CACHE_FILE_LAUNCHES", str(tmp_path / "missing_launches.json"))
+    path = str(tmp_path / "boot_snapshot.json")
+    snapshot = funcs.build_boot_snapshot(
+        LAUNCH_DATA, tz, "Starbase",
+        event_rows=[{"group": "Later"}, LAUNCH_DATA["upcoming"][0]],
+        calendar_mapping={"2099-01-01": ["Crew-9"]},
+        trends={"key": "k", "data_sig": "s", "data": {"months": [], "series": [], "max_value": 0}},
+        next_launch=LAUNCH_DATA["upcoming"][0],
+        upcoming_launches=LAUNCH_DATA["upcoming"],
+        trajectory={"trajectory": [{"lat": 1.0, "lon": 2.0}]},
+        weather={"temperature_f": 75},
+    )
+    assert funcs.save_boot_snapshot(snapshot, path=path)
+    return path
+
+
+def test_boot_snapshot_round_trip_strips_private_keys(tmp_path, monkeypatch):
+    path = _write_snapshot(tmp_path, monkeypatch)
+    snapshot = funcs.load_boot_snapshot(pytz.UTC, "Starbase", path=path)
+    assert snapshot is not None
+    assert snapshot["event_rows"][1]["mission"] == "Crew-9"
+    assert "_parsed_dt" not in snapshot["launch_data"]["upcoming"][0]
+    assert snapshot["trajectory"]["trajectory"][0]["lon"] == 2.0
+
+
+def test_boot_snapshot_rejects_other_timezone_and_location(tmp_path, monkeypatch):
+    path = _write_snapshot(tmp_path, monkeypatch)
+    assert funcs.load_boot_snapshot(pytz.timezone("America/Chicago"), "Starbase", path=path) is None
+    assert funcs.load_boot_snapshot(pytz.UTC, "Vandy", path=path) is None
+
+
+def test_boot_snapshot_rejects_tampered_launch_data(tmp_path, monkeypatch):
+    path = _write_snapshot(tmp_path, monkeypatch)
+    with open(path) as f:
+        text = f.read()
+    with open(path, "w") as f:
+        f.write(text.replace("Crew-9", "Crew-10").replace('"status":"Go"', '"status":"Hold"'))
+    assert funcs.load_boot_snapshot(pytz.UTC, "Starbase", path=path) is None
+
+
+def test_boot_snapshot_stale_after_newer_launch_cache(tmp_path, monkeypatch):
+    path = _write_snapshot(tmp_path, monkeypatch)
+    launches = tmp_path / "launches_cache.json"
+    launches.write_text("{}")
+    future = datetime.now().timestamp() + 60
+    os.utime(launches, (future, future))
+    monkeypatch.setattr(funcs, "RUNTIME_CACHE_FILE_LAUNCHES", str(launches))
+    assert funcs.load_boot_snapshot(pytz.UTC, "Starbase", path=path) is None
+
+
+def test_missing_boot_snapshot_returns_none(tmp_path):
+    assert funcs.load_boot_snapshot(pytz.UTC, "Starbase", path=str(tmp_path / "nope.json")) is None
+
+
+class _SignalStub:
+    def emit(self, *args):
+        pass
+
+
+class _BackendStub:
+    """Just enough of Backend for the location setter and timeline memo."""
+
+    def __init__(self, app):
+        self._app = app
+        self._location = "Starbase"
+        self._tz = pytz.timezone("America/Chicago")
+        self._launch_data = {"previous": [], "upcoming": [dict(LAUNCH_DATA["upcoming"][0])]}
+        self._launches_by_date_cache = None
+        self._timeline_cache = None
+        self._radar_base_url = ""
+        for name in ("radarBaseUrlChanged", "locationChanged", "weatherChanged", "launchesChanged"):
+            setattr(self, name, _SignalStub())
+
+    def _get_timeline(self):
+        return self._app.Backend._get_timeline(self)
+
+    def _refresh_weather_view(self):
+        pass
+
+    def update_countdown(self):
+        pass
+
+    def update_event_model(self):
+        pass
+
+
+def test_location_change_recomputes_timeline_in_new_timezone():
+    pytest.importorskip("PyQt6")
+    import app
+
+    backend = _BackendStub(app)
+    before = backend._get_timeline()["next_launch"]
+    assert backend._timeline_cache is not None
+    app.Backend.location.fset(backend, "Vandy")
+    assert backend._timeline_cache is None
+    after = backend._get_timeline()["next_launch"]
+    assert after["local_time"] != before["local_time"]
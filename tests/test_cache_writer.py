@@ -0,0 +1,56 @@
+"""Atomic cache writes and write-behind coalescing in save_cache_to_file."""
+
+import json
+import os
+import sys
+from datetime import datetime, timezone
+
+import pytest
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), "..", "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+import functions as funcs
+
+
+@pytest.fixture
+def writer(monkeypatch):
+    # Long delay so nothing reaches the disk until the test flushes
+    writer = funcs.CacheWriter(delay=60)
+    monkeypatch.setattr(funcs, "cache_writer", writer)
+    return writer
+
+
+def _counter(name):
+    return funcs.metrics._counters.get(name, 0)
+
+
+def test_saves_of_one_file_coalesce_into_one_disk_write(tmp_path, writer):
+    path = str(tmp_path / "weather_cache.json")
+    requested, written = _counter("cache.write_requests"), _counter("cache.disk_writes")
+    for temp in range(10):
+        funcs.save_cache_to_file(path, {"temp": temp}, datetime.now(timezone.utc))
+    assert not os.path.exists(path)
+    # Readers see the queued save before it is on disk
+    assert funcs.load_cache_from_file(path)["data"] == {"temp": 9}
+
+    writer.flush()
+    with open(path) as f:
+        assert json.load(f)["data"] == {"temp": 9}
+    assert writer.pending(path) is None
+    assert _counter("cache.write_requests") - requested == 10
+    assert _counter("cache.disk_writes") - written == 1
+
+
+def test_failed_write_leaves_previous_file_intact(tmp_path, monkeypatch):
+    path = tmp_path / "launches_cache.json"
+    funcs.atomic_write_bytes(str(path), b'{"data": "old"}')
+
+    def _power_cut(fd):
+        raise OSError("I/O error")
+    monkeypatch.setattr(funcs.os, "fsync", _power_cut)
+    with pytest.raises(OSError):
+        funcs.atomic_write_bytes(str(path), b'{"data": "new"}')
+    assert path.read_text() == '{"data": "old"}'
+    assert os.listdir(tmp_path) == ["launches_cache.json"]
@@ -0,0 +1,141 @@
+import http.server
+import os
+import socket
+import sys
+import threading
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), "..", "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+import functions as funcs
+
+
+class _SlowHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        time.sleep(0.5)
+        self.send_response(204)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+def _serve(handler):
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _closed_port():
+    # Bind and release so nothing is listening there
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _blackhole():
+    # Accepts connections but never answers
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    sock.listen(8)
+    return sock
+
+
+def test_first_success_wins_over_hanging_target():
+    server = _serve(_SlowHandler)
+    hole = _blackhole()
+    try:
+        bus = funcs.ConnectivityBus(targets=[
+            f"http://127.0.0.1:{hole.getsockname()[1]}/",
+            f"http://127.0.0.1:{_closed_port()}/",
+            f"http://127.0.0.1:{server.server_address[1]}/",
+        ], timeout=2.0)
+        started = time.monotonic()
+        assert bus.check() is True
+        # The working target answers in ~0.5 s; the black hole would take the full timeout
+        assert time.monotonic() - started < 1.5
+        assert bus.state()["via"].endswith(f":{server.server_address[1]}/")
+    finally:
+        server.shutdown()
+        hole.close()
+
+
+def test_offline_is_reported_within_the_deadline():
+    hole = _blackhole()
+    try:
+        bus = funcs.ConnectivityBus(targets=[
+            f"http://127.0.0.1:{hole.getsockname()[1]}/",
+            f"http://127.0.0.1:{_closed_port()}/",
+        ], timeout=1.0)
+        published = []
+        bus.subscribe(published.append)
+        started = time.monotonic()
+        assert bus.check() is False
+        assert time.monotonic() - started < 1.5
+        assert [state["online"] for state in published] == [False]
+    finally:
+        hole.close()
+
+
+def test_results_are_cached_and_replayed_to_new_subscribers():
+    bus = funcs.ConnectivityBus(targets=[f"http://127.0.0.1:{_closed_port()}/"], timeout=0.5)
+    assert bus.check() is False
+    bus.targets = ("dns:this-target-must-not-be-probed.invalid",)
+    assert bus.check() is False  # served from cache, no new probe
+    seen = []
+    unsubscribe = bus.subscribe(seen.append)
+    assert seen and seen[0]["online"] is False
+    unsubscribe()
+    bus.publish(True)
+    assert len(seen) == 1
+
+
+def test_concurrent_callers_share_one_probe():
+    calls = []
+
+    class _CountingHandler(_SlowHandler):
+        def do_GET(self):
+            calls.append(1)
+            super().do_GET()
+
+    server = _serve(_CountingHandler)
+    try:
+        bus = funcs.ConnectivityBus(targets=[f"http://127.0.0.1:{server.server_address[1]}/"], timeout=2.0)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(bus.check())) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert results == [True] * 4
+        assert len(calls) == 1
+    finally:
+        server.shutdown()
+
+
+def test_hung_probe_does_not_starve_later_races(monkeypatch):
+    release = threading.Event()
+    probes = []
+
+    def _probe(target, timeout):
+        probes.append(target)
+        if target == "dns:hung":
+            release.wait(10)  # an uncancellable getaddrinfo that outlives the race
+            raise OSError("resolver timed out")
+        return True
+
+    monkeypatch.setattr(funcs, "_probe_target", _probe)
+    bus = funcs.ConnectivityBus(targets=["dns:hung", "dns:ok"], timeout=0.5)
+    try:
+        for _ in range(3):
+            started = time.monotonic()
+            assert bus.check(max_age=0) is True
+            assert time.monotonic() - started < 0.4
+        # The hung target is still in flight, so it is not probed again
+        assert probes.count("dns:hung") == 1
+        assert probes.count("dns:ok") == 3
+    finally:
+        release.set()
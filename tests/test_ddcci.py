@@ -0,0 +1,172 @@
+"""DDC/CI client against a fake display speaking the protocol on a fake i2c-dev node."""
+
+import errno
+import os
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), "..", "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+import functions as funcs
+
+REPLY_DELAY = 0.004
+INTERVAL = 0.01
+
+
+class FakeDisplay:
+    """Answers Get/Set VCP packets the way a monitor on 0x37 would."""
+
+    def __init__(self, values, unsupported=()):
+        self.values = dict(values)
+        self.unsupported = set(unsupported)
+        self.commands = []  # (monotonic time, opcode, code)
+        self.sets = []
+        self.closed = False
+        self._reply = b""
+        self.gate = None
+        self.nacks = 0  # upcoming writes to fail with EIO, like a busy monitor
+
+    def write(self, data):
+        if self.nacks:
+            self.nacks -= 1
+            raise OSError(errno.EIO, "Input/output error")
+        data = bytes(data)
+        assert data[0] == funcs.DDC_HOST_ADDRESS
+        length = data[1] & 0x7F
+        assert funcs._ddc_checksum(funcs.DDC_I2C_ADDRESS << 1, data[:2 + length]) == data[2 + length]
+        opcode, code = data[2], data[3]
+        self.commands.append((time.monotonic(), opcode, code))
+        if opcode == funcs.DDC_GET_VCP:
+            current, maximum = self.values.get(code, (0, 0))
+            result = 1 if code in self.unsupported else 0
+            body = bytes([0x6E, 0x88, funcs.DDC_GET_VCP_REPLY, result, code, 0,
+                          maximum >> 8, maximum & 0xFF, current >> 8, current & 0xFF])
+            self._reply = body + bytes([funcs._ddc_checksum(funcs.DDC_REPLY_CHECKSUM_SEED, body)])
+        elif opcode == funcs.DDC_SET_VCP:
+            if self.gate is not None:
+                self.gate.wait(5)
+            value = (data[4] << 8) | data[5]
+            self.sets.append((code, value))
+            self.values[code] = (value, self.values.get(code, (0, 100))[1])
+
+    def read(self, count):
+        reply, self._reply = self._reply, b""
+        return reply[:count]
+
+    def close(self):
+        self.closed = True
+
+
+def _client(display):
+    return funcs.DDCCIClient(device=display, reply_delay=REPLY_DELAY, command_interval=INTERVAL)
+
+
+def test_packet_layout_and_checksum():
+    # Get VCP 0x10, as documented in the MCCS spec
+    assert funcs.ddc_packet((0x01, 0x10)) == bytes([0x51, 0x82, 0x01, 0x10, 0xAC])
+    reply = bytes([0x6E, 0x88, 0x02, 0x00, 0x10, 0x00, 0x00, 0x64, 0x00, 0x1F])
+    reply += bytes([funcs._ddc_checksum(0x50, reply)])
+    assert funcs.parse_vcp_reply(reply, 0x10) == (31, 100)
+    with pytest.raises(funcs.DDCError):
+        funcs.parse_vcp_reply(reply[:-1] + bytes([reply[-1] ^ 1]), 0x10)
+
+
+def test_batched_read_is_one_paced_session():
+    display = FakeDisplay({0x10: (20, 100), 0x12: (15, 100), 0x60: (0x11, 0)}, unsupported={0x87})
+    client = _client(display)
+    results = client.read_all((0x10, 0x12, 0x87, 0x60))
+    assert results == {0x10: (20, 100), 0x12: (15, 100), 0x60: (0x11, 0)}
+    # The rejected code is retried, then skipped
+    assert [c for _, _, c in display.commands].count(0x87) == funcs.DDC_RETRIES
+    times = [t for t, _, _ in display.commands]
+    assert all(b - a >= INTERVAL * 0.9 for a, b in zip(times, times[1:]))
+
+
+def test_display_control_coalesces_writes():
+    display = FakeDisplay({})
+    control = funcs.DisplayControl(client=_client(display), fallback=_client(FakeDisplay({})))
+    try:
+        # Hold the first write on the bus so the slider drag piles up behind it
+        display.gate = threading.Event()
+        done = []
+        control.set(0x12, 1, done.append)
+        while not display.commands:
+            time.sleep(0.001)
+        for value in range(2, 30):
+            control.set(0x12, value, done.append)
+        control.set(0x16, 7)
+        display.gate.set()
+        assert control.flush(5)
+        assert display.sets == [(0x12, 1), (0x12, 29), (0x16, 7)]
+        assert done == [True, True]
+        assert control.writes == 3
+    finally:
+        control.stop()
+    assert display.closed
+
+
+def test_display_control_falls_back_to_ddcutil():
+    calls = []
+
+    def _run(cmd, **kwargs):
+        calls.append(cmd)
+        stdout = "VCP 10 C 12 100\n" if cmd[1] == "getvcp" else ""
+        return type("Result", (), {"returncode": 0, "stdout": stdout, "stderr": ""})()
+
+    native = funcs.DDCCIClient(bus=999, reply_delay=0, command_interval=0)
+    fallback = funcs.DDCUtilClient(bus=13, run=_run)
+    control = funcs.DisplayControl(client=native, fallback=fallback)
+    try:
+        readings = []
+        control.read_all((funcs.DDC_VCP_BRIGHTNESS,), readings.append)
+        control.set(funcs.DDC_VCP_INPUT_SOURCE, 0x11)
+        assert control.flush(5)
+        assert control.backend == "ddcutil"
+        assert readings == [{0x10: (12, 100)}]
+        assert calls[-1] == [funcs.DDCUTIL_PATH, "setvcp", "60", "17", "--noverify", "--mccs", "2.2", "--bus=13"]
+    finally:
+        control.stop()
+    assert funcs.parse_ddcutil_brief("VCP D6 SNC x01") == (1, None)
+
+
+def test_transient_bus_errors_are_retried_without_fallback():
+    display = FakeDisplay({0x10: (20, 100)})
+    fallback_calls = []
+    fallback = funcs.DDCUtilClient(run=lambda cmd, **kw: fallback_calls.append(cmd))
+    control = funcs.DisplayControl(client=_client(display), fallback=fallback)
+    try:
+        display.nacks = 2
+        readings, done = [], []
+        control.read_all((0x10,), readings.append)
+        assert control.flush(5)
+        display.nacks = 1
+        control.set(0x12, 9, done.append)
+        assert control.flush(5)
+        # Retries exhausted: the one write fails but the session stays native
+        display.nacks = funcs.DDC_RETRIES
+        control.set(0x12, 10, done.append)
+        assert control.flush(5)
+        assert readings == [{0x10: (20, 100)}]
+        assert done == [True, False]
+        assert display.sets == [(0x12, 9)]
+        assert control.backend == "i2c-dev"
+        assert fallback_calls == []
+    finally:
+        control.stop()
+
+
+def test_display_settings_round_trip(tmp_path, monkeypatch):
+    monkeypatch.setattr(funcs, "DISPLAY_SETTINGS_FILE", str(tmp_path / "display_settings.json"))
+    assert funcs.load_display_settings() == {}
+    funcs.save_display_settings({"brightness": 64, "sharpness": 30, "input_source": "11", "unknown": 1})
+    assert funcs.load_display_settings() == {"brightness": 64, "sharpness": 30, "input_source": "11"}
+    # Out-of-range or malformed entries are dropped rather than applied to the UI
+    funcs.save_cache_to_file(funcs.DISPLAY_SETTINGS_FILE,
+                             {"contrast": 250, "color_preset": "HDMI", "power_mode": "01"}, datetime.now(timezone.utc))
+    assert funcs.load_display_settings() == {"power_mode": "01"}
@@ -0,0 +1,103 @@
+"""Tests for the prebuilt texture path in src/globe.html.
+
+tools/tile_globe_texture.py writes power-of-two mip chains (and optionally
+KTX2 files) plus assets/images/textures/manifest.json.  loadEarthTexture must
+prefer those builds and still fall back to the JPEG tiles / single JPEG when
+the manifest is missing, which is the case on a fresh checkout.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+GLOBE_HTML_PATH = Path(__file__).parent.parent / 'src' / 'globe.html'
+TOOLS_DIR = Path(__file__).parent.parent / 'tools'
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+
+def _tool():
+    pytest.importorskip('PIL')
+    import tile_globe_texture
+    return tile_globe_texture
+
+
+def _read_globe():
+    return GLOBE_HTML_PATH.read_text(encoding='utf-8')
+
+
+def _function_source(html, name):
+    start = html.find(f'function {name}(')
+    assert start != -1, f"{name} not found in globe.html"
+    depth = 0
+    for i, ch in enumerate(html[start:], start=start):
+        if ch == '{':
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+            if depth == 0:
+                return html[start:i + 1]
+    return html[start:]
+
+
+def test_manifest_path_matches_tool_output():
+    html = _read_globe()
+    assert "'../assets/images/textures/'" in html
+    assert "'manifest.json'" in html
+
+
+def test_load_earth_texture_fallback_order():
+    """Built formats first, then tiles, then the single JPEG."""
+    body = _function_source(_read_globe(), 'loadEarthTexture')
+    built = body.find("loadBuiltTexture('earth'")
+    tiles = body.find('loadTiledEarthTexture(')
+    single = body.find('loadSingleEarthTexture(')
+    assert -1 < built < tiles < single, (
+        "loadEarthTexture must try the manifest build, then tiles, then the JPEG."
+    )
+
+
+def test_floor_power_of_two():
+    tool = _tool()
+    assert [tool.floor_power_of_two(v) for v in (0, 1, 2, 3, 1023, 1024, 21600)] == [
+        1, 1, 2, 2, 512, 1024, 16384]
+
+
+def test_mip_chain_reaches_one_by_one():
+    tool = _tool()
+    assert tool.mip_chain_sizes(8, 4) == [(8, 4), (4, 2), (2, 1), (1, 1)]
+    assert tool.mip_chain_sizes(4096, 2048)[-1] == (1, 1)
+    assert len(tool.mip_chain_sizes(4096, 2048)) == 13
+
+
+def test_base_level_keeps_equirectangular_aspect():
+    tool = _tool()
+    assert tool.base_level_size(21600, 10800, 4096) == (4096, 2048)
+    assert tool.base_level_size(5400, 2700, 4096) == (4096, 2048)
+    assert tool.base_level_size(1024, 512, 4096) == (1024, 512)
+    assert tool.base_level_size(512, 1024, 256) == (128, 256)
+
+
+def test_build_mip_chain_level0_for_non_square_input(tmp_path):
+    tool = _tool()
+    from PIL import Image
+    source = tmp_path / 'earth.jpg'
+    Image.new('RGB', (200, 100), (10, 20, 30)).save(source)
+    levels = tool.build_mip_chain(str(source), str(tmp_path / 'out'), 'earth', 'JPEG', 'jpg', max_size=64)
+    assert (levels[0]['width'], levels[0]['height']) == (64, 32)
+    assert (levels[-1]['width'], levels[-1]['height']) == (1, 1)
+    assert all((tmp_path / 'out' / level['file']).exists() for level in levels)
+
+
+def test_ktx2_path_is_optional():
+    """three.min.js (r128) has no KTX2Loader; the path must be feature-detected."""
+    body = _function_source(_read_globe(), 'loadKtx2Texture')
+    assert "typeof THREE.KTX2Loader !== 'function'" in body
+
+
+def test_timing_harness_exposed():
+    html = _read_globe()
+    assert 'window.runTextureLoadBenchmark' in html
+    assert 'renderer.initTexture(' in html
+    assert 'window.__textureLoadTimings' in html
@@ -0,0 +1,146 @@
+"""Tests for the instanced wide-line trajectory renderer in src/globe.html.
+
+updateTrajectory used to build CatmullRomCurve3 + TubeGeometry meshes (core and
+glow) for every path on every update.  Paths are now persistent instanced-quad
+lines whose buffers are rewritten in place.
+"""
+
+import json
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+GLOBE_HTML_PATH = Path(__file__).parent.parent / 'src' / 'globe.html'
+
+
+def _read_globe():
+    return GLOBE_HTML_PATH.read_text(encoding='utf-8')
+
+
+def _function_source(html, name):
+    start = html.find(f'function {name}(')
+    assert start != -1, f"{name} not found in globe.html"
+    depth = 0
+    for i, ch in enumerate(html[start:], start=start):
+        if ch == '{':
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+            if depth == 0:
+                return html[start:i + 1]
+    return html[start:]
+
+
+def test_update_trajectory_does_not_generate_tube_geometry():
+    body = _function_source(_read_globe(), 'updateTrajectory')
+    assert 'TubeGeometry' not in body
+    assert 'CatmullRomCurve3' not in body
+    assert '.clone().lerp(' not in body, "gradient must be computed in the shader"
+
+
+def test_wide_line_uses_instanced_quads():
+    body = _function_source(_read_globe(), 'createWideLine')
+    assert 'new THREE.InstancedBufferGeometry()' in body
+    assert 'InstancedInterleavedBuffer' in body
+    assert 'DynamicDrawUsage' in body
+
+
+def test_wide_line_update_is_a_buffer_upload():
+    """Reusing the buffers (only reallocating on growth) is the whole point."""
+    body = _function_source(_read_globe(), 'createWideLine')
+    assert 'if (count + 1 > capacity) allocate(count + 1);' in body
+    assert 'positionBuffer.needsUpdate = true' in body
+
+
+def test_glow_and_gradient_in_one_shader():
+    html = _read_globe()
+    start = html.find('const WIDE_LINE_FRAGMENT_SHADER')
+    assert start != -1
+    shader = html[start:html.find('`;', start)]
+    assert 'mix(colorStart, colorEnd, vT)' in shader
+    assert 'glowOpacity' in shader
+
+
+def test_resize_updates_line_resolution():
+    body = _function_source(_read_globe(), 'onWindowResize')
+    assert 'updateWideLineResolution()' in body
+
+
+def test_benchmark_exposed():
+    html = _read_globe()
+    assert 'window.runTrajectoryBenchmark' in html
+    assert 'window.__trajectoryStats' in html
+
+
+# Just enough of three.js to run createWideLine under node and watch its GPU buffers
+_THREE_STUB = """
+let disposeCalls = 0;
+class Attr { constructor(array) { this.array = array; } }
+const THREE = {
+    DynamicDrawUsage: 35048,
+    InstancedBufferGeometry: class {
+        constructor() { this.attributes = {}; }
+        setAttribute(name, attr) { this.attributes[name] = attr; return this; }
+        setIndex(index) { this.index = index; }
+        dispose() { disposeCalls++; }
+    },
+    Float32BufferAttribute: Attr,
+    InstancedInterleavedBuffer: class {
+        constructor(array, stride) { this.array = array; this.stride = stride; this.updateRange = {}; }
+        setUsage() { return this; }
+    },
+    InterleavedBufferAttribute: class {
+        constructor(data, itemSize, offset) { this.data = data; this.offset = offset; }
+    },
+    ShaderMaterial: class { constructor(params) { this.uniforms = params.uniforms; } },
+    Mesh: class { constructor(geometry, material) { this.geometry = geometry; this.material = material; } },
+    Vector2: class { copy() { return this; } },
+    Vector3: class { set(x, y, z) { this.x = x; this.y = y; this.z = z; return this; } },
+    Color: class {}
+};
+const renderer = { getPixelRatio: () => 1 };
+const WIDE_LINE_VERTEX_SHADER = '', WIDE_LINE_FRAGMENT_SHADER = '';
+function getDrawingBufferResolution(v) { return v; }
+"""
+
+_WIDE_LINE_SCRIPT = """
+const line = createWideLine({ colorStart: 0, width: 3, glowScale: 2, opacity: 1, glowOpacity: 0.3 });
+const geometry = line.mesh.geometry;
+const path = n => Array.from({ length: n }, (_, i) => ({ lat: 0, lon: i % 360 }));
+const result = {};
+result.small = line.setLatLonPoints(path(10), 1.0);
+result.disposeAfterFirst = disposeCalls;
+const firstBuffer = geometry.attributes.instanceStart.data;
+line.setLatLonPoints(path(40), 1.0);
+result.disposeAfterReuse = disposeCalls;
+result.reused = geometry.attributes.instanceStart.data === firstBuffer;
+result.large = line.setLatLonPoints(path(200), 1.0);
+result.disposeAfterGrow = disposeCalls;
+result.capacity = geometry.attributes.instanceStart.data.array.length / 3;
+result.vertexCount = line.vertexCount();
+const last = line.lastPoint(new THREE.Vector3());
+result.lastRadius = Math.hypot(last.x, last.y, last.z);
+result.cleared = line.setLatLonPoints([], 1.0);
+console.log(JSON.stringify(result));
+"""
+
+
+def test_wide_line_runs_and_frees_buffers_on_growth():
+    node = shutil.which('node')
+    if not node:
+        pytest.skip("node is not installed")
+    source = _THREE_STUB + _function_source(_read_globe(), 'createWideLine') + _WIDE_LINE_SCRIPT
+    out = subprocess.run([node, '-e', source], capture_output=True, text=True, timeout=30)
+    assert out.returncode == 0, out.stderr
+    result = json.loads(out.stdout)
+    assert result['small'] == 9 and result['large'] == 199
+    # Growth within capacity reuses the buffers; outgrowing them disposes the old ones once
+    assert result['disposeAfterFirst'] == 0
+    assert result['disposeAfterReuse'] == 0 and result['reused'] is True
+    assert result['disposeAfterGrow'] == 1
+    assert result['capacity'] == 256
+    assert result['vertexCount'] == 199 * 4
+    assert abs(result['lastRadius'] - 1.0) < 1e-6
+    assert result['cleared'] == 0
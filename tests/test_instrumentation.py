@@ -0,0 +1,107 @@
+import os
+import sys
+import time
+
+import pytest
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), "..", "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+import functions as funcs
+
+
+def test_histogram_percentiles_track_bucket_bounds():
+    histogram = funcs.LatencyHistogram()
+    for ms in [1.0] * 90 + [100.0] * 10:
+        histogram.record(ms)
+    stats = histogram.stats()
+    assert stats["count"] == 100
+    # Buckets are ~19% wide, so percentiles land within one bucket of the true value
+    assert 1.0 <= stats["p50_ms"] < 1.2
+    assert 100.0 <= stats["p95_ms"] <= 100.0 * 1.2
+    assert stats["max_ms"] == 100.0
+
+
+def test_spans_decorators_and_counters():
+    metrics = funcs.Instrumentation(enabled=True)
+
+    @metrics.timed("work")
+    def work(fail=False):
+        if fail:
+            raise ValueError("boom")
+        return 42
+
+    assert work() == 42
+    with pytest.raises(ValueError):
+        work(fail=True)
+    with metrics.span("block"):
+        time.sleep(0.002)
+    metrics.count("hits", 3)
+
+    snap = metrics.snapshot()
+    assert snap["spans"]["work"]["count"] == 2
+    assert snap["spans"]["block"]["max_ms"] >= 2.0
+    assert snap["counters"] == {"hits": 3, "work.errors": 1}
+    assert [e.name for e in metrics.events("span")] == ["work", "work", "block"]
+
+
+def test_disabled_instrumentation_records_nothing():
+    metrics = funcs.Instrumentation(enabled=False)
+
+    @metrics.timed()
+    def work():
+        return "ok"
+
+    assert work() == "ok"
+    with metrics.span("block"):
+        pass
+    metrics.count("hits")
+    assert metrics.snapshot()["spans"] == {}
+    assert metrics.snapshot()["counters"] == {}
+    assert metrics.events() == []
+
+
+def test_ring_buffer_is_bounded():
+    metrics = funcs.Instrumentation(ring_size=5)
+    for index in range(20):
+        with metrics.span(f"span {index}"):
+            pass
+    assert [e.name for e in metrics.events()] == [f"span {index}" for index in range(15, 20)]
+
+
+def test_boot_marks_survive_span_churn():
+    metrics = funcs.Instrumentation(ring_size=5, marks_limit=3)
+    metrics.event("boot start")
+    metrics.event("boot end")
+    for index in range(50):
+        with metrics.span("steady state"):
+            pass
+    metrics.event("late 1")
+    metrics.event("late 2")  # over the limit: dropped rather than evicting boot marks
+    assert [e.name for e in metrics.events("mark")] == ["boot start", "boot end", "late 1"]
+    assert len(metrics.events("span")) == 5
+
+
+def test_prometheus_export_is_cumulative():
+    metrics = funcs.Instrumentation()
+    for ms in (0.5, 5.0, 50.0):
+        metrics.observe('fetch "x"', ms)
+    text = metrics.prometheus_text()
+    buckets = [line for line in text.splitlines() if line.startswith("dashboard_span_duration_ms_bucket")]
+    values = [int(line.rsplit(" ", 1)[1]) for line in buckets]
+    assert values == sorted(values) and values[-1] == 3
+    assert 'span="fetch \\"x\\""' in buckets[0]
+    assert 'dashboard_span_duration_ms_count{span="fetch \\"x\\""} 3' in text
+
+
+def test_boot_summary_is_a_view_over_marks_and_spans():
+    profiler = funcs.BootProfiler()
+    assert profiler.metrics is funcs.metrics
+    profiler.mark("summary test mark")
+    with funcs.metrics.span("summary test span"):
+        pass
+    summary = profiler.get_summary()
+    assert "summary test mark" in summary
+    assert "summary test span (span)" in summary
+    assert profiler.events[-1][0] == "summary test mark"
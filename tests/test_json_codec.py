@@ -0,0 +1,60 @@
+"""Cache codec selection, datetime handling and cross-codec compatibility."""
+
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+import pytz
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), "..", "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+import functions as funcs
+
+
+def _codecs():
+    codecs = [funcs.StdlibJsonCodec()]
+    try:
+        codecs.append(funcs.OrjsonCodec())
+    except ImportError:
+        pass
+    return codecs
+
+
+@pytest.fixture
+def inline_writes(monkeypatch):
+    monkeypatch.setattr(funcs, "cache_writer", funcs.CacheWriter(delay=0))
+    yield
+    funcs.set_json_codec(None)
+
+
+@pytest.mark.parametrize("writer", _codecs(), ids=lambda c: c.name)
+@pytest.mark.parametrize("reader", _codecs(), ids=lambda c: c.name)
+def test_files_written_by_one_codec_load_with_the_other(tmp_path, inline_writes, writer, reader):
+    path = str(tmp_path / "weather_cache.json")
+    stamp = datetime(2026, 5, 1, 12, 30, tzinfo=pytz.UTC)
+    funcs.set_json_codec(writer)
+    funcs.save_cache_to_file(path, {"Starbase": {"temp": 81.5, "when": stamp}, 7: "int key"}, stamp)
+    funcs.set_json_codec(reader)
+    cache = funcs.load_cache_from_file(path)
+    assert cache["timestamp"] == stamp
+    assert cache["data"]["Starbase"]["temp"] == 81.5
+    assert funcs.decode_json_datetime(cache["data"]["Starbase"]["when"]) == stamp
+    assert cache["data"]["7"] == "int key"
+
+
+def test_parsed_dates_decode_lazily_including_legacy_epochs(tmp_path, inline_writes, monkeypatch):
+    path = str(tmp_path / "parsed_dates_cache.json")
+    monkeypatch.setattr(funcs, "RUNTIME_CACHE_FILE_PARSED_DATES", path)
+    monkeypatch.setattr(funcs, "_DATE_PARSE_CACHE", {})
+    monkeypatch.setattr(funcs, "_DATE_PARSE_CACHE_LOADED", False)
+    legacy = datetime(2025, 1, 2, 3, 4, tzinfo=pytz.UTC)
+    funcs.save_cache_to_file(path, {"legacy": legacy.timestamp(), "iso": "2025-01-02T03:04:00+00:00",
+                                    "bad": None}, datetime.now(pytz.UTC))
+    assert funcs._get_parsed_dt("legacy") == legacy
+    assert funcs._DATE_PARSE_CACHE["iso"] == "2025-01-02T03:04:00+00:00"  # untouched until used
+    assert funcs._get_parsed_dt("iso") == legacy
+    assert funcs._get_parsed_dt("bad") is None
+    assert funcs._get_parsed_dt("2025-01-02T04:04:00Z") == legacy + timedelta(hours=1)
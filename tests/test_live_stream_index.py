@@ -0,0 +1,56 @@
+"""Nearest X-stream lookup via LiveStreamIndex against the original linear scan."""
+
+import os
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), "..", "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+import functions as funcs
+
+BASE = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+
+def _launch(hours, url=None, video_url=None):
+    return {"net": (BASE + timedelta(hours=hours)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "x_video_url": url, "video_url": video_url}
+
+
+def _linear_scan(launch_data, now_ts):
+    closest, best = "", float("inf")
+    for launch in launch_data["previous"] + launch_data["upcoming"]:
+        url = funcs._x_stream_url(launch)
+        if url:
+            diff = abs(now_ts - funcs._get_parsed_dt(launch["net"]).timestamp())
+            if diff < best:
+                closest, best = url, diff
+    return closest
+
+
+def test_nearest_matches_linear_scan_and_reports_midpoint():
+    rng = random.Random(7)
+    launch_data = {
+        "previous": [_launch(-h, url=f"https://x.com/p{h}") for h in rng.sample(range(1, 500), 40)]
+                    + [_launch(-3, video_url="https://www.youtube.com/watch?v=1")],
+        "upcoming": [_launch(h, video_url=f"https://twitter.com/u{h}") for h in rng.sample(range(1, 500), 20)],
+    }
+    index = funcs.LiveStreamIndex(launch_data)
+    assert len(index) == 60
+    for _ in range(200):
+        now_ts = (BASE + timedelta(minutes=rng.uniform(-600 * 60, 600 * 60))).timestamp()
+        url, change_ts = index.nearest(now_ts)
+        assert url == _linear_scan(launch_data, now_ts)
+        if change_ts is not None:
+            # Stable until the midpoint, then the next candidate takes over
+            assert change_ts > now_ts
+            assert index.nearest(change_ts - 1)[0] == url
+            assert index.nearest(change_ts + 1)[0] != url
+
+
+def test_empty_and_past_last_candidate():
+    assert funcs.LiveStreamIndex({"previous": [], "upcoming": []}).nearest(0) == ("", None)
+    index = funcs.LiveStreamIndex({"previous": [_launch(-5, url="https://x.com/a")], "upcoming": []})
+    assert index.nearest(BASE.timestamp()) == ("https://x.com/a", None)
@@ -0,0 +1,69 @@
+import logging
+import os
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), "..", "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+import functions as funcs
+
+
+def _restore_root():
+    funcs._stop_log_writer()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.setLevel(logging.WARNING)
+
+
+def test_parse_log_levels():
+    levels = funcs.parse_log_levels("functions=warning, app=DEBUG,qt=40,bogus=LOUD,=INFO,noequals")
+    assert levels == {"functions": logging.WARNING, "__main__": logging.DEBUG, "qt": 40}
+
+
+def test_records_are_written_in_the_background_and_flushed_on_stop(tmp_path):
+    log_file = tmp_path / "app.log"
+    log_file.write_text("previous run\n")
+    try:
+        writer = funcs.install_async_logging(str(log_file), stream=False,
+                                             subsystem_levels={"bench.quiet": logging.ERROR})
+        logging.getLogger("bench.loud").info("hello %s", "world")
+        logging.getLogger("bench.quiet").warning("suppressed")
+        logging.getLogger("bench.quiet").error("kept")
+        writer.stop()
+        text = log_file.read_text()
+        assert "INFO - hello world" in text
+        assert "suppressed" not in text
+        assert "ERROR - kept" in text
+        # The previous run is kept as a backup rather than truncated
+        assert (tmp_path / "app.log.1").read_text() == "previous run\n"
+    finally:
+        logging.getLogger("bench.quiet").setLevel(logging.NOTSET)
+        _restore_root()
+
+
+def test_rotation_keeps_backup_count(tmp_path):
+    log_file = tmp_path / "app.log"
+    try:
+        writer = funcs.install_async_logging(str(log_file), max_bytes=2000, backup_count=2, stream=False)
+        for index in range(200):
+            logging.getLogger("bench").warning("line %03d %s", index, "x" * 40)
+        writer.stop()
+        names = sorted(p.name for p in tmp_path.iterdir())
+        assert names == ["app.log", "app.log.1", "app.log.2"]
+        assert all(p.stat().st_size <= 2000 for p in tmp_path.iterdir())
+    finally:
+        _restore_root()
+
+
+def test_flushes_are_batched(tmp_path):
+    try:
+        writer = funcs.install_async_logging(str(tmp_path / "app.log"), stream=False)
+        for index in range(500):
+            logging.getLogger("bench").info("record %d", index)
+        writer.stop()
+        assert writer.flushes < 20
+        assert len((tmp_path / "app.log").read_text().splitlines()) == 500
+    finally:
+        _restore_root()
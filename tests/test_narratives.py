@@ -0,0 +1,60 @@
+"""Narrative-to-launch matching in enrich_narratives."""
+
+import os
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), "..", "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+import functions as funcs
+
+
+def _launch(mission, net, **extra):
+    return dict({"id": mission, "mission": mission, "net": net, "status": "Success", "rocket": "Falcon 9"}, **extra)
+
+
+LAUNCH_DATA = {
+    "upcoming": [_launch("Crew-12", "2026-07-02T20:58:00Z", status="Go")],
+    "previous": [
+        _launch("Starlink 10-1", "2026-07-01T21:04:00Z", orbit="LEO"),
+        _launch("Starlink 10-2", "2026-07-01T03:15:00Z"),
+        _launch("Transporter", "2025-07-01T21:06:00Z"),
+    ],
+}
+
+
+def test_matches_by_day_and_minute_tolerance():
+    narratives = [
+        {"date": "7/1 2104", "text": "a"},
+        {"date": "7/2 2101", "text": "b"},   # within tolerance across the hour
+        {"date": "7/1 1200", "text": "c"},   # right day, no launch near that time
+        {"date": "", "text": "d"},
+    ]
+    enriched = funcs.enrich_narratives(narratives, LAUNCH_DATA)
+    assert [n.get("mission") for n in enriched] == ["Starlink 10-1", "Crew-12", None, None]
+    assert enriched[0]["orbit"] == "LEO" and enriched[0]["day_of_week"] == "Wed"
+    assert enriched[1]["status"] == "Go"
+    # The input list is left untouched
+    assert "mission" not in narratives[0]
+
+
+def test_enrichment_is_memoised_per_launch_data_version():
+    narratives = [{"date": "7/1 2104", "text": "a"}]
+    first = funcs.enrich_narratives(narratives, LAUNCH_DATA)
+    assert funcs.enrich_narratives([dict(n) for n in narratives], LAUNCH_DATA) is first
+
+    changed = {"upcoming": [], "previous": [_launch("Starlink 10-1", "2026-07-01T21:04:00Z", status="Failure")]}
+    again = funcs.enrich_narratives(narratives, changed)
+    assert again is not first and again[0]["status"] == "Failure"
+
+
+def test_enrichment_memo_sees_changes_to_copied_fields():
+    narratives = [{"date": "7/1 2104", "text": "a"}]
+    first = funcs.enrich_narratives(narratives, LAUNCH_DATA)
+    assert first[0]["orbit"] == "LEO"
+
+    # Same id, net and status: only a field enrichment copies has changed
+    changed = {"upcoming": [], "previous": [_launch("Starlink 10-1", "2026-07-01T21:04:00Z", orbit="SSO")]}
+    again = funcs.enrich_narratives(narratives, changed)
+    assert again is not first and again[0]["orbit"] == "SSO"
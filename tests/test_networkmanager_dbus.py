@@ -0,0 +1,233 @@
+"""NetworkManager D-Bus Wi-Fi monitor against a fake NetworkManager service.
+
+Each test starts a private dbus-daemon and exports a small fake of the
+NetworkManager object tree on it, so the real jeepney transport and the
+monitor's signal handling are exercised without touching the system bus.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import threading
+
+import pytest
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), "..", "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+import functions as funcs
+
+jeepney = pytest.importorskip("jeepney")
+from jeepney import DBusAddress, HeaderFields, MessageType, message_bus, new_error, new_method_return, new_signal
+from jeepney.io.blocking import open_dbus_connection
+
+DEVICE = "/org/freedesktop/NetworkManager/Devices/3"
+HOME_AP = "/org/freedesktop/NetworkManager/AccessPoint/1"
+HOME_AP_WEAK = "/org/freedesktop/NetworkManager/AccessPoint/2"
+CAFE_AP = "/org/freedesktop/NetworkManager/AccessPoint/3"
+NEW_AP = "/org/freedesktop/NetworkManager/AccessPoint/4"
+HOME_PROFILE = "/org/freedesktop/NetworkManager/Settings/1"
+WIRED_PROFILE = "/org/freedesktop/NetworkManager/Settings/2"
+
+
+def _ap(ssid, strength, privacy):
+    return {
+        "Ssid": ("ay", ssid.encode()),
+        "Strength": ("y", strength),
+        "Flags": ("u", 1 if privacy else 0),
+        "WpaFlags": ("u", 0),
+        "RsnFlags": ("u", 0x188 if privacy else 0),
+    }
+
+
+class FakeNetworkManager:
+    """Answers the NetworkManager calls the monitor makes and emits its signals."""
+
+    def __init__(self, address):
+        self.conn = open_dbus_connection(address)
+        self.conn.send_and_get_reply(message_bus.RequestName(funcs.NM_DBUS_SERVICE))
+        self.access_points = {
+            HOME_AP: _ap("HomeNet", 80, True),
+            HOME_AP_WEAK: _ap("HomeNet", 30, True),
+            CAFE_AP: _ap("Cafe", 55, False),
+        }
+        self.device = {"DeviceType": ("u", funcs.NM_DEVICE_TYPE_WIFI), "Interface": ("s", "wlan0"),
+                       "State": ("u", funcs.NM_DEVICE_STATE_ACTIVATED)}
+        self.wireless = {"ActiveAccessPoint": ("o", HOME_AP), "LastScan": ("x", 1000)}
+        self.settings = {
+            HOME_PROFILE: {"connection": {"id": ("s", "Home profile"), "type": ("s", "802-11-wireless")},
+                           "802-11-wireless": {"ssid": ("ay", b"HomeNet")}},
+            WIRED_PROFILE: {"connection": {"id": ("s", "Wired"), "type": ("s", "802-3-ethernet")}},
+        }
+        self.scan_requests = 0
+        self._send_lock = threading.Lock()
+        self._running = True
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def close(self):
+        self._running = False
+        self._thread.join(2)
+        self.conn.close()
+
+    def _send(self, msg):
+        with self._send_lock:
+            self.conn.send(msg)
+
+    def signal(self, path, interface, member, signature, body):
+        self._send(new_signal(DBusAddress(path, interface=interface), member, signature, body))
+
+    def _properties(self, path, interface):
+        if path == DEVICE and interface == funcs.NM_IFACE_DEVICE:
+            return self.device
+        if path == DEVICE and interface == funcs.NM_IFACE_WIRELESS:
+            return self.wireless
+        if interface == funcs.NM_IFACE_ACCESS_POINT and path in self.access_points:
+            return self.access_points[path]
+        return None
+
+    def _serve(self):
+        while self._running:
+            try:
+                msg = self.conn.receive(timeout=0.1)
+            except TimeoutError:
+                continue
+            except Exception:
+                return
+            if msg.header.message_type == MessageType.method_call:
+                after = self._handle(msg)
+                if after:
+                    after()
+
+    def _handle(self, msg):
+        path = msg.header.fields[HeaderFields.path]
+        member = msg.header.fields[HeaderFields.member]
+        if member in ("Get", "GetAll"):
+            props = self._properties(path, msg.body[0])
+            if props is None:
+                self._send(new_error(msg, "org.freedesktop.DBus.Error.UnknownObject"))
+            elif member == "Get":
+                self._send(new_method_return(msg, "v", (props[msg.body[1]],)))
+            else:
+                self._send(new_method_return(msg, "a{sv}", (props,)))
+        elif member == "GetDevices":
+            self._send(new_method_return(msg, "ao", ([DEVICE],)))
+        elif member == "GetAllAccessPoints":
+            self._send(new_method_return(msg, "ao", (list(self.access_points),)))
+        elif member == "ListConnections":
+            self._send(new_method_return(msg, "ao", (list(self.settings),)))
+        elif member == "GetSettings":
+            self._send(new_method_return(msg, "a{sa{sv}}", (self.settings[path],)))
+        elif member == "RequestScan":
+            self.scan_requests += 1
+            self._send(new_method_return(msg))
+            return self._finish_scan
+        elif member == "ActivateConnection":
+            self._send(new_method_return(msg, "o", ("/org/freedesktop/NetworkManager/ActiveConnection/7",)))
+            return self._finish_activation
+        else:
+            self._send(new_error(msg, "org.freedesktop.DBus.Error.UnknownMethod"))
+        return None
+
+    def _finish_scan(self):
+        self.access_points[NEW_AP] = _ap("Neighbour", 40, True)
+        self.signal(DEVICE, funcs.NM_IFACE_WIRELESS, "AccessPointAdded", "o", (NEW_AP,))
+        self.wireless["LastScan"] = ("x", 2000)
+        self.signal(DEVICE, funcs.DBUS_IFACE_PROPERTIES, "PropertiesChanged", "sa{sv}as",
+                    (funcs.NM_IFACE_WIRELESS, {"LastScan": ("x", 2000)}, []))
+
+    def _finish_activation(self):
+        self.device["State"] = ("u", funcs.NM_DEVICE_STATE_ACTIVATED)
+        self.signal(DEVICE, funcs.NM_IFACE_DEVICE, "StateChanged", "uuu",
+                    (funcs.NM_DEVICE_STATE_ACTIVATED, 70, 0))
+
+
+@pytest.fixture
+def bus_address():
+    if not shutil.which("dbus-daemon"):
+        pytest.skip("dbus-daemon not installed")
+    proc = subprocess.Popen(["dbus-daemon", "--session", "--nofork", "--print-address"],
+                            stdout=subprocess.PIPE, text=True)
+    address = proc.stdout.readline().strip()
+    try:
+        yield address
+    finally:
+        proc.terminate()
+        proc.wait(5)
+
+
+@pytest.fixture
+def fake_nm(bus_address):
+    fake = FakeNetworkManager(bus_address)
+    try:
+        yield fake
+    finally:
+        fake.close()
+
+
+@pytest.fixture
+def monitor(bus_address, fake_nm):
+    events = []
+    monitor = funcs.start_wifi_monitor(bus=funcs.NetworkManagerDBus(bus_address))
+    assert monitor is not None
+    monitor.events = events
+    monitor.changed = threading.Event()
+
+    def _listener(kind):
+        events.append(kind)
+        monitor.changed.set()
+    monitor.add_listener(_listener)
+    try:
+        yield monitor
+    finally:
+        funcs.stop_wifi_monitor()
+
+
+def _wait_for(monitor, kind):
+    for _ in range(50):
+        if kind in monitor.events:
+            return True
+        monitor.changed.wait(0.1)
+        monitor.changed.clear()
+    return False
+
+
+def test_initial_model_matches_nmcli_shapes(monitor):
+    assert monitor.status() == (True, "HomeNet")
+    networks = sorted(monitor.networks(), key=lambda n: n["ssid"])
+    assert networks == [
+        {"ssid": "Cafe", "signal": 55, "encrypted": False},
+        {"ssid": "HomeNet", "signal": 80, "encrypted": True},
+    ]
+    # The module-level helpers read the model instead of spawning nmcli
+    assert funcs.check_wifi_status() == (True, "HomeNet")
+    assert funcs.get_nmcli_profiles() == [{"name": "Home profile", "ssid": "HomeNet"}]
+
+
+def test_signals_update_the_model(monitor, fake_nm):
+    fake_nm.signal(DEVICE, funcs.NM_IFACE_WIRELESS, "AccessPointRemoved", "o", (CAFE_AP,))
+    assert _wait_for(monitor, "networks")
+    assert [n["ssid"] for n in monitor.networks()] == ["HomeNet"]
+
+    fake_nm.signal(DEVICE, funcs.NM_IFACE_DEVICE, "StateChanged", "uuu",
+                   (funcs.NM_DEVICE_STATE_DISCONNECTED, funcs.NM_DEVICE_STATE_ACTIVATED, 0))
+    assert _wait_for(monitor, "status")
+    assert monitor.status() == (False, "")
+
+
+def test_request_scan_waits_for_last_scan(monitor, fake_nm):
+    networks = monitor.request_scan(wait=5)
+    assert fake_nm.scan_requests == 1
+    assert "Neighbour" in {n["ssid"] for n in networks}
+
+
+def test_activate_profile_waits_for_device(monitor):
+    assert monitor.activate_profile("Home profile", timeout=5)[0] is True
+    assert monitor.activate_profile("Missing", timeout=1)[0] is False
+
+
+def test_missing_networkmanager_falls_back(bus_address):
+    assert funcs.start_wifi_monitor(bus=funcs.NetworkManagerDBus(bus_address)) is None
+    assert funcs._wifi_monitor is None
@@ -0,0 +1,48 @@
+"""Tests for the on-disk QML layout in src/qml.
+
+The UI must be loaded from a file URL so Qt's QML disk cache applies, and the
+heavy panels must sit behind Loaders so they are only compiled/instantiated
+on first use.
+"""
+
+import re
+from pathlib import Path
+
+SRC_DIR = Path(__file__).parent.parent / 'src'
+QML_DIR = SRC_DIR / 'qml'
+
+
+def _read(path):
+    return path.read_text(encoding='utf-8')
+
+
+def test_app_loads_qml_from_file():
+    src = _read(SRC_DIR / 'app.py')
+    assert 'engine.loadData(' not in src, "loadData bypasses the QML disk cache"
+    assert 'engine.load(QUrl.fromLocalFile(MAIN_QML))' in src
+
+
+def test_heavy_panels_are_loader_sources():
+    main = _read(QML_DIR / 'Main.qml')
+    for name in ('CalendarView.qml', 'SpotifyTrayContent.qml', 'WifiSettings.qml'):
+        assert (QML_DIR / name).exists(), f"{name} missing"
+        assert f'source: "{name}"' in main, f"{name} is not loaded through a Loader"
+
+
+def test_panels_start_inactive():
+    main = _read(QML_DIR / 'Main.qml')
+    wifi = main[main.find('id: wifiSettingsLoader'):]
+    assert 'active: false' in wifi[:300]
+    spotify = main[main.find('id: spotifyTrayContentLoader'):]
+    assert 'active: spotifyFullScreenTray.contentRequested' in spotify[:400]
+
+
+def test_split_panel_ids_not_referenced_directly_from_main():
+    """Ids inside Loader-created files are invisible to Main.qml; go through aliases."""
+    main = _read(QML_DIR / 'Main.qml')
+    for panel in ('SpotifyTrayContent.qml', 'WifiSettings.qml'):
+        ids = re.findall(r'^\s*id:\s*(\w+)', _read(QML_DIR / panel), flags=re.M)
+        for qml_id in ids:
+            assert not re.search(r'(?<![\w.])' + qml_id + r'\.', main), (
+                f"Main.qml references {qml_id} from {panel} directly"
+            )
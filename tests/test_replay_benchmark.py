@@ -0,0 +1,46 @@
+"""Smoke test for tools/replay_benchmark.py at 1x with a single run per stage."""
+
+import os
+import sys
+
+TOOLS_DIR = os.path.join(os.path.dirname(__file__), "..", "tools")
+if TOOLS_DIR not in sys.path:
+    sys.path.insert(0, TOOLS_DIR)
+
+import replay_benchmark as bench
+
+funcs = bench.funcs
+
+
+def test_scaled_history_has_unique_ids():
+    history = bench.load_seed_history()[:20]
+    scaled = bench.scale_history(history, 3)
+    assert len(scaled) == 60
+    assert len({l["id"] for l in scaled}) == 60
+    # Copies land a few minutes before their original
+    original = {f"hist-{i}": funcs._get_parsed_dt(l["net"]) for i, l in enumerate(history)}
+    for launch in scaled:
+        delta = original[launch["id"].split("-x")[0]] - funcs._get_parsed_dt(launch["net"])
+        assert 0 <= delta.total_seconds() <= 14 * 60
+
+
+def test_replay_runs_every_stage_against_stand_in():
+    before = (funcs.LAUNCH_API_BASE_URL, funcs.RUNTIME_CACHE_FILE_LAUNCHES)
+    result = bench.run_scale(1, repeats=1)
+    assert (funcs.LAUNCH_API_BASE_URL, funcs.RUNTIME_CACHE_FILE_LAUNCHES) == before
+    assert set(result["stages"]) >= {"full_load", "fetch_launches_merge", "group_event_data.previous",
+                                      "calendar_mapping", "trends.actual", "trajectory", "launch_details"}
+    # The API window merged into the full seed history
+    assert result["sizes"]["previous"] >= len(bench.load_seed_history())
+    assert result["sizes"]["upcoming"] == bench.UPCOMING_COUNT
+
+
+def test_compare_flags_only_real_slowdowns():
+    def _results(**medians):
+        return {"scales": {"10x": {"stages": {k: {"median_ms": v} for k, v in medians.items()}}}}
+
+    baseline = _results(full_load=100.0, trends=1.0, calendar_mapping=40.0)
+    current = _results(full_load=140.0, trends=1.9, calendar_mapping=44.0, new_stage=5.0)
+    regressions = bench.compare_results(baseline, current, threshold=0.25)
+    # trends is under the noise floor, calendar_mapping within threshold, new_stage has no baseline
+    assert [(r["stage"], round(r["change"], 2)) for r in regressions] == [("full_load", 0.4)]
@@ -22,3 +22,101 @@ def test_spotify_state_mismatch_guard_blocks_payload():
     payload = funcs.consume_spotify_auth_result(expected_state="expected")
     assert payload["error"] == "state_mismatch"
     assert funcs.consume_spotify_auth_result() is None
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_spotify_poll_scheduler_polls_at_track_boundary():
+    clock = _FakeClock()
+    scheduler = funcs.SpotifyPollScheduler(clock=clock)
+    player = {"authenticated": True, "has_active_device": True, "is_playing": True,
+              "progress_ms": 170000, "duration_ms": 180000}
+    assert scheduler.next_delay_ms(player) == 10000 + funcs.SPOTIFY_POLL_TRACK_END_MARGIN_MS
+    player["progress_ms"] = 10000
+    assert scheduler.next_delay_ms(player) == funcs.SPOTIFY_POLL_PLAYING_MS
+
+
+def test_spotify_poll_scheduler_backs_off_when_paused_or_idle():
+    scheduler = funcs.SpotifyPollScheduler(clock=_FakeClock())
+    assert scheduler.next_delay_ms({"authenticated": True, "has_active_device": True}) == funcs.SPOTIFY_POLL_PAUSED_MS
+    assert scheduler.next_delay_ms({"authenticated": True, "has_active_device": False}) == funcs.SPOTIFY_POLL_IDLE_MS
+
+
+def test_spotify_poll_scheduler_command_window_and_device_cadence():
+    clock = _FakeClock()
+    scheduler = funcs.SpotifyPollScheduler(clock=clock)
+    player = {"authenticated": True, "has_active_device": True, "track_uri": "spotify:track:a", "up_next_items": [{}]}
+    assert scheduler.plan_poll(player)["include_devices"] is True
+    scheduler.record_result(player, {"player": 1, "devices": 1, "queue": 1}, queue_fetched=True)
+    clock.now += 60
+    plan = scheduler.plan_poll(player)
+    assert plan == {"include_devices": False, "include_queue": False}
+    scheduler.note_command()
+    assert scheduler.next_delay_ms(player) == funcs.SPOTIFY_POLL_COMMAND_MS
+    assert scheduler.plan_poll(player) == {"include_devices": True, "include_queue": True}
+    clock.now += funcs.SPOTIFY_POLL_COMMAND_WINDOW_S + 1
+    assert scheduler.next_delay_ms(player) == funcs.SPOTIFY_POLL_PAUSED_MS
+    stats = scheduler.stats()
+    assert stats["api_calls"] == 3 and stats["polls"] == 3
+
+
+def test_spotify_poll_scheduler_keeps_empty_queue_results():
+    clock = _FakeClock()
+    scheduler = funcs.SpotifyPollScheduler(clock=clock)
+    player = {"authenticated": True, "has_active_device": True, "track_uri": "spotify:track:a", "up_next_items": []}
+    assert scheduler.plan_poll(player)["include_queue"] is True
+    # No queue response yet (e.g. nothing playing): still "never fetched"
+    scheduler.record_result(player, {"player": 1})
+    assert scheduler.plan_poll(player)["include_queue"] is True
+    # The queue request failed: counted, but not treated as fetched
+    scheduler.record_result(player, {"player": 1, "queue": 1})
+    assert scheduler.plan_poll(player)["include_queue"] is True
+    scheduler.record_result(player, {"player": 1, "queue": 1}, queue_fetched=True)
+    clock.now += 60
+    assert scheduler.plan_poll(player)["include_queue"] is False
+    clock.now += funcs.SPOTIFY_QUEUE_REFRESH_S
+    assert scheduler.plan_poll(player)["include_queue"] is True
+
+
+def test_spotify_token_state_only_moves_forward():
+    state = funcs.SpotifyTokenState()
+    fresh = {"access_token": "new", "refresh_token": "r2", "expires_at": 2000.0}
+    state.publish(fresh)
+    # A lane still holding the pre-refresh tokens picks up the rotated ones
+    stale = state.adopt_newer({"access_token": "old", "refresh_token": "r1", "expires_at": 1000.0})
+    assert (stale["access_token"], stale["refresh_token"]) == ("new", "r2")
+    # ...and publishing old tokens never rolls the shared state back
+    state.publish({"access_token": "old", "refresh_token": "r1", "expires_at": 1000.0})
+    assert state.adopt_newer({"expires_at": 0})["refresh_token"] == "r2"
+    state.reset()
+    assert state.adopt_newer({"access_token": "x", "expires_at": 5.0})["access_token"] == "x"
+
+
+def test_ttl_cache_expires_and_evicts_least_recently_used():
+    clock = _FakeClock()
+    cache = funcs.TTLCache(max_entries=2, clock=clock)
+    cache.set(("/me/albums", ()), {"items": [1]}, ttl=10)
+    cache.set(("/search", (("q", "a"),)), {"items": [2]}, ttl=10)
+    assert cache.get(("/me/albums", ())) == {"items": [1]}
+    cache.set(("/albums/x/tracks", ()), {"items": [3]}, ttl=10)
+    # The search entry was least recently used
+    assert cache.get(("/search", (("q", "a"),))) is None
+    clock.now += 11
+    assert cache.get(("/me/albums", ())) is None
+    assert cache.hits == 1 and cache.misses == 2
+
+
+def test_ttl_cache_invalidate_by_predicate():
+    cache = funcs.TTLCache(clock=_FakeClock())
+    cache.set(("/me/playlists", ()), {}, ttl=60)
+    cache.set(("/albums/x/tracks", ()), {}, ttl=60)
+    cache.invalidate(lambda key: key[0].startswith("/me/"))
+    assert len(cache) == 1
+    cache.invalidate()
+    assert len(cache) == 0
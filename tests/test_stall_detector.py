@@ -0,0 +1,90 @@
+import os
+import sys
+import threading
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), "..", "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+import functions as funcs
+
+
+def _blocking_save(seconds):
+    time.sleep(seconds)
+
+
+def _run_heartbeat(detector, block_after_beats, block_s, done):
+    for beat in range(block_after_beats * 2):
+        detector.beat()
+        if beat == block_after_beats:
+            _blocking_save(block_s)
+        time.sleep(detector.heartbeat_ms / 1000.0)
+    done.set()
+
+
+def test_late_heartbeat_records_stack_of_watched_thread():
+    done = threading.Event()
+    worker = threading.Thread(target=lambda: _run_heartbeat(detector, 5, 0.4, done))
+    detector = funcs.StallDetector(threshold_ms=150, heartbeat_ms=20)
+    worker.start()
+    detector.thread_id = worker.ident
+    detector.start()
+    try:
+        assert done.wait(5)
+        time.sleep(0.1)
+    finally:
+        detector.stop()
+        worker.join()
+
+    stalls = detector.stalls()
+    assert len(stalls) == 1
+    assert 300 <= stalls[0].duration_ms <= 1000
+    # Not under src/, so the innermost frame is used as the site
+    assert stalls[0].site.endswith("_blocking_save")
+    assert any("_run_heartbeat" in line for line in stalls[0].stack)
+
+
+def test_check_uses_heartbeat_gap_and_groups_sites():
+    detector = funcs.StallDetector(threshold_ms=200, heartbeat_ms=100)
+    detector._last_beat = 10.0
+    detector.check(now=10.25)  # 150 ms late: under threshold
+    assert detector._pending is None
+    detector.check(now=10.5)   # 400 ms late: captured
+    assert detector._pending is not None
+    detector._last_beat = 11.0
+    detector.check(now=11.0)
+    summary = detector.summary()
+    assert summary["count"] == 1
+    assert round(summary["total_ms"]) == 900
+    assert summary["top_sites"][0]["site"] == summary["recent"][0]["site"]
+    assert 'dashboard_main_thread_stalls_total{site="' in detector.prometheus_text()
+
+
+def test_zero_threshold_disables_watcher():
+    detector = funcs.StallDetector(threshold_ms=0).start()
+    assert detector._thread is None
+
+
+def test_stall_is_logged_at_detection_before_any_later_beat(monkeypatch):
+    warnings = []
+    monkeypatch.setattr(funcs.logger, "warning", warnings.append)
+    detector = funcs.StallDetector(threshold_ms=200, heartbeat_ms=100)
+    detector._last_beat = 10.0
+    detector.check(now=10.5)  # the thread never beats again
+    assert len(warnings) == 1
+    assert warnings[0].startswith("Main thread stalled >400 ms at ")
+    assert "test_stall_is_logged_at_detection" in warnings[0]
+    detector.check(now=20.0)
+    assert len(warnings) == 1 and detector.stalls() == []
+
+
+def test_threshold_env_parsing(monkeypatch):
+    monkeypatch.setenv("DASHBOARD_STALL_THRESHOLD_MS", "250")
+    assert funcs._stall_threshold_from_env() == 250
+    monkeypatch.setenv("DASHBOARD_STALL_THRESHOLD_MS", "0")
+    assert funcs._stall_threshold_from_env() == 0
+    monkeypatch.setenv("DASHBOARD_STALL_THRESHOLD_MS", "500ms")
+    assert funcs._stall_threshold_from_env() == funcs.STALL_DEFAULT_THRESHOLD_MS
+    monkeypatch.delenv("DASHBOARD_STALL_THRESHOLD_MS")
+    assert funcs._stall_threshold_from_env() == funcs.STALL_DEFAULT_THRESHOLD_MS
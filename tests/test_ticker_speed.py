@@ -1,4 +1,4 @@
-"""Tests that validate the ticker scroll-speed fix in src/ui_qml.py.
+"""Tests that validate the ticker scroll-speed fix in src/qml/Main.qml.
 
 The ticker used to have a fixed duration of 1,600,000 ms regardless of text
 width.  When the text content changed after boot (API data loaded with a
@@ -14,7 +14,7 @@ The fix:
 import re
 from pathlib import Path
 
-UI_QML_PATH = Path(__file__).parent.parent / 'src' / 'ui_qml.py'
+UI_QML_PATH = Path(__file__).parent.parent / 'src' / 'qml' / 'Main.qml'
 
 
 def _read_ui():
@@ -0,0 +1,26 @@
+"""Ticker text assembly from narratives, memoised per narratives version."""
+
+import os
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), "..", "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+import functions as funcs
+
+
+def test_ticker_text_joins_full_text_and_legacy_strings():
+    narratives = [{"date": "7/1 2104", "full": "Falcon 9 hoists MTG-S1"}, "7/2 0425: 500th Falcon 9"]
+    assert funcs.build_ticker_text(narratives) == "Falcon 9 hoists MTG-S1  7/2 0425: 500th Falcon 9"
+    assert funcs.build_ticker_text([]) == ""
+
+
+def test_ticker_text_is_reused_for_equal_narratives():
+    narratives = [{"date": "7/8 0545", "full": "Another 28 Starlinks"}]
+    first = funcs.build_ticker_text(narratives)
+    hits = funcs.metrics._counters.get("ticker_text.memo_hits", 0)
+    # A fresh but equal list, as a launch refresh delivers
+    assert funcs.build_ticker_text([dict(n) for n in narratives]) is first
+    if funcs.metrics.enabled:
+        assert funcs.metrics._counters["ticker_text.memo_hits"] == hits + 1
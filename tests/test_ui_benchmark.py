@@ -0,0 +1,38 @@
+"""tools/ui_benchmark.py: timer schedule and settings isolation (Qt-free), plus an offscreen smoke run."""
+
+import os
+import sys
+
+import pytest
+
+TOOLS_DIR = os.path.join(os.path.dirname(__file__), "..", "tools")
+if TOOLS_DIR not in sys.path:
+    sys.path.insert(0, TOOLS_DIR)
+
+import ui_benchmark as bench
+
+funcs = bench.funcs
+
+
+def test_due_timers_follow_backend_cadence():
+    assert bench.due_timers(1) == ["update_countdown", "_tick_spotify_progress"]
+    assert bench.due_timers(5) == ["update_countdown", "update_time", "_tick_spotify_progress"]
+    assert "update_weather" in bench.due_timers(60)
+    assert "update_next_launch_periodic" not in bench.due_timers(60)
+    assert "update_next_launch_periodic" in bench.due_timers(120)
+
+
+def test_scratch_settings_dir_redirects_and_restores(tmp_path):
+    theme_file, launches_file = funcs.THEME_SETTINGS_FILE, funcs.RUNTIME_CACHE_FILE_LAUNCHES
+    with bench.scratch_settings_dir(str(tmp_path)):
+        assert funcs.THEME_SETTINGS_FILE == os.path.join(str(tmp_path), "theme_settings.json")
+        assert funcs.RUNTIME_CACHE_FILE_LAUNCHES.startswith(str(tmp_path))
+    assert (funcs.THEME_SETTINGS_FILE, funcs.RUNTIME_CACHE_FILE_LAUNCHES) == (theme_file, launches_file)
+
+
+def test_offscreen_run_reports_ui_counters():
+    pytest.importorskip("PyQt6.QtWebEngineQuick")
+    results = bench.run_benchmark(minutes=0.25, tick_ms=5, warmup_s=0.5)
+    assert results["signals"]["countdownChanged"] == 15
+    assert results["busy_ms"] > 0
+    assert "EventModel" in results["models"]
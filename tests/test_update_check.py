@@ -0,0 +1,97 @@
+"""Update check against a local stand-in for the GitHub commits API, and .git reading."""
+
+import http.server
+import json
+import os
+import shutil
+import subprocess
+import sys
+import threading
+
+import pytest
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), "..", "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+import functions as funcs
+
+LATEST = {"sha": "b" * 40, "commit": {"message": "Fix countdown", "author": {"name": "dev", "date": "2026-01-01"}}}
+
+
+class _GitHub(http.server.BaseHTTPRequestHandler):
+    requests = []
+    etag = '"v1"'
+
+    def do_GET(self):
+        _GitHub.requests.append((self.path, self.headers.get("If-None-Match")))
+        if self.headers.get("If-None-Match") == _GitHub.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = json.dumps(LATEST).encode()
+        self.send_response(200)
+        self.send_header("ETag", _GitHub.etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def github(tmp_path, monkeypatch):
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _GitHub)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    _GitHub.requests = []
+    monkeypatch.setattr(funcs, "GITHUB_API_BASE_URL", f"http://127.0.0.1:{server.server_address[1]}")
+    monkeypatch.setattr(funcs, "RUNTIME_CACHE_FILE_UPDATE_CHECK", str(tmp_path / "update_check_cache.json"))
+    monkeypatch.setattr(funcs, "cache_writer", funcs.CacheWriter(delay=0))
+    try:
+        yield _GitHub
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_unchanged_branch_costs_a_304(github):
+    has_update, info = funcs.check_github_for_updates("a" * 40, branch="master")
+    assert has_update and info["short_hash"] == "bbbbbbbb" and info["message"] == "Fix countdown"
+    assert github.requests[-1] == ("/repos/hwpaige/spacex-dashboard/commits/master", None)
+
+    assert funcs.check_github_for_updates("b" * 40, branch="master") == (False, info)
+    assert github.requests[-1][1] == '"v1"'
+
+    # A new commit changes the ETag; the full answer is fetched again
+    github.etag = '"v2"'
+    LATEST["sha"] = "c" * 40
+    try:
+        has_update, info = funcs.check_github_for_updates("b" * 40, branch="master")
+    finally:
+        LATEST["sha"], github.etag = "b" * 40, '"v1"'
+    assert has_update and info["hash"] == "c" * 40
+    assert len(github.requests) == 3
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+def test_version_info_read_from_git_dir(tmp_path):
+    def git(*args):
+        return subprocess.run(["git", "-c", "user.name=t", "-c", "user.email=t@t", *args], cwd=tmp_path,
+                              capture_output=True, text=True, check=True).stdout.strip()
+
+    git("init", "-q", "-b", "main")
+    (tmp_path / "a.txt").write_text("a")
+    git("add", "a.txt")
+    git("commit", "-q", "-m", "First line\nwrapped\n\nBody text")
+    (tmp_path / "src").mkdir()
+    head = git("rev-parse", "HEAD")
+    info = funcs.get_git_version_info(str(tmp_path / "src"))
+    assert info == {"hash": head, "short_hash": head[:8], "message": git("log", "-1", "--pretty=format:%s")}
+
+    # Packed refs and objects: the hash still comes from packed-refs, the message from `git log`
+    git("gc", "-q")
+    assert not os.path.exists(tmp_path / ".git" / "refs" / "heads" / "main")
+    assert funcs.read_git_head(str(tmp_path)) == head
+    funcs._commit_message_cache.clear()
+    assert funcs.get_git_version_info(str(tmp_path))["message"] == "First line wrapped"
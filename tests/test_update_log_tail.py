@@ -0,0 +1,73 @@
+"""Incremental tail of the updater log: appends, partial lines, truncation and rotation."""
+
+import os
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), "..", "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+import functions as funcs
+
+
+def _append(path, text):
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(text)
+
+
+def test_reads_only_appended_bytes(tmp_path):
+    log = tmp_path / "update.log"
+    tail = funcs.LogTailFollower(str(log), max_lines=3)
+    assert not tail.poll()
+    assert tail.summary == "Preparing update…"
+
+    _append(log, "one\ntwo\nthr")
+    assert tail.poll()
+    # The unterminated line is shown but completed by the next append
+    assert tail.summary == "one\ntwo\nthr"
+    _append(log, "ee\nfour\n")
+    assert tail.poll()
+    assert tail.summary == "two\nthree\nfour"
+    before = funcs.metrics._counters.get("update_log.bytes_read", 0)
+    assert not tail.poll()
+    assert funcs.metrics._counters.get("update_log.bytes_read", 0) == before
+
+
+def test_truncation_and_rotation_restart_the_tail(tmp_path):
+    log = tmp_path / "update.log"
+    _append(log, "old 1\nold 2\n")
+    tail = funcs.LogTailFollower(str(log))
+    assert tail.poll() and tail.summary == "old 1\nold 2"
+
+    log.write_text("fresh\n", encoding="utf-8")
+    assert tail.poll() and tail.summary == "fresh"
+
+    os.rename(log, tmp_path / "update.log.1")
+    _append(log, "rotated\n")
+    assert tail.poll() and tail.summary == "rotated"
+
+
+def test_large_existing_log_starts_near_the_end(tmp_path):
+    log = tmp_path / "update.log"
+    _append(log, "".join(f"line {i}\n" for i in range(50000)))
+    tail = funcs.LogTailFollower(str(log))
+    before = funcs.metrics._counters.get("update_log.bytes_read", 0)
+    assert tail.poll()
+    assert tail.summary.splitlines() == [f"line {i}" for i in range(49985, 50000)]
+    assert funcs.metrics._counters.get("update_log.bytes_read", 0) - before <= funcs.UPDATE_LOG_INITIAL_BYTES
+
+
+def test_inotify_skips_polls_without_events(tmp_path):
+    log = tmp_path / "update.log"
+    tail = funcs.LogTailFollower(str(log), use_inotify=True)
+    try:
+        tail.poll()
+        if tail.fileno() is None:
+            return
+        assert not tail.poll()
+        _append(tmp_path / "unrelated.log", "noise\n")
+        assert not tail.poll()
+        _append(log, "apt-get upgrade\n")
+        assert tail.poll() and tail.summary == "apt-get upgrade"
+    finally:
+        tail.close()
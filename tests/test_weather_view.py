@@ -0,0 +1,48 @@
+"""Weather view-model: live wind applied to copies, per-field change detection."""
+
+import os
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), "..", "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+import functions as funcs
+
+
+def _weather():
+    return {
+        "Starbase": {"temperature_f": 81.4, "wind_speed_kts": 9, "wind_gusts_kts": 14, "wind_direction": 120,
+                     "live_wind": {"speed_kts": 12, "gust_kts": 18, "direction": 135}},
+        "Vandy": {"temperature_f": 61.0, "wind_speed_kts": 5, "wind_gusts_kts": 5, "wind_direction": 290},
+    }
+
+
+def test_views_apply_live_wind_without_mutating_source():
+    data = _weather()
+    model = funcs.WeatherViewModel()
+    model.update(data)
+    view = model.view("Starbase")
+    assert (view["wind_speed_kts"], view["wind_direction_cardinal"], view["is_live_wind"]) == (12, "SE", True)
+    assert data == _weather()
+
+    model.update(data, use_live_wind=False)
+    assert model.view("Starbase")["wind_speed_kts"] == 9
+    assert model.view("Starbase")["is_live_wind"] is False
+    assert model.view("Cape") == {}
+
+
+def test_select_reports_only_changed_fields():
+    data = _weather()
+    model = funcs.WeatherViewModel()
+    model.update(data)
+    assert set(model.select("Starbase")) == set(funcs.WEATHER_VIEW_DEFAULTS)
+    assert model.select("Starbase") == []
+
+    data["Starbase"] = dict(data["Starbase"], temperature_f=82.0)
+    model.update(data)
+    assert model.select("Starbase") == ["temperature_f"]
+
+    changed = model.select("Cape")
+    assert model.fields == funcs.WEATHER_VIEW_DEFAULTS
+    assert "has_temperature" in changed and "is_live_wind" in changed
@@ -0,0 +1,101 @@
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+# Import-time audit for the dashboard's cold boot.
+#
+# Runs `python -X importtime -c "import <module>"` with src/ on the path and
+# ranks the imports by self and cumulative time, so heavy dependencies that
+# sneak onto the boot path (plotly, pandas, cryptography, ...) show up at the
+# top of the report.  An existing -X importtime log can be passed with --log
+# instead, e.g. one captured on the Pi with:
+#
+#   python -X importtime src/app.py 2> importtime.log
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+
+# "import time:       123 |       4567 |   requests"
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S.*)$')
+
+
+def parse_importtime(text):
+    """Parse -X importtime output into a list of dicts (times in microseconds)."""
+    entries = []
+    for line in text.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        entries.append({
+            'module': name.strip(),
+            'self_us': int(self_us),
+            'cumulative_us': int(cumulative_us),
+            # importtime indents nested imports by two spaces per level
+            'depth': max(0, (len(indent) - 1) // 2),
+        })
+    return entries
+
+
+def run_importtime(module, python=sys.executable):
+    """Import module in a fresh interpreter and return its -X importtime output."""
+    env = dict(os.environ)
+    env['PYTHONPATH'] = SRC_DIR + os.pathsep + env.get('PYTHONPATH', '')
+    # Keep Qt from trying to open a display if the module pulls it in
+    env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    result = subprocess.run([python, '-X', 'importtime', '-c', f'import {module}'],
+                            capture_output=True, text=True, env=env, cwd=SRC_DIR)
+    if result.returncode != 0:
+        tail = result.stderr.strip().splitlines()[-1:] or ['unknown error']
+        print(f"Warning: importing {module} failed: {tail[0]}")
+    return result.stderr
+
+
+def top_level_totals(entries):
+    """Sum self time per top-level package (requests, PyQt6, cryptography, ...)."""
+    totals = {}
+    for entry in entries:
+        package = entry['module'].split('.')[0]
+        totals[package] = totals.get(package, 0) + entry['self_us']
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)
+
+
+def format_report(entries, limit=25):
+    lines = []
+    if not entries:
+        return "No import time data found."
+    total_us = sum(e['self_us'] for e in entries)
+    lines.append(f"--- Import Time Audit ({len(entries)} modules, {total_us / 1000:.1f} ms total) ---")
+
+    lines.append("\nBy package (self time):")
+    for package, self_us in top_level_totals(entries)[:limit]:
+        share = 100.0 * self_us / total_us if total_us else 0.0
+        lines.append(f"  {package:.<40} {self_us / 1000:>8.1f} ms ({share:4.1f}%)")
+
+    lines.append("\nBy module (self time):")
+    for entry in sorted(entries, key=lambda e: e['self_us'], reverse=True)[:limit]:
+        lines.append(f"  {entry['module']:.<40} {entry['self_us'] / 1000:>8.1f} ms")
+
+    lines.append("\nBy module (cumulative time):")
+    for entry in sorted(entries, key=lambda e: e['cumulative_us'], reverse=True)[:limit]:
+        lines.append(f"  {entry['module']:.<40} {entry['cumulative_us'] / 1000:>8.1f} ms")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rank imports by cost using python -X importtime")
+    parser.add_argument('modules', nargs='*', default=['functions'],
+                        help="Modules to import from src/ (default: functions)")
+    parser.add_argument('--log', help="Parse an existing -X importtime log instead of running an import")
+    parser.add_argument('--limit', type=int, default=25, help="Rows per section")
+    args = parser.parse_args()
+
+    if args.log:
+        with open(args.log, 'r', encoding='utf-8', errors='replace') as f:
+            print(format_report(parse_importtime(f.read()), limit=args.limit))
+        sys.exit(0)
+
+    for module in args.modules:
+        print(f"\n=== import {module} ===")
+        print(format_report(parse_importtime(run_importtime(module)), limit=args.limit))
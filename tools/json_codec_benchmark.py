@@ -0,0 +1,91 @@
+import argparse
+import glob
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+# Load and save cost of every cache file under each available JSON codec.
+#
+# For each *.json file in --cache-dir (default: the repo's cache/ seed files;
+# point it at ~/.cache/... on the Pi for the runtime caches) this times
+#
+#   load   read the bytes and decode, as load_cache_from_file does
+#   save   encode and write through atomic_write_bytes (temp file + fsync + rename)
+#
+# under the stdlib json codec and orjson when it is installed, e.g.:
+#
+#   python tools/json_codec_benchmark.py --repeats 20
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_DIR, 'src'))
+
+import functions as funcs  # noqa: E402
+
+
+def available_codecs():
+    codecs = [funcs.StdlibJsonCodec()]
+    try:
+        codecs.append(funcs.OrjsonCodec())
+    except ImportError:
+        pass
+    return codecs
+
+
+def _median_ms(fn, repeats):
+    runs = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn()
+        runs.append((time.perf_counter() - started) * 1000.0)
+    return statistics.median(runs)
+
+
+def benchmark_file(path, codecs, repeats, scratch_dir):
+    with open(path, 'rb') as f:
+        data = funcs.StdlibJsonCodec().loads(f.read())
+    target = os.path.join(scratch_dir, os.path.basename(path))
+    rows = []
+    for codec in codecs:
+        def _load():
+            with open(path, 'rb') as f:
+                codec.loads(f.read())
+
+        def _save():
+            funcs.atomic_write_bytes(target, codec.dumps(data))
+
+        rows.append({'file': os.path.basename(path), 'codec': codec.name,
+                     'size_kb': os.path.getsize(path) / 1024.0,
+                     'load_ms': _median_ms(_load, repeats), 'save_ms': _median_ms(_save, repeats)})
+    return rows
+
+
+def format_results(rows, repeats):
+    lines = [f"--- Cache JSON codec benchmark (median of {repeats}) ---",
+             f"{'file':<40} {'KiB':>8} {'codec':<7} {'load ms':>9} {'save ms':>9} {'vs json':>8}"]
+    baseline = {}
+    for r in rows:
+        if r['codec'] == 'json':
+            baseline[r['file']] = r['load_ms'] + r['save_ms']
+        total = r['load_ms'] + r['save_ms']
+        speedup = baseline.get(r['file'], total) / total if total else 1.0
+        lines.append(f"{r['file']:<40} {r['size_kb']:>8.0f} {r['codec']:<7} {r['load_ms']:>9.2f} "
+                     f"{r['save_ms']:>9.2f} {speedup:>7.1f}x")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare cache load/save times per JSON codec")
+    parser.add_argument('--cache-dir', default=os.path.join(REPO_DIR, 'cache'),
+                        help="Directory whose *.json files are benchmarked")
+    parser.add_argument('--repeats', type=int, default=10)
+    args = parser.parse_args()
+
+    codecs = available_codecs()
+    if len(codecs) == 1:
+        print("orjson is not installed; only the stdlib codec is measured")
+    paths = sorted(glob.glob(os.path.join(args.cache_dir, '*.json')))
+    with tempfile.TemporaryDirectory() as scratch:
+        rows = [row for path in paths for row in benchmark_file(path, codecs, args.repeats, scratch)]
+    print(format_results(rows, args.repeats))
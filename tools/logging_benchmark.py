@@ -0,0 +1,149 @@
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+# Main-thread cost of logging during a simulated refresh cycle.
+#
+# Replays the log traffic of one dashboard refresh (weather, launches,
+# trajectory, Wi-Fi and QML warnings) through two configurations:
+#
+#   sync   the old setup: FileHandler + stdout StreamHandler, one write and
+#          flush per record on the calling thread
+#   async  setup_dashboard_logging's QueueHandler -> AsyncLogWriter pipeline
+#
+# and reports how long the *calling* thread spent inside logging calls.
+# --flush-delay-ms adds a sleep to every flush to stand in for SD-card write
+# latency on the Pi, e.g.:
+#
+#   python tools/logging_benchmark.py --cycles 50 --flush-delay-ms 2
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+sys.path.insert(0, SRC_DIR)
+
+import functions as funcs  # noqa: E402
+
+# (logger name, level, message, args) for one refresh cycle
+REFRESH_CYCLE = [
+    ('functions', logging.INFO, "Fetching weather for %s via new API", ("Starbase",)),
+    ('functions', logging.INFO, "Fetching weather for %s via new API", ("Vandy",)),
+    ('functions', logging.INFO, "Fetching weather for %s via new API", ("Cape",)),
+    ('functions', logging.INFO, "Fetching weather for %s via new API", ("Hawthorne",)),
+    ('functions', logging.INFO, "Fetched and cached weather for %d locations", (4,)),
+    ('functions', logging.INFO, "Fetched %d upcoming and %d previous launches from API", (38, 120)),
+    ('functions', logging.INFO, "Combined with history: total %d upcoming and %d previous", (38, 1420)),
+    ('__main__', logging.INFO, "Scheduled trajectory recompute (debounced)", ()),
+    ('__main__', logging.INFO, "Computing launch trajectory in background…", ()),
+    ('functions', logging.INFO, "Trajectory cache miss for %s; generating new trajectory", ("Starlink 12-3",)),
+    ('functions', logging.INFO, "Generated ASDS booster trajectory (info: %s)", ("OCISLY",)),
+    ('__main__', logging.INFO, "Trajectory loaded for %s: %d points", ("Starlink 12-3", 360)),
+    ('__main__', logging.INFO, "WiFi status updated - Connected: %s, SSID: %s", (True, "HomeNet")),
+    ('qt', logging.ERROR, "[QT-QtWarningMsg] qrc:/qml/Main.qml:%d Binding loop detected", (812,)),
+    ('functions', logging.DEBUG, "Returning cached network connectivity result: %s", (True,)),
+]
+
+
+class SlowStream:
+    """File wrapper whose flush sleeps, standing in for SD-card write latency."""
+
+    def __init__(self, stream, delay_s):
+        self._stream = stream
+        self._delay_s = delay_s
+
+    def write(self, text):
+        return self._stream.write(text)
+
+    def flush(self):
+        self._stream.flush()
+        if self._delay_s:
+            time.sleep(self._delay_s)
+
+    def close(self):
+        self._stream.close()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def _reset_root():
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+
+
+def configure_sync(log_dir, delay_s):
+    _reset_root()
+    file_handler = logging.FileHandler(os.path.join(log_dir, 'sync.log'), mode='w', encoding='utf-8')
+    file_handler.stream = SlowStream(file_handler.stream, delay_s)
+    # On the Pi stdout is redirected into the log file as well
+    console = logging.StreamHandler(SlowStream(open(os.path.join(log_dir, 'sync.stdout'), 'w'), delay_s))
+    logging.basicConfig(level=logging.INFO, format=funcs.LOG_FORMAT, handlers=[file_handler, console], force=True)
+    return None
+
+
+def configure_async(log_dir, delay_s):
+    _reset_root()
+    stdout = SlowStream(open(os.path.join(log_dir, 'async.stdout'), 'w'), delay_s)
+    writer = funcs.install_async_logging(os.path.join(log_dir, 'async.log'), level=logging.INFO,
+                                         max_bytes=64 * 1024 * 1024, stream=stdout)
+    for handler in writer.handlers:
+        if isinstance(handler, logging.FileHandler):
+            handler.stream = SlowStream(handler.stream, delay_s)
+    return writer
+
+
+def run_cycles(cycles):
+    """Replay REFRESH_CYCLE and return a histogram of per-call latency (ms)."""
+    loggers = {name: logging.getLogger(name) for name, _, _, _ in REFRESH_CYCLE}
+    histogram = funcs.LatencyHistogram()
+    for _ in range(cycles):
+        for name, level, message, args in REFRESH_CYCLE:
+            started = time.perf_counter()
+            loggers[name].log(level, message, *args)
+            histogram.record((time.perf_counter() - started) * 1000.0)
+    return histogram
+
+
+def benchmark(mode, cycles, delay_s):
+    with tempfile.TemporaryDirectory() as log_dir:
+        writer = (configure_async if mode == 'async' else configure_sync)(log_dir, delay_s)
+        started = time.perf_counter()
+        histogram = run_cycles(cycles)
+        calling_ms = (time.perf_counter() - started) * 1000.0
+        drain_started = time.perf_counter()
+        if writer is not None:
+            writer.stop()
+        drain_ms = (time.perf_counter() - drain_started) * 1000.0
+        _reset_root()
+        stats = histogram.stats()
+        stats.update({'mode': mode, 'calling_ms': calling_ms, 'drain_ms': drain_ms,
+                      # the sync handlers flush after every record they write
+                      'flushes': writer.flushes if writer is not None else None})
+        return stats
+
+
+def format_results(results, cycles):
+    lines = [f"--- Logging benchmark ({cycles} refresh cycles, {len(REFRESH_CYCLE)} log calls each) ---",
+             f"{'mode':<6} {'caller ms':>10} {'per cycle':>10} {'p50 us':>8} {'p95 us':>8} "
+             f"{'max ms':>8} {'flushes':>8} {'drain ms':>9}"]
+    for r in results:
+        lines.append(f"{r['mode']:<6} {r['calling_ms']:>10.1f} {r['calling_ms'] / cycles:>10.3f} "
+                     f"{r['p50_ms'] * 1000:>8.1f} {r['p95_ms'] * 1000:>8.1f} {r['max_ms']:>8.2f} "
+                     f"{'per rec' if r['flushes'] is None else r['flushes']:>8} {r['drain_ms']:>9.1f}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure caller-thread time spent in logging calls")
+    parser.add_argument('--cycles', type=int, default=200, help="Simulated refresh cycles")
+    parser.add_argument('--flush-delay-ms', type=float, default=0.0,
+                        help="Sleep added to every flush to emulate slow storage")
+    parser.add_argument('--mode', choices=['sync', 'async', 'both'], default='both')
+    args = parser.parse_args()
+
+    modes = ['sync', 'async'] if args.mode == 'both' else [args.mode]
+    results = [benchmark(mode, args.cycles, args.flush_delay_ms / 1000.0) for mode in modes]
+    print(format_results(results, args.cycles))
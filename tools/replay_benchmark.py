@@ -0,0 +1,495 @@
+import argparse
+import contextlib
+import http.server
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from urllib.parse import unquote
+
+import pytz
+
+# Replay benchmark for the non-UI refresh pipeline.
+#
+# Serves /launches, /weather_all, /weather/<loc>, /recent_launches_narratives
+# and /launch_details/<id> from a local stand-in of the launch API, points
+# functions.py at it (and at a scratch cache directory), then times the stages
+# a dashboard refresh goes through with the launch history scaled up
+# synthetically (1x, 10x, 100x by default):
+#
+#   full_load            perform_full_dashboard_data_load, caches cold
+#   fetch_launches_merge fetch_launches merging the API window into history
+#   group_event_data     upcoming and previous groupings
+#   calendar_mapping     get_calendar_mapping
+#   trends               get_launch_trends_series (actual and cumulative)
+#   trajectory           get_launch_trajectory_data, trajectory cache cold
+#   launch_details       fetch_launch_details + parse_launch_data
+#
+# Responses are built from cache/previous_launches_cache.json unless --fixtures
+# points at a directory recorded from the live API with --record.  Results are
+# written as JSON; pass an earlier run as --baseline to fail (exit 1) when a
+# stage's median slows down by more than --threshold, e.g.:
+#
+#   python tools/replay_benchmark.py --output bench/base.json
+#   python tools/replay_benchmark.py --baseline bench/base.json --threshold 0.25
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(REPO_DIR, 'src')
+sys.path.insert(0, SRC_DIR)
+
+import functions as funcs  # noqa: E402
+
+RESULTS_SCHEMA = 1
+DEFAULT_SCALES = (1, 10, 100)
+DEFAULT_REPEATS = 5
+DEFAULT_THRESHOLD = 0.25
+# Stages faster than this are dominated by timer noise and never flagged
+DEFAULT_NOISE_FLOOR_MS = 2.0
+API_PREVIOUS_WINDOW = 100   # previous launches the API returns per call
+UPCOMING_COUNT = 40
+NARRATIVE_COUNT = 60
+LOCATIONS = list(funcs.location_settings)
+
+# Files written by a recording, relative to the fixtures directory
+FIXTURE_FILES = {
+    'launches': 'launches.json',
+    'weather_all': 'weather_all.json',
+    'narratives': 'recent_launches_narratives.json',
+}
+FIXTURE_DETAILS_DIR = 'launch_details'
+
+# Module attributes redirected into the scratch directory while benchmarking
+CACHE_ATTRS = {
+    'RUNTIME_CACHE_FILE_LAUNCHES': 'launches_cache.json',
+    'RUNTIME_CACHE_FILE_NARRATIVES': 'narratives_cache.json',
+    'RUNTIME_CACHE_FILE_PARSED_DATES': 'parsed_dates_cache.json',
+    'CACHE_FILE_WEATHER': 'weather_cache.json',
+    'TRAJECTORY_CACHE_FILE': 'trajectory_cache.json',
+    'SEED_CACHE_FILE_PREVIOUS': 'seed_previous.json',
+    'SEED_CACHE_FILE_UPCOMING': 'seed_upcoming.json',
+}
+
+
+# --- Fixtures ---
+def to_api_launch(launch, launch_id):
+    """Turn a parsed launch back into the raw shape the /launches endpoint returns."""
+    raw = {
+        'id': launch_id,
+        'name': launch.get('mission', 'Unknown'),
+        'net': launch.get('net'),
+        'status': {'name': launch.get('status', 'Unknown')},
+        'rocket': {'configuration': {'name': launch.get('rocket', 'Unknown')}},
+        'mission': {'orbit': {'name': launch.get('orbit', 'Unknown')}},
+        'pad': {'name': launch.get('pad', 'Unknown')},
+        'vidURLs': [{'url': launch['video_url']}] if launch.get('video_url') else [],
+    }
+    if launch.get('landing_type') or launch.get('landing_location'):
+        raw['rocket']['launcher_stage'] = [{'landing': {
+            'type': {'name': launch.get('landing_type')},
+            'location': {'name': launch.get('landing_location')},
+        }}]
+    return raw
+
+
+def scale_history(history, scale):
+    """Replicate the history scale times with unique ids and staggered launch times.
+
+    Each copy lands a few minutes before the original, so calendar and trend
+    buckets grow denser rather than reaching back past year 1.
+    """
+    scaled = []
+    for copy in range(scale):
+        offset = timedelta(minutes=7 * copy)
+        for index, launch in enumerate(history):
+            dt = funcs._get_parsed_dt(launch.get('net'))
+            if dt is None:
+                continue
+            net = (dt - offset).strftime('%Y-%m-%dT%H:%M:%SZ')
+            scaled.append(dict(launch, id=launch.get('id') or f"hist-{index}", net=net,
+                               date=net[:10], time=net[11:19]))
+            if copy:
+                scaled[-1]['id'] = f"{scaled[-1]['id']}-x{copy}"
+    scaled.sort(key=lambda l: l['net'], reverse=True)
+    return scaled
+
+
+def synth_upcoming(history, now, count=UPCOMING_COUNT):
+    """Upcoming manifest: recent missions re-flown every ~2 days from now."""
+    upcoming = []
+    for index, launch in enumerate(history[:count]):
+        net = (now + timedelta(days=2 * index, hours=3)).strftime('%Y-%m-%dT%H:%M:%SZ')
+        upcoming.append(dict(launch, id=f"up-{index}", net=net, date=net[:10], time=net[11:19],
+                             status='Go for Launch'))
+    return upcoming
+
+
+def synth_weather(now):
+    days = [(now + timedelta(days=d)).strftime('%Y-%m-%d') for d in range(7)]
+    hours = [f"{day}T{h:02d}:00" for day in days for h in range(24)]
+    weather = {}
+    for n, loc in enumerate(LOCATIONS):
+        weather[loc] = {
+            'temperature_c': 24.0 + n, 'temperature_f': funcs.c_to_f(24.0 + n),
+            'wind_speed_ms': 5.0, 'wind_speed_kts': 9.7, 'wind_direction': 90 + 30 * n,
+            'cloud_cover': 40,
+            'forecast': {
+                'daily': {
+                    'time': days,
+                    'temperature_2m_max': [28.0 + (d % 3) for d in range(7)],
+                    'temperature_2m_min': [19.0 + (d % 2) for d in range(7)],
+                    'weathercode': [(0, 1, 2, 3, 61, 80, 95)[d] for d in range(7)],
+                },
+                'hourly': {
+                    'time': hours,
+                    'temperature_2m': [20.0 + (h % 24) / 3 for h in range(len(hours))],
+                    'windspeed_10m': [8.0 + (h % 12) for h in range(len(hours))],
+                    'winddirection_10m': [(45 * h) % 360 for h in range(len(hours))],
+                },
+            },
+        }
+    return weather
+
+
+def synth_narratives(history, count=NARRATIVE_COUNT):
+    descriptions = []
+    for launch in history[:count]:
+        dt = funcs._get_parsed_dt(launch.get('net'))
+        if dt is None:
+            continue
+        descriptions.append(f"{dt.month}/{dt.day} {dt.strftime('%H%M')}: {launch.get('mission')} "
+                            f"lifts off from {launch.get('pad')} to {launch.get('orbit')}.")
+    return descriptions
+
+
+def load_seed_history():
+    cache = funcs.load_cache_from_file(os.path.join(REPO_DIR, 'cache', 'previous_launches_cache.json'))
+    return list(cache['data']) if cache and isinstance(cache.get('data'), list) else []
+
+
+def build_fixtures(scale, now=None, recorded_dir=None):
+    """Return the stand-in API responses plus the on-disk history for one scale."""
+    now = now or datetime.now(pytz.UTC)
+    base_history = load_seed_history()
+    recorded = load_recorded(recorded_dir) if recorded_dir else {}
+
+    if 'launches' in recorded:
+        api_upcoming = recorded['launches'].get('upcoming', [])
+        api_previous = recorded['launches'].get('previous', [])
+        base_history = [funcs.parse_launch_data(l) for l in api_previous] + base_history
+    history = scale_history(base_history, scale)
+    if 'launches' not in recorded:
+        api_upcoming = [to_api_launch(l, l['id']) for l in synth_upcoming(history, now)]
+        api_previous = [to_api_launch(l, l['id']) for l in history[:API_PREVIOUS_WINDOW]]
+
+    details = dict(recorded.get('launch_details', {}))
+    for raw in api_upcoming[:3]:
+        details.setdefault(str(raw.get('id')), raw)
+
+    return {
+        'launches': {'upcoming': api_upcoming, 'previous': api_previous},
+        'weather_all': recorded.get('weather_all') or {'weather': synth_weather(now)},
+        'narratives': recorded.get('narratives') or {'descriptions': synth_narratives(history)},
+        'launch_details': details,
+        'history': history,
+    }
+
+
+def load_recorded(fixtures_dir):
+    recorded = {}
+    for key, name in FIXTURE_FILES.items():
+        path = os.path.join(fixtures_dir, name)
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                recorded[key] = json.load(f)
+    details_dir = os.path.join(fixtures_dir, FIXTURE_DETAILS_DIR)
+    if os.path.isdir(details_dir):
+        recorded['launch_details'] = {}
+        for name in sorted(os.listdir(details_dir)):
+            with open(os.path.join(details_dir, name), 'r', encoding='utf-8') as f:
+                recorded['launch_details'][os.path.splitext(name)[0]] = json.load(f)
+    return recorded
+
+
+def record_fixtures(fixtures_dir, details=3):
+    """Save live API responses so later runs replay the same payloads."""
+    requests = funcs.requests
+    base = funcs.LAUNCH_API_BASE_URL
+    os.makedirs(os.path.join(fixtures_dir, FIXTURE_DETAILS_DIR), exist_ok=True)
+    payloads = {}
+    for key, endpoint in (('launches', 'launches'), ('weather_all', 'weather_all'),
+                          ('narratives', 'recent_launches_narratives')):
+        response = requests.get(f"{base}/{endpoint}", timeout=30)
+        response.raise_for_status()
+        payloads[key] = response.json()
+        with open(os.path.join(fixtures_dir, FIXTURE_FILES[key]), 'w', encoding='utf-8') as f:
+            json.dump(payloads[key], f)
+    for raw in payloads['launches'].get('upcoming', [])[:details]:
+        detail = funcs.fetch_launch_details(raw.get('id'))
+        if detail:
+            with open(os.path.join(fixtures_dir, FIXTURE_DETAILS_DIR, f"{raw['id']}.json"), 'w',
+                      encoding='utf-8') as f:
+                json.dump(detail, f)
+    return payloads
+
+
+# --- Stand-in API ---
+class StandInAPI:
+    """Threaded local HTTP server answering the launch API endpoints from fixtures."""
+
+    def __init__(self, fixtures):
+        self.requests = {}
+        self._routes = {
+            '/launches': json.dumps(fixtures['launches']).encode('utf-8'),
+            '/weather_all': json.dumps(fixtures['weather_all']).encode('utf-8'),
+            '/recent_launches_narratives': json.dumps(fixtures['narratives']).encode('utf-8'),
+            '/health': b'{}',
+        }
+        for loc, loc_weather in fixtures['weather_all'].get('weather', {}).items():
+            self._routes[f"/weather/{loc}"] = json.dumps(loc_weather).encode('utf-8')
+        for launch_id, detail in fixtures['launch_details'].items():
+            self._routes[f"/launch_details/{launch_id}"] = json.dumps(detail).encode('utf-8')
+
+        api = self
+
+        class _Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                path = unquote(self.path.split('?', 1)[0])
+                api.requests[path] = api.requests.get(path, 0) + 1
+                body = api._routes.get(path)
+                self.send_response(200 if body is not None else 404)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body or b'')))
+                self.end_headers()
+                self.wfile.write(body or b'')
+
+            def log_message(self, *args):
+                pass
+
+        self._server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@contextlib.contextmanager
+def replay_environment(fixtures, scratch_dir):
+    """Point functions.py at the stand-in API and a scratch cache directory."""
+    saved = {name: getattr(funcs, name) for name in list(CACHE_ATTRS) + ['LAUNCH_API_BASE_URL']}
+    saved_date_cache = (dict(funcs._DATE_PARSE_CACHE), funcs._DATE_PARSE_CACHE_LOADED)
+    api = StandInAPI(fixtures).start()
+    try:
+        for name, filename in CACHE_ATTRS.items():
+            setattr(funcs, name, os.path.join(scratch_dir, filename))
+        funcs.LAUNCH_API_BASE_URL = api.url
+        funcs.save_cache_to_file(funcs.SEED_CACHE_FILE_PREVIOUS, fixtures['history'], datetime.now(pytz.UTC))
+        funcs._DATE_PARSE_CACHE_LOADED = True
+        funcs.set_connectivity_probe_targets([f"{api.url}/health"])
+        yield api
+    finally:
+        api.stop()
+        # Write-behind saves still target the scratch directory
+        funcs.cache_writer.flush()
+        for name, value in saved.items():
+            setattr(funcs, name, value)
+        funcs._DATE_PARSE_CACHE.clear()
+        funcs._DATE_PARSE_CACHE.update(saved_date_cache[0])
+        funcs._DATE_PARSE_CACHE_LOADED = saved_date_cache[1]
+        funcs._TRAJECTORY_DATA_CACHE = None
+        funcs.set_connectivity_probe_targets(None)
+
+
+def _remove(*paths):
+    for path in paths:
+        funcs.cache_writer.discard(path)
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(path)
+
+
+# --- Timing ---
+def time_stage(fn, repeats, setup=None):
+    """Run fn repeats times (after setup, untimed) and return wall times in ms."""
+    runs = []
+    for _ in range(repeats):
+        if setup:
+            setup()
+        started = time.perf_counter()
+        fn()
+        runs.append((time.perf_counter() - started) * 1000.0)
+    return runs
+
+
+def summarize(runs):
+    return {
+        'median_ms': round(statistics.median(runs), 3),
+        'min_ms': round(min(runs), 3),
+        'max_ms': round(max(runs), 3),
+        'runs': len(runs),
+    }
+
+
+def run_scale(scale, repeats, recorded_dir=None):
+    """Time every stage for one history scale and return {stage: summary}."""
+    fixtures = build_fixtures(scale, recorded_dir=recorded_dir)
+    tz = pytz.timezone(funcs.location_settings['Starbase']['timezone'])
+    now = datetime.now(tz)
+    stages = {}
+    with tempfile.TemporaryDirectory() as scratch, replay_environment(fixtures, scratch):
+        def _cold_caches():
+            _remove(funcs.RUNTIME_CACHE_FILE_LAUNCHES, funcs.RUNTIME_CACHE_FILE_NARRATIVES,
+                    funcs.CACHE_FILE_WEATHER)
+
+        def _cold_trajectory():
+            _remove(funcs.TRAJECTORY_CACHE_FILE)
+            funcs._TRAJECTORY_DATA_CACHE = None
+
+        stages['full_load'] = time_stage(
+            lambda: funcs.perform_full_dashboard_data_load(LOCATIONS, tz_obj=tz), repeats, setup=_cold_caches)
+        stages['fetch_launches_merge'] = time_stage(
+            funcs.fetch_launches, repeats, setup=lambda: _remove(funcs.RUNTIME_CACHE_FILE_LAUNCHES))
+
+        launch_data = funcs.fetch_launches()
+        upcoming, previous = launch_data['upcoming'], launch_data['previous']
+        stages['group_event_data.upcoming'] = time_stage(
+            lambda: funcs.group_event_data(launch_data, 'spacex', 'upcoming', tz), repeats)
+        stages['group_event_data.previous'] = time_stage(
+            lambda: funcs.group_event_data(launch_data, 'spacex', 'previous', tz), repeats)
+        stages['calendar_mapping'] = time_stage(
+            lambda: funcs.get_calendar_mapping(launch_data, tz_obj=tz), repeats)
+        for mode in ('actual', 'cumulative'):
+            stages[f"trends.{mode}"] = time_stage(
+                lambda mode=mode: funcs.get_launch_trends_series(previous, mode, now.year, now.month), repeats)
+        stages['trajectory'] = time_stage(
+            lambda: funcs.get_launch_trajectory_data(upcoming, previous), repeats, setup=_cold_trajectory)
+        narratives = funcs.fetch_narratives()
+
+        def _cold_narrative_memo():
+            funcs._narrative_index_memo.update(version=None, index=None)
+            funcs._enriched_narratives_memo.update(key=None, data=None)
+
+        stages['enrich_narratives'] = time_stage(
+            lambda: funcs.enrich_narratives(narratives, launch_data), repeats, setup=_cold_narrative_memo)
+        detail_id = next(iter(fixtures['launch_details']), None)
+        stages['launch_details'] = time_stage(
+            lambda: funcs.parse_launch_data(funcs.fetch_launch_details(detail_id) or {}, is_detailed=True),
+            repeats)
+
+    return {
+        'sizes': {'history': len(fixtures['history']), 'previous': len(previous), 'upcoming': len(upcoming)},
+        'stages': {name: summarize(runs) for name, runs in stages.items()},
+    }
+
+
+def _git_commit():
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_DIR,
+                                capture_output=True, text=True, timeout=5)
+        return result.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run_benchmark(scales=DEFAULT_SCALES, repeats=DEFAULT_REPEATS, recorded_dir=None):
+    return {
+        'schema': RESULTS_SCHEMA,
+        'created': datetime.now(pytz.UTC).isoformat(),
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'repeats': repeats,
+        'fixtures': 'recorded' if recorded_dir else 'synthetic',
+        'scales': {f"{scale}x": run_scale(scale, repeats, recorded_dir) for scale in scales},
+    }
+
+
+def compare_results(baseline, current, threshold=DEFAULT_THRESHOLD, noise_floor_ms=DEFAULT_NOISE_FLOOR_MS):
+    """Return stages whose median slowed down by more than threshold (a fraction)."""
+    regressions = []
+    for scale, result in current.get('scales', {}).items():
+        base_stages = baseline.get('scales', {}).get(scale, {}).get('stages', {})
+        for stage, summary in result['stages'].items():
+            base = base_stages.get(stage)
+            if not base:
+                continue
+            before, after = base['median_ms'], summary['median_ms']
+            if after < noise_floor_ms or after <= before * (1.0 + threshold):
+                continue
+            regressions.append({'scale': scale, 'stage': stage, 'baseline_ms': before, 'current_ms': after,
+                                'change': (after - before) / before if before else float('inf')})
+    return regressions
+
+
+def format_results(results, regressions=None):
+    lines = [f"--- Replay benchmark ({results['fixtures']} fixtures, {results['repeats']} runs/stage, "
+             f"commit {results.get('commit') or 'unknown'}) ---"]
+    stage_names = []
+    for result in results['scales'].values():
+        stage_names.extend(s for s in result['stages'] if s not in stage_names)
+    scales = list(results['scales'])
+    lines.append(f"{'stage (median ms)':<28}" + "".join(f"{s:>12}" for s in scales))
+    lines.append(f"{'previous launches':<28}" + "".join(
+        f"{results['scales'][s]['sizes']['previous']:>12}" for s in scales))
+    for stage in stage_names:
+        lines.append(f"{stage:<28}" + "".join(
+            f"{results['scales'][s]['stages'].get(stage, {}).get('median_ms', float('nan')):>12.2f}" for s in scales))
+    if regressions is not None:
+        if not regressions:
+            lines.append("\nNo regressions against baseline.")
+        for r in regressions:
+            lines.append(f"REGRESSION {r['scale']} {r['stage']}: {r['baseline_ms']:.2f} -> "
+                         f"{r['current_ms']:.2f} ms (+{r['change'] * 100:.0f}%)")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time the refresh pipeline against a local stand-in API")
+    parser.add_argument('--scales', default=",".join(str(s) for s in DEFAULT_SCALES),
+                        help="Comma-separated history multipliers (default: 1,10,100)")
+    parser.add_argument('--repeats', type=int, default=DEFAULT_REPEATS, help="Timed runs per stage")
+    parser.add_argument('--output', help="Write results JSON here")
+    parser.add_argument('--baseline', help="Results JSON from an earlier commit to compare against")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed median slowdown as a fraction (default: 0.25)")
+    parser.add_argument('--fixtures', help="Replay responses recorded with --record instead of synthetic ones")
+    parser.add_argument('--record', metavar='DIR', help="Record live API responses into DIR and exit")
+    args = parser.parse_args()
+
+    if args.record:
+        record_fixtures(args.record)
+        print(f"Recorded API fixtures to {args.record}")
+        sys.exit(0)
+
+    # The pipeline logs every fetch at INFO; keep that out of the timings
+    logging.basicConfig(level=logging.WARNING)
+    results = run_benchmark([int(s) for s in args.scales.split(',') if s.strip()], args.repeats, args.fixtures)
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+    regressions = None
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare_results(json.load(f), results, args.threshold)
+    print(format_results(results, regressions))
+    sys.exit(1 if regressions else 0)
@@ -1,22 +1,56 @@
 from PIL import Image
+import argparse
+import json
 import os
+import shutil
+import subprocess
 import sys
 
+# Texture build pipeline for globe.html.
+#
+# The default run produces, for the earth and cloud textures:
+#   * a complete power-of-two mip chain (level 0 down to 1x1) so the browser
+#     never has to resize a non-power-of-two image or generate mipmaps itself
+#   * an optional KTX2 (Basis Universal) file when `toktx` is installed
+#   * assets/images/textures/manifest.json describing what was built
+#
+# globe.html reads the manifest in loadEarthTexture() and picks the best
+# format the GPU/browser supports, falling back to the legacy JPEG tiles and
+# finally to the single JPEG.
+
+MANIFEST_VERSION = 1
+# 4096 is the hardware texture limit for Pi 4/5
+DEFAULT_MAX_SIZE = 4096
+
+TEXTURE_SOURCES = {
+    'earth': {
+        'inputs': ['assets/images/earth_texture_hd.jpg', 'assets/images/earth_texture.jpg'],
+        'format': 'JPEG',
+        'ext': 'jpg',
+    },
+    'clouds': {
+        'inputs': ['assets/images/earth_clouds_1024.png'],
+        'format': 'PNG',
+        'ext': 'png',
+    },
+}
+
+
 def tile_image(input_path, output_dir, tiles_x, tiles_y, target_size=None):
     if not os.path.exists(input_path):
         print(f"Error: Input {input_path} not found")
         return
-    
+
     os.makedirs(output_dir, exist_ok=True)
-    
+
     # Disable DecompressionBombError for very large images
     Image.MAX_IMAGE_PIXELS = None
-    
+
     print(f"Opening {input_path}...")
     with Image.open(input_path) as img:
         original_size = img.size
         print(f"Original size: {original_size}")
-        
+
         # If target_size is provided, resize the image first
         if target_size:
             print(f"Resizing to {target_size}...")
@@ -24,12 +58,12 @@ def tile_image(input_path, output_dir, tiles_x, tiles_y, target_size=None):
             width, height = target_size
         else:
             width, height = original_size
-            
+
         tile_width = width // tiles_x
         tile_height = height // tiles_y
-        
+
         print(f"Slicing into {tiles_x}x{tiles_y} tiles (approx {tile_width}x{tile_height} each)...")
-        
+
         for y in range(tiles_y):
             for x in range(tiles_x):
                 left = x * tile_width
@@ -37,33 +71,168 @@ def tile_image(input_path, output_dir, tiles_x, tiles_y, target_size=None):
                 # Ensure the last tile covers the remaining pixels
                 right = (x + 1) * tile_width if x < tiles_x - 1 else width
                 bottom = (y + 1) * tile_height if y < tiles_y - 1 else height
-                
+
                 tile = img.crop((left, top, right, bottom))
                 output_path = os.path.join(output_dir, f"tile_{x}_{y}.jpg")
                 tile.save(output_path, quality=90, optimize=True)
                 print(f"Saved {output_path} ({tile.size})")
 
+
+def floor_power_of_two(value):
+    """Largest power of two that is <= value (minimum 1)."""
+    value = max(1, int(value))
+    return 1 << (value.bit_length() - 1)
+
+
+def mip_chain_sizes(width, height):
+    """Return every (w, h) level from the given size down to 1x1.
+
+    WebGL1 only treats a mipmapped texture as complete when the chain reaches
+    1x1, so the chain is never truncated.
+    """
+    sizes = [(width, height)]
+    while width > 1 or height > 1:
+        width = max(1, width // 2)
+        height = max(1, height // 2)
+        sizes.append((width, height))
+    return sizes
+
+
+def base_level_size(width, height, max_size=DEFAULT_MAX_SIZE):
+    """Power-of-two level-0 size for a width x height source.
+
+    The long edge is clamped to max_size and the short edge follows the source
+    aspect, so a 2:1 equirectangular map stays 2:1 (e.g. 21600x10800 -> 4096x2048).
+    """
+    long_edge, short_edge = max(width, height), min(width, height)
+    base_long = min(floor_power_of_two(long_edge), floor_power_of_two(max_size))
+    base_short = floor_power_of_two(short_edge * base_long / long_edge)
+    return (base_long, base_short) if width >= height else (base_short, base_long)
+
+
+def build_mip_chain(input_path, output_dir, name, image_format, ext, max_size=DEFAULT_MAX_SIZE):
+    """Write a power-of-two mip chain for input_path and return its manifest levels."""
+    Image.MAX_IMAGE_PIXELS = None
+    os.makedirs(output_dir, exist_ok=True)
+
+    levels = []
+    with Image.open(input_path) as img:
+        # Keep alpha for the cloud layer, flatten everything else to RGB for JPEG
+        img = img.convert('RGBA' if image_format == 'PNG' else 'RGB')
+        base_w, base_h = base_level_size(img.width, img.height, max_size)
+        print(f"{name}: {img.size} -> mip chain from {base_w}x{base_h}")
+
+        # Each level is downsampled from the previous one; LANCZOS on halving
+        # steps keeps quality while avoiding a full-resolution resample per level.
+        current = img.resize((base_w, base_h), Image.Resampling.LANCZOS)
+        for index, (w, h) in enumerate(mip_chain_sizes(base_w, base_h)):
+            if current.size != (w, h):
+                current = current.resize((w, h), Image.Resampling.LANCZOS)
+            file_name = f"{name}_{index:02d}_{w}x{h}.{ext}"
+            output_path = os.path.join(output_dir, file_name)
+            if image_format == 'JPEG':
+                current.save(output_path, 'JPEG', quality=88, optimize=True)
+            else:
+                current.save(output_path, 'PNG', optimize=True)
+            levels.append({
+                'file': file_name,
+                'width': w,
+                'height': h,
+                'bytes': os.path.getsize(output_path),
+            })
+    print(f"{name}: wrote {len(levels)} mip levels to {output_dir}")
+    return levels
+
+
+def build_ktx2(level0_path, output_path):
+    """Encode a Basis Universal KTX2 file with mipmaps using KTX-Software's toktx.
+
+    Returns the manifest entry, or None when toktx is not installed or fails.
+    """
+    toktx = shutil.which('toktx')
+    if not toktx:
+        print("toktx not found; skipping KTX2 output (install KTX-Software to enable)")
+        return None
+    cmd = [toktx, '--t2', '--encode', 'etc1s', '--genmipmap', '--lower_left_maps_to_s0t0',
+           output_path, level0_path]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        print(f"toktx failed for {level0_path}: {result.stderr.strip()}")
+        return None
+    print(f"Saved {output_path}")
+    return {
+        'file': os.path.basename(output_path),
+        'encoding': 'etc1s',
+        'bytes': os.path.getsize(output_path),
+    }
+
+
+def build_textures(output_root, max_size=DEFAULT_MAX_SIZE, with_ktx2=True):
+    """Build every texture in TEXTURE_SOURCES and write output_root/manifest.json."""
+    os.makedirs(output_root, exist_ok=True)
+    manifest = {'version': MANIFEST_VERSION, 'textures': {}}
+
+    for name, spec in TEXTURE_SOURCES.items():
+        input_path = next((p for p in spec['inputs'] if os.path.exists(p)), None)
+        if not input_path:
+            print(f"Error: no source found for {name} (tried {', '.join(spec['inputs'])})")
+            continue
+
+        levels = build_mip_chain(input_path, os.path.join(output_root, name), name,
+                                 spec['format'], spec['ext'], max_size=max_size)
+        entry = {
+            'source': os.path.basename(input_path),
+            'width': levels[0]['width'],
+            'height': levels[0]['height'],
+            'formats': {
+                'mips': {'dir': name, 'levels': levels},
+            },
+        }
+        if with_ktx2:
+            level0 = os.path.join(output_root, name, levels[0]['file'])
+            ktx2 = build_ktx2(level0, os.path.join(output_root, f"{name}.ktx2"))
+            if ktx2:
+                entry['formats']['ktx2'] = ktx2
+        manifest['textures'][name] = entry
+
+    manifest_path = os.path.join(output_root, 'manifest.json')
+    with open(manifest_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    print(f"Saved {manifest_path}")
+    return manifest
+
+
 if __name__ == "__main__":
-    # Recommended configurations:
-    # 2x1 tiles: 8192x4096 total (128MB VRAM) - Good for 1GB/2GB Pi
-    # 4x2 tiles: 16384x8192 total (512MB VRAM) - Excellent for 4GB/8GB Pi
-    
-    input_file = 'assets/images/earth_texture_hd.jpg'
-    output_folder = 'assets/images/tiles'
-    
-    # Let's upgrade to 4x2 for much higher fidelity
-    tiles_x = 4
-    tiles_y = 2
-    
-    # We resize to exact multiples of the tile count for perfect alignment
-    # 4096 is the hardware limit for Pi 4/5
-    target_w = tiles_x * 4096
-    target_h = tiles_y * 4096
-    
-    # Note: If source is smaller than target, resize() will upscale.
-    # The HD source is 21600x10800, so we are still downscaling slightly to 16384x8192.
-    
-    tile_image(input_file, output_folder, tiles_x, tiles_y, target_size=(target_w, target_h))
-    
-    print(f"\nTiling complete ({tiles_x}x{tiles_y}).")
-    print("Update globe.html with these values to use the new grid.")
+    parser = argparse.ArgumentParser(description="Build globe.html textures (mip chains, KTX2, manifest)")
+    parser.add_argument('--output', default='assets/images/textures', help="Output directory for the build")
+    parser.add_argument('--max-size', type=int, default=DEFAULT_MAX_SIZE, help="Largest mip level edge (power of two)")
+    parser.add_argument('--no-ktx2', action='store_true', help="Skip KTX2 encoding even if toktx is installed")
+    parser.add_argument('--tiles', action='store_true', help="Also rebuild the legacy 4x2 JPEG tiles")
+    args = parser.parse_args()
+
+    if args.max_size != floor_power_of_two(args.max_size):
+        print(f"Error: --max-size must be a power of two (got {args.max_size})")
+        sys.exit(1)
+
+    build_textures(args.output, max_size=args.max_size, with_ktx2=not args.no_ktx2)
+
+    if args.tiles:
+        # Recommended configurations:
+        # 2x1 tiles: 8192x4096 total (128MB VRAM) - Good for 1GB/2GB Pi
+        # 4x2 tiles: 16384x8192 total (512MB VRAM) - Excellent for 4GB/8GB Pi
+        input_file = 'assets/images/earth_texture_hd.jpg'
+        output_folder = 'assets/images/tiles'
+
+        tiles_x = 4
+        tiles_y = 2
+
+        # We resize to exact multiples of the tile count for perfect alignment
+        target_w = tiles_x * 4096
+        target_h = tiles_y * 4096
+
+        # Note: If source is smaller than target, resize() will upscale.
+        # The HD source is 21600x10800, so we are still downscaling slightly to 16384x8192.
+        tile_image(input_file, output_folder, tiles_x, tiles_y, target_size=(target_w, target_h))
+
+        print(f"\nTiling complete ({tiles_x}x{tiles_y}).")
+        print("Update globe.html with these values to use the new grid.")
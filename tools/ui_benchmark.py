@@ -0,0 +1,387 @@
+import argparse
+import contextlib
+import json
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from functools import partial
+
+import pytz
+
+# Offscreen benchmark for the Qt side of the dashboard.
+#
+# Starts Backend and the real QML scene (src/qml/Main.qml) under the offscreen
+# QPA platform, feeds it fixture data served by the replay benchmark's
+# stand-in API, then drives N simulated minutes of the Backend's periodic
+# timers (countdown, clock, Spotify progress, weather, next launch, launches)
+# by calling their slots at their normal cadence.  Between simulated seconds
+# the event loop runs for --tick-ms of real time so bindings re-evaluate and
+# the scene graph renders.  Reported per run:
+#
+#   busy        main-thread time spent in timer slots and event processing
+#   signals     emissions per Backend signal
+#   models      resets / data() calls and time per list model
+#   marshalling Backend property reads through the meta-object (QVariant
+#               round trip) weighted by how often their notify signal fired
+#   repaints    ChartItem.paint calls/time, Canvas paints, rendered frames
+#
+# Needs PyQt6 with QtQuick and QtWebEngine; no display is required, e.g.:
+#
+#   python tools/ui_benchmark.py --minutes 5 --output bench/ui.json
+#   python tools/ui_benchmark.py --minutes 5 --baseline bench/ui.json
+
+os.environ['QT_QPA_PLATFORM'] = 'offscreen'
+
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, TOOLS_DIR)
+
+import replay_benchmark as replay  # noqa: E402
+
+funcs = replay.funcs
+
+DEFAULT_MINUTES = 5
+DEFAULT_TICK_MS = 20
+DEFAULT_WARMUP_S = 3.0
+DEFAULT_THRESHOLD = 0.25
+# Reads timed per property when estimating marshalling cost
+PROPERTY_READ_SAMPLES = 5
+
+# (Backend timer attribute, interval ms, slot) as set up by Backend._setup_timers
+# and Backend.__init__.  Wi-Fi polling, update checks and Spotify API polls are
+# left out: they talk to the system or the internet, not the UI.
+SIMULATED_TIMERS = (
+    ('countdown_timer', 1000, 'update_countdown'),
+    ('_time_timer', 5000, 'update_time'),
+    ('spotify_progress_timer', 1000, '_tick_spotify_progress'),
+    ('weather_timer', 60000, 'update_weather'),
+    ('next_launch_timer', 120000, 'update_next_launch_periodic'),
+    ('launch_timer', funcs.CACHE_REFRESH_INTERVAL_UPCOMING * 1000, 'update_launches_periodic'),
+)
+
+
+def due_timers(second, timers=SIMULATED_TIMERS):
+    """Slots whose timer fires at the end of simulated second `second` (1-based)."""
+    elapsed_ms = second * 1000
+    return [slot for _, interval_ms, slot in timers if elapsed_ms % interval_ms == 0]
+
+
+@contextlib.contextmanager
+def scratch_settings_dir(scratch_dir):
+    """Point every path under functions.CACHE_DIR_F1 (settings, caches, Spotify auth) at scratch_dir."""
+    root = funcs.CACHE_DIR_F1
+    saved = {name: value for name, value in vars(funcs).items()
+             if name.isupper() and isinstance(value, str) and value.startswith(root)}
+    try:
+        for name, value in saved.items():
+            setattr(funcs, name, scratch_dir + value[len(root):])
+        os.makedirs(scratch_dir, exist_ok=True)
+        yield
+    finally:
+        funcs.cache_writer.flush()
+        for name, value in saved.items():
+            setattr(funcs, name, value)
+
+
+class UiProbe:
+    """Counts signals, model traffic and repaints for one Backend + QML scene."""
+
+    def __init__(self, app_module, backend):
+        self.app_module = app_module
+        self.backend = backend
+        self.signals = {}
+        self.models = {}
+        self.canvas_paints = {}
+        self.frames = 0
+        self.busy_ms = 0.0
+        self.ticks = funcs.LatencyHistogram()
+        self._hooked_models = set()
+        self._hook_backend_signals()
+        self._hook_models()
+        backend.eventModelChanged.connect(self._hook_models)
+
+    def _count_signal(self, name, *args):
+        self.signals[name] = self.signals.get(name, 0) + 1
+
+    def _hook_backend_signals(self):
+        pyqtSignal = self.app_module.pyqtSignal
+        for name in dir(type(self.backend)):
+            if isinstance(getattr(type(self.backend), name, None), pyqtSignal):
+                getattr(self.backend, name).connect(partial(self._count_signal, name))
+
+    def _model_stats(self, label):
+        return self.models.setdefault(label, {'resets': 0, 'data_calls': 0, 'data_ms': 0.0})
+
+    def _hook_models(self):
+        QAbstractItemModel = self.app_module.QAbstractListModel
+        for model in list(vars(self.backend).values()):
+            if not isinstance(model, QAbstractItemModel) or id(model) in self._hooked_models:
+                continue
+            self._hooked_models.add(id(model))
+            label = type(model).__name__
+            model.modelReset.connect(lambda label=label: self._count_reset(label))
+
+    def _count_reset(self, label):
+        self._model_stats(label)['resets'] += 1
+
+    def hook_scene(self, window):
+        window.frameSwapped.connect(self._count_frame)
+        for item in window.contentItem().findChildren(self.app_module.QObject):
+            if item.metaObject().className().startswith('QQuickCanvasItem'):
+                label = item.objectName() or f"Canvas@{item.parent().metaObject().className()}"
+                item.painted.connect(partial(self._count_canvas, label))
+
+    def _count_frame(self):
+        self.frames += 1
+
+    def _count_canvas(self, label):
+        self.canvas_paints[label] = self.canvas_paints.get(label, 0) + 1
+
+    def reset(self):
+        self.signals.clear()
+        self.canvas_paints.clear()
+        for stats in self.models.values():
+            stats.update(resets=0, data_calls=0, data_ms=0.0)
+        self.frames = 0
+        self.busy_ms = 0.0
+        self.ticks = funcs.LatencyHistogram()
+
+
+def instrument_classes(app_module, probe_ref):
+    """Wrap the Python overrides Qt calls into (model data(), ChartItem.paint) before any instance exists."""
+    paint_stats = {'calls': 0, 'ms': 0.0}
+
+    def _wrap_data(cls):
+        original = cls.data
+
+        def data(self, index, role=app_module.Qt.ItemDataRole.DisplayRole):
+            started = time.perf_counter()
+            try:
+                return original(self, index, role)
+            finally:
+                probe = probe_ref.get('probe')
+                if probe is not None:
+                    stats = probe._model_stats(cls.__name__)
+                    stats['data_calls'] += 1
+                    stats['data_ms'] += (time.perf_counter() - started) * 1000.0
+        cls.data = data
+
+    for cls in (app_module.EventModel, app_module.WeatherForecastModel):
+        _wrap_data(cls)
+
+    original_paint = app_module.ChartItem.paint
+
+    def paint(self, painter):
+        started = time.perf_counter()
+        try:
+            return original_paint(self, painter)
+        finally:
+            paint_stats['calls'] += 1
+            paint_stats['ms'] += (time.perf_counter() - started) * 1000.0
+    app_module.ChartItem.paint = paint
+    return paint_stats
+
+
+def property_read_costs(backend):
+    """Median ms to read each notifying Backend property through the meta-object, keyed by notify signal."""
+    meta = backend.metaObject()
+    costs = {}
+    for i in range(meta.propertyOffset(), meta.propertyCount()):
+        prop = meta.property(i)
+        if not prop.hasNotifySignal():
+            continue
+        runs = []
+        for _ in range(PROPERTY_READ_SAMPLES):
+            started = time.perf_counter()
+            backend.property(prop.name())
+            runs.append((time.perf_counter() - started) * 1000.0)
+        signal = bytes(prop.notifySignal().name()).decode()
+        costs.setdefault(signal, {})[prop.name()] = statistics.median(runs)
+    return costs
+
+
+def run_event_loop(app, probe, duration_ms):
+    """Process events for duration_ms of real time, adding processing time to probe.busy_ms."""
+    QEventLoop = sys.modules['PyQt6.QtCore'].QEventLoop
+    deadline = time.perf_counter() + duration_ms / 1000.0
+    while True:
+        remaining_ms = int((deadline - time.perf_counter()) * 1000)
+        started = time.perf_counter()
+        app.processEvents(QEventLoop.ProcessEventsFlag.AllEvents, max(remaining_ms, 0))
+        probe.busy_ms += (time.perf_counter() - started) * 1000.0
+        if remaining_ms <= 0:
+            return
+        time.sleep(min(0.002, remaining_ms / 1000.0))
+
+
+def simulate(app, backend, probe, minutes, tick_ms):
+    for second in range(1, int(minutes * 60) + 1):
+        started = time.perf_counter()
+        for slot in due_timers(second):
+            getattr(backend, slot)()
+        slot_ms = (time.perf_counter() - started) * 1000.0
+        probe.busy_ms += slot_ms
+        before = probe.busy_ms
+        run_event_loop(app, probe, tick_ms)
+        probe.ticks.record(slot_ms + probe.busy_ms - before)
+
+
+def run_benchmark(minutes=DEFAULT_MINUTES, tick_ms=DEFAULT_TICK_MS, scale=1, warmup_s=DEFAULT_WARMUP_S):
+    fixtures = replay.build_fixtures(scale)
+    with tempfile.TemporaryDirectory() as scratch, \
+            scratch_settings_dir(os.path.join(scratch, 'settings')), \
+            replay.replay_environment(fixtures, scratch):
+        # app.py sets up logging and registers ChartItem on import
+        import app as app_module
+        from PyQt6.QtCore import QTimer, QUrl
+        from PyQt6.QtQml import QQmlApplicationEngine
+        from PyQt6.QtWebEngineQuick import QtWebEngineQuick
+        from PyQt6.QtWidgets import QApplication
+        from ui_qml import MAIN_QML
+        logging.getLogger().setLevel(logging.WARNING)
+
+        probe_ref = {}
+        paint_stats = instrument_classes(app_module, probe_ref)
+        QtWebEngineQuick.initialize()
+        app = QApplication.instance() or QApplication([sys.argv[0]])
+
+        tz = pytz.timezone(funcs.location_settings['Starbase']['timezone'])
+        launch_data, weather_data, narratives, calendar = funcs.perform_full_dashboard_data_load(
+            funcs.location_settings, tz_obj=tz)
+        backend = app_module.Backend(initial_wifi_connected=True, initial_wifi_ssid="bench")
+        probe = UiProbe(app_module, backend)
+        probe_ref['probe'] = probe
+
+        engine = QQmlApplicationEngine()
+        app_module.set_qml_context_properties(engine.rootContext(), backend)
+        engine.load(QUrl.fromLocalFile(MAIN_QML))
+        if not engine.rootObjects():
+            raise RuntimeError("Main.qml failed to load under the offscreen platform")
+        window = engine.rootObjects()[0]
+        backend.setBootMode(False)
+        backend.on_data_loaded(launch_data, weather_data, narratives, calendar)
+        backend._setup_timers()
+        # The simulation fires these slots itself; real timers would double up
+        for timer in backend.findChildren(QTimer):
+            if not timer.isSingleShot():
+                timer.stop()
+
+        run_event_loop(app, probe, warmup_s * 1000.0)
+        probe.hook_scene(window)
+        probe.reset()
+        paint_stats.update(calls=0, ms=0.0)
+        funcs.metrics.reset()
+
+        started = time.perf_counter()
+        simulate(app, backend, probe, minutes, tick_ms)
+        wall_ms = (time.perf_counter() - started) * 1000.0
+
+        read_costs = property_read_costs(backend)
+        marshalling = {}
+        for signal, props in read_costs.items():
+            emitted = probe.signals.get(signal, 0)
+            for name, cost_ms in props.items():
+                marshalling[name] = {'reads': emitted, 'read_ms': round(cost_ms, 4),
+                                     'total_ms': round(emitted * cost_ms, 3)}
+
+        results = summarize(probe, paint_stats, marshalling, minutes, tick_ms, wall_ms, scale)
+        results['spans'] = funcs.metrics.snapshot()['spans']
+        backend.shutdown()
+        engine.deleteLater()
+        return results
+
+
+def summarize(probe, paint_stats, marshalling, minutes, tick_ms, wall_ms, scale):
+    tick_stats = probe.ticks.stats()
+    marshalling_ms = sum(m['total_ms'] for m in marshalling.values())
+    model_data_ms = sum(m['data_ms'] for m in probe.models.values())
+
+    def per_minute(value):
+        return round(value / minutes, 3)
+
+    stages = {
+        'busy_per_minute': {'median_ms': per_minute(probe.busy_ms)},
+        'tick_p95': {'median_ms': round(tick_stats['p95_ms'], 3)},
+        'model_data_per_minute': {'median_ms': per_minute(model_data_ms)},
+        'marshalling_per_minute': {'median_ms': per_minute(marshalling_ms)},
+        'chart_paint_per_minute': {'median_ms': per_minute(paint_stats['ms'])},
+    }
+    return {
+        'schema': replay.RESULTS_SCHEMA,
+        'created': datetime.now(pytz.UTC).isoformat(),
+        'commit': replay._git_commit(),
+        'minutes': minutes,
+        'tick_ms': tick_ms,
+        'wall_ms': round(wall_ms, 1),
+        # Same layout as tools/replay_benchmark.py so compare_results works on both
+        'scales': {f"{scale}x": {'stages': stages}},
+        'busy_ms': round(probe.busy_ms, 3),
+        'ticks': tick_stats,
+        'signals': dict(sorted(probe.signals.items(), key=lambda item: -item[1])),
+        'models': {label: dict(stats, data_ms=round(stats['data_ms'], 3)) for label, stats in probe.models.items()},
+        'marshalling': dict(sorted(marshalling.items(), key=lambda item: -item[1]['total_ms'])),
+        'repaints': {
+            'frames': probe.frames,
+            'chart_paint_calls': paint_stats['calls'],
+            'chart_paint_ms': round(paint_stats['ms'], 3),
+            'canvas': probe.canvas_paints,
+        },
+    }
+
+
+def format_results(results, regressions=None, limit=12):
+    minutes = results['minutes']
+    repaints = results['repaints']
+    lines = [f"--- UI benchmark ({minutes} simulated min, {results['tick_ms']} ms/tick, "
+             f"commit {results.get('commit') or 'unknown'}) ---",
+             f"main thread busy: {results['busy_ms']:.1f} ms ({results['busy_ms'] / minutes:.1f} ms/min), "
+             f"tick p50 {results['ticks']['p50_ms']:.2f} ms, p95 {results['ticks']['p95_ms']:.2f} ms, "
+             f"max {results['ticks']['max_ms']:.2f} ms",
+             f"frames: {repaints['frames']}, ChartItem.paint: {repaints['chart_paint_calls']} calls "
+             f"({repaints['chart_paint_ms']:.1f} ms), canvas paints: {sum(repaints['canvas'].values())}",
+             "\nSignals (emissions):"]
+    for name, count in list(results['signals'].items())[:limit]:
+        lines.append(f"  {name:.<40} {count:>7}")
+    lines.append("\nModels:")
+    for label, stats in results['models'].items():
+        lines.append(f"  {label:.<40} resets {stats['resets']:>5}  data() {stats['data_calls']:>7} "
+                     f"({stats['data_ms']:.1f} ms)")
+    lines.append("\nProperty marshalling (reads x cost):")
+    for name, stats in list(results['marshalling'].items())[:limit]:
+        lines.append(f"  {name:.<40} {stats['reads']:>7} x {stats['read_ms']:.4f} ms = {stats['total_ms']:.2f} ms")
+    if regressions is not None:
+        lines.append("\nNo regressions against baseline." if not regressions else "")
+        for r in regressions:
+            lines.append(f"REGRESSION {r['stage']}: {r['baseline_ms']:.2f} -> {r['current_ms']:.2f} ms "
+                         f"(+{r['change'] * 100:.0f}%)")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Drive Backend + QML offscreen and report main-thread UI cost")
+    parser.add_argument('--minutes', type=float, default=DEFAULT_MINUTES, help="Simulated minutes of timers")
+    parser.add_argument('--tick-ms', type=int, default=DEFAULT_TICK_MS,
+                        help="Real event-loop time per simulated second (lets frames render)")
+    parser.add_argument('--scale', type=int, default=1, help="Launch history multiplier for the fixtures")
+    parser.add_argument('--output', help="Write results JSON here")
+    parser.add_argument('--baseline', help="Results JSON from an earlier commit to compare against")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed slowdown as a fraction (default: 0.25)")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.minutes, args.tick_ms, args.scale)
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+    regressions = None
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = replay.compare_results(json.load(f), results, args.threshold)
+    print(format_results(results, regressions))
+    # Chromium and QML teardown at interpreter exit can hang offscreen; results are already out
+    os._exit(1 if regressions else 0)